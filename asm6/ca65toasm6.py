@@ -34,13 +34,20 @@ Anonymous labels should be easier to translate automatically.
 - Replace :+ in an expression with @ca65toasm6_anonlabel_{anoncount+1}.
 - Replace :- in an expression with @ca65toasm6_anonlabel_{anoncount}.
 
+With -j, each file gets its own counter, and labels take the form
+@ca65toasm6_f{index of file}_anonlabel_1 so that files can be
+translated independently in parallel.
+
 
 """
 import sys
 import os
 import re
+import json
+import hashlib
+import argparse
 from collections import OrderedDict
-from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
 
 quotesRE = r"""[^"';]+|"[^"]*"|'[^']*'|;.*"""
 quotesRE = re.compile(quotesRE)
@@ -57,12 +64,11 @@ def uncomment(line):
     if lineparts and lineparts[-1].startswith(";"): del lineparts[-1]
     return "".join(lineparts)
 
-def openreadlines(filename, xform=None):
-    """Open a file and return a list of all its lines.
-
-xform -- a function to run on all lines"""
-    with open(filename, "r", encoding="utf-8") as infp:
-        return [xform(x) if xform else x for x in infp]
+def uncommented_lines(lines):
+    """Yield nonblank lines of ca65 source code without comments."""
+    for line in lines:
+        line = uncomment(line).strip()
+        if line: yield line
 
 def fix_pc_references(s):
     """Translate references to the current program counter from ca65 to ASM6.
@@ -128,19 +134,29 @@ macros_equal_0 = {
 
 known_segs = ['', 'ZEROPAGE', 'BSS']
 
-def translate(filestoload):
-    lines = []
-    for filename in filestoload:
-        lines.append('.segment ""')
-        lines.extend(openreadlines(filename,
-                                   lambda x: uncomment(x).strip()))
+# Bump this when translation rules change to invalidate cached output
+TRANSLATOR_VERSION = 2
+
+def translate_lines(lines, anoncount=None, warn=None):
+    """Translate one ca65 source file to ASM6.
+
+lines -- iterable of lines of ca65 source code, consumed one at a time
+anoncount -- an AnonLabelCounter shared among files, or None for a
+    new one
+warn -- a function called with each warning message, or None to
+    print warnings to standard error
 
-    anoncount = AnonLabelCounter()
+Return an OrderedDict from segment names to lists of lines.
+"""
+    if anoncount is None:
+        anoncount = AnonLabelCounter()
+    if warn is None:
+        def warn(msg):
+            print(msg, file=sys.stderr)
     seg_lines = OrderedDict((k, []) for k in known_segs)
     cur_seg = ""
 
-    for line in lines:
-        if not line: continue
+    for line in uncommented_lines(lines):
         words = line.split(None, 1)
         label = None
 
@@ -202,19 +218,18 @@ def translate(filestoload):
                 continue
             if word0 == 'ifndef':
                 if words[1].startswith('PENTLY_USE_'):
-                    print("warning: PENTLY_USE default in",
-                          line, file=sys.stderr)
+                    warn("warning: PENTLY_USE default in %s" % line)
                 else:
-                    print("warning: ifndef in", line, file=sys.stderr)
+                    warn("warning: ifndef in %s" % line)
                 seg_lines[cur_seg].append('if 0  ; was ifndef')
                 continue
             elif word0 in directive_translation:
                 if word0 in ('ifdef', 'ifndef'):
-                    print("warning: ifdef in", line, file=sys.stderr)
+                    warn("warning: ifdef in %s" % line)
                 words[0] = directive_translation[word0]
                 word0 = words[0]
             else:
-                print("unknown directive", line, file=sys.stderr)
+                warn("unknown directive %s" % line)
                 continue
 
         # EQU is for string replacement (like ca65 .define),
@@ -244,6 +259,77 @@ def translate(filestoload):
             line = "%s: %s" % (label, line)
         seg_lines[cur_seg].append(line)
 
+    return seg_lines
+
+def get_translator_hash():
+    """Hash this script so that changing it invalidates cached output."""
+    with open(os.path.abspath(__file__), "rb") as infp:
+        return hashlib.sha256(infp.read()).hexdigest()
+
+def translate_file(filename, anoncount, warn=None, cache_dir=None):
+    """Translate one file, reusing a cached translation if possible.
+
+The cache key covers the file's contents, the anonymous label count
+and prefix at the start of the file, and this script.  A cache entry records
+the segments, the anonymous label count at the end, and warnings,
+so that a hit behaves exactly like a translation.
+
+Return an OrderedDict from segment names to lists of lines.
+"""
+    if warn is None:
+        def warn(msg):
+            print(msg, file=sys.stderr)
+    if not cache_dir:
+        with open(filename, "r", encoding="utf-8") as infp:
+            return translate_lines(infp, anoncount, warn)
+
+    with open(filename, "rb") as infp:
+        content = infp.read()
+    key = hashlib.sha256()
+    key.update(("%d %d %s %s\n"
+                % (TRANSLATOR_VERSION, anoncount.count, anoncount.prefix,
+                   get_translator_hash())).encode("utf-8"))
+    key.update(content)
+    cache_path = os.path.join(cache_dir, key.hexdigest() + ".json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as infp:
+            cached = json.load(infp)
+    except (OSError, ValueError):
+        pass
+    else:
+        for msg in cached["warnings"]:
+            warn(msg)
+        anoncount.count = cached["anoncount"]
+        return OrderedDict(cached["segments"])
+
+    warnings = []
+    def cachewarn(msg):
+        warnings.append(msg)
+        warn(msg)
+    seg_lines = translate_lines(content.decode("utf-8").splitlines(),
+                                anoncount, cachewarn)
+    cached = {
+        "segments": list(seg_lines.items()),
+        "anoncount": anoncount.count,
+        "warnings": warnings,
+    }
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as outfp:
+        json.dump(cached, outfp)
+    os.replace(tmp_path, cache_path)
+    return seg_lines
+
+def merge_segments(seg_lines_list):
+    """Concatenate each segment's lines across files, in order of first use."""
+    seg_lines = OrderedDict((k, []) for k in known_segs)
+    for file_seg_lines in seg_lines_list:
+        for segment, lines in file_seg_lines.items():
+            seg_lines.setdefault(segment, []).extend(lines)
+    return seg_lines
+
+def format_segments(seg_lines):
+    """Join translated segments into the text of one ASM6 file."""
     # These segments allocate RAM variables by stuffing them into
     # a ca65 segment with a conventional name.  Omit them from the
     # translation because ASM6 libraries instead allocate variables by
@@ -258,6 +344,89 @@ def translate(filestoload):
     out.append("")
     return "\n".join(out)
 
+def translate_one_file(job):
+    """Translate one file with its own anonymous label namespace.
 
-xlated = translate(sys.argv[1:])
-sys.stdout.write(xlated)
+job -- (filename, index of file on command line, cache_dir)
+
+Anonymous labels are named after the file's index so that they
+do not depend on other files and do not collide with them.  This
+runs in a worker process and is thus a top-level function.
+
+Return (segment list, list of warnings).
+"""
+    filename, index, cache_dir = job
+    warnings = []
+    anoncount = AnonLabelCounter(prefix="@ca65toasm6_f%d_anonlabel_" % index)
+    seg_lines = translate_file(filename, anoncount, warnings.append,
+                               cache_dir)
+    return seg_lines, warnings
+
+def translate(filestoload, cache_dir=None, warn=None, jobs=None):
+    """Translate ca65 source files to one ASM6 source file.
+
+jobs -- None to number anonymous labels consecutively across all
+    files; otherwise number them separately for each file and
+    translate files in up to this many worker processes.  The result
+    depends only on the files, not on the number of processes.
+
+Return the translation as a string.
+"""
+    if jobs is None:
+        anoncount = AnonLabelCounter()
+        seg_lines = merge_segments(
+            translate_file(filename, anoncount, warn, cache_dir)
+            for filename in filestoload
+        )
+        return format_segments(seg_lines)
+
+    if warn is None:
+        def warn(msg):
+            print(msg, file=sys.stderr)
+    job_list = [(filename, i, cache_dir)
+                for i, filename in enumerate(filestoload)]
+    if jobs > 1 and len(job_list) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(translate_one_file, job_list))
+    else:
+        results = [translate_one_file(job) for job in job_list]
+
+    # Merge in command line order regardless of completion order
+    for _, warnings in results:
+        for msg in warnings:
+            warn(msg)
+    seg_lines = merge_segments(seg_lines for seg_lines, _ in results)
+    return format_segments(seg_lines)
+
+def parse_argv(argv):
+    parser = argparse.ArgumentParser(
+        description="Translate Pently from ca65 to ASM6."
+    )
+    parser.add_argument("infilename", nargs="+",
+                        help="ca65 source files to translate")
+    parser.add_argument("-o", "--output", default="-",
+                        help="write output to file (default: standard output)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="reuse translations of unchanged files "
+                             "stored in DIR")
+    parser.add_argument("-j", "--jobs", type=int, metavar="N",
+                        help="translate files in up to N processes, "
+                             "numbering anonymous labels separately "
+                             "for each file")
+    args = parser.parse_args(argv[1:])
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("number of jobs must be positive")
+    return args
+
+def main(argv=None):
+    args = parse_argv(argv or sys.argv)
+    xlated = translate(args.infilename, cache_dir=args.cache_dir,
+                       jobs=args.jobs)
+    if args.output == '-':
+        sys.stdout.write(xlated)
+    else:
+        with open(args.output, "w", encoding="utf-8") as outfp:
+            outfp.write(xlated)
+
+if __name__=='__main__':
+    main()
@@ -2,8 +2,8 @@
 set -e
 
 # Only if you've changed the driver
-python3 ca65toasm6.py ../src/pently.inc ../src/pentlyseq.inc < /dev/null > pently-asm6.inc
-python3 ca65toasm6.py ../src/pentlysound.s ../src/pentlymusic.s < /dev/null > pently-asm6.asm
+python3 ca65toasm6.py --cache-dir ../obj/asm6cache ../src/pently.inc ../src/pentlyseq.inc -o pently-asm6.inc < /dev/null
+python3 ca65toasm6.py --cache-dir ../obj/asm6cache ../src/pentlysound.s ../src/pentlymusic.s -o pently-asm6.asm < /dev/null
 
 # If you've changed pentlyconfig.inc
 python3 ../tools/pentlybss.py --asm6 pentlyconfig.inc pentlymusicbase -o pentlybss.inc
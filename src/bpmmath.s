@@ -45,6 +45,14 @@
   lda #0
 .else
 
+.if ::PENTLY_USE_TEMPO_TABLE
+  ; With a tempo table, tempoCounter counts up from 0 to 65535
+  ; through each row, so A = tempoCounterHi * 96 / 256
+  lda pently_tempoCounterHi
+  ldy #96
+  jsr mul8
+.else
+
 .if ::PENTLY_USE_PAL_ADJUST
   ldx tvSystem
   beq isNTSC_1
@@ -76,6 +84,7 @@ isNTSC_1:
   jsr mul8
 
   ; A:0 = ptc * 4096*6 / fpm, in other words, A = ptc * 96 / fpm
+.endif
   sta 0
   
   ; now shift rpb to the right in case it's a power of 2
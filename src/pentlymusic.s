@@ -40,6 +40,12 @@
 .if PENTLY_USE_ROW_CALLBACK
 .import pently_row_callback, pently_dalsegno_callback
 .endif
+.if PENTLY_USE_REHEARSAL
+.import pently_rehearsal_snapshots
+.endif
+.if PENTLY_USE_SONG_BANKS
+.import pently_song_bank_callback
+.endif
 
 PENTLY_NUM_CHANNELS = 4
 PENTLY_DRUM_TRACK = 12
@@ -48,6 +54,7 @@ PENTLY_MAX_CHANNEL_VOLUME = 4
 PENTLY_INITIAL_TEMPO = 300
 PENTLY_INITIAL_ROW_LENGTH = 4
 PENTLY_MAX_TEMPO_SCALE = 8
+PENTLY_TEMPO_TABLE_SCALES = 4
 
 .if PENTLY_USE_ATTACK_TRACK
   PENTLY_LAST_TRACK = PENTLY_ATTACK_TRACK
@@ -154,6 +161,15 @@ pentlyi_porta1x_rates_hi:
 pentlymusic_code_start = *
 
 .proc pently_start_music
+  .if ::PENTLY_USE_SONG_BANKS
+    ; Let the main program switch in the bank holding this song
+    pha
+    tax
+    lda pently_song_banks,x
+    jsr pently_song_bank_callback
+    pla
+  .endif
+
   ; Fetch initial conductor track position (limit 128 songs)
   asl a
   tax
@@ -165,11 +181,19 @@ pentlymusic_code_start = *
   sta pentlyi_conductorSegnoHi
 
   ; Clear all music state except that shared with sound effects
-  ldy #pentlymusicbase_size - 1
   lda #0
   .if ::PENTLY_USE_ATTACK_TRACK
     sta pentlyi_attackChn
   .endif
+  .if ::pentlymusicbase_zp_size > 0
+    ; pentlybss.py may have moved frequently used fields to zero page
+    ldy #pentlymusicbase_zp_size - 1
+    :
+      sta pentlymusicbase_zp,y
+      dey
+      bpl :-
+  .endif
+  ldy #pentlymusicbase_size - 1
   :
     sta pentlymusicbase,y
     dey
@@ -209,10 +233,18 @@ pentlymusic_code_start = *
     lda #PENTLY_INITIAL_ROW_LENGTH
     sta pently_rows_per_beat
   .endif
-  lda #<PENTLY_INITIAL_TEMPO
-  sta pentlyi_tempoLo
-  lda #>PENTLY_INITIAL_TEMPO
-  sta pentlyi_tempoHi
+  .if ::PENTLY_USE_TEMPO_TABLE
+    ; Entry 0 of the tempo table is always PENTLY_INITIAL_TEMPO
+    lda #0
+    sta pentlyi_tempoLo
+    sta pentlyi_tempoHi
+    jsr pentlyi_load_tempo
+  .else
+    lda #<PENTLY_INITIAL_TEMPO
+    sta pentlyi_tempoLo
+    lda #>PENTLY_INITIAL_TEMPO
+    sta pentlyi_tempoHi
+  .endif
   ; Fall through
 .endproc
 .proc pently_resume_music
@@ -236,7 +268,15 @@ pentlymusic_code_start = *
   ; This applies Bresenham's algorithm to tick generation: add
   ; rows per minute every frame, then subtract frames per minute
   ; when it overflows.  But
-  .if ::PENTLY_USE_REHEARSAL
+  .if ::PENTLY_USE_TEMPO_TABLE
+    ; pentlyi_load_tempo has already divided the tempo by frames per
+    ; minute and scaled it, so each row is 65536 units long
+    clc
+    lda pentlyi_tempoIncLo
+    adc pently_tempoCounterLo
+    sta pently_tempoCounterLo
+    lda pentlyi_tempoIncHi
+  .elseif ::PENTLY_USE_REHEARSAL
 scaled_tempoHi  = pently_zptemp + 0
 
     lda pentlyi_tempoHi
@@ -273,19 +313,22 @@ music_not_playing:
 ; Conductor reading ;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;
 
 .proc pentlyi_next_row
-  ; Subtract tempo
-  .if ::PENTLY_USE_PAL_ADJUST
-    ldy tvSystem
-  .else
-    ldy #0
+  ; Subtract tempo.  With a tempo table, the counter instead wraps
+  ; to the start of the next row.
+  .if ::PENTLY_USE_TEMPO_TABLE = 0
+    .if ::PENTLY_USE_PAL_ADJUST
+      ldy tvSystem
+    .else
+      ldy #0
+    .endif
+    ; sec  ; carry was set by bcs in pentlyi_update_music
+    lda pently_tempoCounterLo
+    sbc pently_fpmLo,y
+    sta pently_tempoCounterLo
+    lda pently_tempoCounterHi
+    sbc pently_fpmHi,y
+    sta pently_tempoCounterHi
   .endif
-  ; sec  ; carry was set by bcs in pentlyi_update_music
-  lda pently_tempoCounterLo
-  sbc pently_fpmLo,y
-  sta pently_tempoCounterLo
-  lda pently_tempoCounterHi
-  sbc pently_fpmHi,y
-  sta pently_tempoCounterHi
 
   .if ::PENTLY_USE_REHEARSAL
     inc pently_rowslo
@@ -396,6 +439,10 @@ doConductor:
     sta pently_music_playing
     sta pentlyi_tempoHi
     sta pentlyi_tempoLo
+    .if ::PENTLY_USE_TEMPO_TABLE
+      sta pentlyi_tempoIncHi
+      sta pentlyi_tempoIncLo
+    .endif
     .if ::PENTLY_USE_ROW_CALLBACK
       clc
       jmp pently_dalsegno_callback
@@ -462,10 +509,14 @@ doConductor:
   cmp #PENTLY_CON_SETBEAT
   bcs not_tempo_change
     ; 30-37 tt: Set tempo to (A & $07) * 256 + tt
+    ; (with a tempo table: to the entry at that offset)
     and #%00000111
     sta pentlyi_tempoHi
     lda (pentlyi_conductorPos),y
     sta pentlyi_tempoLo
+    .if ::PENTLY_USE_TEMPO_TABLE
+      jsr pentlyi_load_tempo
+    .endif
   skipConductorByte:
     inc pentlyi_conductorPos
     bne :+
@@ -484,8 +535,38 @@ doConductor:
       ldy #0
       sty pently_row_beat_part
     .endif
+    jmp doConductor
   not_set_beat:
 
+  .if ::PENTLY_USE_CONDUCTOR_CALL
+    cmp #PENTLY_CON_RETURN
+    beq is_return
+    cmp #PENTLY_CON_CALL
+    bne not_call
+      ; 40 ll hh: Remember the position after hh and jump to hhll
+      lda pentlyi_conductorPos
+      clc
+      adc #2
+      sta pentlyi_segRetLo
+      lda pentlyi_conductorPos+1
+      adc #0
+      sta pentlyi_segRetHi
+      lda (pentlyi_conductorPos),y
+      tax
+      iny
+      lda (pentlyi_conductorPos),y
+      sta pentlyi_conductorPos+1
+      stx pentlyi_conductorPos
+      jmp doConductor
+    is_return:
+      ; 41: Return to the position after the last call
+      lda pentlyi_segRetLo
+      sta pentlyi_conductorPos
+      lda pentlyi_segRetHi
+      sta pentlyi_conductorPos+1
+    not_call:
+  .endif
+
   jmp doConductor
 .endproc
 
@@ -621,6 +702,9 @@ patcmdhandlers:
   .addr set_fx_portamento-1  ; Reserved for future use
   .addr set_fx_fastarp-1
   .addr set_fx_slowarp-1
+.if ::PENTLY_USE_PATTERN_REPEAT
+  .addr set_fx_repeat-1
+.endif
 num_patcmdhandlers = (* - patcmdhandlers) / 2
 
 set_fx_instrument:
@@ -740,12 +824,48 @@ set_fx_ch_volume:
   set_fx_ch_volume = nextPatternByte 
 .endif
 
+.if ::PENTLY_USE_PATTERN_REPEAT
+; REPEAT count, distance plays the bytes that precede it count more
+; times.  The distance is the length of those bytes plus 2, measured
+; back from the distance byte.  Repeats do not nest.
+set_fx_repeat:
+  lda pentlyi_repeatCount,x
+  beq repeatFirstTime
+  dec pentlyi_repeatCount,x
+  bne repeatJumpBack
+    ; Done repeating: skip the count and continue after the distance
+    inc pentlyi_chnPatternPos,x
+    bne :+
+      inc pentlyi_chnPatternPos+1,x
+    :
+    jmp nextPatternByte
+  repeatFirstTime:
+    lda (pentlyi_chnPatternPos,x)
+    sta pentlyi_repeatCount,x
+  repeatJumpBack:
+  inc pentlyi_chnPatternPos,x
+  bne :+
+    inc pentlyi_chnPatternPos+1,x
+  :
+  lda pentlyi_chnPatternPos,x
+  sec
+  sbc (pentlyi_chnPatternPos,x)
+  sta pentlyi_chnPatternPos,x
+  bcs :+
+    dec pentlyi_chnPatternPos+1,x
+  :
+  jmp anotherPatternByte
+.endif
+
 .endproc
 
 .proc pentlyi_start_pattern
   lda #0
   sta pentlyi_graceTime,x
   sta pentlyi_noteRowsLeft,x
+  .if ::PENTLY_USE_PATTERN_REPEAT
+    sta pentlyi_repeatCount,x
+  .endif
   lda pentlyi_musicPattern,x
   cmp #255
   bcc @notSilentPattern
@@ -815,6 +935,215 @@ set_fx_ch_volume:
   sta pentlyi_sustainVol+PENTLY_DRUM_TRACK
   rts
 .endproc
+
+;;
+; Starts song A at its rehearsal mark X, loading the state that
+; pently_skip_to_row would reach from a snapshot made by pentlyas.
+; Notes held across the mark are silent until the next note.
+.proc pently_start_music_at_mark
+snapshot = pently_zptemp + 0
+markidx = pently_zptemp + 2
+  stx markidx
+  pha
+  jsr pently_start_music
+  pla
+  asl a
+  tax
+  lda pently_rehearsal_snapshots,x
+  sta snapshot
+  lda pently_rehearsal_snapshots+1,x
+  sta snapshot+1
+  lda markidx
+  asl a
+  tay
+  lda (snapshot),y
+  tax
+  iny
+  lda (snapshot),y
+  sta snapshot+1
+  stx snapshot
+
+  ; Conductor state
+  ldy #0
+  lda (snapshot),y
+  sta pentlyi_conductorPos
+  iny
+  lda (snapshot),y
+  sta pentlyi_conductorPos+1
+  iny
+  lda (snapshot),y
+  sta pentlyi_songWaitRows
+  iny
+  lda (snapshot),y
+  sta pentlyi_conductorSegnoLo
+  iny
+  lda (snapshot),y
+  sta pentlyi_conductorSegnoHi
+  iny
+  lda (snapshot),y
+  sta pentlyi_tempoLo
+  iny
+  lda (snapshot),y
+  sta pentlyi_tempoHi
+  iny
+  lda (snapshot),y
+  sta pently_rowslo
+  iny
+  lda (snapshot),y
+  sta pently_rowshi
+  iny
+  .if ::PENTLY_USE_BPMMATH
+    lda (snapshot),y
+    sta pently_rows_per_beat
+    iny
+    lda (snapshot),y
+    sta pently_row_beat_part
+    iny
+  .else
+    iny
+    iny
+  .endif
+  .if ::PENTLY_USE_ATTACK_TRACK
+    lda (snapshot),y
+    sta pentlyi_attackChn
+  .endif
+  iny
+  .if ::PENTLY_USE_CONDUCTOR_CALL
+    lda (snapshot),y
+    sta pentlyi_segRetLo
+    iny
+    lda (snapshot),y
+    sta pentlyi_segRetHi
+    iny
+  .else
+    iny
+    iny
+  .endif
+
+  ; Each track's pattern state
+  ldx #0
+  trackloop:
+    lda (snapshot),y
+    sta pentlyi_musicPattern,x
+    iny
+    cmp #255
+    bcs isSilentPattern
+      lda (snapshot),y
+      sta pentlyi_chnPatternPos,x
+      iny
+      lda (snapshot),y
+      sta pentlyi_chnPatternPos+1,x
+      dey
+    isSilentPattern:
+    iny
+    iny
+    lda (snapshot),y
+    sta pentlyi_noteRowsLeft,x
+    iny
+    lda (snapshot),y
+    sta pentlyi_graceTime,x
+    iny
+    lda (snapshot),y
+    sta pentlyi_instrument,x
+    iny
+    lda (snapshot),y
+    sta pentlyi_chBaseNote,x
+    iny
+    cpx #PENTLY_DRUM_TRACK
+    bcs notPitched
+      lda (snapshot),y
+      and #$02
+      sta pentlyi_noteLegato,x
+      .if ::PENTLY_USE_ARPEGGIO
+        lda (snapshot),y
+        and #$40
+        sta pentlyi_arpPhase,x
+        iny
+        lda (snapshot),y
+        lsr a
+        lsr a
+        lsr a
+        lsr a
+        sta pentlyi_arpInterval1,x
+        lda (snapshot),y
+        and #$0F
+        sta pentlyi_arpInterval2,x
+        iny
+      .else
+        iny
+        iny
+      .endif
+      .if ::PENTLY_USE_VIBRATO
+        lda (snapshot),y
+        sta pentlyi_vibratoDepth,x
+      .endif
+      iny
+      .if ::PENTLY_USE_PORTAMENTO
+        lda (snapshot),y
+        sta pentlyi_chPortamento,x
+      .endif
+      dey
+      dey
+      dey
+    notPitched:
+    iny
+    iny
+    iny
+    iny
+    .if ::PENTLY_USE_CHANNEL_VOLUME
+      cpx #PENTLY_ATTACK_TRACK
+      bcs :+
+        lda (snapshot),y
+        sta pentlyi_chVolScale,x
+      :
+    .endif
+    iny
+    .if ::PENTLY_USE_PATTERN_REPEAT
+      lda (snapshot),y
+      sta pentlyi_repeatCount,x
+    .endif
+    iny
+    inx
+    inx
+    inx
+    inx
+    cpx #PENTLY_LAST_TRACK + 4
+    bcc trackloop
+
+  ; Wait a full row before reading the next, as pently_skip_to_row
+  ; does
+  .if ::PENTLY_USE_TEMPO_TABLE
+    lda #0
+    sta pently_tempoCounterLo
+    sta pently_tempoCounterHi
+    jmp pentlyi_load_tempo
+  .else
+    .if ::PENTLY_USE_PAL_ADJUST
+      ldx tvSystem
+    .else
+      ldx #0
+    .endif
+    sec
+    lda #0
+    sbc pently_fpmLo,x
+    sta pently_tempoCounterLo
+    lda #0
+    sbc pently_fpmHi,x
+    sta pently_tempoCounterHi
+    rts
+  .endif
+.endproc
+
+;;
+; Sets pently_tempo_scale to A.
+.proc pently_set_tempo_scale
+  sta pently_tempo_scale
+  .if ::PENTLY_USE_TEMPO_TABLE
+    jmp pentlyi_load_tempo
+  .else
+    rts
+  .endif
+.endproc
 .endif
 
 ; Playing notes ;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;;
@@ -1064,12 +1393,17 @@ porta_not_injected:
   lda pentlyi_noteRowsLeft,x
   bne notCutNote
 
-  clc
-  lda pently_tempoCounterLo
-  adc #<(FRAMES_PER_MINUTE_NTSC/2)
-  lda pently_tempoCounterHi
-  adc #>(FRAMES_PER_MINUTE_NTSC/2)
-  bcc notCutNote
+  .if ::PENTLY_USE_TEMPO_TABLE
+    lda pently_tempoCounterHi
+    bpl notCutNote
+  .else
+    clc
+    lda pently_tempoCounterLo
+    adc #<(FRAMES_PER_MINUTE_NTSC/2)
+    lda pently_tempoCounterHi
+    adc #>(FRAMES_PER_MINUTE_NTSC/2)
+    bcc notCutNote
+  .endif
 
   ; Unless the next byte in the pattern is a tie or a legato enable,
   ; cut the note
@@ -1485,11 +1819,89 @@ is_decrease:
 
 .endif
 
+.if PENTLY_USE_TEMPO_TABLE
+;;
+; Looks up the amount to add to the tempo counter each frame for
+; the current tempo, TV system, and tempo scale.  The tempo is an
+; offset into pently_tempo_table, whose entries are made by
+; pentlyas.py --tempo-table:
+; 16-bit words: increment for NTSC and PAL at normal speed, then
+; (with --rehearse) at half, quarter, and eighth speed
+.proc pentlyi_load_tempo
+tableptr = pently_zptemp + 0
+  clc
+  lda #<pently_tempo_table
+  adc pentlyi_tempoLo
+  sta tableptr
+  lda #>pently_tempo_table
+  adc pentlyi_tempoHi
+  sta tableptr+1
+  .if ::PENTLY_USE_REHEARSAL
+    ; Pause if bit 7 is set or the scale is beyond the table
+    lda pently_tempo_scale
+    cmp #PENTLY_TEMPO_TABLE_SCALES
+    bcs is_paused
+    asl a
+    asl a
+    tay
+  .else
+    ldy #0
+  .endif
+  .if ::PENTLY_USE_PAL_ADJUST
+    lda tvSystem
+    beq :+
+      iny
+      iny
+    :
+  .endif
+  lda (tableptr),y
+  sta pentlyi_tempoIncLo
+  iny
+  lda (tableptr),y
+  sta pentlyi_tempoIncHi
+  rts
+  .if ::PENTLY_USE_REHEARSAL
+  is_paused:
+    lda #0
+    sta pentlyi_tempoIncLo
+    sta pentlyi_tempoIncHi
+    rts
+  .endif
+.endproc
+.endif
+
 .if PENTLY_USE_TEMPO_ROUNDING
 ;;
 ; Rounds accumulated musical time within this row to either
 ; zero or one whole tick.
 .proc pentlyi_round_to_beat
+.if ::PENTLY_USE_TEMPO_TABLE
+  ; With a tempo table, a row is 65536 units long, and the tempo
+  ; counter counts up from 0 at the start of each row.
+  ; Calculate half a tick's worth of musical time
+  lda pentlyi_tempoIncHi
+  lsr a
+  tax
+  lda pentlyi_tempoIncLo
+  ror a
+  ; XXAA = half tick length
+
+  ; If half a tick is at least the time since the start of the row,
+  ; round DOWN to the start of the row.  Otherwise, round UP to one
+  ; tick into the row.
+  cmp pently_tempoCounterLo
+  txa
+  sbc pently_tempoCounterHi
+  lda #0
+  tay
+  bcs :+
+    lda pentlyi_tempoIncLo
+    ldy pentlyi_tempoIncHi
+  :
+  sta pently_tempoCounterLo
+  sty pently_tempoCounterHi
+  rts
+.else
   ; Calculate half a tick's worth of musical time
   lda pentlyi_tempoHi
   lsr a
@@ -1530,6 +1942,7 @@ is_decrease:
   sbc pently_fpmHi,x
   sta pently_tempoCounterHi
   rts
+.endif
 .endproc
 .endif
 
@@ -467,23 +467,22 @@ bail:
 .endproc
 
 .proc seek_to_section
-src = $00
-  asl a
-  beq vis_draw_section_arrow::bail
-  tay
-  lda cur_song
-  asl a
-  tax
-  lda pently_rehearsal_marks,x
-  sta src+0
-  lda pently_rehearsal_marks+1,x
-  sta src+1
-  iny
-  lda (src),y
   tax
-  dey
-  lda (src),y
-  jmp pently_skip_to_row
+  lda pently_tempo_scale
+  pha
+  lda cur_song
+  dex
+  bpl has_mark
+    jsr pently_start_music
+    jmp restore_tempo_scale
+  has_mark:
+    jsr pently_start_music_at_mark
+  restore_tempo_scale:
+  .if ::PENTLY_USE_VARMIX
+    jsr vis_set_mute
+  .endif
+  pla
+  jmp pently_set_tempo_scale
 .endproc
 
 .proc vis_handle_rehearsal_keys
@@ -503,25 +502,14 @@ src = $00
     jsr seek_to_section
   notDown:
 
-  ; Up: Rewind, then go to start of previous section
+  ; Up: Go to start of previous section
   lda new_keys
   and #KEY_UP
   beq notUp
   lda vis_cur_song_section
   beq notUp
-    lda pently_tempo_scale
-    pha
-    lda cur_song
-    jsr pently_start_music
-    .if ::PENTLY_USE_VARMIX
-      jsr vis_set_mute
-    .endif
-    pla
-    sta pently_tempo_scale
-    lda vis_cur_song_section
     sec
     sbc #1
-    bcc notUp
     jsr seek_to_section
   notUp:
 
@@ -540,7 +528,7 @@ startHeld:
   beq not_start_release
   lda #$80
   eor pently_tempo_scale
-  sta pently_tempo_scale
+  jsr pently_set_tempo_scale
   jmp consume_start_held
 
 not_start_release:
@@ -558,7 +546,10 @@ not_start_release:
   beq not_start_up
     cpx #0
     beq :+
-      dec pently_tempo_scale
+      lda pently_tempo_scale
+      sec
+      sbc #1
+      jsr pently_set_tempo_scale
     :
     jmp consume_start_held
   not_start_up:
@@ -568,7 +559,10 @@ not_start_release:
   beq nope
     cpx #3
     beq :+
-      inc pently_tempo_scale
+      lda pently_tempo_scale
+      clc
+      adc #1
+      jsr pently_set_tempo_scale
     :
 
 consume_start_held:
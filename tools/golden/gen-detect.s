@@ -0,0 +1,98 @@
+; Generated using Pently music assembler
+; Music from generated/detect.pently
+; title: <?>
+; author: <?>
+; copyright: <?>
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=3
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 3 entries, 40 bytes
+sfxdef PE_hat, PEDAT_hat, 5, 1, 3
+sfxdef PE_kick, PEDAT_kick, 5, 1, 3
+sfxdef PE_trikick, PEDAT_trikick, 4, 1, 2
+PEDAT_hat:
+.byte 6,3,4,3,3,3,2,3,1,3
+PEDAT_kick:
+.byte 10,6,8,5,6,4,4,4,2,4
+PEDAT_trikick:
+.byte 143,31,143,27,143,24,130,21
+pently_instruments:  ; 2 entries, 13 bytes
+instdef PI_lead, 2, 6, 1, 0, PIDAT_lead, 3
+instdef PI_bass, 2, 8, 0, 0, 0, 0
+PIDAT_lead:
+.byte 156,154,152
+pently_drums:  ; 3 entries, 6 bytes
+drumdef DR_hat,PE_hat,$80
+drumdef DR_kick,PE_kick,PE_trikick
+drumdef DR_kickhat,PE_hat,PE_trikick
+pently_patterns:  ; 5 entries, 35 bytes
+patdef PP_detect_detect_drum, PPDAT_detect_detect_drum
+patdef PP_detect_detect_rest_drum, PPDAT_detect_detect_rest_drum
+patdef PP_detect_detect_pitched, PPDAT_detect_detect_pitched
+patdef PP_detect_detect_rest_pitched, PPDAT_detect_detect_rest_pitched
+patdef PP_detect_detect_waits, PPDAT_detect_detect_waits
+PPDAT_detect_detect_drum:
+.byte DR_kick|D_8,DR_hat|D_8,DR_kickhat|D_8,DR_hat|D_D4,DR_kick|D_4,PATEND
+PPDAT_detect_detect_rest_drum:
+.byte N_TIE|D_D8,DR_hat,DR_hat,DR_kick|D_8,DR_hat|D_8,PATEND
+PPDAT_detect_detect_pitched:
+.byte N_C|D_4,N_E|D_4,N_G|D_4,N_E|D_4,PATEND
+PPDAT_detect_detect_rest_pitched:
+.byte N_TIE|D_4,N_C|D_8,N_E|D_8,N_G|D_8,REST|D_4,PATEND
+PPDAT_detect_detect_waits:
+.byte N_TIE|D_1,PATEND
+pently_songs:  ; 1 entry, 30 bytes
+songdef PS_detect, PSDAT_detect
+PSDAT_detect:
+; title: detect
+playPatNoise PP_detect_detect_drum
+playPatTri PP_detect_detect_pitched, 15, PI_bass
+playPatSq2 PP_detect_detect_rest_pitched, 27, PI_lead
+setTempo 560
+setBeatDuration D_4
+waitRows 16  ; end at 0:01.71
+playPatNoise PP_detect_detect_rest_drum
+playPatSq1 PP_detect_detect_waits, 0, PI_lead
+waitRows 16  ; end at 0:03.43
+fine
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 124 bytes
+; pently_sfx_table: 40 bytes
+;   PE_hat: 14 bytes
+;   PE_kick: 14 bytes
+;   PE_trikick: 12 bytes
+; pently_instruments: 13 bytes
+;   PI_lead: 8 bytes
+;   PI_bass: 5 bytes
+; pently_drums: 6 bytes
+;   DR_hat: 2 bytes
+;   DR_kick: 2 bytes
+;   DR_kickhat: 2 bytes
+; pently_patterns: 35 bytes
+;   PP_detect_detect_drum: 8 bytes
+;   PP_detect_detect_rest_drum: 8 bytes
+;   PP_detect_detect_pitched: 7 bytes
+;   PP_detect_detect_rest_pitched: 8 bytes
+;   PP_detect_detect_waits: 4 bytes
+; pently_songs: 30 bytes
+;   PS_detect: 30 bytes
+;
+; Breakdown by song
+;   Shared: 59 bytes
+;   Song detect: 65 bytes
+
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_hat,PE_kick
+.exportzp PE_trikick,PI_lead,PI_bass,PS_detect
@@ -0,0 +1,123 @@
+; Generated using Pently music assembler
+; Music from generated/fallthrough4.pently
+; title: <?>
+; author: <?>
+; copyright: <?>
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=3
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 3 entries, 40 bytes
+sfxdef PE_hat, PEDAT_hat, 5, 1, 3
+sfxdef PE_kick, PEDAT_kick, 5, 1, 3
+sfxdef PE_trikick, PEDAT_trikick, 4, 1, 2
+PEDAT_hat:
+.byte 6,3,4,3,3,3,2,3,1,3
+PEDAT_kick:
+.byte 10,6,8,5,6,4,4,4,2,4
+PEDAT_trikick:
+.byte 143,31,143,27,143,24,130,21
+pently_instruments:  ; 2 entries, 13 bytes
+instdef PI_lead, 2, 6, 1, 0, PIDAT_lead, 3
+instdef PI_bass, 2, 8, 0, 0, 0, 0
+PIDAT_lead:
+.byte 156,154,152
+pently_drums:  ; 3 entries, 6 bytes
+drumdef DR_hat,PE_hat,$80
+drumdef DR_kick,PE_kick,PE_trikick
+drumdef DR_kickhat,PE_hat,PE_trikick
+pently_patterns:  ; 5 entries, 36 bytes
+patdef PP_fallthrough4_ft0, PPDAT_fallthrough4_ft0
+patdef PP_fallthrough4_ft1, PPDAT_fallthrough4_ft1
+patdef PP_fallthrough4_ft2, PPDAT_fallthrough4_ft2
+patdef PP_fallthrough4_ft3, PPDAT_fallthrough4_ft3
+patdef PP_fallthrough4_ft4, PPDAT_fallthrough4_ft4
+PPDAT_fallthrough4_ft0:
+.byte N_C|D_4,REST|D_8,N_E|D_D4,N_C|D_8,REST|D_8
+PPDAT_fallthrough4_ft1:
+.byte N_E|D_4,REST|D_8,N_G|D_D4,N_E|D_8,REST|D_8
+PPDAT_fallthrough4_ft2:
+.byte N_G|D_4,REST|D_8,N_B|D_D4,N_G|D_8,REST|D_8
+PPDAT_fallthrough4_ft3:
+.byte N_B|D_4,REST|D_8,N_DH|D_D4,N_B|D_8,REST|D_8
+PPDAT_fallthrough4_ft4:
+.byte N_DH|D_4,REST|D_8,N_FH|D_D4,N_DH|D_8,REST|D_8,PATEND
+pently_songs:  ; 1 entry, 36 bytes
+songdef PS_fallthrough4, PSDAT_fallthrough4
+PSDAT_fallthrough4:
+; title: fallthrough4
+playPatSq2 PP_fallthrough4_ft0, 27, PI_lead
+setTempoEntry 16
+setBeatDuration D_4
+waitRows 32  ; end at 0:03.20
+playPatSq1 PP_fallthrough4_ft1, 27, PI_lead
+waitRows 32  ; end at 0:06.40
+playPatSq1 PP_fallthrough4_ft2, 27, PI_lead
+waitRows 32  ; end at 0:09.60
+playPatSq1 PP_fallthrough4_ft3, 27, PI_lead
+waitRows 32  ; end at 0:12.80
+playPatSq1 PP_fallthrough4_ft4, 27, PI_lead
+waitRows 32  ; end at 0:16.00
+fine
+pently_tempo_table:
+.word 5452,6554,2726,3277,1363,1638,682,819  ; 300 rows/min
+.word 10904,13107,5452,6554,2726,3277,1363,1638  ; 600 rows/min
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 163 bytes
+; pently_sfx_table: 40 bytes
+;   PE_hat: 14 bytes
+;   PE_kick: 14 bytes
+;   PE_trikick: 12 bytes
+; pently_instruments: 13 bytes
+;   PI_lead: 8 bytes
+;   PI_bass: 5 bytes
+; pently_drums: 6 bytes
+;   DR_hat: 2 bytes
+;   DR_kick: 2 bytes
+;   DR_kickhat: 2 bytes
+; pently_patterns: 36 bytes
+;   PP_fallthrough4_ft0: 7 bytes
+;   PP_fallthrough4_ft1: 7 bytes
+;   PP_fallthrough4_ft2: 7 bytes
+;   PP_fallthrough4_ft3: 7 bytes
+;   PP_fallthrough4_ft4: 8 bytes
+; pently_songs: 36 bytes
+;   PS_fallthrough4: 36 bytes
+; pently_tempo_table: 32 bytes
+;
+; Breakdown by song
+;   Shared: 91 bytes
+;   Song fallthrough4: 72 bytes
+
+; Rehearsal mark data begin
+pently_rehearsal_marks:
+.addr PRM_fallthrough4
+
+PRM_fallthrough4:
+.byte  0  ; number of rehearsal marks
+.byte  0  ; reserved
+
+pently_rehearsal_snapshots:
+.addr PRS_fallthrough4
+
+PRS_fallthrough4:
+pently_resume_song = 0
+pently_resume_rows = 0
+; Rehearsal mark end
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs,pently_tempo_table
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_hat,PE_kick
+.exportzp PE_trikick,PI_lead,PI_bass,PS_fallthrough4
+.exportzp pently_resume_song
+.export pently_rehearsal_marks, pently_resume_rows:absolute
+.export pently_rehearsal_snapshots
@@ -0,0 +1,148 @@
+; Generated using Pently music assembler
+; Music from generated/famitracker.pently
+; title: Drum test
+; author: Nobody
+; copyright: 2019
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=2
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 2 entries, 28 bytes
+sfxdef PE_noise_1_lead, PEDAT_noise_1_lead, 5, 1, 3
+sfxdef PE_noise_C_lead, PEDAT_noise_C_lead, 5, 1, 3
+PEDAT_noise_1_lead:
+.byte 15,14,12,14,9,14,6,14,3,14
+PEDAT_noise_C_lead:
+.byte 15,3,12,3,9,3,6,3,3,3
+pently_instruments:  ; 1 entry, 10 bytes
+instdef PI_lead, 2, 0, 0, 0, PIDAT_lead, 5
+PIDAT_lead:
+.byte 159,156,153,150,147
+pently_drums:  ; 2 entries, 4 bytes
+drumdef DR_noise_1_lead_d,PE_noise_1_lead,$80
+drumdef DR_noise_C_lead_d,PE_noise_C_lead,$80
+pently_patterns:  ; 4 entries, 23 bytes
+patdef PP_Drums_sq1_00, PPDAT_Drums_sq1_00
+patdef PP_Drums_sq1_01, PPDAT_Drums_sq1_01
+patdef PP_Drums_tri_00, PPDAT_Drums_tri_00
+patdef PP_Drums_noise_00, PPDAT_Drums_noise_00
+PPDAT_Drums_sq1_00:
+.byte N_C|D_4,N_E|D_4,N_G|D_4,REST|D_4,PATEND
+PPDAT_Drums_sq1_01:
+.byte N_C|D_1,PATEND
+PPDAT_Drums_tri_00:
+.byte N_F|D_2,N_C|D_2,PATEND
+PPDAT_Drums_noise_00:
+.byte DR_noise_1_lead_d|D_4,DR_noise_C_lead_d|D_4,DR_noise_1_lead_d|D_4
+.byte DR_noise_C_lead_d|D_4,PATEND
+pently_songs:  ; 1 entry, 47 bytes
+songdef PS_Drums, PSDAT_Drums
+PSDAT_Drums:
+; title: Drums
+callSegment PSSEG_Drums_0
+playPatNoise PP_Drums_noise_00
+setTempoEntry 16
+setBeatDuration D_4
+waitRows 16  ; end at 0:01.60
+callSegment PSSEG_Drums_0
+stopPatNoise
+waitRows 16  ; end at 0:03.20
+playPatSq1 PP_Drums_sq1_01, 29, PI_lead
+playPatTri PP_Drums_tri_00, 10, PI_lead
+playPatNoise PP_Drums_noise_00
+waitRows 16  ; end at 0:04.80
+dalSegno
+PSSEG_Drums_0:
+playPatSq1 PP_Drums_sq1_00, 27, PI_lead
+playPatTri PP_Drums_tri_00, 10, PI_lead
+returnSegment
+pently_tempo_table:
+.word 5452,6554,2726,3277,1363,1638,682,819  ; 300 rows/min
+.word 10904,13107,5452,6554,2726,3277,1363,1638  ; 600 rows/min
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 144 bytes
+; pently_sfx_table: 28 bytes
+;   PE_noise_1_lead: 14 bytes
+;   PE_noise_C_lead: 14 bytes
+; pently_instruments: 10 bytes
+;   PI_lead: 10 bytes
+; pently_drums: 4 bytes
+;   DR_noise_1_lead_d: 2 bytes
+;   DR_noise_C_lead_d: 2 bytes
+; pently_patterns: 23 bytes
+;   PP_Drums_sq1_00: 7 bytes
+;   PP_Drums_sq1_01: 4 bytes
+;   PP_Drums_tri_00: 5 bytes
+;   PP_Drums_noise_00: 7 bytes
+; pently_songs: 47 bytes
+;   PS_Drums: 47 bytes
+; pently_tempo_table: 32 bytes
+;
+; Breakdown by song
+;   Shared: 74 bytes
+;   Song Drums: 70 bytes
+
+; Rehearsal mark data begin
+pently_rehearsal_marks:
+.addr PRM_Drums
+
+PRM_Drums:
+.byte  2  ; number of rehearsal marks
+.byte  0  ; reserved
+.word 16,32
+.byte 70,114,97,109,101,32,48,49,10,70,114,97,109,101,32,48,50,0
+
+pently_rehearsal_snapshots:
+.addr PRS_Drums
+
+PRS_Drums:
+.addr PRS_Drums_0,PRS_Drums_1
+PRS_Drums_0:  ; Frame 01
+.addr PSDAT_Drums+12
+.byte 0
+.addr PSDAT_Drums+0
+.word 16,16
+.byte 4,3,0
+.addr PSDAT_Drums+3
+.byte PP_Drums_sq1_00,<(PPDAT_Drums_sq1_00+4),>(PPDAT_Drums_sq1_00+4),0,0
+.byte PI_lead,27,$00,$00,0,$00,4,0
+.byte 255,<(0),>(0),0,0,0,0,$00,$00,0,$00,4,0
+.byte PP_Drums_tri_00,<(PPDAT_Drums_tri_00+2),>(PPDAT_Drums_tri_00+2),0,0
+.byte PI_lead,10,$00,$00,0,$00,4,0
+.byte PP_Drums_noise_00,<(PPDAT_Drums_noise_00+4),>(PPDAT_Drums_noise_00+4),0,0
+.byte 0,0,$00,$00,0,$00,4,0
+.byte 255,<(0),>(0),0,0,0,0,$00,$00,0,$00,0,0
+PRS_Drums_1:  ; Frame 02
+.addr PSDAT_Drums+21
+.byte 0
+.addr PSDAT_Drums+0
+.word 16,32
+.byte 4,3,0
+.addr PSDAT_Drums+15
+.byte PP_Drums_sq1_00,<(PPDAT_Drums_sq1_00+4),>(PPDAT_Drums_sq1_00+4),0,0
+.byte PI_lead,27,$00,$00,0,$00,4,0
+.byte 255,<(0),>(0),0,0,0,0,$00,$00,0,$00,4,0
+.byte PP_Drums_tri_00,<(PPDAT_Drums_tri_00+2),>(PPDAT_Drums_tri_00+2),0,0
+.byte PI_lead,10,$00,$00,0,$00,4,0
+.byte 255,<(0),>(0),0,0,0,0,$00,$00,0,$00,4,0
+.byte 255,<(0),>(0),0,0,0,0,$00,$00,0,$00,0,0
+pently_resume_song = 0
+pently_resume_rows = 0
+; Rehearsal mark end
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs,pently_tempo_table
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_noise_1_lead
+.exportzp PE_noise_C_lead,PI_lead,PS_Drums
+.exportzp pently_resume_song
+.export pently_rehearsal_marks, pently_resume_rows:absolute
+.export pently_rehearsal_snapshots
@@ -0,0 +1,92 @@
+; Generated using Pently music assembler
+; Music from generated/famitracker.pently
+; title: Drum test
+; author: Nobody
+; copyright: 2019
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=2
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 2 entries, 28 bytes
+sfxdef PE_noise_1_lead, PEDAT_noise_1_lead, 5, 1, 3
+sfxdef PE_noise_C_lead, PEDAT_noise_C_lead, 5, 1, 3
+PEDAT_noise_1_lead:
+.byte 15,14,12,14,9,14,6,14,3,14
+PEDAT_noise_C_lead:
+.byte 15,3,12,3,9,3,6,3,3,3
+pently_instruments:  ; 1 entry, 10 bytes
+instdef PI_lead, 2, 0, 0, 0, PIDAT_lead, 5
+PIDAT_lead:
+.byte 159,156,153,150,147
+pently_drums:  ; 2 entries, 4 bytes
+drumdef DR_noise_1_lead_d,PE_noise_1_lead,$80
+drumdef DR_noise_C_lead_d,PE_noise_C_lead,$80
+pently_patterns:  ; 4 entries, 23 bytes
+patdef PP_Drums_sq1_00, PPDAT_Drums_sq1_00
+patdef PP_Drums_sq1_01, PPDAT_Drums_sq1_01
+patdef PP_Drums_tri_00, PPDAT_Drums_tri_00
+patdef PP_Drums_noise_00, PPDAT_Drums_noise_00
+PPDAT_Drums_sq1_00:
+.byte N_C|D_4,N_E|D_4,N_G|D_4,REST|D_4,PATEND
+PPDAT_Drums_sq1_01:
+.byte N_C|D_1,PATEND
+PPDAT_Drums_tri_00:
+.byte N_F|D_2,N_C|D_2,PATEND
+PPDAT_Drums_noise_00:
+.byte DR_noise_1_lead_d|D_4,DR_noise_C_lead_d|D_4,DR_noise_1_lead_d|D_4
+.byte DR_noise_C_lead_d|D_4,PATEND
+pently_songs:  ; 1 entry, 48 bytes
+songdef PS_Drums, PSDAT_Drums
+PSDAT_Drums:
+; title: Drums
+playPatSq1 PP_Drums_sq1_00, 27, PI_lead
+playPatTri PP_Drums_tri_00, 10, PI_lead
+playPatNoise PP_Drums_noise_00
+setTempo 600
+setBeatDuration D_4
+waitRows 16  ; end at 0:01.60
+playPatSq1 PP_Drums_sq1_00, 27, PI_lead
+playPatTri PP_Drums_tri_00, 10, PI_lead
+stopPatNoise
+waitRows 16  ; end at 0:03.20
+playPatSq1 PP_Drums_sq1_01, 29, PI_lead
+playPatTri PP_Drums_tri_00, 10, PI_lead
+playPatNoise PP_Drums_noise_00
+waitRows 16  ; end at 0:04.80
+dalSegno
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 113 bytes
+; pently_sfx_table: 28 bytes
+;   PE_noise_1_lead: 14 bytes
+;   PE_noise_C_lead: 14 bytes
+; pently_instruments: 10 bytes
+;   PI_lead: 10 bytes
+; pently_drums: 4 bytes
+;   DR_noise_1_lead_d: 2 bytes
+;   DR_noise_C_lead_d: 2 bytes
+; pently_patterns: 23 bytes
+;   PP_Drums_sq1_00: 7 bytes
+;   PP_Drums_sq1_01: 4 bytes
+;   PP_Drums_tri_00: 5 bytes
+;   PP_Drums_noise_00: 7 bytes
+; pently_songs: 48 bytes
+;   PS_Drums: 48 bytes
+;
+; Breakdown by song
+;   Shared: 42 bytes
+;   Song Drums: 71 bytes
+
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_noise_1_lead
+.exportzp PE_noise_C_lead,PI_lead,PS_Drums
@@ -0,0 +1,101 @@
+; Generated using Pently music assembler
+; Music from generated/grace32.pently
+; title: <?>
+; author: <?>
+; copyright: <?>
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=3
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 3 entries, 40 bytes
+sfxdef PE_hat, PEDAT_hat, 5, 1, 3
+sfxdef PE_kick, PEDAT_kick, 5, 1, 3
+sfxdef PE_trikick, PEDAT_trikick, 4, 1, 2
+PEDAT_hat:
+.byte 6,3,4,3,3,3,2,3,1,3
+PEDAT_kick:
+.byte 10,6,8,5,6,4,4,4,2,4
+PEDAT_trikick:
+.byte 143,31,143,27,143,24,130,21
+pently_instruments:  ; 2 entries, 13 bytes
+instdef PI_lead, 2, 6, 1, 0, PIDAT_lead, 3
+instdef PI_bass, 2, 8, 0, 0, 0, 0
+PIDAT_lead:
+.byte 156,154,152
+pently_drums:  ; 3 entries, 6 bytes
+drumdef DR_hat,PE_hat,$80
+drumdef DR_kick,PE_kick,PE_trikick
+drumdef DR_kickhat,PE_hat,PE_trikick
+pently_patterns:  ; 1 entry, 29 bytes
+patdef PP_grace32_grace32, PPDAT_grace32_grace32
+PPDAT_grace32_grace32:
+.byte GRACE,4,N_D,N_E|D_2,N_D|D_1,GRACE,1,N_C,N_D|D_4,GRACE,2,N_E,N_F|D_4
+.byte GRACE,3,REST,N_G|D_D2,N_G|D_8,GRACE,2,N_A,N_B|D_2,GRACE,2,REST,N_CH|D_1
+.byte PATEND
+pently_songs:  ; 1 entry, 12 bytes
+songdef PS_grace32, PSDAT_grace32
+PSDAT_grace32:
+; title: grace32
+playPatSq2 PP_grace32_grace32, 27, PI_lead
+setTempoEntry 16
+setBeatDuration D_2
+waitRows 32  ; end at 0:02.40
+fine
+pently_tempo_table:
+.word 5452,6554,2726,3277,1363,1638,682,819  ; 300 rows/min
+.word 14539,17476,7270,8738,3635,4369,1817,2185  ; 800 rows/min
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 132 bytes
+; pently_sfx_table: 40 bytes
+;   PE_hat: 14 bytes
+;   PE_kick: 14 bytes
+;   PE_trikick: 12 bytes
+; pently_instruments: 13 bytes
+;   PI_lead: 8 bytes
+;   PI_bass: 5 bytes
+; pently_drums: 6 bytes
+;   DR_hat: 2 bytes
+;   DR_kick: 2 bytes
+;   DR_kickhat: 2 bytes
+; pently_patterns: 29 bytes
+;   PP_grace32_grace32: 29 bytes
+; pently_songs: 12 bytes
+;   PS_grace32: 12 bytes
+; pently_tempo_table: 32 bytes
+;
+; Breakdown by song
+;   Shared: 91 bytes
+;   Song grace32: 41 bytes
+
+; Rehearsal mark data begin
+pently_rehearsal_marks:
+.addr PRM_grace32
+
+PRM_grace32:
+.byte  0  ; number of rehearsal marks
+.byte  0  ; reserved
+
+pently_rehearsal_snapshots:
+.addr PRS_grace32
+
+PRS_grace32:
+pently_resume_song = 0
+pently_resume_rows = 0
+; Rehearsal mark end
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs,pently_tempo_table
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_hat,PE_kick
+.exportzp PE_trikick,PI_lead,PI_bass,PS_grace32
+.exportzp pently_resume_song
+.export pently_rehearsal_marks, pently_resume_rows:absolute
+.export pently_rehearsal_snapshots
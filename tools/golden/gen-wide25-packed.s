@@ -0,0 +1,102 @@
+; Generated using Pently music assembler
+; Music from generated/wide25.pently
+; title: <?>
+; author: <?>
+; copyright: <?>
+;
+PENTLY_NUM_SONGS=1
+PENTLY_NUM_SOUNDS=3
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 3 entries, 40 bytes
+sfxdef PE_hat, PEDAT_hat, 5, 1, 3
+sfxdef PE_kick, PEDAT_kick, 5, 1, 3
+sfxdef PE_trikick, PEDAT_trikick, 4, 1, 2
+PEDAT_hat:
+.byte 6,3,4,3,3,3,2,3,1,3
+PEDAT_kick:
+.byte 10,6,8,5,6,4,4,4,2,4
+PEDAT_trikick:
+.byte 143,31,143,27,143,24,130,21
+pently_instruments:  ; 2 entries, 13 bytes
+instdef PI_lead, 2, 6, 1, 0, PIDAT_lead, 3
+instdef PI_bass, 2, 8, 0, 0, 0, 0
+PIDAT_lead:
+.byte 156,154,152
+pently_drums:  ; 3 entries, 6 bytes
+drumdef DR_hat,PE_hat,$80
+drumdef DR_kick,PE_kick,PE_trikick
+drumdef DR_kickhat,PE_hat,PE_trikick
+pently_patterns:  ; 1 entry, 23 bytes
+patdef PP_wide25_wide25_up, PPDAT_wide25_wide25_up
+PPDAT_wide25_wide25_up:
+.byte N_C|D_8,TRANSPOSE,<1,N_CHH|D_8,N_B|D_8,N_C|D_8,N_BH|D_8,TRANSPOSE,<-1
+.byte N_C|D_8,N_C,N_CHH,N_CS,N_CH,TRANSPOSE,<25,N_C,TRANSPOSE,<-25,N_C,PATEND
+pently_songs:  ; 1 entry, 20 bytes
+songdef PS_wide25, PSDAT_wide25
+PSDAT_wide25:
+; title: wide25
+playPatSq1 PP_wide25_wide25_up, 15, PI_lead
+playPatSq2 PP_wide25_wide25_up, 40, PI_lead
+playPatTri PP_wide25_wide25_up, 27, PI_bass
+setTempoEntry 16
+setBeatDuration D_4
+waitRows 32  ; end at 0:04.00
+fine
+pently_tempo_table:
+.word 5452,6554,2726,3277,1363,1638,682,819  ; 300 rows/min
+.word 8724,10486,4362,5243,2181,2621,1090,1311  ; 480 rows/min
+pentlyseq_end:
+
+; references to subsequences
+pently_resume_mute = $00
+
+; Total music data size: 134 bytes
+; pently_sfx_table: 40 bytes
+;   PE_hat: 14 bytes
+;   PE_kick: 14 bytes
+;   PE_trikick: 12 bytes
+; pently_instruments: 13 bytes
+;   PI_lead: 8 bytes
+;   PI_bass: 5 bytes
+; pently_drums: 6 bytes
+;   DR_hat: 2 bytes
+;   DR_kick: 2 bytes
+;   DR_kickhat: 2 bytes
+; pently_patterns: 23 bytes
+;   PP_wide25_wide25_up: 23 bytes
+; pently_songs: 20 bytes
+;   PS_wide25: 20 bytes
+; pently_tempo_table: 32 bytes
+;
+; Breakdown by song
+;   Shared: 91 bytes
+;   Song wide25: 43 bytes
+
+; Rehearsal mark data begin
+pently_rehearsal_marks:
+.addr PRM_wide25
+
+PRM_wide25:
+.byte  0  ; number of rehearsal marks
+.byte  0  ; reserved
+
+pently_rehearsal_snapshots:
+.addr PRS_wide25
+
+PRS_wide25:
+pently_resume_song = 0
+pently_resume_rows = 0
+; Rehearsal mark end
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs,pently_tempo_table
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute,PE_hat,PE_kick
+.exportzp PE_trikick,PI_lead,PI_bass,PS_wide25
+.exportzp pently_resume_song
+.export pently_rehearsal_marks, pently_resume_rows:absolute
+.export pently_rehearsal_snapshots
@@ -0,0 +1,1793 @@
+; Generated using Pently music assembler
+; in ASM6 mode
+; Music from audio/musicseq.pently
+; title: Pently demo
+; author: DJ Tepples
+; copyright: 2019 Damian Yerrick
+;
+PENTLY_NUM_SONGS=10
+PENTLY_NUM_SOUNDS=15
+pently_sfx_table:  ; 15 entries, 330 bytes
+PE_kick = 0
+PE_snare = 0
+PE_hihat = 0
+PE_openhat = 0
+PE_snarehat = 0
+PE_trikick = 0
+PE_trisnare = 0
+PE_quiethat = 0
+PE_shorthat = 0
+PE_tubfloorA = 0
+PE_arghatbuzz = 0
+PE_stickskick = 0
+PE_stickshatlo = 0
+PE_longkick = 0
+PE_longsnare = 0
+PENTLY_sfxdef PE_kick, PEDAT_kick, 10, 1, 3
+PENTLY_sfxdef PE_snare, PEDAT_snare, 10, 1, 3
+PENTLY_sfxdef PE_hihat, PEDAT_hihat, 4, 1, 3
+PENTLY_sfxdef PE_openhat, PEDAT_openhat, 15, 1, 3
+PENTLY_sfxdef PE_snarehat, PEDAT_snarehat, 15, 1, 3
+PENTLY_sfxdef PE_trikick, PEDAT_trikick, 5, 1, 2
+PENTLY_sfxdef PE_trisnare, PEDAT_trisnare, 4, 1, 2
+PENTLY_sfxdef PE_quiethat, PEDAT_quiethat, 1, 1, 3
+PENTLY_sfxdef PE_shorthat, PEDAT_shorthat, 1, 1, 3
+PENTLY_sfxdef PE_tubfloorA, PEDAT_tubfloorA, 12, 1, 0
+PENTLY_sfxdef PE_arghatbuzz, PEDAT_arghatbuzz, 6, 1, 3
+PENTLY_sfxdef PE_stickskick, PEDAT_stickskick, 12, 1, 3
+PENTLY_sfxdef PE_stickshatlo, PEDAT_stickshatlo, 6, 1, 3
+PENTLY_sfxdef PE_longkick, PEDAT_longkick, 17, 1, 3
+PENTLY_sfxdef PE_longsnare, PEDAT_longsnare, 17, 1, 3
+PEDAT_kick:
+.byte 12,5,10,15,8,15,6,15,5,15,4,15,3,15,2,15,1,15,1,15
+PEDAT_snare:
+.byte 12,11,10,5,8,5,6,5,5,5,4,5,3,5,2,5,1,5,1,5
+PEDAT_hihat:
+.byte 4,3,2,131,2,3,1,131
+PEDAT_openhat:
+.byte 6,3,5,131,4,3,4,131,3,3,3,131,3,3,2,131,2,3,2,131,1,3,1,131,1,3,1,131,1,3
+PEDAT_snarehat:
+.byte 12,11,10,5,8,5,6,131,3,3,3,131,3,3,2,131,2,3,2,131,1,3,1,131,1,3,1,131,1
+.byte 3
+PEDAT_trikick:
+.byte 143,31,143,27,143,24,130,21,130,19
+PEDAT_trisnare:
+.byte 143,37,143,35,130,34,130,33
+PEDAT_tubfloorA:
+.byte 76,6,74,2,136,2,135,1,134,0,133,0,132,0,132,0,131,0,131,0,130,0,129,0
+PEDAT_arghatbuzz:
+.byte 4,3,2,131,3,136,2,136,2,136,1,136
+PEDAT_stickskick:
+.byte 4,140,6,139,5,138,4,138,3,138,3,139,2,138,2,139,1,139,1,139,1,139,1,139
+PEDAT_stickshatlo:
+.byte 4,137,6,137,3,137,2,137,1,137,1,137
+PEDAT_longkick:
+.byte 12,5,11,15,10,15,9,15,8,15,7,15,6,15,4,15,3,15,3,15,2,15,2,15,2,15,1,15,1
+.byte 15,1,15,1,15
+PEDAT_longsnare:
+.byte 12,11,11,5,10,5,9,5,8,5,7,5,6,5,4,5,3,5,3,5,2,5,2,5,2,5,1,5,1,5,1,5,1,5
+pently_instruments:  ; 26 entries, 308 bytes
+PI_bass = 0
+PI_framepop = 0
+PI_banjo = 0
+PI_latebanjo = 0
+PI_tubbass = 0
+PI_tubbass_slow = 0
+PI_dut = 0
+PI_feat_wah = 0
+PI_feat_power = 0
+PI_bf98_flute = 0
+PI_bf98_flute2 = 0
+PI_bf98_osti = 0
+PI_orchhit = 0
+PI_crashcymbal = 0
+PI_fiddle2 = 0
+PI_bf98_fluteshort = 0
+PI_vowele = 0
+PI_vowela = 0
+PI_argtwinkle = 0
+PI_arg2bass = 0
+PI_toot0 = 0
+PI_stringlead = 0
+PI_isopiano = 0
+PI_isotinkle = 0
+PI_isobeep = 0
+PI_isobeepsq = 0
+PENTLY_instdef PI_bass, 2, 8, 0, 0, 0, 0
+PENTLY_instdef PI_framepop, 2, 0, 0, 0, PIDAT_framepop, 1
+PENTLY_instdef PI_banjo, 0, 2, 1, 0, PIDAT_banjo, 8
+PENTLY_instdef PI_latebanjo, 0, 2, 1, 0, PIDAT_latebanjo, 9
+PENTLY_instdef PI_tubbass, 2, 4, 2, 0, PIDAT_tubbass, 6
+PENTLY_instdef PI_tubbass_slow, 2, 8, 1, 0, PIDAT_tubbass_slow, 8
+PENTLY_instdef PI_dut, 0, 0, 16, 0, PIDAT_dut, 9
+PENTLY_instdef PI_feat_wah, 0, 3, 1, 0, PIDAT_feat_wah, 12
+PENTLY_instdef PI_feat_power, 0, 8, 0, 0, 0, 0
+PENTLY_instdef PI_bf98_flute, 2, 5, 0, 0, PIDAT_bf98_flute, 7
+PENTLY_instdef PI_bf98_flute2, 2, 4, 0, 0, PIDAT_bf98_flute2, 7
+PENTLY_instdef PI_bf98_osti, 0, 5, 0, 1, PIDAT_bf98_osti, 4
+PENTLY_instdef PI_orchhit, 1, 0, 0, 0, PIDAT_orchhit, 24
+PENTLY_instdef PI_crashcymbal, 0, 7, 2, 0, 0, 0
+PENTLY_instdef PI_fiddle2, 1, 4, 0, 1, PIDAT_fiddle2, 5
+PENTLY_instdef PI_bf98_fluteshort, 2, 5, 0, 0, PIDAT_bf98_fluteshort, 4
+PENTLY_instdef PI_vowele, 1, 5, 0, 0, PIDAT_vowele, 7
+PENTLY_instdef PI_vowela, 0, 5, 0, 0, PIDAT_vowela, 7
+PENTLY_instdef PI_argtwinkle, 2, 2, 1, 0, PIDAT_argtwinkle, 10
+PENTLY_instdef PI_arg2bass, 2, 10, 20, 0, 0, 0
+PENTLY_instdef PI_toot0, 2, 2, 8, 0, PIDAT_toot0, 7
+PENTLY_instdef PI_stringlead, 0, 3, 0, 0, PIDAT_stringlead, 9
+PENTLY_instdef PI_isopiano, 1, 7, 2, 0, PIDAT_isopiano, 1
+PENTLY_instdef PI_isotinkle, 1, 0, 0, 0, PIDAT_isotinkle, 2
+PENTLY_instdef PI_isobeep, 2, 8, 18, 0, 0, 0
+PENTLY_instdef PI_isobeepsq, 0, 4, 8, 0, 0, 0
+PIDAT_framepop:
+.byte 158
+PIDAT_latebanjo:
+.byte 16,28,24,22,21,20,20,19,19
+PIDAT_tubbass:
+.byte 76,6,74,4,136,2,135,1,150,149
+PIDAT_tubbass_slow:
+.byte 14,6,13,4,76,2,75,1,154,153,153,153
+PIDAT_dut:
+.byte 140,253,76,255,27,24,6,255,5,255,4,254,2,253,1,251
+PIDAT_feat_wah:
+.byte 152,152,151,151,150,150,85,85,85,84,84,84
+PIDAT_bf98_flute2:
+.byte 148,150,151,150,150,149,149
+PIDAT_bf98_osti:
+.byte 19,22,23,22
+PIDAT_orchhit:
+.byte 72,12,88,72,244,71,12,87,71,244,70,12,86,70,244,69,12,85,69,244,68,12,84
+.byte 68,244,67,12,83,67,244,66,12,82,66,244,65,12,81,65,244
+PIDAT_fiddle2:
+.byte 83,85,86,85,85
+PIDAT_vowele:
+.byte 84,86,87,86,86,85,85
+PIDAT_vowela:
+.byte 20,22,23,22,22,21,21
+PIDAT_argtwinkle:
+.byte 151,150,150,149,149,148,148,148,148,148
+PIDAT_toot0:
+.byte 148,151,152,152,151,149,147
+PIDAT_stringlead:
+.byte 20,23,24,24,23,23,21,20,20
+PIDAT_isotinkle:
+.byte 153,85
+pently_drums:  ; 15 entries, 30 bytes
+DR_kick = 0
+DR_snare = 0
+DR_clhat = 0
+DR_ohat = 0
+DR_tkick = 0
+DR_tsnare = 0
+DR_tsohat = 0
+DR_tubkick = 0
+DR_arghatbuzz = 0
+DR_quiethat = 0
+DR_shorthat = 0
+DR_stickskick = 0
+DR_stickshatlo = 0
+DR_lkick = 0
+DR_lsnare = 0
+PENTLY_drumdef DR_kick,PE_kick,$80
+PENTLY_drumdef DR_snare,PE_snare,$80
+PENTLY_drumdef DR_clhat,PE_hihat,$80
+PENTLY_drumdef DR_ohat,PE_openhat,$80
+PENTLY_drumdef DR_tkick,PE_kick,PE_trikick
+PENTLY_drumdef DR_tsnare,PE_snare,PE_trisnare
+PENTLY_drumdef DR_tsohat,PE_snarehat,PE_trisnare
+PENTLY_drumdef DR_tubkick,PE_kick,PE_tubfloorA
+PENTLY_drumdef DR_arghatbuzz,PE_arghatbuzz,$80
+PENTLY_drumdef DR_quiethat,PE_quiethat,$80
+PENTLY_drumdef DR_shorthat,PE_shorthat,$80
+PENTLY_drumdef DR_stickskick,PE_stickskick,$80
+PENTLY_drumdef DR_stickshatlo,PE_stickshatlo,$80
+PENTLY_drumdef DR_lkick,PE_longkick,PE_trikick
+PENTLY_drumdef DR_lsnare,PE_longsnare,PE_trisnare
+pently_patterns:  ; 95 entries, 2649 bytes
+PP_argument_drum34 = 0
+PP_argument_drum34_8 = 0
+PP_argument_commemorate3 = 0
+PP_argument_tubbassloop = 0
+PP_argument_intro_dut = 0
+PP_argument_bass = 0
+PP_argument_melody = 0
+PP_argument_melodyend = 0
+PP_argument_descendingchords = 0
+PP_argument_twinkle = 0
+PP_argument_cadenzabass = 0
+PP_argument_cadenza = 0
+PP_argument_cadenzaend = 0
+PP_argument_cadenzaend2 = 0
+PP_argument_cadenzaend3 = 0
+PP_argument_drum68 = 0
+PP_argument_drum68nokick = 0
+PP_argument_drum68allkick = 0
+PP_argument_drum68top = 0
+PP_argument_bass68 = 0
+PP_argument_harmony68_1 = 0
+PP_argument_harmony68_2 = 0
+PP_argument_harmony68_3 = 0
+PP_argument_melody68 = 0
+PP_argument_bass68end = 0
+PP_argument_drum68topend = 0
+PP_Isometry_triosti = 0
+PP_Isometry_trifill = 0
+PP_Isometry_tinkle1 = 0
+PP_Isometry_tinkle2 = 0
+PP_Isometry_tinkle3 = 0
+PP_Isometry_melmin1 = 0
+PP_Isometry_melmaj1 = 0
+PP_Isometry_melmin2 = 0
+PP_Isometry_melmaj2 = 0
+PP_Isometry_drum = 0
+PP_Isometry_drumfill = 0
+PP_Isometry_restperiod1 = 0
+PP_Isometry_restperiod2 = 0
+PP_Sticks_introbanjo1 = 0
+PP_Sticks_introch2 = 0
+PP_Sticks_introbanjo2 = 0
+PP_Sticks_introbass = 0
+PP_Sticks_introdrum = 0
+PP_Sticks_bassstart = 0
+PP_Sticks_bass = 0
+PP_Sticks_chords1start = 0
+PP_Sticks_chords1 = 0
+PP_Sticks_chords2 = 0
+PP_Sticks_drum = 0
+PP_Sticks_v_iv_bass = 0
+PP_Sticks_v_iv_chords1 = 0
+PP_Sticks_v_iv_chords2 = 0
+PP_twinkle_melody = 0
+PP_twinkle_bassline = 0
+PP_twinkle_bassfinal = 0
+PP_twinkle_beat = 0
+PP_canon_bass = 0
+PP_canon_melody = 0
+PP_bf98_orchhits = 0
+PP_bf98_drums = 0
+PP_bf98_drums_resumefill = 0
+PP_bf98_drums_tripletfill = 0
+PP_bf98_drums_quietfill = 0
+PP_bf98_drums_break = 0
+PP_bf98_bassA = 0
+PP_bf98_melodyA = 0
+PP_bf98_thirdsA = 0
+PP_bf98_osti1 = 0
+PP_bf98_osti2 = 0
+PP_bf98_melodyB1 = 0
+PP_bf98_counterB1 = 0
+PP_bf98_bassB1 = 0
+PP_bf98_melodyB2 = 0
+PP_bf98_counterB2 = 0
+PP_bf98_bassB2 = 0
+PP_arp_waltz_bass1 = 0
+PP_arp_waltz_bass2 = 0
+PP_arp_waltz_bassintro = 0
+PP_arp_waltz_melody = 0
+PP_allfeatures_between = 0
+PP_allfeatures_drumfill = 0
+PP_allfeatures_drum = 0
+PP_allfeatures_chords = 0
+PP_allfeatures_bass = 0
+PP_Stairs_lead1 = 0
+PP_Stairs_lead1end = 0
+PP_Stairs_introg = 0
+PP_Stairs_bass = 0
+PP_Stairs_lead2 = 0
+PP_Stairs_lead2end = 0
+PP_attacktest_drumfill = 0
+PP_attacktest_drums = 0
+PP_attacktest_bass = 0
+PP_attacktest_atk = 0
+PENTLY_patdef PP_argument_drum34, PPDAT_argument_drum34
+PENTLY_patdef PP_argument_drum34_8, PPDAT_argument_drum34_8
+PENTLY_patdef PP_argument_commemorate3, PPDAT_argument_commemorate3
+PENTLY_patdef PP_argument_tubbassloop, PPDAT_argument_tubbassloop
+PENTLY_patdef PP_argument_intro_dut, PPDAT_argument_intro_dut
+PENTLY_patdef PP_argument_bass, PPDAT_argument_bass
+PENTLY_patdef PP_argument_melody, PPDAT_argument_melody
+PENTLY_patdef PP_argument_melodyend, PPDAT_argument_melodyend
+PENTLY_patdef PP_argument_descendingchords, PPDAT_argument_descendingchords
+PENTLY_patdef PP_argument_twinkle, PPDAT_argument_twinkle
+PENTLY_patdef PP_argument_cadenzabass, PPDAT_argument_cadenzabass
+PENTLY_patdef PP_argument_cadenza, PPDAT_argument_cadenza
+PENTLY_patdef PP_argument_cadenzaend, PPDAT_argument_cadenzaend
+PENTLY_patdef PP_argument_cadenzaend2, PPDAT_argument_cadenzaend2
+PENTLY_patdef PP_argument_cadenzaend3, PPDAT_argument_cadenzaend3
+PENTLY_patdef PP_argument_drum68, PPDAT_argument_drum68
+PENTLY_patdef PP_argument_drum68nokick, PPDAT_argument_drum68nokick
+PENTLY_patdef PP_argument_drum68allkick, PPDAT_argument_drum68allkick
+PENTLY_patdef PP_argument_drum68top, PPDAT_argument_drum68top
+PENTLY_patdef PP_argument_bass68, PPDAT_argument_bass68
+PENTLY_patdef PP_argument_harmony68_1, PPDAT_argument_harmony68_1
+PENTLY_patdef PP_argument_harmony68_2, PPDAT_argument_harmony68_2
+PENTLY_patdef PP_argument_harmony68_3, PPDAT_argument_harmony68_3
+PENTLY_patdef PP_argument_melody68, PPDAT_argument_melody68
+PENTLY_patdef PP_argument_bass68end, PPDAT_argument_bass68end
+PENTLY_patdef PP_argument_drum68topend, PPDAT_argument_drum68topend
+PENTLY_patdef PP_Isometry_triosti, PPDAT_Isometry_triosti
+PENTLY_patdef PP_Isometry_trifill, PPDAT_Isometry_trifill
+PENTLY_patdef PP_Isometry_tinkle1, PPDAT_Isometry_tinkle1
+PENTLY_patdef PP_Isometry_tinkle2, PPDAT_Isometry_tinkle2
+PENTLY_patdef PP_Isometry_tinkle3, PPDAT_Isometry_tinkle3
+PENTLY_patdef PP_Isometry_melmin1, PPDAT_Isometry_melmin1
+PENTLY_patdef PP_Isometry_melmaj1, PPDAT_Isometry_melmaj1
+PENTLY_patdef PP_Isometry_melmin2, PPDAT_Isometry_melmin2
+PENTLY_patdef PP_Isometry_melmaj2, PPDAT_Isometry_melmaj2
+PENTLY_patdef PP_Isometry_drum, PPDAT_Isometry_drum
+PENTLY_patdef PP_Isometry_drumfill, PPDAT_Isometry_drumfill
+PENTLY_patdef PP_Isometry_restperiod1, PPDAT_Isometry_restperiod1
+PENTLY_patdef PP_Isometry_restperiod2, PPDAT_Isometry_restperiod2
+PENTLY_patdef PP_Sticks_introbanjo1, PPDAT_Sticks_introbanjo1
+PENTLY_patdef PP_Sticks_introch2, PPDAT_Sticks_introch2
+PENTLY_patdef PP_Sticks_introbanjo2, PPDAT_Sticks_introbanjo2
+PENTLY_patdef PP_Sticks_introbass, PPDAT_Sticks_introbass
+PENTLY_patdef PP_Sticks_introdrum, PPDAT_Sticks_introdrum
+PENTLY_patdef PP_Sticks_bassstart, PPDAT_Sticks_bassstart
+PENTLY_patdef PP_Sticks_bass, PPDAT_Sticks_bass
+PENTLY_patdef PP_Sticks_chords1start, PPDAT_Sticks_chords1start
+PENTLY_patdef PP_Sticks_chords1, PPDAT_Sticks_chords1
+PENTLY_patdef PP_Sticks_chords2, PPDAT_Sticks_chords2
+PENTLY_patdef PP_Sticks_drum, PPDAT_Sticks_drum
+PENTLY_patdef PP_Sticks_v_iv_bass, PPDAT_Sticks_v_iv_bass
+PENTLY_patdef PP_Sticks_v_iv_chords1, PPDAT_Sticks_v_iv_chords1
+PENTLY_patdef PP_Sticks_v_iv_chords2, PPDAT_Sticks_v_iv_chords2
+PENTLY_patdef PP_twinkle_melody, PPDAT_twinkle_melody
+PENTLY_patdef PP_twinkle_bassline, PPDAT_twinkle_bassline
+PENTLY_patdef PP_twinkle_bassfinal, PPDAT_twinkle_bassfinal
+PENTLY_patdef PP_twinkle_beat, PPDAT_twinkle_beat
+PENTLY_patdef PP_canon_bass, PPDAT_canon_bass
+PENTLY_patdef PP_canon_melody, PPDAT_canon_melody
+PENTLY_patdef PP_bf98_orchhits, PPDAT_bf98_orchhits
+PENTLY_patdef PP_bf98_drums, PPDAT_bf98_drums
+PENTLY_patdef PP_bf98_drums_resumefill, PPDAT_bf98_drums_resumefill
+PENTLY_patdef PP_bf98_drums_tripletfill, PPDAT_bf98_drums_tripletfill
+PENTLY_patdef PP_bf98_drums_quietfill, PPDAT_bf98_drums_quietfill
+PENTLY_patdef PP_bf98_drums_break, PPDAT_bf98_drums_break
+PENTLY_patdef PP_bf98_bassA, PPDAT_bf98_bassA
+PENTLY_patdef PP_bf98_melodyA, PPDAT_bf98_melodyA
+PENTLY_patdef PP_bf98_thirdsA, PPDAT_bf98_thirdsA
+PENTLY_patdef PP_bf98_osti1, PPDAT_bf98_osti1
+PENTLY_patdef PP_bf98_osti2, PPDAT_bf98_osti2
+PENTLY_patdef PP_bf98_melodyB1, PPDAT_bf98_melodyB1
+PENTLY_patdef PP_bf98_counterB1, PPDAT_bf98_counterB1
+PENTLY_patdef PP_bf98_bassB1, PPDAT_bf98_bassB1
+PENTLY_patdef PP_bf98_melodyB2, PPDAT_bf98_melodyB2
+PENTLY_patdef PP_bf98_counterB2, PPDAT_bf98_counterB2
+PENTLY_patdef PP_bf98_bassB2, PPDAT_bf98_bassB2
+PENTLY_patdef PP_arp_waltz_bass1, PPDAT_arp_waltz_bass1
+PENTLY_patdef PP_arp_waltz_bass2, PPDAT_arp_waltz_bass2
+PENTLY_patdef PP_arp_waltz_bassintro, PPDAT_arp_waltz_bassintro
+PENTLY_patdef PP_arp_waltz_melody, PPDAT_arp_waltz_melody
+PENTLY_patdef PP_allfeatures_between, PPDAT_allfeatures_between
+PENTLY_patdef PP_allfeatures_drumfill, PPDAT_allfeatures_drumfill
+PENTLY_patdef PP_allfeatures_drum, PPDAT_allfeatures_drum
+PENTLY_patdef PP_allfeatures_chords, PPDAT_allfeatures_chords
+PENTLY_patdef PP_allfeatures_bass, PPDAT_allfeatures_bass
+PENTLY_patdef PP_Stairs_lead1, PPDAT_Stairs_lead1
+PENTLY_patdef PP_Stairs_lead1end, PPDAT_Stairs_lead1end
+PENTLY_patdef PP_Stairs_introg, PPDAT_Stairs_introg
+PENTLY_patdef PP_Stairs_bass, PPDAT_Stairs_bass
+PENTLY_patdef PP_Stairs_lead2, PPDAT_Stairs_lead2
+PENTLY_patdef PP_Stairs_lead2end, PPDAT_Stairs_lead2end
+PENTLY_patdef PP_attacktest_drumfill, PPDAT_attacktest_drumfill
+PENTLY_patdef PP_attacktest_drums, PPDAT_attacktest_drums
+PENTLY_patdef PP_attacktest_bass, PPDAT_attacktest_bass
+PENTLY_patdef PP_attacktest_atk, PPDAT_attacktest_atk
+PPDAT_argument_drum34:
+.byte DR_tubkick|PENTLY_D_8,DR_shorthat|PENTLY_D_8,DR_shorthat|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_argument_drum34_8:
+.byte DR_tubkick,DR_quiethat,DR_shorthat,DR_arghatbuzz,DR_shorthat,DR_quiethat
+.byte PENTLY_PATEND
+PPDAT_argument_commemorate3:
+.byte PENTLY_INSTRUMENT,PI_vowele,PENTLY_N_D,PENTLY_N_F,PENTLY_REST,PENTLY_N_E
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_INSTRUMENT,PI_vowela,PENTLY_N_F,PENTLY_GRACE,4,PENTLY_N_TIE
+.byte PENTLY_INSTRUMENT,PI_vowele,PENTLY_N_E|PENTLY_D_8,PENTLY_N_DS
+.byte PENTLY_GRACE,4,PENTLY_N_TIE,PENTLY_INSTRUMENT,PI_bf98_flute2
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_INSTRUMENT,PI_vowele,PENTLY_N_FS
+.byte PENTLY_GRACE,4,PENTLY_REST,PENTLY_INSTRUMENT,PI_bf98_flute2
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_INSTRUMENT,PI_vowela,PENTLY_N_D
+.byte PENTLY_GRACE,4,PENTLY_REST,PENTLY_INSTRUMENT,PI_vowele
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_INSTRUMENT,PI_bf98_flute2
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_INSTRUMENT,PI_bf98_flute2,PENTLY_N_CS
+.byte PENTLY_INSTRUMENT,PI_vowela,PENTLY_GRACE,7,PENTLY_N_DS,PENTLY_REST
+.byte PENTLY_INSTRUMENT,PI_vowele,PENTLY_N_CS,PENTLY_INSTRUMENT,PI_bf98_flute2
+.byte PENTLY_N_F,PENTLY_GRACE,4,PENTLY_N_TIE,PENTLY_INSTRUMENT,PI_vowele
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_CS,PENTLY_GRACE,4,PENTLY_REST
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CS
+.byte PENTLY_INSTRUMENT,PI_bf98_flute2,PENTLY_GRACE,4,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_INSTRUMENT,PI_vowele,PENTLY_N_CS
+.byte PENTLY_INSTRUMENT,PI_vowela,PENTLY_N_C,PENTLY_REST,PENTLY_GRACE,4
+.byte PENTLY_N_G,PENTLY_N_C|PENTLY_D_8,PENTLY_INSTRUMENT,PI_vowele
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST|PENTLY_D_4,PENTLY_PATEND
+PPDAT_argument_tubbassloop:
+.byte PENTLY_INSTRUMENT,PI_tubbass_slow,PENTLY_N_CS,PENTLY_LEGATO_ON
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_D8,PENTLY_LEGATO_OFF
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_argument_intro_dut:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C
+.byte PENTLY_PATEND
+PPDAT_argument_bass:
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_DH,PENTLY_N_D|PENTLY_D_8,PENTLY_N_DH
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH,PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_GH,PENTLY_N_G|PENTLY_D_8,PENTLY_N_GH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_argument_melody:
+.byte PENTLY_N_E|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_E|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_argument_melodyend:
+.byte PENTLY_N_C,PENTLY_N_CS,PENTLY_REST|PENTLY_D_4,PENTLY_PATEND
+PPDAT_argument_descendingchords:
+.byte PENTLY_N_CHH,PENTLY_N_GSH,PENTLY_N_FH,PENTLY_N_CH,PENTLY_N_GS,PENTLY_N_F
+.byte PENTLY_N_C,PENTLY_TRANSPOSE,<-19,PENTLY_N_DSH,PENTLY_N_CH,PENTLY_N_G
+.byte PENTLY_N_DS,PENTLY_N_C,PENTLY_TRANSPOSE,<22,PENTLY_N_CHH,PENTLY_N_AH
+.byte PENTLY_N_FH,PENTLY_N_CH,PENTLY_N_A,PENTLY_N_F,PENTLY_N_C
+.byte PENTLY_TRANSPOSE,<-19,PENTLY_N_EH,PENTLY_N_CH,PENTLY_N_G,PENTLY_N_E
+.byte PENTLY_N_C,PENTLY_TRANSPOSE,<19,PENTLY_N_CHH,PENTLY_N_GH,PENTLY_N_EH
+.byte PENTLY_N_CH,PENTLY_N_G,PENTLY_N_E,PENTLY_N_C,PENTLY_TRANSPOSE,<-20
+.byte PENTLY_N_DSH,PENTLY_N_CH,PENTLY_N_GS,PENTLY_N_DS,PENTLY_N_C
+.byte PENTLY_TRANSPOSE,<19,PENTLY_N_CHH,PENTLY_N_GSH,PENTLY_N_DSH,PENTLY_N_CH
+.byte PENTLY_N_GS,PENTLY_N_DS,PENTLY_N_C,PENTLY_TRANSPOSE,<-21,PENTLY_N_FH
+.byte PENTLY_N_CH,PENTLY_N_A,PENTLY_N_F,PENTLY_N_C,PENTLY_TRANSPOSE,<19
+.byte PENTLY_PATEND
+PPDAT_argument_twinkle:
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_D4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_argument_cadenzabass:
+.byte PENTLY_N_D|PENTLY_D_D2,PENTLY_N_F|PENTLY_D_D2,PENTLY_N_C|PENTLY_D_D2
+.byte PENTLY_N_G|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_argument_cadenza:
+.byte PENTLY_N_AH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_FH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_TRANSPOSE,<-22,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8
+.byte PENTLY_TRANSPOSE,<22,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_PATEND
+PPDAT_argument_cadenzaend:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8
+.byte PENTLY_N_CHH|PENTLY_D_8,PENTLY_TRANSPOSE,<23,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_CHH,PENTLY_N_ASH,PENTLY_N_GSH
+.byte PENTLY_N_FH,PENTLY_N_DSH,PENTLY_N_CH,PENTLY_N_AS,PENTLY_N_GS,PENTLY_N_F
+.byte PENTLY_N_DS,PENTLY_N_C,PENTLY_TRANSPOSE,<-5,PENTLY_N_DS
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_BEND,$01
+.byte PENTLY_TRANSPOSE,<-24,PENTLY_N_C|PENTLY_D_8,PENTLY_TRANSPOSE,<6
+.byte PENTLY_PATEND
+PPDAT_argument_cadenzaend2:
+.byte PENTLY_N_CHH,PENTLY_N_ASH,PENTLY_N_GH,PENTLY_N_FH,PENTLY_N_DSH
+.byte PENTLY_N_CH,PENTLY_N_AS,PENTLY_N_G,PENTLY_N_F,PENTLY_N_DS,PENTLY_N_C
+.byte PENTLY_TRANSPOSE,<-7,PENTLY_N_F,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_TRANSPOSE,<7,PENTLY_PATEND
+PPDAT_argument_cadenzaend3:
+.byte PENTLY_N_CHH|PENTLY_D_4,PENTLY_BEND,$01,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_argument_drum68:
+.byte DR_tkick,DR_quiethat,DR_quiethat
+PPDAT_argument_drum68nokick:
+.byte DR_shorthat,DR_quiethat,DR_quiethat,PENTLY_PATEND
+PPDAT_argument_drum68allkick:
+.byte DR_tkick,DR_quiethat,DR_quiethat,PENTLY_PATEND
+PPDAT_argument_drum68top:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_argument_bass68:
+.byte PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D
+.byte PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D,PENTLY_N_D
+.byte PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F
+.byte PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F
+.byte PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C
+.byte PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C,PENTLY_N_C
+.byte PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G
+.byte PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G
+.byte PENTLY_PATEND
+PPDAT_argument_harmony68_1:
+.byte PENTLY_BEND,$00,PENTLY_N_C,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_DS,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D4,PENTLY_N_DS
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_N_D,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_argument_harmony68_2:
+.byte PENTLY_BEND,$00,PENTLY_N_D|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_PATEND
+PPDAT_argument_harmony68_3:
+.byte PENTLY_N_C,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_E,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D4,PENTLY_N_D
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_N_D,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_argument_melody68:
+.byte PENTLY_N_A,PENTLY_N_D,PENTLY_N_F,PENTLY_N_A,PENTLY_N_G,PENTLY_N_F
+.byte PENTLY_N_G,PENTLY_REST,PENTLY_N_A,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CH
+.byte PENTLY_N_C,PENTLY_N_F,PENTLY_N_A,PENTLY_N_G,PENTLY_N_F,PENTLY_N_G
+.byte PENTLY_REST,PENTLY_N_A,PENTLY_REST,PENTLY_N_G,PENTLY_N_F,PENTLY_N_CH
+.byte PENTLY_N_C,PENTLY_N_E,PENTLY_N_G,PENTLY_N_F,PENTLY_N_E,PENTLY_N_F
+.byte PENTLY_REST,PENTLY_N_G,PENTLY_REST|PENTLY_D_D8,PENTLY_N_B,PENTLY_N_D
+.byte PENTLY_N_G,PENTLY_N_B,PENTLY_N_A,PENTLY_N_G,PENTLY_REST
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_CSH,PENTLY_N_DH,PENTLY_PATEND
+PPDAT_argument_bass68end:
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_argument_drum68topend:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_Isometry_triosti:
+.byte PENTLY_N_C,PENTLY_PATEND
+PPDAT_Isometry_trifill:
+.byte PENTLY_N_C,PENTLY_REST|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_Isometry_tinkle1:
+.byte PENTLY_N_CH,PENTLY_N_GS,PENTLY_N_DS,PENTLY_N_C,PENTLY_PATEND
+PPDAT_Isometry_tinkle2:
+.byte PENTLY_N_B,PENTLY_N_A,PENTLY_N_F,PENTLY_N_C,PENTLY_PATEND
+PPDAT_Isometry_tinkle3:
+.byte PENTLY_N_CH,PENTLY_N_A,PENTLY_N_F,PENTLY_N_C,PENTLY_PATEND
+PPDAT_Isometry_melmin1:
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+PPDAT_Isometry_melmaj1:
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D4
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_Isometry_melmin2:
+.byte PENTLY_N_CS|PENTLY_D_D8,PENTLY_N_CS|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_D8
+.byte PENTLY_N_CS|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+PPDAT_Isometry_melmaj2:
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_Isometry_drum:
+.byte DR_lkick|PENTLY_D_4,DR_lsnare|PENTLY_D_4,DR_clhat|PENTLY_D_4
+.byte DR_lsnare|PENTLY_D_4,DR_clhat|PENTLY_D_4,DR_lsnare|PENTLY_D_4
+.byte DR_clhat|PENTLY_D_4,DR_lsnare|PENTLY_D_4,PENTLY_PATEND
+PPDAT_Isometry_drumfill:
+.byte DR_kick|PENTLY_D_4,PENTLY_PATEND
+PPDAT_Isometry_restperiod1:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_CS|PENTLY_D_D4,PENTLY_N_DS|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_4,PENTLY_PATEND
+PPDAT_Isometry_restperiod2:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_D|PENTLY_D_D4,PENTLY_N_DS|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_4,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_D|PENTLY_D_D4
+.byte PENTLY_N_E|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_4,PENTLY_PATEND
+PPDAT_Sticks_introbanjo1:
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_N_F|PENTLY_D_D4
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_N_DS|PENTLY_D_4,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_Sticks_introch2:
+.byte PENTLY_N_CH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo
+.byte PENTLY_N_ASH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_C|PENTLY_D_D2,PENTLY_INSTRUMENT,PI_toot0
+.byte PENTLY_N_DSH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo
+.byte PENTLY_N_ASH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_DS|PENTLY_D_D2,PENTLY_INSTRUMENT,PI_toot0
+.byte PENTLY_N_FH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo
+.byte PENTLY_N_ASH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_F|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo,PENTLY_N_CH|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_tubbass,PENTLY_TRANSPOSE,<-5,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_banjo,PENTLY_ARPEGGIO,$37,PENTLY_TRANSPOSE,<36
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_tubbass,PENTLY_ARPEGGIO,$00
+.byte PENTLY_TRANSPOSE,<-33,PENTLY_N_C|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo
+.byte PENTLY_ARPEGGIO,$47,PENTLY_TRANSPOSE,<36,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_INSTRUMENT,PI_tubbass,PENTLY_ARPEGGIO,$00,PENTLY_TRANSPOSE,<-36
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_D|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_TRANSPOSE,<2,PENTLY_PATEND
+PPDAT_Sticks_introbanjo2:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_CS|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_D4,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_ARPEGGIO,$47,PENTLY_N_DSH|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_ARPEGGIO,$00,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_Sticks_introbass:
+.byte PENTLY_N_C|PENTLY_D_D2,PENTLY_N_DS|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_Sticks_introdrum:
+.byte DR_clhat|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,DR_clhat|PENTLY_D_8
+.byte DR_clhat|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,DR_clhat|PENTLY_D_8
+.byte DR_clhat|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8,DR_stickskick|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_2,DR_clhat|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_Sticks_bassstart:
+.byte PENTLY_N_TIE|PENTLY_D_4,PENTLY_N_D|PENTLY_D_2,PENTLY_N_D|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_C|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_PATEND
+PPDAT_Sticks_bass:
+.byte PENTLY_INSTRUMENT,PI_toot0,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_INSTRUMENT,PI_isobeep,PENTLY_TRANSPOSE,<29,PENTLY_N_D|PENTLY_D_2
+.byte PENTLY_N_D|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2
+.byte PENTLY_N_C|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8,PENTLY_TRANSPOSE,<-29
+.byte PENTLY_PATEND
+PPDAT_Sticks_chords1start:
+.byte PENTLY_N_TIE|PENTLY_D_4,PENTLY_INSTRUMENT,PI_toot0,PENTLY_N_DS|PENTLY_D_2
+.byte PENTLY_N_CS|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2
+.byte PENTLY_N_C|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8,PENTLY_PATEND
+PPDAT_Sticks_chords1:
+.byte PENTLY_INSTRUMENT,PI_tubbass,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_INSTRUMENT,PI_toot0,PENTLY_TRANSPOSE,<33,PENTLY_N_DS|PENTLY_D_2
+.byte PENTLY_N_CS|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_D8,PENTLY_GRACE,4
+.byte PENTLY_N_TIE,PENTLY_N_CH,PENTLY_GRACE,2,PENTLY_N_TIE,PENTLY_N_CSH
+.byte PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_TIE,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_TRANSPOSE,<-33,PENTLY_N_C|PENTLY_D_4,PENTLY_INSTRUMENT,PI_toot0
+.byte PENTLY_TRANSPOSE,<33,PENTLY_N_DS|PENTLY_D_2,PENTLY_N_CS|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_N_CH|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_D4
+.byte PENTLY_TRANSPOSE,<-33,PENTLY_PATEND
+PPDAT_Sticks_chords2:
+.byte PENTLY_N_TIE|PENTLY_D_4,PENTLY_N_E|PENTLY_D_2,PENTLY_N_D|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2,PENTLY_N_C|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_PATEND
+PPDAT_Sticks_drum:
+.byte DR_stickskick|PENTLY_D_D2,DR_clhat|PENTLY_D_D2,DR_stickshatlo|PENTLY_D_D2
+.byte DR_clhat|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_Sticks_v_iv_bass:
+.byte PENTLY_INSTRUMENT,PI_toot0,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_INSTRUMENT,PI_isobeep,PENTLY_N_CHH|PENTLY_D_2
+.byte PENTLY_N_CHH|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8,PENTLY_TRANSPOSE,<22
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_N_F|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_2,PENTLY_N_C|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_N_C|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_INSTRUMENT,PI_toot0,PENTLY_TRANSPOSE,<-24,PENTLY_N_C|PENTLY_D_D2
+.byte PENTLY_TRANSPOSE,<2,PENTLY_PATEND
+PPDAT_Sticks_v_iv_chords1:
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_CSH|PENTLY_D_2,PENTLY_N_DSH|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_2,PENTLY_N_FH|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_2,PENTLY_N_CSH|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_banjo,PENTLY_N_GS|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_N_C|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_Sticks_v_iv_chords2:
+.byte PENTLY_N_C|PENTLY_D_4,PENTLY_INSTRUMENT,PI_toot0,PENTLY_TRANSPOSE,<17
+.byte PENTLY_N_DH|PENTLY_D_2,PENTLY_N_EH|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_FH|PENTLY_D_2,PENTLY_N_FH|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_2,PENTLY_N_DH|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_D4,PENTLY_INSTRUMENT,PI_banjo
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_INSTRUMENT,PI_tubbass,PENTLY_TRANSPOSE,<-19,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_INSTRUMENT,PI_banjo,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_B|PENTLY_D_4
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_TRANSPOSE,<2,PENTLY_PATEND
+PPDAT_twinkle_melody:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_E|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_E|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D4
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_twinkle_bassline:
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8,PENTLY_N_CH|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_twinkle_bassfinal:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_twinkle_beat:
+.byte DR_tkick|PENTLY_D_D8,DR_clhat|PENTLY_D_D8,DR_tkick|PENTLY_D_D8
+.byte DR_clhat|PENTLY_D_8,DR_clhat,PENTLY_PATEND
+PPDAT_canon_bass:
+.byte PENTLY_N_CH|PENTLY_D_2,PENTLY_N_G|PENTLY_D_2,PENTLY_N_A|PENTLY_D_2
+.byte PENTLY_N_E|PENTLY_D_2,PENTLY_N_F|PENTLY_D_2,PENTLY_N_C|PENTLY_D_2
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_N_G|PENTLY_D_2,PENTLY_PATEND
+PPDAT_canon_melody:
+.byte PENTLY_VIBRATO,1,PENTLY_N_GH|PENTLY_D_2,PENTLY_N_FH|PENTLY_D_2
+.byte PENTLY_N_DSH|PENTLY_D_2,PENTLY_N_DH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_DH|PENTLY_D_2
+.byte PENTLY_N_DSH|PENTLY_D_2,PENTLY_N_DH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_N_GS|PENTLY_D_2,PENTLY_N_G|PENTLY_D_2
+.byte PENTLY_N_GS|PENTLY_D_2,PENTLY_N_F|PENTLY_D_2,PENTLY_N_DS|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_4,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_N_DS|PENTLY_D_4,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_4
+.byte PENTLY_N_CH|PENTLY_D_4,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_4,PENTLY_N_F|PENTLY_D_4
+.byte PENTLY_N_DH|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4
+.byte PENTLY_N_ASH|PENTLY_D_4,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_N_GS|PENTLY_D_4,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4
+.byte PENTLY_N_DS|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_D4
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_CHH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_4
+.byte PENTLY_N_GH|PENTLY_D_4,PENTLY_N_FH|PENTLY_D_2,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_2,PENTLY_N_CHH|PENTLY_D_2
+.byte PENTLY_N_ASH|PENTLY_D_2,PENTLY_N_CHH|PENTLY_D_2,PENTLY_TRANSPOSE,<3
+.byte PENTLY_N_BH|PENTLY_D_2,PENTLY_N_CHH|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_N_B|PENTLY_D_2,PENTLY_REST|PENTLY_D_4,PENTLY_N_A|PENTLY_D_4
+.byte PENTLY_N_CH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_D2,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_N_CH|PENTLY_D_4,PENTLY_N_FH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4
+.byte PENTLY_N_GH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_EH,PENTLY_N_FH
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_EH,PENTLY_N_FH,PENTLY_N_GH,PENTLY_N_G
+.byte PENTLY_N_A,PENTLY_N_B,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_EH,PENTLY_N_FH
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_E,PENTLY_N_F,PENTLY_N_G,PENTLY_N_A,PENTLY_N_G,PENTLY_N_F
+.byte PENTLY_N_G,PENTLY_N_E,PENTLY_N_F,PENTLY_N_G,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_A,PENTLY_N_G,PENTLY_N_F|PENTLY_D_8,PENTLY_N_E,PENTLY_N_D
+.byte PENTLY_N_E,PENTLY_N_D,PENTLY_N_C,PENTLY_N_D,PENTLY_N_E,PENTLY_N_F
+.byte PENTLY_N_G,PENTLY_N_A,PENTLY_N_F|PENTLY_D_8,PENTLY_N_A,PENTLY_N_G
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_B,PENTLY_N_CH,PENTLY_N_G,PENTLY_N_A
+.byte PENTLY_N_B,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_EH,PENTLY_N_FH,PENTLY_N_GH
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_DH,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_B,PENTLY_N_CH,PENTLY_N_DH
+.byte PENTLY_N_EH,PENTLY_N_DH,PENTLY_N_CH,PENTLY_N_B,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_A,PENTLY_N_B,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_C,PENTLY_N_D
+.byte PENTLY_N_E,PENTLY_N_F,PENTLY_N_E,PENTLY_N_D,PENTLY_N_E,PENTLY_N_CH
+.byte PENTLY_N_B,PENTLY_N_CH,PENTLY_N_A|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_B
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_G,PENTLY_N_F,PENTLY_N_G,PENTLY_N_F
+.byte PENTLY_N_E,PENTLY_N_F,PENTLY_N_G,PENTLY_N_A,PENTLY_N_B,PENTLY_N_CH
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_B,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_B,PENTLY_N_A,PENTLY_N_B,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_CH
+.byte PENTLY_N_B,PENTLY_N_CH,PENTLY_N_A,PENTLY_N_B,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_B|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_A|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_C|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_C|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_D|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_E|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_E|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_F|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_DH|PENTLY_D_4,PENTLY_N_EH|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_TRANSPOSE,<-7
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8,PENTLY_N_FSH|PENTLY_D_8
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_FSH|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_AH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_FSH|PENTLY_D_8
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_FSH|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8,PENTLY_N_CHH|PENTLY_D_8
+.byte PENTLY_N_BH|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_BH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_CHH|PENTLY_D_8
+.byte PENTLY_N_BH|PENTLY_D_8,PENTLY_N_CHH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_AH|PENTLY_D_8,PENTLY_N_FSH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_BH|PENTLY_D_8,PENTLY_N_BH|PENTLY_D_8,PENTLY_N_BH|PENTLY_D_8
+.byte PENTLY_N_AH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8,PENTLY_N_AH|PENTLY_D_8
+.byte PENTLY_N_AH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_TRANSPOSE,<6
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8
+.byte PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8
+.byte PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_CHH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_8
+.byte PENTLY_N_CS,PENTLY_N_DS,PENTLY_N_F|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_CSH,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8,PENTLY_TRANSPOSE,<-2
+.byte PENTLY_N_C,PENTLY_N_D,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_GS,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_GS,PENTLY_N_G
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_DS,PENTLY_N_F,PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_AS,PENTLY_N_GS|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_GS
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_DSH,PENTLY_N_DH,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_CH,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_DSH,PENTLY_N_FH
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GH,PENTLY_N_FH,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_AS,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_GH,PENTLY_N_FH
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_DSH,PENTLY_N_DH,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_D2,PENTLY_N_AS|PENTLY_D_4
+.byte PENTLY_N_DS|PENTLY_D_D2,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_2
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_N_GS|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_4
+.byte PENTLY_N_DS|PENTLY_D_D4,PENTLY_N_D|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_4
+.byte PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_N_DS|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_F|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_G|PENTLY_D_D4,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_FH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_D4,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_DSH|PENTLY_D_2
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_D4,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_D4,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8
+.byte PENTLY_N_CHH|PENTLY_D_8,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_GH|PENTLY_D_D4,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_D4,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_D4
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_2
+.byte PENTLY_N_DH|PENTLY_D_2,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_AS|PENTLY_D_2
+.byte PENTLY_N_GS|PENTLY_D_2,PENTLY_N_G|PENTLY_D_2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_F|PENTLY_D_2,PENTLY_N_G|PENTLY_D_4
+.byte PENTLY_N_GH|PENTLY_D_2,PENTLY_N_FH|PENTLY_D_4,PENTLY_N_DSH|PENTLY_D_4
+.byte PENTLY_TRANSPOSE,<3,PENTLY_N_CHH|PENTLY_D_2,PENTLY_N_ASH|PENTLY_D_4
+.byte PENTLY_N_AH|PENTLY_D_2,PENTLY_N_CHH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4
+.byte PENTLY_N_AH|PENTLY_D_2,PENTLY_N_GH|PENTLY_D_2,PENTLY_N_GH|PENTLY_D_2
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_2
+.byte PENTLY_N_EH|PENTLY_D_D4,PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_D2
+.byte PENTLY_N_CH|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_2,PENTLY_N_B|PENTLY_D_2
+.byte PENTLY_N_CH|PENTLY_D_4,PENTLY_N_C|PENTLY_D_4,PENTLY_TRANSPOSE,<-5
+.byte PENTLY_N_E|PENTLY_D_4,PENTLY_N_EH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4
+.byte PENTLY_N_D|PENTLY_D_4,PENTLY_N_C|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_N_AS|PENTLY_D_4,PENTLY_N_ASH|PENTLY_D_4,PENTLY_N_AH|PENTLY_D_4
+.byte PENTLY_N_A|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4,PENTLY_N_AH|PENTLY_D_4
+.byte PENTLY_N_A|PENTLY_D_4,PENTLY_N_G|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4
+.byte PENTLY_N_FH|PENTLY_D_4,PENTLY_N_F|PENTLY_D_4,PENTLY_N_E|PENTLY_D_4
+.byte PENTLY_N_EH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4,PENTLY_TRANSPOSE,<10
+.byte PENTLY_N_EH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4,PENTLY_N_D|PENTLY_D_4
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_A|PENTLY_D_8,PENTLY_N_D|PENTLY_D_4
+.byte PENTLY_N_D|PENTLY_D_4,PENTLY_N_D|PENTLY_D_2,PENTLY_TRANSPOSE,<-8
+.byte PENTLY_PATEND
+PPDAT_bf98_orchhits:
+.byte PENTLY_N_E|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_8,PENTLY_N_F|PENTLY_D_4
+.byte PENTLY_PATEND
+PPDAT_bf98_drums:
+.byte DR_tkick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_tkick,DR_tsnare|PENTLY_D_D8
+.byte DR_tkick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_tkick,DR_tsnare|PENTLY_D_D8
+.byte DR_tkick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_tkick,DR_tsnare|PENTLY_D_D8
+PPDAT_bf98_drums_resumefill:
+.byte DR_tkick|PENTLY_D_8,DR_tsnare,DR_clhat|PENTLY_D_8,DR_tkick
+.byte DR_tsnare|PENTLY_D_8,DR_tsnare,PENTLY_PATEND
+PPDAT_bf98_drums_tripletfill:
+.byte DR_tkick|PENTLY_D_8,DR_clhat,DR_tsnare|PENTLY_D_8,DR_tkick|PENTLY_D_8
+.byte DR_tsnare|PENTLY_D_8,PENTLY_PATEND
+PPDAT_bf98_drums_quietfill:
+.byte DR_tkick|PENTLY_D_D8,DR_clhat|PENTLY_D_D8,DR_clhat|PENTLY_D_D8
+.byte PENTLY_PATEND
+PPDAT_bf98_drums_break:
+.byte DR_tkick|PENTLY_D_D4,DR_clhat|PENTLY_D_8,DR_tkick,PENTLY_PATEND
+PPDAT_bf98_bassA:
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_FS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_GS,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_FS,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CSH,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_bf98_melodyA:
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_GRACE,5,PENTLY_N_GS
+.byte PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_GS|PENTLY_D_4,PENTLY_N_TIE,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_bf98_thirdsA:
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_N_FS
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_E,PENTLY_N_FS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_bf98_osti1:
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_FS,PENTLY_N_A,PENTLY_N_A,PENTLY_N_A
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_FS,PENTLY_REST|PENTLY_D_8,PENTLY_N_E
+.byte PENTLY_N_G,PENTLY_N_G,PENTLY_N_G,PENTLY_N_G|PENTLY_D_8,PENTLY_N_E
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_D,PENTLY_N_FS,PENTLY_N_FS,PENTLY_N_FS
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_D,PENTLY_REST|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_N_E,PENTLY_N_E,PENTLY_N_E,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_PATEND
+PPDAT_bf98_osti2:
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_INSTRUMENT,PI_bf98_osti,PENTLY_N_GH
+.byte PENTLY_N_CHH,PENTLY_N_CHH,PENTLY_N_CHH,PENTLY_N_CHH|PENTLY_D_8
+.byte PENTLY_N_GH,PENTLY_INSTRUMENT,PI_orchhit,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_INSTRUMENT,PI_bf98_osti,PENTLY_N_FH,PENTLY_N_ASH,PENTLY_N_ASH
+.byte PENTLY_N_ASH,PENTLY_N_ASH|PENTLY_D_8,PENTLY_N_FH
+.byte PENTLY_INSTRUMENT,PI_orchhit,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_INSTRUMENT,PI_bf98_osti,PENTLY_N_EH,PENTLY_N_GH,PENTLY_N_GH
+.byte PENTLY_N_GH,PENTLY_N_GH|PENTLY_D_8,PENTLY_N_EH
+.byte PENTLY_INSTRUMENT,PI_orchhit,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_INSTRUMENT,PI_bf98_osti,PENTLY_N_DH,PENTLY_N_FH,PENTLY_N_FH
+.byte PENTLY_N_FH,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_DH
+.byte PENTLY_INSTRUMENT,PI_orchhit,PENTLY_PATEND
+PPDAT_bf98_melodyB1:
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_CS,PENTLY_N_F|PENTLY_D_8,PENTLY_N_GS
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_N_F
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_CS
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_N_F,PENTLY_N_DS|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_CS|PENTLY_D_8,PENTLY_N_DS
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_bf98_counterB1:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_TIE,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_bf98_bassB1:
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CSH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_bf98_melodyB2:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_F,PENTLY_N_E|PENTLY_D_8,PENTLY_N_F
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_E,PENTLY_N_D|PENTLY_D_8,PENTLY_N_E
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_GS,PENTLY_GRACE,4,PENTLY_N_GS
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_GS|PENTLY_D_4,PENTLY_N_TIE,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_bf98_counterB2:
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_FS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST,PENTLY_N_FS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_PATEND
+PPDAT_bf98_bassB2:
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_D|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_B|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_CSH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_REST,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_arp_waltz_bass1:
+.byte PENTLY_N_G,PENTLY_N_BH,PENTLY_N_BH,PENTLY_N_D,PENTLY_N_BH,PENTLY_N_BH
+.byte PENTLY_N_C,PENTLY_N_CHH,PENTLY_N_CHH,PENTLY_N_G,PENTLY_N_CHH,PENTLY_N_CHH
+.byte PENTLY_N_A,PENTLY_N_CHH,PENTLY_N_CHH,PENTLY_N_E,PENTLY_N_CHH,PENTLY_N_CHH
+.byte PENTLY_N_D,PENTLY_N_AH,PENTLY_N_AH,PENTLY_N_A,PENTLY_N_CHH,PENTLY_N_CHH
+.byte PENTLY_PATEND
+PPDAT_arp_waltz_bass2:
+.byte PENTLY_N_C,PENTLY_N_ASH,PENTLY_N_ASH,PENTLY_N_F,PENTLY_N_AH,PENTLY_N_AH
+.byte PENTLY_N_C,PENTLY_N_D,PENTLY_N_E
+PPDAT_arp_waltz_bassintro:
+.byte PENTLY_N_F,PENTLY_N_AH,PENTLY_N_AH,PENTLY_N_C,PENTLY_N_AH,PENTLY_N_AH
+.byte PENTLY_PATEND
+PPDAT_arp_waltz_melody:
+.byte PENTLY_INSTRUMENT,PI_stringlead,PENTLY_SLOWARP,PENTLY_ARPEGGIO,$59
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_ARPEGGIO,$36,PENTLY_N_G,PENTLY_ARPEGGIO,$47
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_ARPEGGIO,$37,PENTLY_N_AS
+.byte PENTLY_ARPEGGIO,$47,PENTLY_N_GS,PENTLY_ARPEGGIO,$38
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_N_F,PENTLY_ARPEGGIO,$47,PENTLY_N_GS
+.byte PENTLY_ARPEGGIO,$37,PENTLY_N_AS|PENTLY_D_8,PENTLY_ARPEGGIO,$47
+.byte PENTLY_N_GS,PENTLY_ARPEGGIO,$38,PENTLY_N_F|PENTLY_D_8,PENTLY_ARPEGGIO,$37
+.byte PENTLY_N_F,PENTLY_ARPEGGIO,$47,PENTLY_N_DS,PENTLY_ARPEGGIO,$36
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_TIE,PENTLY_ARPEGGIO,$59
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_ARPEGGIO,$36,PENTLY_N_G,PENTLY_ARPEGGIO,$47
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_ARPEGGIO,$59,PENTLY_N_DS
+.byte PENTLY_ARPEGGIO,$38,PENTLY_N_F,PENTLY_ARPEGGIO,$59
+.byte PENTLY_N_GS|PENTLY_D_D8,PENTLY_ARPEGGIO,$38,PENTLY_N_G
+.byte PENTLY_ARPEGGIO,$59,PENTLY_N_GS,PENTLY_ARPEGGIO,$38,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_F,PENTLY_ARPEGGIO,$49,PENTLY_N_DS|PENTLY_D_8,PENTLY_ARPEGGIO,$47
+.byte PENTLY_N_DS,PENTLY_ARPEGGIO,$38,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_INSTRUMENT,PI_argtwinkle,PENTLY_SLOWARP
+.byte PENTLY_ARPEGGIO,$70,PENTLY_N_GSH|PENTLY_D_D8,PENTLY_FASTARP
+.byte PENTLY_ARPEGGIO,$7C,PENTLY_N_GSH|PENTLY_D_D8,PENTLY_SLOWARP
+.byte PENTLY_ARPEGGIO,$70,PENTLY_TRANSPOSE,<20,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_FASTARP,PENTLY_ARPEGGIO,$59,PENTLY_N_C|PENTLY_D_D8,PENTLY_SLOWARP
+.byte PENTLY_ARPEGGIO,$70,PENTLY_N_D|PENTLY_D_D8,PENTLY_FASTARP
+.byte PENTLY_ARPEGGIO,$7C,PENTLY_N_D|PENTLY_D_D8,PENTLY_ARPEGGIO,$57
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_ARPEGGIO,$59,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_SLOWARP,PENTLY_ARPEGGIO,$70,PENTLY_N_C|PENTLY_D_D8,PENTLY_FASTARP
+.byte PENTLY_ARPEGGIO,$7C,PENTLY_N_C|PENTLY_D_D8,PENTLY_SLOWARP
+.byte PENTLY_ARPEGGIO,$70,PENTLY_N_F|PENTLY_D_D8,PENTLY_FASTARP
+.byte PENTLY_ARPEGGIO,$4C,PENTLY_N_F|PENTLY_D_D8,PENTLY_ARPEGGIO,$7C
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_ARPEGGIO,$59,PENTLY_N_D|PENTLY_D_D8
+.byte PENTLY_ARPEGGIO,$4C,PENTLY_N_C|PENTLY_D_D4,PENTLY_TRANSPOSE,<-20
+.byte PENTLY_PATEND
+PPDAT_allfeatures_between:
+.byte PENTLY_ARPEGGIO,$00,PENTLY_N_C|PENTLY_D_D4,PENTLY_REST|PENTLY_D_1
+.byte PENTLY_N_TIE|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_1
+.byte PENTLY_PATEND
+PPDAT_allfeatures_drumfill:
+.byte DR_tkick|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_tkick|PENTLY_D_8
+.byte DR_tsnare|PENTLY_D_8,DR_tsnare|PENTLY_D_8,DR_tsnare|PENTLY_D_8
+PPDAT_allfeatures_drum:
+.byte DR_tkick|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_clhat|PENTLY_D_8
+.byte DR_tsnare|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_ohat|PENTLY_D_8
+.byte DR_tkick|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_clhat|PENTLY_D_8
+.byte DR_tsnare|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_tkick|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_allfeatures_chords:
+.byte PENTLY_ARPEGGIO,$37,PENTLY_REST|PENTLY_D_D4,PENTLY_N_D|PENTLY_D_1
+.byte PENTLY_REST|PENTLY_D_2,PENTLY_ARPEGGIO,$47,PENTLY_N_C|PENTLY_D_1
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_PATEND
+PPDAT_allfeatures_bass:
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_REST|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_F|PENTLY_D_4
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_AS|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_4,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_C|PENTLY_D_4,PENTLY_REST|PENTLY_D_8,PENTLY_PATEND
+PPDAT_Stairs_lead1:
+.byte PENTLY_N_DS|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_N_DS|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_GS
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_AS|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_Stairs_lead1end:
+.byte PENTLY_N_D|PENTLY_D_D8
+PPDAT_Stairs_introg:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_Stairs_bass:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_latebanjo
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_TRANSPOSE,<-5,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_latebanjo,PENTLY_TRANSPOSE,<29
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass,PENTLY_TRANSPOSE,<-31
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_latebanjo,PENTLY_TRANSPOSE,<7
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_latebanjo
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_TRANSPOSE,<-5,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_latebanjo,PENTLY_TRANSPOSE,<5
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_D|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_latebanjo
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_latebanjo
+.byte PENTLY_N_CHH|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass
+.byte PENTLY_TRANSPOSE,<-5,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_latebanjo,PENTLY_TRANSPOSE,<29
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_INSTRUMENT,PI_tubbass,PENTLY_TRANSPOSE,<-24
+.byte PENTLY_PATEND
+PPDAT_Stairs_lead2:
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_A,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_A,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_D|PENTLY_D_8,PENTLY_N_DH
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_D|PENTLY_D_8,PENTLY_N_DH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_F|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_F|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_PATEND
+PPDAT_Stairs_lead2end:
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_G,PENTLY_N_D|PENTLY_D_8,PENTLY_N_G
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_attacktest_drumfill:
+.byte DR_snare|PENTLY_D_8,DR_ohat,DR_snare,DR_snare,DR_snare
+PPDAT_attacktest_drums:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_D8,DR_snare|PENTLY_D_D8
+.byte DR_clhat|PENTLY_D_8,DR_kick,DR_clhat|PENTLY_D_D8,DR_kick|PENTLY_D_D8
+.byte DR_snare|PENTLY_D_D8,DR_clhat|PENTLY_D_D8,DR_kick|PENTLY_D_D8
+.byte DR_clhat|PENTLY_D_D8,DR_snare|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_snare
+.byte DR_clhat|PENTLY_D_D8,DR_kick|PENTLY_D_D8,DR_snare|PENTLY_D_D8
+.byte DR_ohat|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_attacktest_bass:
+.byte PENTLY_N_DS|PENTLY_D_4,PENTLY_REST,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_2,PENTLY_REST|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_REST,PENTLY_N_DS|PENTLY_D_4,PENTLY_REST,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_BEND,$16,PENTLY_N_GS|PENTLY_D_2
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_BEND,$00,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_4,PENTLY_REST,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_2,PENTLY_REST|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_REST,PENTLY_N_DS|PENTLY_D_4,PENTLY_REST,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_GRACE,1,PENTLY_N_DS,PENTLY_BEND,$16
+.byte PENTLY_N_FS|PENTLY_D_2,PENTLY_BEND,$00,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_PATEND
+PPDAT_attacktest_atk:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_G|PENTLY_D_8,PENTLY_N_DS
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_AS,PENTLY_N_G|PENTLY_D_8,PENTLY_N_AS
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_G|PENTLY_D_8,PENTLY_N_DS
+.byte PENTLY_PATEND
+pently_songs:  ; 10 entries, 1173 bytes
+PS_argument = 0
+PS_Isometry = 0
+PS_Sticks = 0
+PS_twinkle = 0
+PS_canon = 0
+PS_bf98 = 0
+PS_arp_waltz = 0
+PS_allfeatures = 0
+PS_Stairs = 0
+PS_attacktest = 0
+PENTLY_songdef PS_argument, PSDAT_argument
+PENTLY_songdef PS_Isometry, PSDAT_Isometry
+PENTLY_songdef PS_Sticks, PSDAT_Sticks
+PENTLY_songdef PS_twinkle, PSDAT_twinkle
+PENTLY_songdef PS_canon, PSDAT_canon
+PENTLY_songdef PS_bf98, PSDAT_bf98
+PENTLY_songdef PS_arp_waltz, PSDAT_arp_waltz
+PENTLY_songdef PS_allfeatures, PSDAT_allfeatures
+PENTLY_songdef PS_Stairs, PSDAT_Stairs
+PENTLY_songdef PS_attacktest, PSDAT_attacktest
+PSDAT_argument:
+; title: Argument?
+PENTLY_playPatNoise PP_argument_drum34
+PENTLY_setTempo 360
+PENTLY_setBeatDuration PENTLY_D_8
+PENTLY_waitRows 48  ; end at 0:08.00
+PENTLY_playPatSq2 PP_argument_commemorate3, 23, PI_bf98_flute2
+PENTLY_waitRows 48  ; end at 0:16.00
+PENTLY_playPatSq2 PP_argument_tubbassloop, 0, PI_tubbass_slow
+PENTLY_waitRows 24  ; end at 0:20.00
+PENTLY_stopPatSq2
+PENTLY_waitRows 24  ; end at 0:24.00
+PENTLY_playPatSq2 PP_argument_intro_dut, 18, PI_dut
+PENTLY_waitRows 48  ; end at 0:32.00
+PENTLY_stopPatSq2
+PENTLY_playPatTri PP_argument_bass, 10, PI_bass
+PENTLY_waitRows 96  ; end at 0:48.00
+PENTLY_playPatSq2 PP_argument_melody, 27, PI_bf98_flute2
+PENTLY_waitRows 96  ; end at 1:04.00
+PENTLY_attackOnSq2
+PENTLY_playPatSq2 PP_argument_bass, 10, PI_bf98_flute2
+PENTLY_playPatAttack PP_argument_melodyend, 30, PI_bf98_flute2
+PENTLY_playPatNoise PP_argument_drum34_8
+PENTLY_waitRows 6  ; end at 1:05.00
+PENTLY_stopPatAttack
+PENTLY_waitRows 42  ; end at 1:12.00
+PENTLY_playPatSq1 PP_argument_bass, 22, PI_bf98_flute2
+PENTLY_waitRows 48  ; end at 1:20.00
+PENTLY_playPatSq1 PP_argument_tubbassloop, 12, PI_tubbass_slow
+PENTLY_playPatSq2 PP_argument_melody, 39, PI_bf98_flute2
+PENTLY_waitRows 96  ; end at 1:36.00
+PENTLY_playPatSq2 PP_argument_descendingchords, 19, PI_bf98_flute2
+PENTLY_waitRows 96  ; end at 1:52.00
+PENTLY_stopPatSq1
+PENTLY_playPatSq2 PP_argument_twinkle, 50, PI_argtwinkle
+PENTLY_waitRows 192  ; end at 2:24.00
+PENTLY_playPatSq1 PP_argument_tubbassloop, 12, PI_tubbass_slow
+PENTLY_playPatSq2 PP_argument_melody, 39, PI_bf98_flute2
+PENTLY_attackOnSq1
+PENTLY_playPatAttack PP_argument_twinkle, 50, PI_argtwinkle
+PENTLY_waitRows 96  ; end at 2:40.00
+PENTLY_attackOnSq2
+PENTLY_playPatSq2 PP_argument_bass, 10, PI_bf98_flute2
+PENTLY_playPatAttack PP_argument_melodyend, 42, PI_bf98_flute2
+PENTLY_stopPatSq1
+PENTLY_waitRows 6  ; end at 2:41.00
+PENTLY_stopPatAttack
+PENTLY_waitRows 42  ; end at 2:48.00
+PENTLY_playPatSq1 PP_argument_bass, 22, PI_bf98_flute2
+PENTLY_waitRows 48  ; end at 2:56.00
+PENTLY_playPatSq2 PP_argument_cadenza, 34, PI_bf98_flute2
+PENTLY_attackOnSq2
+PENTLY_playPatAttack PP_argument_cadenza, 22, PI_bf98_fluteshort
+PENTLY_playPatSq1 PP_argument_cadenzabass, 10, PI_tubbass_slow
+PENTLY_waitRows 144  ; end at 3:20.00
+PENTLY_playPatSq2 PP_argument_cadenzaend, 15, PI_bf98_flute2
+PENTLY_playPatAttack PP_argument_cadenzaend, 3, PI_bf98_fluteshort
+PENTLY_waitRows 24  ; end at 3:24.00
+PENTLY_playPatAttack PP_argument_cadenzaend2, 31, PI_bf98_fluteshort
+PENTLY_waitRows 18  ; end at 3:27.00
+PENTLY_playPatSq1 PP_argument_cadenzaend3, 0, PI_bf98_flute
+PENTLY_waitRows 6  ; end at 3:28.00
+PENTLY_stopPatSq1
+PENTLY_stopPatSq2
+PENTLY_stopPatTri
+PENTLY_stopPatAttack
+PENTLY_playPatNoise PP_argument_drum68
+PENTLY_attackOnSq1
+PENTLY_playPatAttack PP_argument_drum68top, 12, PI_tubbass
+PENTLY_playPatTri PP_argument_bass68, 10, PI_arg2bass
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 192  ; end at 4:00.00
+PENTLY_playPatSq2 PP_argument_harmony68_1, 31, PI_bf98_flute2
+PENTLY_waitRows 6  ; end at 4:01.00
+PENTLY_playPatSq1 PP_argument_harmony68_2, 10, PI_bf98_flute2
+PENTLY_waitRows 90  ; end at 4:16.00
+PENTLY_playPatAttack PP_argument_harmony68_3, 27, PI_bf98_flute2
+PENTLY_waitRows 96  ; end at 4:32.00
+PENTLY_playPatAttack PP_argument_drum68top, 12, PI_tubbass
+PENTLY_playPatSq2 PP_argument_melody68, 22, PI_bf98_flute2
+PENTLY_playPatNoise PP_argument_drum68allkick
+PENTLY_waitRows 96  ; end at 4:48.00
+PENTLY_playPatNoise PP_argument_drum68
+PENTLY_playPatSq2 PP_argument_harmony68_1, 31, PI_bf98_flute2
+PENTLY_playPatTri PP_argument_harmony68_2, 10, PI_bf98_flute2
+PENTLY_waitRows 96  ; end at 5:04.00
+PENTLY_playPatNoise PP_argument_drum68allkick
+PENTLY_playPatAttack PP_argument_drum68top, 12, PI_tubbass
+PENTLY_playPatSq2 PP_argument_melody68, 22, PI_bf98_flute2
+PENTLY_playPatTri PP_argument_bass68, 10, PI_arg2bass
+PENTLY_waitRows 96  ; end at 5:20.00
+PENTLY_playPatTri PP_argument_harmony68_2, 10, PI_bf98_flute2
+PENTLY_playPatNoise PP_argument_drum68nokick
+PENTLY_waitRows 96  ; end at 5:36.00
+PENTLY_stopPatSq1
+PENTLY_stopPatSq2
+PENTLY_playPatNoise PP_argument_drum68allkick
+PENTLY_playPatTri PP_argument_bass68, 10, PI_arg2bass
+PENTLY_waitRows 96  ; end at 5:52.00
+PENTLY_playPatNoise PP_argument_drum68
+PENTLY_playPatTri PP_argument_bass68end, 10, PI_arg2bass
+PENTLY_playPatAttack PP_argument_drum68topend, 12, PI_tubbass
+PENTLY_waitRows 96  ; end at 6:08.00
+PENTLY_stopPatTri
+PENTLY_dalSegno
+PSDAT_Isometry:
+; title: Isometry
+PENTLY_attackOnSq1
+PENTLY_playPatAttack PP_Isometry_tinkle1, 44, PI_isotinkle
+PENTLY_playPatSq2 PP_Isometry_melmaj2, 30, PI_isopiano
+PENTLY_playPatSq1 PP_Isometry_melmaj1, 26, PI_isopiano
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatNoise PP_Isometry_drum
+PENTLY_setTempo 360
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 32  ; end at 0:05.33
+PENTLY_playPatAttack PP_Isometry_tinkle2, 45, PI_isotinkle
+PENTLY_playPatTri PP_Isometry_triosti, 26, PI_isobeep
+PENTLY_waitRows 32  ; end at 0:10.67
+PENTLY_playPatAttack PP_Isometry_tinkle3, 43, PI_isotinkle
+PENTLY_playPatSq2 PP_Isometry_melmin2, 30, PI_isopiano
+PENTLY_playPatSq1 PP_Isometry_melmin1, 26, PI_isopiano
+PENTLY_playPatTri PP_Isometry_triosti, 24, PI_isobeep
+PENTLY_waitRows 32  ; end at 0:16.00
+PENTLY_playPatAttack PP_Isometry_tinkle1, 44, PI_isotinkle
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_waitRows 24  ; end at 0:20.00
+PENTLY_stopPatSq1
+PENTLY_stopPatAttack
+PENTLY_playPatNoise PP_Isometry_drumfill
+PENTLY_playPatSq2 PP_Isometry_trifill, 4, PI_banjo
+PENTLY_playPatTri PP_Isometry_trifill, 28, PI_bass
+PENTLY_waitRows 8  ; end at 0:21.33
+PENTLY_playPatAttack PP_Isometry_tinkle1, 44, PI_isotinkle
+PENTLY_playPatSq2 PP_Isometry_melmaj2, 30, PI_isopiano
+PENTLY_playPatSq1 PP_Isometry_melmaj1, 26, PI_isopiano
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatNoise PP_Isometry_drum
+PENTLY_waitRows 32  ; end at 0:26.67
+PENTLY_playPatAttack PP_Isometry_tinkle2, 45, PI_isotinkle
+PENTLY_playPatTri PP_Isometry_triosti, 26, PI_isobeep
+PENTLY_waitRows 32  ; end at 0:32.00
+PENTLY_playPatAttack PP_Isometry_tinkle3, 43, PI_isotinkle
+PENTLY_playPatSq2 PP_Isometry_melmin2, 30, PI_isopiano
+PENTLY_playPatSq1 PP_Isometry_melmin1, 26, PI_isopiano
+PENTLY_playPatTri PP_Isometry_triosti, 24, PI_isobeep
+PENTLY_waitRows 32  ; end at 0:37.33
+PENTLY_playPatAttack PP_Isometry_tinkle1, 44, PI_isotinkle
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_waitRows 24  ; end at 0:41.33
+PENTLY_stopPatSq1
+PENTLY_stopPatAttack
+PENTLY_playPatNoise PP_Isometry_drumfill
+PENTLY_playPatSq2 PP_Isometry_trifill, 4, PI_banjo
+PENTLY_playPatTri PP_Isometry_trifill, 28, PI_bass
+PENTLY_waitRows 8  ; end at 0:42.67
+PENTLY_stopPatSq2
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 4, PI_isobeepsq
+PENTLY_playPatNoise PP_Isometry_drum
+PENTLY_waitRows 32  ; end at 0:48.00
+PENTLY_playPatTri PP_Isometry_triosti, 26, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 2, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 0:53.33
+PENTLY_playPatTri PP_Isometry_triosti, 24, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 0, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 0:58.67
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 4, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 1:04.00
+PENTLY_playPatSq1 PP_Isometry_restperiod1, 20, PI_isopiano
+PENTLY_waitRows 32  ; end at 1:09.33
+PENTLY_playPatTri PP_Isometry_triosti, 26, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 2, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 1:14.67
+PENTLY_playPatSq1 PP_Isometry_restperiod2, 16, PI_isopiano
+PENTLY_playPatTri PP_Isometry_triosti, 24, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 0, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 1:20.00
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 4, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 1:25.33
+PENTLY_playPatTri PP_Isometry_triosti, 24, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 0, PI_isobeepsq
+PENTLY_waitRows 32  ; end at 1:30.67
+PENTLY_playPatTri PP_Isometry_triosti, 28, PI_isobeep
+PENTLY_playPatSq2 PP_Isometry_triosti, 4, PI_isobeepsq
+PENTLY_waitRows 16  ; end at 1:33.33
+PENTLY_stopPatSq1
+PENTLY_stopPatAttack
+PENTLY_playPatSq2 PP_Isometry_trifill, 4, PI_banjo
+PENTLY_playPatNoise PP_Isometry_drumfill
+PENTLY_playPatTri PP_Isometry_trifill, 28, PI_bass
+PENTLY_waitRows 16  ; end at 1:36.00
+PENTLY_dalSegno
+PSDAT_Sticks:
+; title: Sticks
+PENTLY_playPatSq1 PP_Sticks_introbanjo1, 24, PI_banjo
+PENTLY_playPatSq2 PP_Sticks_introch2, 5, PI_toot0
+PENTLY_setTempo 600
+PENTLY_setBeatDuration PENTLY_D_D4
+PENTLY_waitRows 60  ; end at 0:06.00
+PENTLY_playPatSq1 PP_Sticks_introbanjo2, 26, PI_banjo
+PENTLY_waitRows 12  ; end at 0:07.20
+PENTLY_playPatTri PP_Sticks_introbass, 0, PI_bass
+PENTLY_playPatNoise PP_Sticks_introdrum
+PENTLY_waitRows 48  ; end at 0:12.00
+PENTLY_playPatSq2 PP_Sticks_chords2, 39, PI_toot0
+PENTLY_playPatSq1 PP_Sticks_chords1start, 36, PI_toot0
+PENTLY_stopPatTri
+PENTLY_waitRows 24  ; end at 0:14.40
+PENTLY_stopPatNoise
+PENTLY_waitRows 24  ; end at 0:16.80
+PENTLY_playPatTri PP_Sticks_bassstart, 44, PI_isobeep
+PENTLY_waitRows 48  ; end at 0:21.60
+PENTLY_segno
+PENTLY_playPatSq1 PP_Sticks_chords1, 3, PI_toot0
+PENTLY_playPatSq2 PP_Sticks_chords2, 39, PI_toot0
+PENTLY_playPatTri PP_Sticks_bass, 15, PI_toot0
+PENTLY_playPatNoise PP_Sticks_drum
+PENTLY_waitRows 256
+PENTLY_waitRows 128  ; end at 1:00.00
+PENTLY_playPatTri PP_Sticks_v_iv_bass, 22, PI_toot0
+PENTLY_playPatSq1 PP_Sticks_v_iv_chords1, 24, PI_toot0
+PENTLY_playPatSq2 PP_Sticks_v_iv_chords2, 10, PI_tubbass
+PENTLY_waitRows 72  ; end at 1:07.20
+PENTLY_stopPatNoise
+PENTLY_waitRows 24  ; end at 1:09.60
+PENTLY_dalSegno
+PSDAT_twinkle:
+; title: The Naive Confidence
+; author: traditional; arr. D. Yerrick
+PENTLY_playPatSq2 PP_twinkle_melody, 27, PI_bf98_osti
+PENTLY_playPatNoise PP_twinkle_beat
+PENTLY_playPatTri PP_twinkle_bassline, 22, PI_bass
+PENTLY_setTempo 270
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 132  ; end at 0:29.33
+PENTLY_setTempo 225
+PENTLY_waitRows 6  ; end at 0:30.93
+PENTLY_playPatTri PP_twinkle_bassfinal, 27, PI_bass
+PENTLY_setTempo 180
+PENTLY_waitRows 3  ; end at 0:31.93
+PENTLY_stopPatNoise
+PENTLY_waitRows 3  ; end at 0:32.93
+PENTLY_fine
+PSDAT_canon:
+; title: Canon in D
+; author: J. Pachelbel; arr. D. Yerrick
+PENTLY_playPatTri PP_canon_bass, 17, PI_bass
+PENTLY_setTempo 450
+PENTLY_setBeatDuration PENTLY_D_2
+PENTLY_waitRows 64  ; end at 0:08.53
+PENTLY_playPatSq2 PP_canon_melody, 26, PI_bf98_osti
+PENTLY_waitRows 64  ; end at 0:17.07
+PENTLY_playPatSq1 PP_canon_melody, 26, PI_fiddle2
+PENTLY_waitRows 192  ; end at 0:42.67
+PENTLY_waitRows 256  ; end at 1:16.80
+PENTLY_waitRows 256  ; end at 1:50.93
+PENTLY_waitRows 256
+PENTLY_waitRows 128  ; end at 2:42.13
+PENTLY_waitRows 256  ; end at 3:16.27
+PENTLY_waitRows 256
+PENTLY_waitRows 40  ; end at 3:55.73
+PENTLY_setTempo 400
+PENTLY_waitRows 8  ; end at 3:56.93
+PENTLY_setTempo 350
+PENTLY_waitRows 8  ; end at 3:58.30
+PENTLY_setTempo 300
+PENTLY_waitRows 8  ; end at 3:59.90
+PENTLY_playPatSq1 PP_canon_melody, 26, PI_fiddle2
+PENTLY_setTempo 250
+PENTLY_waitRows 8  ; end at 4:01.82
+PENTLY_fine
+PSDAT_bf98:
+; title: Happy Flappy Crappy
+PENTLY_playPatSq2 PP_bf98_orchhits, 31, PI_orchhit
+PENTLY_setTempo 400
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 36  ; end at 0:05.40
+PENTLY_playPatTri PP_bf98_bassA, 17, PI_bass
+PENTLY_playPatNoise PP_bf98_drums
+PENTLY_noteOnNoise 5, PI_crashcymbal
+PENTLY_waitRows 36  ; end at 0:10.80
+PENTLY_segno
+PENTLY_playPatSq2 PP_bf98_melodyA, 33, PI_bf98_flute
+PENTLY_playPatNoise PP_bf98_drums
+PENTLY_waitRows 36  ; end at 0:16.20
+PENTLY_playPatSq1 PP_bf98_thirdsA, 29, PI_bf98_flute2
+PENTLY_waitRows 36  ; end at 0:21.60
+PENTLY_stopPatSq2
+PENTLY_playPatSq1 PP_bf98_osti1, 41, PI_bf98_osti
+PENTLY_playPatSq2 PP_bf98_osti2, 31, PI_orchhit
+PENTLY_waitRows 72  ; end at 0:32.40
+PENTLY_playPatSq2 PP_bf98_melodyA, 33, PI_bf98_flute
+PENTLY_playPatSq1 PP_bf98_thirdsA, 29, PI_bf98_flute2
+PENTLY_waitRows 72  ; end at 0:43.20
+PENTLY_playPatSq2 PP_bf98_melodyB1, 35, PI_bf98_flute
+PENTLY_playPatSq1 PP_bf98_counterB1, 28, PI_bf98_flute2
+PENTLY_playPatTri PP_bf98_bassB1, 18, PI_bass
+PENTLY_waitRows 63  ; end at 0:52.65
+PENTLY_playPatNoise PP_bf98_drums_tripletfill
+PENTLY_waitRows 9  ; end at 0:54.00
+PENTLY_playPatNoise PP_bf98_drums
+PENTLY_waitRows 18  ; end at 0:56.70
+PENTLY_playPatSq2 PP_bf98_melodyB2, 34, PI_bf98_flute
+PENTLY_playPatSq1 PP_bf98_counterB2, 28, PI_bf98_flute2
+PENTLY_playPatTri PP_bf98_bassB2, 17, PI_bass
+PENTLY_waitRows 45  ; end at 1:03.45
+PENTLY_playPatNoise PP_bf98_drums_quietfill
+PENTLY_stopPatSq1
+PENTLY_stopPatSq2
+PENTLY_waitRows 9  ; end at 1:04.80
+PENTLY_playPatNoise PP_bf98_drums
+PENTLY_playPatTri PP_bf98_bassA, 17, PI_bass
+PENTLY_waitRows 36  ; end at 1:10.20
+PENTLY_playPatNoise PP_bf98_drums_break
+PENTLY_waitRows 27  ; end at 1:14.25
+PENTLY_playPatNoise PP_bf98_drums_resumefill
+PENTLY_waitRows 9  ; end at 1:15.60
+PENTLY_dalSegno
+PSDAT_arp_waltz:
+; title: Arpeggio Waltz
+PENTLY_playPatSq1 PP_arp_waltz_bassintro, 3, PI_toot0
+PENTLY_setTempo 180
+PENTLY_setBeatDuration 0
+PENTLY_waitRows 12  ; end at 0:04.00
+PENTLY_segno
+PENTLY_playPatSq2 PP_arp_waltz_melody, 24, PI_stringlead
+PENTLY_playPatSq1 PP_arp_waltz_bass1, 1, PI_toot0
+PENTLY_waitRows 39  ; end at 0:17.00
+PENTLY_playPatSq1 PP_arp_waltz_bass2, 3, PI_toot0
+PENTLY_waitRows 9  ; end at 0:20.00
+PENTLY_playPatSq1 PP_arp_waltz_bass1, 1, PI_toot0
+PENTLY_waitRows 39  ; end at 0:33.00
+PENTLY_playPatSq1 PP_arp_waltz_bass2, 3, PI_toot0
+PENTLY_waitRows 9  ; end at 0:36.00
+PENTLY_dalSegno
+PSDAT_allfeatures:
+; title: Individual features
+PENTLY_playPatSq1 PP_allfeatures_between, 6, PI_feat_power
+PENTLY_playPatSq2 PP_allfeatures_between, 13, PI_feat_power
+PENTLY_playPatTri PP_allfeatures_between, 30, PI_bass
+PENTLY_setTempo 720
+PENTLY_setBeatDuration PENTLY_D_D4
+PENTLY_waitRows 12  ; end at 0:01.00
+PENTLY_stopPatSq1
+PENTLY_playPatNoise PP_allfeatures_drum
+PENTLY_waitRows 36  ; end at 0:04.00
+PENTLY_playPatNoise PP_allfeatures_drumfill
+PENTLY_waitRows 12  ; end at 0:05.00
+PENTLY_playPatTri PP_allfeatures_bass, 25, PI_bass
+PENTLY_playPatNoise PP_allfeatures_drum
+PENTLY_playPatSq2 PP_allfeatures_chords, 28, PI_feat_wah
+PENTLY_waitRows 84  ; end at 0:12.00
+PENTLY_playPatNoise PP_allfeatures_drumfill
+PENTLY_waitRows 12  ; end at 0:13.00
+PENTLY_stopPatNoise
+PENTLY_dalSegno
+PSDAT_Stairs:
+; title: Stairs
+PENTLY_playPatSq2 PP_Stairs_lead1, 19, PI_banjo
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 51  ; end at 0:10.20
+PENTLY_playPatSq1 PP_Stairs_introg, 34, PI_latebanjo
+PENTLY_waitRows 36  ; end at 0:17.40
+PENTLY_playPatSq2 PP_Stairs_lead1end, 22, PI_banjo
+PENTLY_waitRows 3  ; end at 0:18.00
+PENTLY_stopPatSq1
+PENTLY_waitRows 6  ; end at 0:19.20
+PENTLY_segno
+PENTLY_playPatSq2 PP_Stairs_lead1, 19, PI_banjo
+PENTLY_playPatSq1 PP_Stairs_bass, 10, PI_tubbass
+PENTLY_waitRows 87  ; end at 0:36.60
+PENTLY_playPatSq2 PP_Stairs_lead1end, 22, PI_banjo
+PENTLY_waitRows 3  ; end at 0:37.20
+PENTLY_playPatSq1 PP_Stairs_introg, 10, PI_tubbass
+PENTLY_waitRows 6  ; end at 0:38.40
+PENTLY_playPatSq2 PP_Stairs_lead2, 17, PI_banjo
+PENTLY_playPatSq1 PP_Stairs_bass, 10, PI_tubbass
+PENTLY_waitRows 84  ; end at 0:55.20
+PENTLY_playPatSq2 PP_Stairs_lead2end, 22, PI_banjo
+PENTLY_waitRows 6  ; end at 0:56.40
+PENTLY_playPatSq1 PP_Stairs_introg, 10, PI_tubbass
+PENTLY_waitRows 6  ; end at 0:57.60
+PENTLY_dalSegno
+PSDAT_attacktest:
+; title: Attack injection (no pulse!)
+PENTLY_playPatNoise PP_attacktest_drums
+PENTLY_playPatTri PP_attacktest_bass, 15, PI_bass
+PENTLY_attackOnTri
+PENTLY_playPatAttack PP_attacktest_atk, 56, PI_framepop
+PENTLY_setTempo 515
+PENTLY_setBeatDuration PENTLY_D_D4
+PENTLY_waitRows 72  ; end at 0:08.39
+PENTLY_playPatAttack PP_attacktest_atk, 54, PI_framepop
+PENTLY_waitRows 18  ; end at 0:10.49
+PENTLY_playPatNoise PP_attacktest_drumfill
+PENTLY_waitRows 6  ; end at 0:11.18
+PENTLY_dalSegno
+pentlyseq_end:
+
+; references to subsequences
+PEDAT_quiethat = PEDAT_snarehat + 16
+PEDAT_shorthat = PEDAT_openhat + 4
+PIDAT_banjo = PIDAT_latebanjo + 1
+PIDAT_bf98_flute = PIDAT_bf98_flute2 + 0
+PIDAT_bf98_fluteshort = PIDAT_bf98_flute2 + 0
+PIDAT_isopiano = PIDAT_feat_wah + 0
+pently_resume_mute = $00
+
+; Total music data size: 4490 bytes
+; pently_sfx_table: 330 bytes
+;   PE_kick: 24 bytes
+;   PE_snare: 24 bytes
+;   PE_hihat: 12 bytes
+;   PE_openhat: 34 bytes
+;   PE_snarehat: 34 bytes
+;   PE_trikick: 14 bytes
+;   PE_trisnare: 12 bytes
+;   PE_quiethat: 6 bytes
+;   PE_shorthat: 6 bytes
+;   PE_tubfloorA: 28 bytes
+;   PE_arghatbuzz: 16 bytes
+;   PE_stickskick: 28 bytes
+;   PE_stickshatlo: 16 bytes
+;   PE_longkick: 38 bytes
+;   PE_longsnare: 38 bytes
+; pently_instruments: 308 bytes
+;   PI_bass: 5 bytes
+;   PI_framepop: 6 bytes
+;   PI_banjo: 13 bytes
+;   PI_latebanjo: 14 bytes
+;   PI_tubbass: 15 bytes
+;   PI_tubbass_slow: 17 bytes
+;   PI_dut: 21 bytes
+;   PI_feat_wah: 17 bytes
+;   PI_feat_power: 5 bytes
+;   PI_bf98_flute: 12 bytes
+;   PI_bf98_flute2: 12 bytes
+;   PI_bf98_osti: 9 bytes
+;   PI_orchhit: 45 bytes
+;   PI_crashcymbal: 5 bytes
+;   PI_fiddle2: 10 bytes
+;   PI_bf98_fluteshort: 9 bytes
+;   PI_vowele: 12 bytes
+;   PI_vowela: 12 bytes
+;   PI_argtwinkle: 15 bytes
+;   PI_arg2bass: 5 bytes
+;   PI_toot0: 12 bytes
+;   PI_stringlead: 14 bytes
+;   PI_isopiano: 6 bytes
+;   PI_isotinkle: 7 bytes
+;   PI_isobeep: 5 bytes
+;   PI_isobeepsq: 5 bytes
+; pently_drums: 30 bytes
+;   DR_kick: 2 bytes
+;   DR_snare: 2 bytes
+;   DR_clhat: 2 bytes
+;   DR_ohat: 2 bytes
+;   DR_tkick: 2 bytes
+;   DR_tsnare: 2 bytes
+;   DR_tsohat: 2 bytes
+;   DR_tubkick: 2 bytes
+;   DR_arghatbuzz: 2 bytes
+;   DR_quiethat: 2 bytes
+;   DR_shorthat: 2 bytes
+;   DR_stickskick: 2 bytes
+;   DR_stickshatlo: 2 bytes
+;   DR_lkick: 2 bytes
+;   DR_lsnare: 2 bytes
+; pently_patterns: 2649 bytes
+;   PP_argument_drum34: 6 bytes
+;   PP_argument_drum34_8: 9 bytes
+;   PP_argument_commemorate3: 99 bytes
+;   PP_argument_tubbassloop: 12 bytes
+;   PP_argument_intro_dut: 18 bytes
+;   PP_argument_bass: 31 bytes
+;   PP_argument_melody: 13 bytes
+;   PP_argument_melodyend: 6 bytes
+;   PP_argument_descendingchords: 67 bytes
+;   PP_argument_twinkle: 19 bytes
+;   PP_argument_cadenzabass: 7 bytes
+;   PP_argument_cadenza: 55 bytes
+;   PP_argument_cadenzaend: 40 bytes
+;   PP_argument_cadenzaend2: 21 bytes
+;   PP_argument_cadenzaend3: 7 bytes
+;   PP_argument_drum68: 5 bytes
+;   PP_argument_drum68nokick: 6 bytes
+;   PP_argument_drum68allkick: 6 bytes
+;   PP_argument_drum68top: 4 bytes
+;   PP_argument_bass68: 51 bytes
+;   PP_argument_harmony68_1: 21 bytes
+;   PP_argument_harmony68_2: 13 bytes
+;   PP_argument_harmony68_3: 19 bytes
+;   PP_argument_melody68: 46 bytes
+;   PP_argument_bass68end: 27 bytes
+;   PP_argument_drum68topend: 4 bytes
+;   PP_Isometry_triosti: 4 bytes
+;   PP_Isometry_trifill: 5 bytes
+;   PP_Isometry_tinkle1: 7 bytes
+;   PP_Isometry_tinkle2: 7 bytes
+;   PP_Isometry_tinkle3: 7 bytes
+;   PP_Isometry_melmin1: 11 bytes
+;   PP_Isometry_melmaj1: 12 bytes
+;   PP_Isometry_melmin2: 11 bytes
+;   PP_Isometry_melmaj2: 12 bytes
+;   PP_Isometry_drum: 11 bytes
+;   PP_Isometry_drumfill: 4 bytes
+;   PP_Isometry_restperiod1: 7 bytes
+;   PP_Isometry_restperiod2: 11 bytes
+;   PP_Sticks_introbanjo1: 9 bytes
+;   PP_Sticks_introch2: 69 bytes
+;   PP_Sticks_introbanjo2: 19 bytes
+;   PP_Sticks_introbass: 10 bytes
+;   PP_Sticks_introdrum: 14 bytes
+;   PP_Sticks_bassstart: 10 bytes
+;   PP_Sticks_bass: 18 bytes
+;   PP_Sticks_chords1start: 12 bytes
+;   PP_Sticks_chords1: 45 bytes
+;   PP_Sticks_chords2: 10 bytes
+;   PP_Sticks_drum: 7 bytes
+;   PP_Sticks_v_iv_bass: 29 bytes
+;   PP_Sticks_v_iv_chords1: 20 bytes
+;   PP_Sticks_v_iv_chords2: 36 bytes
+;   PP_twinkle_melody: 31 bytes
+;   PP_twinkle_bassline: 35 bytes
+;   PP_twinkle_bassfinal: 4 bytes
+;   PP_twinkle_beat: 8 bytes
+;   PP_canon_bass: 11 bytes
+;   PP_canon_melody: 633 bytes
+;   PP_bf98_orchhits: 9 bytes
+;   PP_bf98_drums: 14 bytes
+;   PP_bf98_drums_resumefill: 9 bytes
+;   PP_bf98_drums_tripletfill: 8 bytes
+;   PP_bf98_drums_quietfill: 6 bytes
+;   PP_bf98_drums_break: 6 bytes
+;   PP_bf98_bassA: 26 bytes
+;   PP_bf98_melodyA: 27 bytes
+;   PP_bf98_thirdsA: 22 bytes
+;   PP_bf98_osti1: 31 bytes
+;   PP_bf98_osti2: 47 bytes
+;   PP_bf98_melodyB1: 43 bytes
+;   PP_bf98_counterB1: 41 bytes
+;   PP_bf98_bassB1: 26 bytes
+;   PP_bf98_melodyB2: 31 bytes
+;   PP_bf98_counterB2: 28 bytes
+;   PP_bf98_bassB2: 35 bytes
+;   PP_arp_waltz_bass1: 27 bytes
+;   PP_arp_waltz_bass2: 11 bytes
+;   PP_arp_waltz_bassintro: 9 bytes
+;   PP_arp_waltz_melody: 146 bytes
+;   PP_allfeatures_between: 10 bytes
+;   PP_allfeatures_drumfill: 8 bytes
+;   PP_allfeatures_drum: 15 bytes
+;   PP_allfeatures_chords: 12 bytes
+;   PP_allfeatures_bass: 17 bytes
+;   PP_Stairs_lead1: 22 bytes
+;   PP_Stairs_lead1end: 3 bytes
+;   PP_Stairs_introg: 5 bytes
+;   PP_Stairs_bass: 69 bytes
+;   PP_Stairs_lead2: 35 bytes
+;   PP_Stairs_lead2end: 9 bytes
+;   PP_attacktest_drumfill: 7 bytes
+;   PP_attacktest_drums: 21 bytes
+;   PP_attacktest_bass: 44 bytes
+;   PP_attacktest_atk: 19 bytes
+; pently_songs: 1173 bytes
+;   PS_argument: 326 bytes
+;   PS_Isometry: 301 bytes
+;   PS_Sticks: 99 bytes
+;   PS_twinkle: 38 bytes
+;   PS_canon: 58 bytes
+;   PS_bf98: 142 bytes
+;   PS_arp_waltz: 41 bytes
+;   PS_allfeatures: 60 bytes
+;   PS_Stairs: 75 bytes
+;   PS_attacktest: 33 bytes
+;
+; Breakdown by song
+;   Shared: 668 bytes
+;   Song Isometry: 410 bytes
+;   Song Stairs: 218 bytes
+;   Song Sticks: 407 bytes
+;   Song allfeatures: 122 bytes
+;   Song argument: 938 bytes
+;   Song arp_waltz: 234 bytes
+;   Song attacktest: 124 bytes
+;   Song bf98: 551 bytes
+;   Song canon: 702 bytes
+;   Song twinkle: 116 bytes
+
+; Period table of length 76 for ntsc: 152 bytes
+periodTableLo:
+.byte $f1,$7f,$13,$ad,$4d,$f3,$9d,$4c,$00,$b8,$74,$34,$f8,$bf,$89,$56,$26,$f9
+.byte $ce,$a6,$80,$5c,$3a,$1a,$fb,$df,$c4,$ab,$93,$7c,$67,$52,$3f,$2d,$1c,$0c
+.byte $fd,$ef,$e1,$d5,$c9,$bd,$b3,$a9,$9f,$96,$8e,$86,$7e,$77,$70,$6a,$64,$5e
+.byte $59,$54,$4f,$4b,$46,$42,$3f,$3b,$38,$34,$31,$2f,$2c,$29,$27,$25,$23,$21
+.byte $1f,$1d,$1b,$1a
+periodTableHi:
+.byte 7,7,7,6,6,5,5,5,5,4,4,4,3,3,3,3,3,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,0
+.byte 0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0
+.byte 0,0
@@ -0,0 +1,2091 @@
+; Generated using Pently music assembler
+; Music from audio/musicseq.pently, audio/pino-a53.pently
+; title: Pently demo
+; author: DJ Tepples
+; copyright: 2019 Damian Yerrick
+;
+PENTLY_NUM_SONGS=24
+PENTLY_NUM_SOUNDS=43
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 43 entries, 1024 bytes
+sfxdef PE_musicseq_kick, PEDAT_musicseq_kick, 10, 1, 3
+sfxdef PE_musicseq_snare, PEDAT_musicseq_snare, 10, 1, 3
+sfxdef PE_musicseq_hihat, PEDAT_musicseq_hihat, 4, 1, 3
+sfxdef PE_musicseq_openhat, PEDAT_musicseq_openhat, 15, 1, 3
+sfxdef PE_musicseq_snarehat, PEDAT_musicseq_snarehat, 15, 1, 3
+sfxdef PE_musicseq_trikick, PEDAT_musicseq_trikick, 5, 1, 2
+sfxdef PE_musicseq_trisnare, PEDAT_musicseq_trisnare, 4, 1, 2
+sfxdef PE_musicseq_quiethat, PEDAT_musicseq_quiethat, 1, 1, 3
+sfxdef PE_musicseq_shorthat, PEDAT_musicseq_shorthat, 1, 1, 3
+sfxdef PE_musicseq_tubfloorA, PEDAT_musicseq_tubfloorA, 12, 1, 0
+sfxdef PE_musicseq_arghatbuzz, PEDAT_musicseq_arghatbuzz, 6, 1, 3
+sfxdef PE_musicseq_stickskick, PEDAT_musicseq_stickskick, 12, 1, 3
+sfxdef PE_musicseq_stickshatlo, PEDAT_musicseq_stickshatlo, 6, 1, 3
+sfxdef PE_musicseq_longkick, PEDAT_musicseq_longkick, 17, 1, 3
+sfxdef PE_musicseq_longsnare, PEDAT_musicseq_longsnare, 17, 1, 3
+sfxdef PE_pino_a53_thwaite_mirv_split, PEDAT_pino_a53_thwaite_mirv_split, 18, 1, 0
+sfxdef PE_pino_a53_thwaite_threat_1, PEDAT_pino_a53_thwaite_threat_1, 21, 1, 0
+sfxdef PE_pino_a53_thwaite_threat_2, PEDAT_pino_a53_thwaite_threat_2, 10, 2, 0
+sfxdef PE_pino_a53_thwaite_shoot, PEDAT_pino_a53_thwaite_shoot, 7, 5, 3
+sfxdef PE_pino_a53_thwaite_boomp, PEDAT_pino_a53_thwaite_boomp, 15, 2, 0
+sfxdef PE_pino_a53_thwaite_boomn, PEDAT_pino_a53_thwaite_boomn, 16, 4, 3
+sfxdef PE_pino_a53_croom_rotate, PEDAT_pino_a53_croom_rotate, 6, 1, 0
+sfxdef PE_pino_a53_croom_shift, PEDAT_pino_a53_croom_shift, 2, 1, 0
+sfxdef PE_pino_a53_croom_land, PEDAT_pino_a53_croom_land, 8, 1, 0
+sfxdef PE_pino_a53_croom_line_clear, PEDAT_pino_a53_croom_line_clear, 15, 1, 0
+sfxdef PE_pino_a53_croom_homer_clear, PEDAT_pino_a53_croom_homer_clear, 25, 1, 0
+sfxdef PE_pino_a53_croom_garbage, PEDAT_pino_a53_croom_garbage, 6, 1, 0
+sfxdef PE_pino_a53_croom_die1, PEDAT_pino_a53_croom_die1, 17, 4, 0
+sfxdef PE_pino_a53_croom_die2, PEDAT_pino_a53_croom_die2, 17, 4, 3
+sfxdef PE_pino_a53_rhde_scanbeep, PEDAT_pino_a53_rhde_scanbeep, 4, 3, 0
+sfxdef PE_pino_a53_rhde_countdown, PEDAT_pino_a53_rhde_countdown, 12, 1, 0
+sfxdef PE_pino_a53_rhde_hold_piece, PEDAT_pino_a53_rhde_hold_piece, 5, 2, 3
+sfxdef PE_pino_a53_rhde_explode, PEDAT_pino_a53_rhde_explode, 8, 4, 3
+sfxdef PE_pino_a53_rhde_start, PEDAT_pino_a53_rhde_start, 16, 1, 0
+sfxdef PE_pino_a53_tennis_paddle, PEDAT_pino_a53_tennis_paddle, 4, 1, 3
+sfxdef PE_pino_a53_kick, PEDAT_pino_a53_kick, 4, 1, 3
+sfxdef PE_pino_a53_snare, PEDAT_pino_a53_snare, 7, 1, 3
+sfxdef PE_pino_a53_tkick, PEDAT_pino_a53_tkick, 4, 1, 2
+sfxdef PE_pino_a53_tsnare, PEDAT_pino_a53_tsnare, 2, 1, 2
+sfxdef PE_pino_a53_clhat, PEDAT_pino_a53_clhat, 3, 1, 3
+sfxdef PE_pino_a53_ohat, PEDAT_pino_a53_ohat, 13, 1, 3
+sfxdef PE_pino_a53_kickohat, PEDAT_pino_a53_kickohat, 13, 1, 3
+sfxdef PE_pino_a53_snareohat, PEDAT_pino_a53_snareohat, 13, 1, 3
+PEDAT_musicseq_kick:
+.byte 12,5,10,15,8,15,6,15,5,15,4,15,3,15,2,15,1,15,1,15
+PEDAT_musicseq_snare:
+.byte 12,11,10,5,8,5,6,5,5,5,4,5,3,5,2,5,1,5,1,5
+PEDAT_musicseq_hihat:
+.byte 4,3,2,131,2,3,1,131
+PEDAT_musicseq_openhat:
+.byte 6,3,5,131,4,3,4,131,3,3,3,131,3,3,2,131,2,3,2,131,1,3,1,131,1,3,1,131,1,3
+PEDAT_musicseq_snarehat:
+.byte 12,11,10,5,8,5,6,131,3,3,3,131,3,3,2,131,2,3,2,131,1,3,1,131,1,3,1,131,1
+.byte 3
+PEDAT_musicseq_trikick:
+.byte 143,31,143,27,143,24,130,21,130,19
+PEDAT_musicseq_trisnare:
+.byte 143,37,143,35,130,34,130,33
+PEDAT_musicseq_tubfloorA:
+.byte 76,6,74,2,136,2,135,1,134,0,133,0,132,0,132,0,131,0,131,0,130,0,129,0
+PEDAT_musicseq_arghatbuzz:
+.byte 4,3,2,131,3,136,2,136,2,136,1,136
+PEDAT_musicseq_stickskick:
+.byte 4,140,6,139,5,138,4,138,3,138,3,139,2,138,2,139,1,139,1,139,1,139,1,139
+PEDAT_musicseq_stickshatlo:
+.byte 4,137,6,137,3,137,2,137,1,137,1,137
+PEDAT_musicseq_longkick:
+.byte 12,5,11,15,10,15,9,15,8,15,7,15,6,15,4,15,3,15,3,15,2,15,2,15,2,15,1,15,1
+.byte 15,1,15,1,15
+PEDAT_musicseq_longsnare:
+.byte 12,11,11,5,10,5,9,5,8,5,7,5,6,5,4,5,3,5,3,5,2,5,2,5,2,5,1,5,1,5,1,5,1,5
+PEDAT_pino_a53_thwaite_mirv_split:
+.byte 79,36,68,36,79,41,68,41,79,46,68,46,68,36,66,36,68,41,66,41,68,46,66,46
+.byte 66,36,65,36,66,41,65,41,66,46,65,46
+PEDAT_pino_a53_thwaite_threat_1:
+.byte 70,31,76,31,76,31,76,37,76,37,76,43,76,43,76,49,76,49,76,49,76,49,76,49
+.byte 76,49,76,49,76,49,76,49,75,49,74,49,73,49,71,49,69,49
+PEDAT_pino_a53_thwaite_threat_2:
+.byte 76,28,76,34,76,40,76,46,76,46,76,46,76,46,75,46,73,46,70,46
+PEDAT_pino_a53_thwaite_shoot:
+.byte 10,3,8,4,7,4,6,5,4,6,3,6,2,6
+PEDAT_pino_a53_thwaite_boomp:
+.byte 143,18,143,15,142,12,142,15,141,12,140,10,139,11,138,9,137,6,136,8,135,7
+.byte 134,5,132,6,130,4,129,3
+PEDAT_pino_a53_thwaite_boomn:
+.byte 15,14,14,13,13,14,12,14,11,14,10,15,9,14,8,14,7,15,6,14,5,15,4,14,3,15,2
+.byte 14,1,15,1,15
+PEDAT_pino_a53_croom_shift:
+.byte 79,48,68,48
+PEDAT_pino_a53_croom_land:
+.byte 143,19,141,15,139,12,137,9,135,7,133,5,131,3,129,2
+PEDAT_pino_a53_croom_line_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,133,41
+.byte 132,44,131,39,130,42,129,44
+PEDAT_pino_a53_croom_homer_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,79,42,78
+.byte 45,77,47,76,42,75,44,74,47,137,42,136,45,135,47,134,42,133,44,132,47,131
+.byte 42,130,45,129,47
+PEDAT_pino_a53_croom_garbage:
+.byte 79,16,77,19,75,22,73,25,71,28,69,31
+PEDAT_pino_a53_croom_die1:
+.byte 143,7,143,7,142,7,141,7,140,7,139,7,138,7,137,7,136,7,135,7,134,7,133,7
+.byte 132,7,131,7,130,7,129,7,129,7
+PEDAT_pino_a53_croom_die2:
+.byte 15,12,15,13,14,14,13,14,12,14,11,14,10,14,9,14,8,14,7,14,6,14,5,14,4,14,3
+.byte 14,2,14,1,14,1,14
+PEDAT_pino_a53_rhde_scanbeep:
+.byte 140,42,140,42,131,42,129,42
+PEDAT_pino_a53_rhde_countdown:
+.byte 71,26,73,29,75,31,77,32,79,33,79,33,79,34,79,34,75,34,75,34,73,33,71,31
+PEDAT_pino_a53_rhde_hold_piece:
+.byte 7,11,9,10,9,11,8,12,6,14
+PEDAT_pino_a53_rhde_explode:
+.byte 15,13,13,13,11,13,9,14,7,14,5,14,3,14,2,14
+PEDAT_pino_a53_rhde_start:
+.byte 140,50,137,50,134,50,132,50,130,50,140,62,137,62,134,62,132,62,130,62,140
+.byte 57,137,57,134,57,132,57,130,57,129,57
+PEDAT_pino_a53_tennis_paddle:
+.byte 6,7,4,134,2,5,1,134
+PEDAT_pino_a53_kick:
+.byte 9,5,9,15,4,15,2,15
+PEDAT_pino_a53_snare:
+.byte 10,11,8,5,6,5,4,5,3,5,2,5,1,5
+PEDAT_pino_a53_tsnare:
+.byte 143,38,143,36
+PEDAT_pino_a53_clhat:
+.byte 6,3,3,131,1,3
+PEDAT_pino_a53_ohat:
+.byte 7,3,6,131,5,3,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_pino_a53_kickohat:
+.byte 10,5,8,15,6,15,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_pino_a53_snareohat:
+.byte 10,11,8,5,6,5,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+pently_instruments:  ; 45 entries, 423 bytes
+instdef PI_musicseq_bass, 2, 8, 0, 0, 0, 0
+instdef PI_musicseq_framepop, 2, 0, 0, 0, PIDAT_musicseq_framepop, 1
+instdef PI_musicseq_banjo, 0, 2, 1, 0, PIDAT_musicseq_banjo, 8
+instdef PI_musicseq_latebanjo, 0, 2, 1, 0, PIDAT_musicseq_latebanjo, 9
+instdef PI_musicseq_tubbass, 2, 4, 2, 0, PIDAT_musicseq_tubbass, 6
+instdef PI_musicseq_tubbass_slow, 2, 8, 1, 0, PIDAT_musicseq_tubbass_slow, 8
+instdef PI_musicseq_dut, 0, 0, 16, 0, PIDAT_musicseq_dut, 9
+instdef PI_musicseq_feat_wah, 0, 3, 1, 0, PIDAT_musicseq_feat_wah, 12
+instdef PI_musicseq_feat_power, 0, 8, 0, 0, 0, 0
+instdef PI_musicseq_bf98_flute, 2, 5, 0, 0, PIDAT_musicseq_bf98_flute, 7
+instdef PI_musicseq_bf98_flute2, 2, 4, 0, 0, PIDAT_musicseq_bf98_flute2, 7
+instdef PI_musicseq_bf98_osti, 0, 5, 0, 1, PIDAT_musicseq_bf98_osti, 4
+instdef PI_musicseq_orchhit, 1, 0, 0, 0, PIDAT_musicseq_orchhit, 24
+instdef PI_musicseq_crashcymbal, 0, 7, 2, 0, 0, 0
+instdef PI_musicseq_fiddle2, 1, 4, 0, 1, PIDAT_musicseq_fiddle2, 5
+instdef PI_musicseq_bf98_fluteshort, 2, 5, 0, 0, PIDAT_musicseq_bf98_fluteshort, 4
+instdef PI_musicseq_vowele, 1, 5, 0, 0, PIDAT_musicseq_vowele, 7
+instdef PI_musicseq_vowela, 0, 5, 0, 0, PIDAT_musicseq_vowela, 7
+instdef PI_musicseq_argtwinkle, 2, 2, 1, 0, PIDAT_musicseq_argtwinkle, 10
+instdef PI_musicseq_arg2bass, 2, 10, 20, 0, 0, 0
+instdef PI_musicseq_toot0, 2, 2, 8, 0, PIDAT_musicseq_toot0, 7
+instdef PI_musicseq_stringlead, 0, 3, 0, 0, PIDAT_musicseq_stringlead, 9
+instdef PI_musicseq_isopiano, 1, 7, 2, 0, PIDAT_musicseq_isopiano, 1
+instdef PI_musicseq_isotinkle, 1, 0, 0, 0, PIDAT_musicseq_isotinkle, 2
+instdef PI_musicseq_isobeep, 2, 8, 18, 0, 0, 0
+instdef PI_musicseq_isobeepsq, 0, 4, 8, 0, 0, 0
+instdef PI_pino_a53_v02, 2, 6, 0, 0, 0, 0
+instdef PI_pino_a53_v02detached, 2, 6, 0, 1, 0, 0
+instdef PI_pino_a53_piano, 1, 7, 2, 0, PIDAT_pino_a53_piano, 2
+instdef PI_pino_a53_town_tune_bell, 2, 6, 1, 0, 0, 0
+instdef PI_pino_a53_xylo_short, 2, 7, 6, 0, 0, 0
+instdef PI_pino_a53_xylo_medium, 2, 8, 4, 0, PIDAT_pino_a53_xylo_medium, 1
+instdef PI_pino_a53_xylo_long, 2, 7, 2, 0, 0, 0
+instdef PI_pino_a53_distanthorn, 0, 5, 0, 0, PIDAT_pino_a53_distanthorn, 4
+instdef PI_pino_a53_distantguitdet, 1, 4, 0, 1, PIDAT_pino_a53_distantguitdet, 1
+instdef PI_pino_a53_stringsdet, 0, 7, 3, 1, PIDAT_pino_a53_stringsdet, 3
+instdef PI_pino_a53_rhdeban, 0, 9, 8, 0, 0, 0
+instdef PI_pino_a53_bassassist, 1, 7, 6, 0, 0, 0
+instdef PI_pino_a53_fanfarehorn, 0, 7, 0, 1, PIDAT_pino_a53_fanfarehorn, 6
+instdef PI_pino_a53_axe_fg_1, 2, 6, 10, 0, 0, 0
+instdef PI_pino_a53_axe_fg_2, 1, 7, 10, 0, 0, 0
+instdef PI_pino_a53_axe_fg_3, 0, 9, 10, 0, 0, 0
+instdef PI_pino_a53_axe_echo_1, 2, 2, 3, 0, 0, 0
+instdef PI_pino_a53_axe_echo_2, 1, 2, 3, 0, 0, 0
+instdef PI_pino_a53_axe_echo_tri, 2, 2, 5, 0, 0, 0
+PIDAT_musicseq_framepop:
+.byte 158
+PIDAT_musicseq_latebanjo:
+.byte 16,28,24,22,21,20,20,19,19
+PIDAT_musicseq_tubbass:
+.byte 76,6,74,4,136,2,135,1,150,149
+PIDAT_musicseq_tubbass_slow:
+.byte 14,6,13,4,76,2,75,1,154,153,153,153
+PIDAT_musicseq_dut:
+.byte 140,253,76,255,27,24,6,255,5,255,4,254,2,253,1,251
+PIDAT_musicseq_feat_wah:
+.byte 152,152,151,151,150,150,85,85,85,84,84,84
+PIDAT_musicseq_bf98_flute2:
+.byte 148,150,151,150,150,149,149
+PIDAT_musicseq_bf98_osti:
+.byte 19,22,23,22
+PIDAT_musicseq_orchhit:
+.byte 72,12,88,72,244,71,12,87,71,244,70,12,86,70,244,69,12,85,69,244,68,12,84
+.byte 68,244,67,12,83,67,244,66,12,82,66,244,65,12,81,65,244
+PIDAT_musicseq_fiddle2:
+.byte 83,85,86,85,85
+PIDAT_musicseq_vowele:
+.byte 84,86,87,86,86,85,85
+PIDAT_musicseq_vowela:
+.byte 20,22,23,22,22,21,21
+PIDAT_musicseq_argtwinkle:
+.byte 151,150,150,149,149,148,148,148,148,148
+PIDAT_musicseq_toot0:
+.byte 148,151,152,152,151,149,147
+PIDAT_musicseq_stringlead:
+.byte 20,23,24,24,23,23,21,20,20
+PIDAT_musicseq_isotinkle:
+.byte 153,85
+PIDAT_pino_a53_piano:
+.byte 153,88
+PIDAT_pino_a53_xylo_medium:
+.byte 136,17
+PIDAT_pino_a53_distanthorn:
+.byte 83,21,22,22
+PIDAT_pino_a53_distantguitdet:
+.byte 131,254
+PIDAT_pino_a53_stringsdet:
+.byte 23,27,28
+PIDAT_pino_a53_fanfarehorn:
+.byte 68,255,23,25,25,24,24
+pently_drums:  ; 21 entries, 42 bytes
+drumdef DR_musicseq_kick,PE_musicseq_kick,$80
+drumdef DR_musicseq_snare,PE_musicseq_snare,$80
+drumdef DR_musicseq_clhat,PE_musicseq_hihat,$80
+drumdef DR_musicseq_ohat,PE_musicseq_openhat,$80
+drumdef DR_musicseq_tkick,PE_musicseq_kick,PE_musicseq_trikick
+drumdef DR_musicseq_tsnare,PE_musicseq_snare,PE_musicseq_trisnare
+drumdef DR_musicseq_tsohat,PE_musicseq_snarehat,PE_musicseq_trisnare
+drumdef DR_musicseq_tubkick,PE_musicseq_kick,PE_musicseq_tubfloorA
+drumdef DR_musicseq_arghatbuzz,PE_musicseq_arghatbuzz,$80
+drumdef DR_musicseq_quiethat,PE_musicseq_quiethat,$80
+drumdef DR_musicseq_shorthat,PE_musicseq_shorthat,$80
+drumdef DR_musicseq_stickskick,PE_musicseq_stickskick,$80
+drumdef DR_musicseq_stickshatlo,PE_musicseq_stickshatlo,$80
+drumdef DR_musicseq_lkick,PE_musicseq_longkick,PE_musicseq_trikick
+drumdef DR_musicseq_lsnare,PE_musicseq_longsnare,PE_musicseq_trisnare
+drumdef DR_pino_a53_kick,PE_pino_a53_kick,PE_pino_a53_tkick
+drumdef DR_pino_a53_snare,PE_pino_a53_snare,PE_pino_a53_tsnare
+drumdef DR_pino_a53_clhat,PE_pino_a53_clhat,$80
+drumdef DR_pino_a53_ohat,PE_pino_a53_ohat,$80
+drumdef DR_pino_a53_kickohat,PE_pino_a53_kickohat,PE_pino_a53_tkick
+drumdef DR_pino_a53_snareohat,PE_pino_a53_snareohat,PE_pino_a53_tsnare
+pently_patterns:  ; 152 entries, 3955 bytes
+patdef PP_musicseq_argument_drum34, PPDAT_musicseq_argument_drum34
+patdef PP_musicseq_argument_drum34_8, PPDAT_musicseq_argument_drum34_8
+patdef PP_musicseq_argument_commemorate3, PPDAT_musicseq_argument_commemorate3
+patdef PP_musicseq_argument_tubbassloop, PPDAT_musicseq_argument_tubbassloop
+patdef PP_musicseq_argument_intro_dut, PPDAT_musicseq_argument_intro_dut
+patdef PP_musicseq_argument_bass, PPDAT_musicseq_argument_bass
+patdef PP_musicseq_argument_melody, PPDAT_musicseq_argument_melody
+patdef PP_musicseq_argument_melodyend, PPDAT_musicseq_argument_melodyend
+patdef PP_musicseq_argument_descendingchords, PPDAT_musicseq_argument_descendingchords
+patdef PP_musicseq_argument_twinkle, PPDAT_musicseq_argument_twinkle
+patdef PP_musicseq_argument_cadenzabass, PPDAT_musicseq_argument_cadenzabass
+patdef PP_musicseq_argument_cadenza, PPDAT_musicseq_argument_cadenza
+patdef PP_musicseq_argument_cadenzaend, PPDAT_musicseq_argument_cadenzaend
+patdef PP_musicseq_argument_cadenzaend2, PPDAT_musicseq_argument_cadenzaend2
+patdef PP_musicseq_argument_cadenzaend3, PPDAT_musicseq_argument_cadenzaend3
+patdef PP_musicseq_argument_drum68, PPDAT_musicseq_argument_drum68
+patdef PP_musicseq_argument_drum68nokick, PPDAT_musicseq_argument_drum68nokick
+patdef PP_musicseq_argument_drum68allkick, PPDAT_musicseq_argument_drum68allkick
+patdef PP_musicseq_argument_drum68top, PPDAT_musicseq_argument_drum68top
+patdef PP_musicseq_argument_bass68, PPDAT_musicseq_argument_bass68
+patdef PP_musicseq_argument_harmony68_1, PPDAT_musicseq_argument_harmony68_1
+patdef PP_musicseq_argument_harmony68_2, PPDAT_musicseq_argument_harmony68_2
+patdef PP_musicseq_argument_harmony68_3, PPDAT_musicseq_argument_harmony68_3
+patdef PP_musicseq_argument_melody68, PPDAT_musicseq_argument_melody68
+patdef PP_musicseq_argument_bass68end, PPDAT_musicseq_argument_bass68end
+patdef PP_musicseq_argument_drum68topend, PPDAT_musicseq_argument_drum68topend
+patdef PP_musicseq_Isometry_triosti, PPDAT_musicseq_Isometry_triosti
+patdef PP_musicseq_Isometry_trifill, PPDAT_musicseq_Isometry_trifill
+patdef PP_musicseq_Isometry_tinkle1, PPDAT_musicseq_Isometry_tinkle1
+patdef PP_musicseq_Isometry_tinkle2, PPDAT_musicseq_Isometry_tinkle2
+patdef PP_musicseq_Isometry_tinkle3, PPDAT_musicseq_Isometry_tinkle3
+patdef PP_musicseq_Isometry_melmin1, PPDAT_musicseq_Isometry_melmin1
+patdef PP_musicseq_Isometry_melmaj1, PPDAT_musicseq_Isometry_melmaj1
+patdef PP_musicseq_Isometry_melmin2, PPDAT_musicseq_Isometry_melmin2
+patdef PP_musicseq_Isometry_melmaj2, PPDAT_musicseq_Isometry_melmaj2
+patdef PP_musicseq_Isometry_drum, PPDAT_musicseq_Isometry_drum
+patdef PP_musicseq_Isometry_drumfill, PPDAT_musicseq_Isometry_drumfill
+patdef PP_musicseq_Isometry_restperiod1, PPDAT_musicseq_Isometry_restperiod1
+patdef PP_musicseq_Isometry_restperiod2, PPDAT_musicseq_Isometry_restperiod2
+patdef PP_musicseq_Sticks_introbanjo1, PPDAT_musicseq_Sticks_introbanjo1
+patdef PP_musicseq_Sticks_introch2, PPDAT_musicseq_Sticks_introch2
+patdef PP_musicseq_Sticks_introbanjo2, PPDAT_musicseq_Sticks_introbanjo2
+patdef PP_musicseq_Sticks_introbass, PPDAT_musicseq_Sticks_introbass
+patdef PP_musicseq_Sticks_introdrum, PPDAT_musicseq_Sticks_introdrum
+patdef PP_musicseq_Sticks_bassstart, PPDAT_musicseq_Sticks_bassstart
+patdef PP_musicseq_Sticks_bass, PPDAT_musicseq_Sticks_bass
+patdef PP_musicseq_Sticks_chords1start, PPDAT_musicseq_Sticks_chords1start
+patdef PP_musicseq_Sticks_chords1, PPDAT_musicseq_Sticks_chords1
+patdef PP_musicseq_Sticks_chords2, PPDAT_musicseq_Sticks_chords2
+patdef PP_musicseq_Sticks_drum, PPDAT_musicseq_Sticks_drum
+patdef PP_musicseq_Sticks_v_iv_bass, PPDAT_musicseq_Sticks_v_iv_bass
+patdef PP_musicseq_Sticks_v_iv_chords1, PPDAT_musicseq_Sticks_v_iv_chords1
+patdef PP_musicseq_Sticks_v_iv_chords2, PPDAT_musicseq_Sticks_v_iv_chords2
+patdef PP_musicseq_twinkle_melody, PPDAT_musicseq_twinkle_melody
+patdef PP_musicseq_twinkle_bassline, PPDAT_musicseq_twinkle_bassline
+patdef PP_musicseq_twinkle_bassfinal, PPDAT_musicseq_twinkle_bassfinal
+patdef PP_musicseq_twinkle_beat, PPDAT_musicseq_twinkle_beat
+patdef PP_musicseq_canon_bass, PPDAT_musicseq_canon_bass
+patdef PP_musicseq_canon_melody, PPDAT_musicseq_canon_melody
+patdef PP_musicseq_bf98_orchhits, PPDAT_musicseq_bf98_orchhits
+patdef PP_musicseq_bf98_drums, PPDAT_musicseq_bf98_drums
+patdef PP_musicseq_bf98_drums_resumefill, PPDAT_musicseq_bf98_drums_resumefill
+patdef PP_musicseq_bf98_drums_tripletfill, PPDAT_musicseq_bf98_drums_tripletfill
+patdef PP_musicseq_bf98_drums_quietfill, PPDAT_musicseq_bf98_drums_quietfill
+patdef PP_musicseq_bf98_drums_break, PPDAT_musicseq_bf98_drums_break
+patdef PP_musicseq_bf98_bassA, PPDAT_musicseq_bf98_bassA
+patdef PP_musicseq_bf98_melodyA, PPDAT_musicseq_bf98_melodyA
+patdef PP_musicseq_bf98_thirdsA, PPDAT_musicseq_bf98_thirdsA
+patdef PP_musicseq_bf98_osti1, PPDAT_musicseq_bf98_osti1
+patdef PP_musicseq_bf98_osti2, PPDAT_musicseq_bf98_osti2
+patdef PP_musicseq_bf98_melodyB1, PPDAT_musicseq_bf98_melodyB1
+patdef PP_musicseq_bf98_counterB1, PPDAT_musicseq_bf98_counterB1
+patdef PP_musicseq_bf98_bassB1, PPDAT_musicseq_bf98_bassB1
+patdef PP_musicseq_bf98_melodyB2, PPDAT_musicseq_bf98_melodyB2
+patdef PP_musicseq_bf98_counterB2, PPDAT_musicseq_bf98_counterB2
+patdef PP_musicseq_bf98_bassB2, PPDAT_musicseq_bf98_bassB2
+patdef PP_musicseq_arp_waltz_bass1, PPDAT_musicseq_arp_waltz_bass1
+patdef PP_musicseq_arp_waltz_bass2, PPDAT_musicseq_arp_waltz_bass2
+patdef PP_musicseq_arp_waltz_bassintro, PPDAT_musicseq_arp_waltz_bassintro
+patdef PP_musicseq_arp_waltz_melody, PPDAT_musicseq_arp_waltz_melody
+patdef PP_musicseq_allfeatures_between, PPDAT_musicseq_allfeatures_between
+patdef PP_musicseq_allfeatures_drumfill, PPDAT_musicseq_allfeatures_drumfill
+patdef PP_musicseq_allfeatures_drum, PPDAT_musicseq_allfeatures_drum
+patdef PP_musicseq_allfeatures_chords, PPDAT_musicseq_allfeatures_chords
+patdef PP_musicseq_allfeatures_bass, PPDAT_musicseq_allfeatures_bass
+patdef PP_musicseq_Stairs_lead1, PPDAT_musicseq_Stairs_lead1
+patdef PP_musicseq_Stairs_lead1end, PPDAT_musicseq_Stairs_lead1end
+patdef PP_musicseq_Stairs_introg, PPDAT_musicseq_Stairs_introg
+patdef PP_musicseq_Stairs_bass, PPDAT_musicseq_Stairs_bass
+patdef PP_musicseq_Stairs_lead2, PPDAT_musicseq_Stairs_lead2
+patdef PP_musicseq_Stairs_lead2end, PPDAT_musicseq_Stairs_lead2end
+patdef PP_musicseq_attacktest_drumfill, PPDAT_musicseq_attacktest_drumfill
+patdef PP_musicseq_attacktest_drums, PPDAT_musicseq_attacktest_drums
+patdef PP_musicseq_attacktest_bass, PPDAT_musicseq_attacktest_bass
+patdef PP_musicseq_attacktest_atk, PPDAT_musicseq_attacktest_atk
+patdef PP_pino_a53_croom_intro_chords1, PPDAT_pino_a53_croom_intro_chords1
+patdef PP_pino_a53_croom_intro_chords2, PPDAT_pino_a53_croom_intro_chords2
+patdef PP_pino_a53_croom_intro_bass, PPDAT_pino_a53_croom_intro_bass
+patdef PP_pino_a53_croom_cleared_melody, PPDAT_pino_a53_croom_cleared_melody
+patdef PP_pino_a53_croom_cleared_bass, PPDAT_pino_a53_croom_cleared_bass
+patdef PP_pino_a53_thwaite_0200_bass, PPDAT_pino_a53_thwaite_0200_bass
+patdef PP_pino_a53_thwaite_0200_backing, PPDAT_pino_a53_thwaite_0200_backing
+patdef PP_pino_a53_thwaite_0200_melody, PPDAT_pino_a53_thwaite_0200_melody
+patdef PP_pino_a53_thwaite_0200_drums, PPDAT_pino_a53_thwaite_0200_drums
+patdef PP_pino_a53_thwaite_0300_drums, PPDAT_pino_a53_thwaite_0300_drums
+patdef PP_pino_a53_thwaite_0300_bass1, PPDAT_pino_a53_thwaite_0300_bass1
+patdef PP_pino_a53_thwaite_0300_bass2, PPDAT_pino_a53_thwaite_0300_bass2
+patdef PP_pino_a53_thwaite_0300_melA, PPDAT_pino_a53_thwaite_0300_melA
+patdef PP_pino_a53_thwaite_0300_backingA, PPDAT_pino_a53_thwaite_0300_backingA
+patdef PP_pino_a53_thwaite_0300_melB, PPDAT_pino_a53_thwaite_0300_melB
+patdef PP_pino_a53_thwaite_0400_drum2, PPDAT_pino_a53_thwaite_0400_drum2
+patdef PP_pino_a53_thwaite_0400_drum1, PPDAT_pino_a53_thwaite_0400_drum1
+patdef PP_pino_a53_thwaite_0400_chords1, PPDAT_pino_a53_thwaite_0400_chords1
+patdef PP_pino_a53_thwaite_0400_chords2, PPDAT_pino_a53_thwaite_0400_chords2
+patdef PP_pino_a53_thwaite_0500_backing, PPDAT_pino_a53_thwaite_0500_backing
+patdef PP_pino_a53_thwaite_0500_melody, PPDAT_pino_a53_thwaite_0500_melody
+patdef PP_pino_a53_thwaite_0500_bass, PPDAT_pino_a53_thwaite_0500_bass
+patdef PP_pino_a53_thwaite_1600_drum, PPDAT_pino_a53_thwaite_1600_drum
+patdef PP_pino_a53_thwaite_1600_chords1, PPDAT_pino_a53_thwaite_1600_chords1
+patdef PP_pino_a53_thwaite_1600_chords2, PPDAT_pino_a53_thwaite_1600_chords2
+patdef PP_pino_a53_thwaite_1600_bass, PPDAT_pino_a53_thwaite_1600_bass
+patdef PP_pino_a53_thwaite_town_tune_town_tune, PPDAT_pino_a53_thwaite_town_tune_town_tune
+patdef PP_pino_a53_tennis_win_point_orchhits, PPDAT_pino_a53_tennis_win_point_orchhits
+patdef PP_pino_a53_tennis_win_point_bass, PPDAT_pino_a53_tennis_win_point_bass
+patdef PP_pino_a53_tennis_win_point_drum, PPDAT_pino_a53_tennis_win_point_drum
+patdef PP_pino_a53_tennis_win_game_fanfare, PPDAT_pino_a53_tennis_win_game_fanfare
+patdef PP_pino_a53_tennis_win_game_fanfarejoinin, PPDAT_pino_a53_tennis_win_game_fanfarejoinin
+patdef PP_pino_a53_tennis_win_game_drum, PPDAT_pino_a53_tennis_win_game_drum
+patdef PP_pino_a53_axe_beat_sq1, PPDAT_pino_a53_axe_beat_sq1
+patdef PP_pino_a53_axe_beat_drum, PPDAT_pino_a53_axe_beat_drum
+patdef PP_pino_a53_axe_beat_tiestream, PPDAT_pino_a53_axe_beat_tiestream
+patdef PP_pino_a53_rhde_battle_drums, PPDAT_pino_a53_rhde_battle_drums
+patdef PP_pino_a53_rhde_battle_bassA, PPDAT_pino_a53_rhde_battle_bassA
+patdef PP_pino_a53_rhde_battle_bassAend, PPDAT_pino_a53_rhde_battle_bassAend
+patdef PP_pino_a53_rhde_battle_bassB, PPDAT_pino_a53_rhde_battle_bassB
+patdef PP_pino_a53_rhde_battle_melA, PPDAT_pino_a53_rhde_battle_melA
+patdef PP_pino_a53_rhde_battle_backingA, PPDAT_pino_a53_rhde_battle_backingA
+patdef PP_pino_a53_rhde_battle_backingAend, PPDAT_pino_a53_rhde_battle_backingAend
+patdef PP_pino_a53_rhde_battle_melB, PPDAT_pino_a53_rhde_battle_melB
+patdef PP_pino_a53_rhde_battle_backingB, PPDAT_pino_a53_rhde_battle_backingB
+patdef PP_pino_a53_rhde_kalinka_intro, PPDAT_pino_a53_rhde_kalinka_intro
+patdef PP_pino_a53_rhde_kalinka_introdrum, PPDAT_pino_a53_rhde_kalinka_introdrum
+patdef PP_pino_a53_rhde_kalinka_bassA, PPDAT_pino_a53_rhde_kalinka_bassA
+patdef PP_pino_a53_rhde_kalinka_partA, PPDAT_pino_a53_rhde_kalinka_partA
+patdef PP_pino_a53_rhde_kalinka_drum, PPDAT_pino_a53_rhde_kalinka_drum
+patdef PP_pino_a53_rhde_kalinka_drumfill, PPDAT_pino_a53_rhde_kalinka_drumfill
+patdef PP_pino_a53_rhde_kalinka_bassB, PPDAT_pino_a53_rhde_kalinka_bassB
+patdef PP_pino_a53_rhde_kalinka_chordsB, PPDAT_pino_a53_rhde_kalinka_chordsB
+patdef PP_pino_a53_rhde_kalinka_ending_p1, PPDAT_pino_a53_rhde_kalinka_ending_p1
+patdef PP_pino_a53_rhde_kalinka_ending_p2, PPDAT_pino_a53_rhde_kalinka_ending_p2
+patdef PP_pino_a53_rhde_kalinka_ending_tri, PPDAT_pino_a53_rhde_kalinka_ending_tri
+patdef PP_pino_a53_K_231_LMIA, PPDAT_pino_a53_K_231_LMIA
+PPDAT_musicseq_argument_drum34:
+.byte DR_musicseq_tubkick|D_8,DR_musicseq_shorthat|D_8,DR_musicseq_shorthat|D_8
+.byte PATEND
+PPDAT_musicseq_argument_drum34_8:
+.byte DR_musicseq_tubkick,DR_musicseq_quiethat,DR_musicseq_shorthat
+.byte DR_musicseq_arghatbuzz,DR_musicseq_shorthat,DR_musicseq_quiethat,PATEND
+PPDAT_musicseq_argument_commemorate3:
+.byte INSTRUMENT,PI_musicseq_vowele,N_D,N_F,REST,N_E,N_F|D_8,N_E|D_8,REST
+.byte INSTRUMENT,PI_musicseq_vowela,N_F,GRACE,4,N_TIE
+.byte INSTRUMENT,PI_musicseq_vowele,N_E|D_8,N_DS,GRACE,4,N_TIE
+.byte INSTRUMENT,PI_musicseq_bf98_flute2,N_D|D_8,INSTRUMENT,PI_musicseq_vowele
+.byte N_FS,GRACE,4,REST,INSTRUMENT,PI_musicseq_bf98_flute2,N_DS|D_8
+.byte INSTRUMENT,PI_musicseq_vowela,N_D,GRACE,4,REST
+.byte INSTRUMENT,PI_musicseq_vowele,N_CS|D_8,INSTRUMENT,PI_musicseq_bf98_flute2
+.byte REST|D_8,INSTRUMENT,PI_musicseq_bf98_flute2,N_CS
+.byte INSTRUMENT,PI_musicseq_vowela,GRACE,7,N_DS,REST
+.byte INSTRUMENT,PI_musicseq_vowele,N_CS,INSTRUMENT,PI_musicseq_bf98_flute2,N_F
+.byte GRACE,4,N_TIE,INSTRUMENT,PI_musicseq_vowele,N_E|D_8,N_CS,GRACE,4,REST
+.byte N_E|D_8,N_DS|D_8,REST,N_CS,INSTRUMENT,PI_musicseq_bf98_flute2,GRACE,4
+.byte REST,N_DS|D_8,INSTRUMENT,PI_musicseq_vowele,N_CS
+.byte INSTRUMENT,PI_musicseq_vowela,N_C,REST,GRACE,4,N_G,N_C|D_8
+.byte INSTRUMENT,PI_musicseq_vowele,N_CS|D_8,REST|D_4,PATEND
+PPDAT_musicseq_argument_tubbassloop:
+.byte INSTRUMENT,PI_musicseq_tubbass_slow,N_CS,LEGATO_ON,N_C|D_2,N_TIE|D_D8
+.byte LEGATO_OFF,REST|D_D4,REST|D_D4,PATEND
+PPDAT_musicseq_argument_intro_dut:
+.byte N_C|D_D4,REST|D_D4,N_C|D_D4,REST|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_8,N_C|D_8
+.byte N_C|D_8,N_C,N_C,N_C,N_C,N_C,N_C,PATEND
+PPDAT_musicseq_argument_bass:
+.byte N_D|D_8,N_DH,N_D|D_8,N_DH,N_D|D_8,N_DH|D_8,N_D|D_8,N_F|D_8,N_FH,N_F|D_8
+.byte N_FH,N_F|D_8,N_FH|D_8,N_F|D_8,N_C|D_8,N_CH,N_C|D_8,N_CH,N_C|D_8,N_CH|D_8
+.byte N_C|D_8,N_G|D_8,N_GH,N_G|D_8,N_GH,N_G|D_8,N_GH|D_8,N_G|D_8,PATEND
+PPDAT_musicseq_argument_melody:
+.byte N_E|D_2,N_TIE|D_8,N_G|D_8,N_D|D_2,N_TIE|D_8,N_C|D_8,N_E|D_2,N_TIE|D_8
+.byte N_G|D_8,N_D|D_D2,PATEND
+PPDAT_musicseq_argument_melodyend:
+.byte N_C,N_CS,REST|D_4,PATEND
+PPDAT_musicseq_argument_descendingchords:
+.byte N_CHH,N_GSH,N_FH,N_CH,N_GS,N_F,N_C,TRANSPOSE,<-19,N_DSH,N_CH,N_G,N_DS,N_C
+.byte TRANSPOSE,<22,N_CHH,N_AH,N_FH,N_CH,N_A,N_F,N_C,TRANSPOSE,<-19,N_EH,N_CH
+.byte N_G,N_E,N_C,TRANSPOSE,<19,N_CHH,N_GH,N_EH,N_CH,N_G,N_E,N_C,TRANSPOSE,<-20
+.byte N_DSH,N_CH,N_GS,N_DS,N_C,TRANSPOSE,<19,N_CHH,N_GSH,N_DSH,N_CH,N_GS,N_DS
+.byte N_C,TRANSPOSE,<-21,N_FH,N_CH,N_A,N_F,N_C,TRANSPOSE,<19,PATEND
+PPDAT_musicseq_argument_twinkle:
+.byte REST|D_8,N_CS|D_8,N_DS|D_8,N_F|D_D4,REST|D_8,N_F|D_8,N_G|D_8,N_GS|D_D4
+.byte REST|D_8,N_C|D_8,N_CS|D_8,N_DS|D_D4,REST|D_8,N_DS|D_8,N_F|D_8,N_G|D_D4
+.byte PATEND
+PPDAT_musicseq_argument_cadenzabass:
+.byte N_D|D_D2,N_F|D_D2,N_C|D_D2,N_G|D_D2,PATEND
+PPDAT_musicseq_argument_cadenza:
+.byte N_AH|D_8,N_GH|D_8,N_FH|D_8,N_GH|D_8,N_AH|D_8,N_DH|D_8,N_FH|D_8,N_CH|D_8
+.byte N_DH|D_8,N_A|D_8,N_CH|D_8,N_F|D_8,N_G|D_8,N_C|D_8,N_E|D_8,TRANSPOSE,<-22
+.byte N_FH|D_8,N_ASH|D_8,N_DH|D_8,N_FH|D_8,N_A|D_8,N_CH|D_8,N_F|D_8,N_A|D_8
+.byte N_C|D_8,N_DS|D_8,N_G|D_8,N_CH|D_8,N_G|D_8,N_CH|D_8,N_DSH|D_8,N_AS|D_8
+.byte N_DSH|D_8,N_GH|D_8,N_DSH|D_8,N_GH|D_8,N_ASH|D_8,N_FH|D_8,N_ASH|D_8
+.byte TRANSPOSE,<22,N_E|D_8,N_C|D_8,N_E|D_8,N_G|D_8,N_D|D_8,N_G|D_8,N_B|D_8
+.byte N_G|D_8,N_B|D_8,N_DH|D_8,PATEND
+PPDAT_musicseq_argument_cadenzaend:
+.byte N_C|D_8,N_E|D_8,N_A|D_8,N_CH|D_8,N_EH|D_8,N_AH|D_8,N_CHH|D_8
+.byte TRANSPOSE,<23,N_F|D_8,N_GS|D_8,N_CSH|D_8,N_FH|D_8,N_GSH|D_8,N_CHH,N_ASH
+.byte N_GSH,N_FH,N_DSH,N_CH,N_AS,N_GS,N_F,N_DS,N_C,TRANSPOSE,<-5,N_DS,N_C|D_2
+.byte N_TIE|D_8,BEND,$01,TRANSPOSE,<-24,N_C|D_8,TRANSPOSE,<6,PATEND
+PPDAT_musicseq_argument_cadenzaend2:
+.byte N_CHH,N_ASH,N_GH,N_FH,N_DSH,N_CH,N_AS,N_G,N_F,N_DS,N_C,TRANSPOSE,<-7,N_F
+.byte N_C|D_D4,REST|D_D4,TRANSPOSE,<7,PATEND
+PPDAT_musicseq_argument_cadenzaend3:
+.byte N_CHH|D_4,BEND,$01,N_C|D_8,PATEND
+PPDAT_musicseq_argument_drum68:
+.byte DR_musicseq_tkick,DR_musicseq_quiethat,DR_musicseq_quiethat
+PPDAT_musicseq_argument_drum68nokick:
+.byte DR_musicseq_shorthat,DR_musicseq_quiethat,DR_musicseq_quiethat,PATEND
+PPDAT_musicseq_argument_drum68allkick:
+.byte DR_musicseq_tkick,DR_musicseq_quiethat,DR_musicseq_quiethat,PATEND
+PPDAT_musicseq_argument_drum68top:
+.byte N_C|D_D8,PATEND
+PPDAT_musicseq_argument_bass68:
+.byte N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_D,N_F,N_F,N_F,N_F,N_F,N_F
+.byte N_F,N_F,N_F,N_F,N_F,N_F,N_C,N_C,N_C,N_C,N_C,N_C,N_C,N_C,N_C,N_C,N_C,N_C
+.byte N_G,N_G,N_G,N_G,N_G,N_G,N_G,N_G,N_G,N_G,N_G,N_G,PATEND
+PPDAT_musicseq_argument_harmony68_1:
+.byte BEND,$00,N_C,REST|D_8,REST|D_D8,REST|D_D4,N_DS,REST|D_8,REST|D_D8
+.byte REST|D_D4,N_DS,REST|D_8,REST|D_D8,REST|D_D4,N_D,REST|D_8,REST|D_D8
+.byte REST|D_D4,PATEND
+PPDAT_musicseq_argument_harmony68_2:
+.byte BEND,$00,N_D|D_D4,REST|D_D4,N_F|D_D4,REST|D_D4,N_C|D_D4,REST|D_D4
+.byte N_G|D_D4,REST|D_D4,PATEND
+PPDAT_musicseq_argument_harmony68_3:
+.byte N_C,REST|D_8,REST|D_D8,REST|D_D4,N_E,REST|D_8,REST|D_D8,REST|D_D4,N_D
+.byte REST|D_8,REST|D_D8,REST|D_D4,N_D,REST|D_8,REST|D_D8,REST|D_D4,PATEND
+PPDAT_musicseq_argument_melody68:
+.byte N_A,N_D,N_F,N_A,N_G,N_F,N_G,REST,N_A,REST|D_D8,N_CH,N_C,N_F,N_A,N_G,N_F
+.byte N_G,REST,N_A,REST,N_G,N_F,N_CH,N_C,N_E,N_G,N_F,N_E,N_F,REST,N_G,REST|D_D8
+.byte N_B,N_D,N_G,N_B,N_A,N_G,REST,N_B|D_8,N_CH,N_CSH,N_DH,PATEND
+PPDAT_musicseq_argument_bass68end:
+.byte N_D|D_8,N_D|D_8,N_D|D_8,N_D|D_8,N_D|D_8,N_D|D_8,N_F|D_8,N_F|D_8,N_F|D_8
+.byte N_F|D_8,N_F|D_8,N_F|D_8,N_C|D_8,N_C|D_8,N_C|D_8,N_C|D_8,N_C|D_8,N_C|D_8
+.byte N_G|D_8,N_G|D_8,N_G|D_8,N_G|D_8,N_G|D_8,N_G|D_8,PATEND
+PPDAT_musicseq_argument_drum68topend:
+.byte N_C|D_D4,PATEND
+PPDAT_musicseq_Isometry_triosti:
+.byte N_C,PATEND
+PPDAT_musicseq_Isometry_trifill:
+.byte N_C,REST|D_D8,PATEND
+PPDAT_musicseq_Isometry_tinkle1:
+.byte N_CH,N_GS,N_DS,N_C,PATEND
+PPDAT_musicseq_Isometry_tinkle2:
+.byte N_B,N_A,N_F,N_C,PATEND
+PPDAT_musicseq_Isometry_tinkle3:
+.byte N_CH,N_A,N_F,N_C,PATEND
+PPDAT_musicseq_Isometry_melmin1:
+.byte N_D|D_D8,N_D|D_D8,N_E|D_D4,N_F|D_8,N_E|D_8,N_D|D_D8,N_D|D_D8,N_C|D_2
+.byte N_TIE|D_8
+PPDAT_musicseq_Isometry_melmaj1:
+.byte N_D|D_D8,N_D|D_D8,N_E|D_D4,N_FS|D_8,N_E|D_8,N_D|D_D8,N_D|D_D8,N_C|D_2
+.byte N_TIE|D_8,PATEND
+PPDAT_musicseq_Isometry_melmin2:
+.byte N_CS|D_D8,N_CS|D_D8,N_DS|D_D4,N_F|D_8,N_DS|D_8,N_CS|D_D8,N_CS|D_D8
+.byte N_C|D_2,N_TIE|D_8
+PPDAT_musicseq_Isometry_melmaj2:
+.byte N_D|D_D8,N_D|D_D8,N_DS|D_D4,N_F|D_8,N_DS|D_8,N_D|D_D8,N_D|D_D8,N_C|D_2
+.byte N_TIE|D_8,PATEND
+PPDAT_musicseq_Isometry_drum:
+.byte DR_musicseq_lkick|D_4,DR_musicseq_lsnare|D_4,DR_musicseq_clhat|D_4
+.byte DR_musicseq_lsnare|D_4,DR_musicseq_clhat|D_4,DR_musicseq_lsnare|D_4
+.byte DR_musicseq_clhat|D_4,DR_musicseq_lsnare|D_4,PATEND
+PPDAT_musicseq_Isometry_drumfill:
+.byte DR_musicseq_kick|D_4,PATEND
+PPDAT_musicseq_Isometry_restperiod1:
+.byte N_C|D_D4,N_CS|D_D4,N_DS|D_1,N_TIE|D_4,PATEND
+PPDAT_musicseq_Isometry_restperiod2:
+.byte N_C|D_D4,N_D|D_D4,N_DS|D_1,N_TIE|D_4,N_C|D_D4,N_D|D_D4,N_E|D_1,N_TIE|D_4
+.byte PATEND
+PPDAT_musicseq_Sticks_introbanjo1:
+.byte N_TIE|D_8,REST|D_8,N_F|D_D4,N_C|D_2,N_DS|D_4,N_F|D_8,PATEND
+PPDAT_musicseq_Sticks_introch2:
+.byte N_CH|D_D4,INSTRUMENT,PI_musicseq_banjo,N_ASH|D_D4
+.byte INSTRUMENT,PI_musicseq_tubbass,N_C|D_D2,INSTRUMENT,PI_musicseq_toot0
+.byte N_DSH|D_D4,INSTRUMENT,PI_musicseq_banjo,N_ASH|D_D4
+.byte INSTRUMENT,PI_musicseq_tubbass,N_DS|D_D2,INSTRUMENT,PI_musicseq_toot0
+.byte N_FH|D_D4,INSTRUMENT,PI_musicseq_banjo,N_ASH|D_D4
+.byte INSTRUMENT,PI_musicseq_tubbass,N_F|D_D4,INSTRUMENT,PI_musicseq_banjo
+.byte N_CH|D_D4,INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-5,N_C|D_D4
+.byte INSTRUMENT,PI_musicseq_banjo,ARPEGGIO,$37,TRANSPOSE,<36,N_C|D_D4
+.byte INSTRUMENT,PI_musicseq_tubbass,ARPEGGIO,$00,TRANSPOSE,<-33,N_C|D_D4
+.byte INSTRUMENT,PI_musicseq_banjo,ARPEGGIO,$47,TRANSPOSE,<36,N_C|D_4
+.byte INSTRUMENT,PI_musicseq_tubbass,ARPEGGIO,$00,TRANSPOSE,<-36,N_C|D_8
+.byte N_D|D_1,N_TIE|D_8,REST|D_D4,TRANSPOSE,<2,PATEND
+PPDAT_musicseq_Sticks_introbanjo2:
+.byte N_C|D_D4,N_CS|D_4,N_DS|D_8,N_F|D_4,N_DS|D_8,N_F|D_D4,N_F|D_4,N_GS|D_D4
+.byte N_AS|D_8,ARPEGGIO,$47,N_DSH|D_1,N_TIE|D_8,ARPEGGIO,$00,REST|D_D4,PATEND
+PPDAT_musicseq_Sticks_introbass:
+.byte N_C|D_D2,N_DS|D_2,N_TIE|D_8,N_DS|D_8,N_F|D_1,N_TIE|D_8,REST|D_D4,PATEND
+PPDAT_musicseq_Sticks_introdrum:
+.byte DR_musicseq_clhat|D_2,N_TIE|D_8,DR_musicseq_clhat|D_8
+.byte DR_musicseq_clhat|D_2,N_TIE|D_8,DR_musicseq_clhat|D_8
+.byte DR_musicseq_clhat|D_1,N_TIE|D_8,DR_musicseq_stickskick|D_1,N_TIE|D_2
+.byte DR_musicseq_clhat|D_D4,PATEND
+PPDAT_musicseq_Sticks_bassstart:
+.byte N_TIE|D_4,N_D|D_2,N_D|D_2,N_TIE|D_8,N_C|D_2,N_C|D_1,N_TIE|D_8,PATEND
+PPDAT_musicseq_Sticks_bass:
+.byte INSTRUMENT,PI_musicseq_toot0,N_C|D_4,INSTRUMENT,PI_musicseq_isobeep
+.byte TRANSPOSE,<29,N_D|D_2,N_D|D_2,N_TIE|D_8,N_C|D_2,N_C|D_1,N_TIE|D_8
+.byte TRANSPOSE,<-29,PATEND
+PPDAT_musicseq_Sticks_chords1start:
+.byte N_TIE|D_4,INSTRUMENT,PI_musicseq_toot0,N_DS|D_2,N_CS|D_2,N_TIE|D_8
+.byte N_C|D_2,N_C|D_1,N_TIE|D_8,PATEND
+PPDAT_musicseq_Sticks_chords1:
+.byte INSTRUMENT,PI_musicseq_tubbass,N_C|D_4,INSTRUMENT,PI_musicseq_toot0
+.byte TRANSPOSE,<33,N_DS|D_2,N_CS|D_2,N_TIE|D_8,N_C|D_2,N_C|D_2,N_TIE|D_D8
+.byte GRACE,4,N_TIE,N_CH,GRACE,2,N_TIE,N_CSH,N_DSH|D_4,N_TIE
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-33,N_C|D_4
+.byte INSTRUMENT,PI_musicseq_toot0,TRANSPOSE,<33,N_DS|D_2,N_CS|D_2,N_TIE|D_8
+.byte N_C|D_2,N_C|D_D4,N_CH|D_4,N_CH|D_8,N_AS|D_D4,TRANSPOSE,<-33,PATEND
+PPDAT_musicseq_Sticks_chords2:
+.byte N_TIE|D_4,N_E|D_2,N_D|D_2,N_TIE|D_8,N_C|D_2,N_C|D_1,N_TIE|D_8,PATEND
+PPDAT_musicseq_Sticks_drum:
+.byte DR_musicseq_stickskick|D_D2,DR_musicseq_clhat|D_D2
+.byte DR_musicseq_stickshatlo|D_D2,DR_musicseq_clhat|D_D2,PATEND
+PPDAT_musicseq_Sticks_v_iv_bass:
+.byte INSTRUMENT,PI_musicseq_toot0,N_C|D_4,INSTRUMENT,PI_musicseq_isobeep
+.byte N_CHH|D_2,N_CHH|D_2,N_TIE|D_8,TRANSPOSE,<22,N_F|D_2,N_F|D_2,N_TIE|D_8
+.byte N_D|D_2,N_C|D_2,N_TIE|D_8,N_C|D_2,N_C|D_1,N_TIE|D_8
+.byte INSTRUMENT,PI_musicseq_toot0,TRANSPOSE,<-24,N_C|D_D2,TRANSPOSE,<2,PATEND
+PPDAT_musicseq_Sticks_v_iv_chords1:
+.byte REST|D_4,N_CSH|D_2,N_DSH|D_2,N_TIE|D_8,N_FH|D_2,N_FH|D_2,N_TIE|D_8
+.byte N_CSH|D_2,N_CSH|D_2,N_TIE|D_8,N_CH|D_2,N_CH|D_D4
+.byte INSTRUMENT,PI_musicseq_banjo,N_GS|D_D4,N_C|D_D4,N_C|D_D2,PATEND
+PPDAT_musicseq_Sticks_v_iv_chords2:
+.byte N_C|D_4,INSTRUMENT,PI_musicseq_toot0,TRANSPOSE,<17,N_DH|D_2,N_EH|D_2
+.byte N_TIE|D_8,N_FH|D_2,N_FH|D_2,N_TIE|D_8,N_DH|D_2,N_DH|D_2,N_TIE|D_8
+.byte N_CH|D_2,N_CH|D_D4,INSTRUMENT,PI_musicseq_banjo,REST|D_4,N_C|D_D4,N_C|D_8
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-19,N_C|D_4
+.byte INSTRUMENT,PI_musicseq_banjo,N_CH|D_8,N_B|D_4,N_A|D_8,TRANSPOSE,<2,PATEND
+PPDAT_musicseq_twinkle_melody:
+.byte N_C|D_D8,N_C|D_D8,N_G|D_D8,N_G|D_D8,N_A|D_D8,N_A|D_D8,N_G|D_D4,N_F|D_D8
+.byte N_F|D_D8,N_E|D_D8,N_E|D_D8,N_D|D_D8,N_D|D_D8,N_C|D_D4,N_G|D_D8,N_G|D_D8
+.byte N_F|D_D8,N_F|D_D8,N_E|D_D8,N_E|D_D8,N_D|D_D4,N_G|D_D8,N_G|D_D8,N_F|D_D8
+.byte N_F|D_D8,N_E|D_D8,N_E|D_D8,N_D|D_D4,PATEND
+PPDAT_musicseq_twinkle_bassline:
+.byte N_F|D_D8,N_CH|D_D8,N_A|D_D8,N_CH|D_D8,N_AS|D_D8,N_F|D_D8,N_A|D_D8
+.byte N_F|D_D8,N_G|D_D8,N_AS|D_D8,N_F|D_D8,N_A|D_D8,N_CH|D_D8,N_E|D_D8,N_F|D_D8
+.byte N_CH|D_D8,N_A|D_D8,N_CH|D_D8,N_G|D_D8,N_AS|D_D8,N_F|D_D8,N_A|D_D8
+.byte N_CH|D_D8,N_G|D_D8,N_A|D_D8,N_CH|D_D8,N_G|D_D8,N_AS|D_D8,N_F|D_D8
+.byte N_A|D_D8,N_CH|D_D8,N_C|D_D8,PATEND
+PPDAT_musicseq_twinkle_bassfinal:
+.byte N_C|D_D4,PATEND
+PPDAT_musicseq_twinkle_beat:
+.byte DR_musicseq_tkick|D_D8,DR_musicseq_clhat|D_D8,DR_musicseq_tkick|D_D8
+.byte DR_musicseq_clhat|D_8,DR_musicseq_clhat,PATEND
+PPDAT_musicseq_canon_bass:
+.byte N_CH|D_2,N_G|D_2,N_A|D_2,N_E|D_2,N_F|D_2,N_C|D_2,N_F|D_2,N_G|D_2,PATEND
+PPDAT_musicseq_canon_melody:
+.byte VIBRATO,1,N_GH|D_2,N_FH|D_2,N_DSH|D_2,N_DH|D_2,N_CH|D_2,N_AS|D_2,N_CH|D_2
+.byte N_DH|D_2,N_DSH|D_2,N_DH|D_2,N_CH|D_2,N_AS|D_2,N_GS|D_2,N_G|D_2,N_GS|D_2
+.byte N_F|D_2,N_DS|D_4,N_G|D_4,N_AS|D_4,N_GS|D_4,N_G|D_4,N_DS|D_4,N_G|D_4
+.byte N_F|D_4,N_DS|D_4,N_C|D_4,N_DS|D_4,N_AS|D_4,N_GS|D_4,N_CH|D_4,N_AS|D_4
+.byte N_GS|D_4,N_G|D_4,N_DS|D_4,N_F|D_4,N_DH|D_4,N_DSH|D_4,N_GH|D_4,N_ASH|D_4
+.byte N_AS|D_4,N_CH|D_4,N_GS|D_4,N_AS|D_4,N_G|D_4,N_DS|D_4,N_DSH|D_4,N_DSH|D_D4
+.byte N_DH|D_8,N_DSH|D_8,N_DH|D_8,N_DSH|D_8,N_DS|D_8,N_D|D_8,N_AS|D_8,N_F|D_8
+.byte N_G|D_8,N_DS|D_8,N_DSH|D_8,N_DH|D_8,N_CH|D_8,N_DH|D_8,N_GH|D_8,N_ASH|D_8
+.byte N_CHH|D_8,N_GSH|D_8,N_GH|D_8,N_FH|D_8,N_GSH|D_8,N_GH|D_8,N_FH|D_8
+.byte N_DSH|D_8,N_DH|D_8,N_CH|D_8,N_AS|D_8,N_GS|D_8,N_G|D_8,N_F|D_8,N_GS|D_8
+.byte N_G|D_8,N_F|D_8,N_DS|D_8,N_F|D_8,N_G|D_8,N_GS|D_8,N_AS|D_8,N_F|D_8
+.byte N_AS|D_8,N_GS|D_8,N_G|D_8,N_CH|D_8,N_AS|D_8,N_GS|D_8,N_AS|D_8,N_GS|D_8
+.byte N_G|D_8,N_F|D_8,N_DS|D_8,N_C|D_8,N_CH|D_8,N_DH|D_8,N_DSH|D_8,N_DH|D_8
+.byte N_CH|D_8,N_AS|D_8,N_GS|D_8,N_G|D_8,N_F|D_8,N_CH|D_8,N_AS|D_8,N_CH|D_8
+.byte N_AS|D_8,N_GS|D_8,N_G|D_4,N_GH|D_4,N_FH|D_2,REST|D_4,N_DSH|D_4,N_GH|D_2
+.byte N_CHH|D_2,N_ASH|D_2,N_CHH|D_2,TRANSPOSE,<3,N_BH|D_2,N_CHH|D_4,N_CH|D_4
+.byte N_B|D_2,REST|D_4,N_A|D_4,N_CH|D_2,N_CH|D_D2,N_CH|D_4,N_CH|D_4,N_FH|D_4
+.byte N_DH|D_4,N_GH|D_4,N_GH|D_8,N_EH,N_FH,N_GH|D_8,N_EH,N_FH,N_GH,N_G,N_A,N_B
+.byte N_CH,N_DH,N_EH,N_FH,N_EH|D_8,N_CH,N_DH,N_EH|D_8,N_E,N_F,N_G,N_A,N_G,N_F
+.byte N_G,N_E,N_F,N_G,N_F|D_8,N_A,N_G,N_F|D_8,N_E,N_D,N_E,N_D,N_C,N_D,N_E,N_F
+.byte N_G,N_A,N_F|D_8,N_A,N_G,N_A|D_8,N_B,N_CH,N_G,N_A,N_B,N_CH,N_DH,N_EH,N_FH
+.byte N_GH,N_EH|D_8,N_CH,N_DH,N_EH|D_8,N_DH,N_CH,N_DH,N_B,N_CH,N_DH,N_EH,N_DH
+.byte N_CH,N_B,N_CH|D_8,N_A,N_B,N_CH|D_8,N_C,N_D,N_E,N_F,N_E,N_D,N_E,N_CH,N_B
+.byte N_CH,N_A|D_8,N_CH,N_B,N_A|D_8,N_G,N_F,N_G,N_F,N_E,N_F,N_G,N_A,N_B,N_CH
+.byte N_A|D_8,N_CH,N_B,N_CH|D_8,N_B,N_A,N_B,N_CH,N_DH,N_CH,N_B,N_CH,N_A,N_B
+.byte N_CH|D_4,REST|D_4,N_B|D_4,REST|D_4,N_A|D_4,REST|D_4,N_CH|D_4,REST|D_4
+.byte N_C|D_4,REST|D_4,N_C|D_4,REST|D_4,N_C|D_4,REST|D_4,N_D|D_4,REST|D_4
+.byte REST|D_4,N_G|D_4,REST|D_4,N_G|D_4,REST|D_4,N_E|D_4,REST|D_4,N_G|D_4
+.byte REST|D_4,N_F|D_4,REST|D_4,N_E|D_4,REST|D_4,N_F|D_4,REST|D_4,N_DH|D_4
+.byte N_EH|D_8,N_E|D_8,N_F|D_8,N_E|D_8,N_D|D_8,N_DH|D_8,N_EH|D_8,N_DH|D_8
+.byte N_CH|D_8,N_E|D_8,N_C|D_8,N_A|D_8,N_G|D_8,TRANSPOSE,<-7,N_D|D_8,N_C|D_8
+.byte N_D|D_8,N_E|D_8,N_EH|D_8,N_FSH|D_8,N_EH|D_8,N_DH|D_8,N_D|D_8,N_C|D_8
+.byte N_D|D_8,N_E|D_8,N_EH|D_8,N_DH|D_8,N_EH|D_8,N_FSH|D_8,N_FS|D_8,N_E|D_8
+.byte N_FS|D_8,N_G|D_8,N_GH|D_8,N_AH|D_8,N_GH|D_8,N_FSH|D_8,N_FS|D_8,N_G|D_8
+.byte N_FS|D_8,N_E|D_8,N_EH|D_8,N_DH|D_8,N_EH|D_8,N_FSH|D_8,N_FS|D_8,N_B|D_8
+.byte N_A|D_8,N_G|D_8,N_GH|D_8,N_AH|D_8,N_CHH|D_8,N_BH|D_8,N_B|D_8,N_DH|D_8
+.byte N_BH|D_8,N_GH|D_8,N_CHH|D_8,N_BH|D_8,N_CHH|D_8,N_AH|D_8,N_DH|D_8,N_CH|D_8
+.byte N_DH|D_8,N_B|D_8,N_DH|D_8,N_DH|D_8,N_DH|D_8,N_DH|D_8,N_DH|D_8,N_DH|D_8
+.byte N_DH|D_8,N_B|D_8,N_B|D_8,N_B|D_8,N_B|D_8,N_B|D_8,N_B|D_8,N_DH|D_8
+.byte N_DH|D_8,N_CH|D_8,N_CH|D_8,N_CH|D_8,N_GH|D_8,N_GH|D_8,N_GH|D_8,N_GH|D_8
+.byte N_GH|D_8,N_GH|D_8,N_GH|D_8,N_EH|D_8,N_EH|D_8,N_DH|D_8,N_DH|D_8,N_AH|D_8
+.byte N_FSH|D_8,N_DH|D_8,N_BH|D_8,N_BH|D_8,N_BH|D_8,N_AH|D_8,N_AH|D_8,N_AH|D_8
+.byte N_AH|D_8,N_GH|D_8,N_GH|D_8,N_GH|D_8,N_GH|D_8,TRANSPOSE,<6,N_GSH|D_8
+.byte N_GSH|D_8,N_GSH|D_8,N_GSH|D_8,N_ASH|D_8,N_ASH|D_8,N_ASH|D_8,N_ASH|D_8
+.byte N_GSH|D_8,N_GSH|D_8,N_GSH|D_8,N_GSH|D_8,N_ASH|D_8,N_ASH|D_8,N_ASH|D_8
+.byte N_ASH|D_8,N_CHH|D_8,N_CH|D_8,N_CH|D_8,N_CH|D_8,N_CSH|D_8,N_CS,N_DS
+.byte N_F|D_8,N_CS|D_8,N_C|D_8,N_CH,N_CSH,N_DSH|D_8,N_CH|D_8,N_AS|D_8
+.byte TRANSPOSE,<-2,N_C,N_D,N_DS|D_8,N_C|D_8,N_D|D_8,N_AS,N_GS,N_G|D_8,N_F|D_8
+.byte N_DS|D_8,N_GS,N_G,N_F|D_8,N_GS|D_8,N_G|D_8,N_DS,N_F,N_G|D_8,N_AS|D_8
+.byte N_GS|D_8,N_CH,N_AS,N_GS|D_8,N_G|D_8,N_F|D_8,N_AS,N_GS,N_G|D_8,N_F|D_8
+.byte N_G|D_8,N_DSH,N_DH,N_DSH|D_8,N_G|D_8,N_AS|D_8,N_AS,N_CH,N_DH|D_8,N_AS|D_8
+.byte N_G|D_8,N_DSH,N_FH,N_GH|D_8,N_DSH|D_8,N_GH|D_8,N_GH,N_FH,N_DSH|D_8
+.byte N_DH|D_8,N_CH|D_8,N_CH,N_AS,N_CH|D_8,N_DH|D_8,N_DSH|D_8,N_GH,N_FH
+.byte N_DSH|D_8,N_GH|D_8,N_GSH|D_8,N_DSH,N_DH,N_CH|D_8,N_CH|D_8,N_AS|D_8
+.byte N_F|D_8,N_AS|D_8,N_AS|D_8,N_AS|D_D2,N_AS|D_4,N_DS|D_D2,N_AS|D_4,N_GS|D_2
+.byte N_AS|D_2,N_GS|D_4,N_DS|D_4,N_DS|D_D4,N_D|D_8,N_DS|D_4,N_DSH|D_4,N_DH|D_2
+.byte N_CH|D_2,N_AS|D_2,N_DS|D_D4,N_F|D_8,N_G|D_2,N_CH|D_2,N_F|D_D4,N_F|D_8
+.byte N_G|D_D4,N_GH|D_8,N_GH|D_8,N_GSH|D_8,N_GH|D_8,N_FH|D_8,N_DSH|D_D4
+.byte N_DSH|D_8,N_DSH|D_8,N_FH|D_8,N_DSH|D_8,N_DH|D_8,N_CH|D_2,N_DSH|D_2
+.byte N_DSH|D_8,N_CSH|D_8,N_CH|D_8,N_CSH|D_8,N_AS|D_D4,N_AS|D_8,N_AS|D_D4
+.byte N_ASH|D_8,N_ASH|D_8,N_CHH|D_8,N_ASH|D_8,N_GSH|D_8,N_GH|D_D4,N_GH|D_8
+.byte N_GH|D_8,N_GSH|D_8,N_GH|D_8,N_FH|D_8,N_DSH|D_8,N_CSH|D_8,N_CH|D_8
+.byte N_CSH|D_8,N_AS|D_D4,N_AS|D_8,N_GS|D_4,N_DSH|D_4,N_DH|D_D4,N_DH|D_8
+.byte N_DSH|D_4,N_DSH|D_2,N_DH|D_2,N_CH|D_2,N_AS|D_2,N_GS|D_2,N_G|D_2,N_TIE|D_8
+.byte N_F|D_8,N_F|D_2,N_G|D_4,N_GH|D_2,N_FH|D_4,N_DSH|D_4,TRANSPOSE,<3
+.byte N_CHH|D_2,N_ASH|D_4,N_AH|D_2,N_CHH|D_4,N_GH|D_4,N_AH|D_2,N_GH|D_2
+.byte N_GH|D_2,N_G|D_D4,N_F|D_8,N_E|D_2,N_EH|D_D4,N_DH|D_8,N_CH|D_D2,N_CH|D_4
+.byte N_CH|D_2,N_B|D_2,N_CH|D_4,N_C|D_4,TRANSPOSE,<-5,N_E|D_4,N_EH|D_4,N_DH|D_4
+.byte N_D|D_4,N_C|D_4,N_CH|D_4,N_AS|D_4,N_ASH|D_4,N_AH|D_4,N_A|D_4,N_G|D_4
+.byte N_DH|D_4,N_G|D_4,N_GH|D_4,N_AH|D_4,N_A|D_4,N_G|D_4,N_GH|D_4,N_FH|D_4
+.byte N_F|D_4,N_E|D_4,N_EH|D_4,N_DH|D_4,TRANSPOSE,<10,N_EH|D_4,N_DH|D_4,N_D|D_4
+.byte N_C|D_D4,N_A|D_8,N_D|D_4,N_D|D_4,N_D|D_2,TRANSPOSE,<-8,PATEND
+PPDAT_musicseq_bf98_orchhits:
+.byte N_E|D_D8,N_E|D_8,N_C|D_4,N_D|D_D8,N_D|D_8,N_F|D_4,PATEND
+PPDAT_musicseq_bf98_drums:
+.byte DR_musicseq_tkick|D_D8,DR_musicseq_clhat|D_8,DR_musicseq_tkick
+.byte DR_musicseq_tsnare|D_D8,DR_musicseq_tkick|D_D8,DR_musicseq_clhat|D_8
+.byte DR_musicseq_tkick,DR_musicseq_tsnare|D_D8,DR_musicseq_tkick|D_D8
+.byte DR_musicseq_clhat|D_8,DR_musicseq_tkick,DR_musicseq_tsnare|D_D8
+PPDAT_musicseq_bf98_drums_resumefill:
+.byte DR_musicseq_tkick|D_8,DR_musicseq_tsnare,DR_musicseq_clhat|D_8
+.byte DR_musicseq_tkick,DR_musicseq_tsnare|D_8,DR_musicseq_tsnare,PATEND
+PPDAT_musicseq_bf98_drums_tripletfill:
+.byte DR_musicseq_tkick|D_8,DR_musicseq_clhat,DR_musicseq_tsnare|D_8
+.byte DR_musicseq_tkick|D_8,DR_musicseq_tsnare|D_8,PATEND
+PPDAT_musicseq_bf98_drums_quietfill:
+.byte DR_musicseq_tkick|D_D8,DR_musicseq_clhat|D_D8,DR_musicseq_clhat|D_D8
+.byte PATEND
+PPDAT_musicseq_bf98_drums_break:
+.byte DR_musicseq_tkick|D_D4,DR_musicseq_clhat|D_8,DR_musicseq_tkick,PATEND
+PPDAT_musicseq_bf98_bassA:
+.byte N_D|D_8,REST,N_FS|D_8,REST,N_A|D_8,N_GS,N_G|D_8,REST,N_C|D_8,REST,N_E|D_8
+.byte REST,N_D|D_8,N_FS,N_A|D_8,REST,N_DH|D_8,N_CSH,N_CH|D_8,REST,N_G|D_8
+.byte N_GS|D_8,N_A|D_8,PATEND
+PPDAT_musicseq_bf98_melodyA:
+.byte REST|D_D8,N_D|D_8,REST,N_F|D_8,REST,N_DS|D_8,N_F,N_DS|D_8,REST,N_C|D_8
+.byte REST,N_D|D_8,N_DS,N_F|D_8,REST,N_AS|D_8,REST,GRACE,5,N_GS,N_AS|D_D8
+.byte N_GS|D_4,N_TIE,REST,PATEND
+PPDAT_musicseq_bf98_thirdsA:
+.byte REST|D_D8,N_D|D_8,REST,N_FS|D_8,REST,N_E|D_8,N_FS,N_E|D_8,REST,N_C|D_8
+.byte REST,N_D|D_8,N_E,N_FS|D_8,REST,N_A|D_8,REST,N_G|D_2,REST,PATEND
+PPDAT_musicseq_bf98_osti1:
+.byte REST|D_8,N_FS,N_A,N_A,N_A,N_A|D_8,N_FS,REST|D_8,N_E,N_G,N_G,N_G,N_G|D_8
+.byte N_E,REST|D_8,N_D,N_FS,N_FS,N_FS,N_FS|D_8,N_D,REST|D_8,N_C,N_E,N_E,N_E
+.byte N_E|D_8,N_C,PATEND
+PPDAT_musicseq_bf98_osti2:
+.byte N_E|D_8,INSTRUMENT,PI_musicseq_bf98_osti,N_GH,N_CHH,N_CHH,N_CHH,N_CHH|D_8
+.byte N_GH,INSTRUMENT,PI_musicseq_orchhit,N_D|D_8
+.byte INSTRUMENT,PI_musicseq_bf98_osti,N_FH,N_ASH,N_ASH,N_ASH,N_ASH|D_8,N_FH
+.byte INSTRUMENT,PI_musicseq_orchhit,N_C|D_8,INSTRUMENT,PI_musicseq_bf98_osti
+.byte N_EH,N_GH,N_GH,N_GH,N_GH|D_8,N_EH,INSTRUMENT,PI_musicseq_orchhit,N_F|D_8
+.byte INSTRUMENT,PI_musicseq_bf98_osti,N_DH,N_FH,N_FH,N_FH,N_FH|D_8,N_DH
+.byte INSTRUMENT,PI_musicseq_orchhit,PATEND
+PPDAT_musicseq_bf98_melodyB1:
+.byte REST|D_8,N_CS,N_F|D_8,N_GS,N_F|D_8,REST,N_G|D_8,N_F,N_DS|D_8,REST
+.byte N_DS|D_8,N_CS,N_C|D_8,REST,N_DS|D_8,REST,N_CS|D_8,N_F,N_DS|D_D8,REST|D_D8
+.byte N_GS|D_8,N_G,N_F|D_8,N_DS,N_CS|D_8,N_DS,N_F|D_8,REST,N_G|D_8,REST
+.byte N_DS|D_8,REST,N_CS|D_8,REST,N_C|D_8,REST,N_DS|D_4,N_TIE,REST|D_4
+.byte REST|D_D4,PATEND
+PPDAT_musicseq_bf98_counterB1:
+.byte N_C|D_8,REST,N_DS|D_8,REST,N_GS|D_8,REST,N_F|D_8,REST,N_D|D_8,REST
+.byte N_F|D_8,REST,N_DS|D_8,REST,N_G|D_8,REST,N_F|D_8,REST,N_G|D_D8,REST|D_D4
+.byte N_GS|D_8,REST,N_DS|D_8,REST,N_C|D_8,REST,N_D|D_8,REST,N_F|D_8,REST
+.byte N_D|D_8,REST,N_DS|D_8,REST,N_G|D_4,N_TIE,REST|D_4,REST|D_D4,PATEND
+PPDAT_musicseq_bf98_bassB1:
+.byte N_FS|D_8,REST,N_GS|D_8,REST,N_AS|D_8,REST,N_GS|D_8,REST,N_DS|D_8,REST
+.byte N_C|D_8,REST,N_CS|D_8,REST,N_CS|D_8,REST,N_GS|D_8,REST,N_CSH|D_8,REST
+.byte N_CS|D_8,N_DS|D_8,N_F|D_8,PATEND
+PPDAT_musicseq_bf98_melodyB2:
+.byte N_C|D_8,REST,N_E|D_8,REST,N_FS|D_D8,N_G|D_D8,REST|D_D8,N_G|D_8,N_F
+.byte N_E|D_8,N_F,N_G|D_8,REST,N_E|D_8,REST,N_FS|D_8,N_E,N_D|D_8,N_E,N_FS|D_8
+.byte N_GS,GRACE,4,N_GS,N_A|D_D8,N_GS|D_4,N_TIE,REST,PATEND
+PPDAT_musicseq_bf98_counterB2:
+.byte N_DS|D_8,REST,N_FS|D_8,REST,N_GS|D_D8,N_F|D_8,REST,N_CS|D_8,REST,N_F|D_8
+.byte REST,N_CS|D_8,REST,N_FS|D_8,REST,N_CS|D_8,REST,N_DS|D_8,REST,N_C|D_8,REST
+.byte N_DS|D_8,REST,N_F|D_2,REST,PATEND
+PPDAT_musicseq_bf98_bassB2:
+.byte N_D|D_8,REST,N_D|D_8,REST,N_G|D_8,REST,N_CH|D_8,REST,N_C|D_8,N_D|D_8
+.byte N_E|D_8,N_F|D_8,REST,N_A|D_8,REST,N_CH|D_8,N_DH,N_G|D_8,REST,N_DH|D_8
+.byte N_CH,N_B|D_8,REST,N_A|D_8,REST,N_CSH|D_8,REST,N_E|D_8,REST,N_A|D_8,REST
+.byte REST|D_D4,PATEND
+PPDAT_musicseq_arp_waltz_bass1:
+.byte N_G,N_BH,N_BH,N_D,N_BH,N_BH,N_C,N_CHH,N_CHH,N_G,N_CHH,N_CHH,N_A,N_CHH
+.byte N_CHH,N_E,N_CHH,N_CHH,N_D,N_AH,N_AH,N_A,N_CHH,N_CHH,PATEND
+PPDAT_musicseq_arp_waltz_bass2:
+.byte N_C,N_ASH,N_ASH,N_F,N_AH,N_AH,N_C,N_D,N_E
+PPDAT_musicseq_arp_waltz_bassintro:
+.byte N_F,N_AH,N_AH,N_C,N_AH,N_AH,PATEND
+PPDAT_musicseq_arp_waltz_melody:
+.byte INSTRUMENT,PI_musicseq_stringlead,SLOWARP,ARPEGGIO,$59,N_DS|D_8
+.byte ARPEGGIO,$36,N_G,ARPEGGIO,$47,N_GS|D_8,ARPEGGIO,$37,N_AS,ARPEGGIO,$47
+.byte N_GS,ARPEGGIO,$38,N_F|D_D8,N_F,ARPEGGIO,$47,N_GS,ARPEGGIO,$37,N_AS|D_8
+.byte ARPEGGIO,$47,N_GS,ARPEGGIO,$38,N_F|D_8,ARPEGGIO,$37,N_F,ARPEGGIO,$47,N_DS
+.byte ARPEGGIO,$36,N_G|D_4,N_TIE,ARPEGGIO,$59,N_DS|D_8,ARPEGGIO,$36,N_G
+.byte ARPEGGIO,$47,N_GS|D_8,ARPEGGIO,$59,N_DS,ARPEGGIO,$38,N_F,ARPEGGIO,$59
+.byte N_GS|D_D8,ARPEGGIO,$38,N_G,ARPEGGIO,$59,N_GS,ARPEGGIO,$38,N_G|D_8,N_F
+.byte ARPEGGIO,$49,N_DS|D_8,ARPEGGIO,$47,N_DS,ARPEGGIO,$38,N_C|D_4,REST|D_8
+.byte INSTRUMENT,PI_musicseq_argtwinkle,SLOWARP,ARPEGGIO,$70,N_GSH|D_D8,FASTARP
+.byte ARPEGGIO,$7C,N_GSH|D_D8,SLOWARP,ARPEGGIO,$70,TRANSPOSE,<20,N_F|D_D8
+.byte FASTARP,ARPEGGIO,$59,N_C|D_D8,SLOWARP,ARPEGGIO,$70,N_D|D_D8,FASTARP
+.byte ARPEGGIO,$7C,N_D|D_D8,ARPEGGIO,$57,N_G|D_D8,ARPEGGIO,$59,N_D|D_D8,SLOWARP
+.byte ARPEGGIO,$70,N_C|D_D8,FASTARP,ARPEGGIO,$7C,N_C|D_D8,SLOWARP,ARPEGGIO,$70
+.byte N_F|D_D8,FASTARP,ARPEGGIO,$4C,N_F|D_D8,ARPEGGIO,$7C,N_D|D_D8,ARPEGGIO,$59
+.byte N_D|D_D8,ARPEGGIO,$4C,N_C|D_D4,TRANSPOSE,<-20,PATEND
+PPDAT_musicseq_allfeatures_between:
+.byte ARPEGGIO,$00,N_C|D_D4,REST|D_1,N_TIE|D_1,N_TIE|D_1,N_TIE|D_1,PATEND
+PPDAT_musicseq_allfeatures_drumfill:
+.byte DR_musicseq_tkick|D_8,DR_musicseq_clhat|D_8,DR_musicseq_tkick|D_8
+.byte DR_musicseq_tsnare|D_8,DR_musicseq_tsnare|D_8,DR_musicseq_tsnare|D_8
+PPDAT_musicseq_allfeatures_drum:
+.byte DR_musicseq_tkick|D_8,DR_musicseq_clhat|D_8,DR_musicseq_clhat|D_8
+.byte DR_musicseq_tsnare|D_8,DR_musicseq_clhat|D_8,DR_musicseq_ohat|D_8
+.byte DR_musicseq_tkick|D_8,DR_musicseq_clhat|D_8,DR_musicseq_clhat|D_8
+.byte DR_musicseq_tsnare|D_8,DR_musicseq_clhat|D_8,DR_musicseq_tkick|D_8,PATEND
+PPDAT_musicseq_allfeatures_chords:
+.byte ARPEGGIO,$37,REST|D_D4,N_D|D_1,REST|D_2,ARPEGGIO,$47,N_C|D_1,REST|D_8
+.byte PATEND
+PPDAT_musicseq_allfeatures_bass:
+.byte N_F|D_4,REST|D_8,N_GS|D_D4,REST|D_4,N_GS|D_8,N_F|D_4,N_GS|D_8,N_AS|D_4
+.byte N_DS|D_4,REST|D_8,N_DS|D_4,REST|D_4,N_C|D_4,REST|D_8,PATEND
+PPDAT_musicseq_Stairs_lead1:
+.byte N_DS|D_D8,N_G|D_D8,N_G|D_D8,REST|D_8,N_DS,N_C|D_D8,N_DS|D_D8,N_DS|D_D8
+.byte REST|D_D8,N_F|D_D8,N_G|D_8,N_GS,N_AS|D_8,N_GS,N_F|D_D8,N_G|D_D8,N_AS|D_D8
+.byte N_AS|D_D8,REST|D_D8,PATEND
+PPDAT_musicseq_Stairs_lead1end:
+.byte N_D|D_D8
+PPDAT_musicseq_Stairs_introg:
+.byte N_C|D_D8,REST|D_D8,PATEND
+PPDAT_musicseq_Stairs_bass:
+.byte N_C|D_D8,INSTRUMENT,PI_musicseq_latebanjo,N_CHH|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-5,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_latebanjo,TRANSPOSE,<29,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-31,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_latebanjo,TRANSPOSE,<7,N_CHH|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,N_C|D_D8,INSTRUMENT,PI_musicseq_latebanjo
+.byte N_CHH|D_D8,INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-5,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_latebanjo,TRANSPOSE,<5,N_CHH|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,N_D|D_D8,INSTRUMENT,PI_musicseq_latebanjo
+.byte N_CHH|D_D8,INSTRUMENT,PI_musicseq_tubbass,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_latebanjo,N_CHH|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-5,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_latebanjo,TRANSPOSE,<29,N_C|D_D8
+.byte INSTRUMENT,PI_musicseq_tubbass,TRANSPOSE,<-24,PATEND
+PPDAT_musicseq_Stairs_lead2:
+.byte N_F|D_8,N_A,N_C|D_8,N_CH,N_F|D_8,N_A,N_C|D_8,N_CH,N_F|D_8,N_AS,N_D|D_8
+.byte N_DH,N_F|D_8,N_AS,N_D|D_8,N_DH,N_G|D_8,N_AS,N_C|D_8,N_CH,N_G|D_8,N_AS
+.byte N_C|D_8,N_CH,N_A|D_8,N_CH,N_F|D_8,N_CH,N_A|D_8,N_CH,N_F|D_8,N_CH,PATEND
+PPDAT_musicseq_Stairs_lead2end:
+.byte N_E|D_8,N_G,N_D|D_8,N_G,N_C|D_D8,REST|D_D8,PATEND
+PPDAT_musicseq_attacktest_drumfill:
+.byte DR_musicseq_snare|D_8,DR_musicseq_ohat,DR_musicseq_snare
+.byte DR_musicseq_snare,DR_musicseq_snare
+PPDAT_musicseq_attacktest_drums:
+.byte DR_musicseq_kick|D_D8,DR_musicseq_clhat|D_D8,DR_musicseq_snare|D_D8
+.byte DR_musicseq_clhat|D_8,DR_musicseq_kick,DR_musicseq_clhat|D_D8
+.byte DR_musicseq_kick|D_D8,DR_musicseq_snare|D_D8,DR_musicseq_clhat|D_D8
+.byte DR_musicseq_kick|D_D8,DR_musicseq_clhat|D_D8,DR_musicseq_snare|D_D8
+.byte DR_musicseq_clhat|D_8,DR_musicseq_snare,DR_musicseq_clhat|D_D8
+.byte DR_musicseq_kick|D_D8,DR_musicseq_snare|D_D8,DR_musicseq_ohat|D_D8,PATEND
+PPDAT_musicseq_attacktest_bass:
+.byte N_DS|D_4,REST,N_F|D_8,REST|D_2,REST|D_D4,N_C|D_8,REST,N_DS|D_4,REST
+.byte N_F|D_8,REST|D_8,BEND,$16,N_GS|D_2,REST|D_4,BEND,$00,N_C|D_8,REST
+.byte N_DS|D_4,REST,N_F|D_8,REST|D_2,REST|D_D4,N_C|D_8,REST,N_DS|D_4,REST
+.byte N_F|D_8,REST|D_8,GRACE,1,N_DS,BEND,$16,N_FS|D_2,BEND,$00,REST|D_4,N_C|D_8
+.byte REST,PATEND
+PPDAT_musicseq_attacktest_atk:
+.byte N_C|D_8,N_DS,N_G|D_8,N_DS,N_G|D_8,N_AS,N_G|D_8,N_AS,N_DH|D_8,N_AS,N_G|D_8
+.byte N_AS,N_G|D_8,N_DS,N_G|D_8,N_DS,PATEND
+PPDAT_pino_a53_croom_intro_chords1:
+.byte REST,N_E,N_A|D_4,REST,N_D,N_G|D_4,REST,N_C,N_E|D_2,N_TIE|D_8,PATEND
+PPDAT_pino_a53_croom_intro_chords2:
+.byte REST|D_8,N_DS|D_4,REST|D_8,N_D|D_4,REST|D_8,N_C|D_2,N_TIE|D_8,PATEND
+PPDAT_pino_a53_croom_intro_bass:
+.byte N_A|D_D4,N_G|D_D4,N_F|D_D2,N_A|D_D4,N_G|D_D4,N_C|D_D4,N_D|D_D4,PATEND
+PPDAT_pino_a53_croom_cleared_melody:
+.byte N_G,N_A,N_G,N_F,N_E,N_D,N_C,N_E,N_G,N_CH|D_D8,PATEND
+PPDAT_pino_a53_croom_cleared_bass:
+.byte N_CH|D_8,REST,N_G|D_8,REST,N_E|D_8,REST,N_C|D_8,REST,PATEND
+PPDAT_pino_a53_thwaite_0200_bass:
+.byte N_F|D_2,REST,N_DS|D_2,REST,N_F|D_2,REST,N_DS|D_2,REST,N_F|D_2,REST
+.byte N_DS|D_2,REST,N_F|D_2,REST,N_DS|D_2,REST,N_D|D_2,REST,N_G|D_2,REST
+.byte N_C|D_2,REST,N_C|D_2,REST,N_AS|D_2,REST,N_AS|D_2,REST,N_A|D_2,REST
+.byte N_D|D_2,REST,N_G|D_2,REST,N_C|D_2,REST,N_F|D_2,REST,N_F|D_2,REST,PATEND
+PPDAT_pino_a53_thwaite_0200_backing:
+.byte REST|D_D8,N_G|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8
+.byte N_F|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8,N_G|D_D4
+.byte REST|D_D8,N_F|D_D4,REST|D_D8,N_GS|D_D4,REST|D_D8,N_AS|D_D8,N_DH|D_D8
+.byte REST|D_D8,N_G|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8
+.byte N_G|D_D4,REST|D_D8,N_GS|D_D4,REST|D_D8,N_DS|D_D4,REST|D_D8,N_F|D_D4
+.byte REST|D_D8,N_CS|D_D4,REST|D_D8,N_CS|D_D4,REST|D_D8,N_C|D_D4,PATEND
+PPDAT_pino_a53_thwaite_0200_melody:
+.byte REST|D_D8,N_F|D_D4,REST|D_D8,N_DS|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8
+.byte N_DS|D_D4,N_F|D_2,REST,N_DS|D_2,REST,N_GS|D_2,N_TIE,REST|D_D4,N_FS|D_D8
+.byte N_F|D_4,N_TIE,N_GS|D_4,N_CSH|D_D8,N_DSH|D_D4,N_GS|D_2,N_TIE,REST|D_D4
+.byte N_A|D_D8,N_AS|D_2,REST,N_DS|D_D4,N_F|D_8,N_FS,N_GS|D_2,REST,N_D|D_2,REST
+.byte N_FS|D_2,REST,N_F|D_8,N_DS|D_D8,N_CS|D_D8,N_C,N_DS|D_2,REST,N_CS|D_2,REST
+.byte PATEND
+PPDAT_pino_a53_thwaite_0200_drums:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_clhat|D_D8,DR_pino_a53_snare|D_D8,DR_pino_a53_clhat|D_D4
+.byte PATEND
+PPDAT_pino_a53_thwaite_0300_drums:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_8,DR_pino_a53_kick
+.byte DR_pino_a53_snare|D_8,DR_pino_a53_clhat,DR_pino_a53_clhat|D_8
+.byte DR_pino_a53_clhat,DR_pino_a53_kick|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_clhat|D_8,DR_pino_a53_kick,DR_pino_a53_snare|D_D8
+.byte DR_pino_a53_clhat|D_D8,PATEND
+PPDAT_pino_a53_thwaite_0300_bass1:
+.byte N_C|D_8,REST,N_CH|D_8,N_C|D_8,REST,N_CH|D_8,REST|D_8,REST|D_D2,N_F|D_8
+.byte REST,N_FH|D_8,N_F|D_8,REST,N_FH|D_8,REST|D_8,REST|D_D2,PATEND
+PPDAT_pino_a53_thwaite_0300_bass2:
+.byte N_D|D_8,REST,N_DH|D_8,N_D|D_8,REST,N_DH|D_8,REST|D_8,REST|D_D2,N_C|D_8
+.byte REST,N_CH|D_8,N_C|D_8,REST,N_CH|D_8,REST|D_8,REST|D_D2,PATEND
+PPDAT_pino_a53_thwaite_0300_melA:
+.byte N_E|D_D2,N_D|D_D2,N_CS|D_D2,N_C|D_D2,PATEND
+PPDAT_pino_a53_thwaite_0300_backingA:
+.byte N_FS|D_D2,N_E|D_D2,N_D|D_D2,N_C|D_D2,PATEND
+PPDAT_pino_a53_thwaite_0300_melB:
+.byte REST|D_D8,N_E|D_4,N_TIE,N_G|D_4,N_FS|D_4,N_TIE,N_D|D_D4,N_TIE,REST|D_D8
+.byte N_D|D_4,N_TIE,N_F|D_4,N_E|D_4,N_TIE,N_C|D_D4,N_TIE,PATEND
+PPDAT_pino_a53_thwaite_0400_drum2:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_D8,DR_pino_a53_snare|D_D8
+.byte DR_pino_a53_clhat|D_8,DR_pino_a53_kick
+PPDAT_pino_a53_thwaite_0400_drum1:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_D4,DR_pino_a53_clhat|D_8
+.byte DR_pino_a53_kick,PATEND
+PPDAT_pino_a53_thwaite_0400_chords1:
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_AS|D_8,N_A|D_4,N_G|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_G,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_A|D_8,N_G|D_4,N_F|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_F,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_G|D_8,N_F|D_4,N_DS|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_DS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_DS|D_8,N_D|D_4,N_C|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_G,REST|D_8,REST|D_D4,REST|D_D4
+.byte PATEND
+PPDAT_pino_a53_thwaite_0400_chords2:
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_AS|D_D8,N_GS|D_D8,N_FS|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_FS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_GS|D_D8,N_FS|D_D8,N_F|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_F,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_FS|D_D8,N_F|D_D8,N_DS|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_DS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_pino_a53_xylo_short,N_DS|D_D8,N_CS|D_D8,N_C|D_D8
+.byte INSTRUMENT,PI_pino_a53_distanthorn,N_GS,REST|D_8,REST|D_D4,REST|D_D4
+.byte PATEND
+PPDAT_pino_a53_thwaite_0500_backing:
+.byte INSTRUMENT,PI_pino_a53_piano,REST|D_8,N_C,N_F|D_8,N_G,N_A|D_8,REST
+.byte N_AS|D_8,N_G|D_8,REST,INSTRUMENT,PI_pino_a53_distanthorn,N_C,N_F|D_8,N_G
+.byte N_A|D_8,REST,N_AS|D_8,N_G|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2
+.byte INSTRUMENT,PI_pino_a53_piano,REST|D_8,N_C,N_F|D_8,N_G,N_A|D_8,REST
+.byte N_G|D_8,N_DS|D_8,REST,INSTRUMENT,PI_pino_a53_distanthorn,N_C,N_F|D_8,N_G
+.byte N_A|D_8,REST,N_G|D_8,N_DS|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2
+.byte PATEND
+PPDAT_pino_a53_thwaite_0500_melody:
+.byte REST,N_A,N_AS,N_A,N_G,N_A,N_AS,N_CH|D_8,N_CH|D_8,N_CH|D_D8,REST|D_4
+.byte REST|D_D4,REST|D_D2,REST|D_D2,N_CH|D_8,N_A,N_AS|D_8,N_CH|D_D8,N_AS
+.byte N_A|D_8,N_DH|D_D8,REST|D_4,REST|D_D4,REST|D_D2,REST|D_D2,N_A|D_8,N_F
+.byte N_G|D_8,N_A|D_D8,N_G,N_F|D_8,N_AS|D_D8,REST|D_4,REST|D_D4,REST|D_D2
+.byte REST|D_D2,N_C|D_D8,N_C|D_D8,N_C|D_D8,N_C|D_8,N_F|D_D8,REST|D_4,REST|D_D4
+.byte REST|D_D2,REST|D_D2,PATEND
+PPDAT_pino_a53_thwaite_0500_bass:
+.byte N_F|D_8,REST,N_DS|D_8,N_D|D_8,REST,N_DS|D_8,REST|D_8,REST|D_D4,N_D|D_8
+.byte REST,N_CS|D_8,N_C|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2,PATEND
+PPDAT_pino_a53_thwaite_1600_drum:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_snare|D_D8,DR_pino_a53_clhat|D_8
+.byte DR_pino_a53_kick,DR_pino_a53_snare|D_D8,PATEND
+PPDAT_pino_a53_thwaite_1600_chords1:
+.byte N_G|D_D8,N_D|D_D8,N_G|D_D8,N_D|D_8,N_G,N_F|D_D8,N_C|D_D8,N_F|D_D8,N_C|D_8
+.byte N_F,N_G|D_D8,N_E|D_D8,N_G|D_D8,N_E|D_8,N_G,N_A|D_D8,N_E|D_D8,N_A|D_D8
+.byte N_D|D_8,N_A,PATEND
+PPDAT_pino_a53_thwaite_1600_chords2:
+.byte N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_4,N_TIE,N_C,N_CS|D_D4
+.byte N_CS|D_4,N_TIE,N_CS,PATEND
+PPDAT_pino_a53_thwaite_1600_bass:
+.byte N_GS|D_8,REST|D_4,REST|D_8,N_DS|D_8,REST|D_8,N_FS|D_8,REST|D_4,REST|D_8
+.byte N_CS|D_8,REST|D_8,N_F|D_8,REST|D_4,REST|D_8,N_C|D_8,REST|D_8,N_AS|D_8
+.byte REST|D_4,REST|D_8,N_DS|D_8,REST|D_8,PATEND
+PPDAT_pino_a53_thwaite_town_tune_town_tune:
+.byte N_F,N_A,N_G,N_C|D_8,PATEND
+PPDAT_pino_a53_tennis_win_point_orchhits:
+.byte N_C|D_D8,N_DS|D_D8,N_F|D_4,REST|D_D4,N_F|D_D8,N_FS|D_D8,N_GS|D_4,PATEND
+PPDAT_pino_a53_tennis_win_point_bass:
+.byte N_C|D_D8,N_DS|D_D8,N_F|D_D8,REST,N_F,N_F,N_F,N_F,N_F,N_F,N_F|D_D8
+.byte N_FS|D_D8,N_GS|D_D8,REST,PATEND
+PPDAT_pino_a53_tennis_win_point_drum:
+.byte DR_pino_a53_snare|D_D8,DR_pino_a53_snare|D_D8,DR_pino_a53_snare|D_4
+.byte DR_pino_a53_kick,DR_pino_a53_kick,DR_pino_a53_snare|D_8,DR_pino_a53_kick
+.byte DR_pino_a53_kick,PATEND
+PPDAT_pino_a53_tennis_win_game_fanfare:
+.byte N_C|D_8,N_C|D_8
+PPDAT_pino_a53_tennis_win_game_fanfarejoinin:
+.byte N_F|D_4,REST|D_8,N_C|D_8,N_F|D_2,PATEND
+PPDAT_pino_a53_tennis_win_game_drum:
+.byte DR_pino_a53_clhat|D_8,DR_pino_a53_clhat|D_8,DR_pino_a53_snare|D_D4
+.byte DR_pino_a53_clhat,DR_pino_a53_clhat,DR_pino_a53_snare|D_2,PATEND
+PPDAT_pino_a53_axe_beat_sq1:
+.byte REST|D_8,N_C|D_8,PATEND
+PPDAT_pino_a53_axe_beat_drum:
+.byte DR_pino_a53_kick|D_8,DR_pino_a53_ohat|D_8,DR_pino_a53_snare,GRACE,1,N_TIE
+.byte DR_pino_a53_clhat,DR_pino_a53_ohat|D_8,PATEND
+PPDAT_pino_a53_axe_beat_tiestream:
+.byte N_TIE|D_1,PATEND
+PPDAT_pino_a53_rhde_battle_drums:
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_clhat|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_kick|D_D8,DR_pino_a53_kick|D_D8,PATEND
+PPDAT_pino_a53_rhde_battle_bassA:
+.byte N_F|D_8,REST|D_D8,N_F,N_C|D_8,REST|D_D8,N_C,N_F|D_8,REST|D_D8,N_C,N_F|D_8
+.byte REST,N_G|D_8,REST,N_A|D_8,REST|D_D8,N_A,N_E|D_8,REST|D_D8,N_E,N_A|D_8
+.byte REST|D_D8,N_E,N_A|D_8,REST,N_CH|D_8,REST,N_AS|D_8,REST|D_D8,N_AS,N_F|D_8
+.byte REST|D_D8,N_F,N_AS|D_8,REST|D_D8,N_F,N_AS|D_8,REST,N_CSH|D_8,REST
+.byte N_CH|D_8,REST|D_D8,N_CH,N_G|D_8,REST|D_D8,N_G,N_CH|D_8,N_CH,N_AS|D_8,REST
+.byte N_A|D_8,REST,N_G|D_8,REST,PATEND
+PPDAT_pino_a53_rhde_battle_bassAend:
+.byte N_CH|D_8,REST,N_F|D_8,REST|D_D8,N_F,N_G|D_8,REST|D_D8,N_G,N_F|D_8,REST
+.byte N_C|D_8,REST,N_F|D_8,REST,N_G|D_8,REST,PATEND
+PPDAT_pino_a53_rhde_battle_bassB:
+.byte N_CH|D_8,REST|D_D8,N_CH,N_G|D_8,REST|D_D8,N_G,N_CH|D_8,REST|D_D8,N_CH
+.byte N_G|D_8,REST,N_CH|D_8,REST,N_F|D_8,REST|D_D8,N_F,N_G|D_8,REST|D_D8,N_G
+.byte N_F|D_8,REST|D_D8,N_F,N_CH|D_8,REST,N_F|D_8,REST,N_AS|D_8,REST|D_D8,N_AS
+.byte N_F|D_8,REST|D_D8,N_F,N_AS|D_8,REST|D_D8,N_AS,N_F|D_8,REST,N_AS|D_8,REST
+.byte N_DS|D_8,REST|D_D8,N_DS,N_CS|D_8,REST|D_D8,N_CS,N_C|D_8,N_CH,N_GS|D_8
+.byte REST,N_AS|D_8,REST,N_DS|D_8,REST,PATEND
+PPDAT_pino_a53_rhde_battle_melA:
+.byte N_CH|D_8,REST,N_DSH|D_4,N_TIE,N_GSH|D_D8,REST,N_CH|D_8,REST,N_DS|D_8,REST
+.byte N_GS|D_8,REST,N_F|D_8,REST,N_G|D_8,REST,N_EH|D_4,N_TIE,N_AS|D_D8,REST
+.byte N_AS|D_D4,REST|D_D4,N_CSH|D_8,N_AS,N_GS|D_8,N_CSH|D_D8,REST,N_EH|D_8,REST
+.byte N_GSH|D_8,REST,N_GSH|D_8,REST,N_EH|D_8,REST,N_GSH|D_8,N_GSH|D_D8,REST
+.byte N_CSH|D_8,REST,N_AS|D_8,REST,N_GS|D_8,N_G|D_D4,REST,N_G|D_D4,N_CH|D_8
+.byte REST,N_DSH|D_4,N_TIE,N_GSH|D_D8,REST,N_CH|D_8,REST,N_DS|D_8,REST,N_GS|D_8
+.byte N_DS,N_F|D_8,REST,N_G|D_8,REST,N_EH|D_4,N_TIE,N_AS|D_D8,REST,N_AS|D_D8
+.byte N_C|D_8,REST,N_E|D_8,N_D,N_C|D_8,REST,N_CSH|D_8,N_AS,N_GS|D_8,N_CSH|D_D8
+.byte REST,N_EH|D_8,REST,N_GSH|D_8,REST,N_GSH|D_8,REST,N_EH|D_8,REST,N_GSH|D_8
+.byte N_GSH|D_D8,REST,N_GSH|D_8,REST,N_DSH|D_8,N_CH,N_CSH|D_8,REST,N_CH|D_8
+.byte REST,N_DSH|D_8,N_GSH,N_CHH|D_8,REST|D_4,PATEND
+PPDAT_pino_a53_rhde_battle_backingA:
+.byte N_E|D_8,REST,N_GS|D_4,N_TIE,N_B|D_D8,REST,N_E|D_8,REST|D_4,REST|D_D4
+.byte REST|D_D8,N_FS|D_4,N_TIE,N_GS|D_D8,REST,N_C|D_D4,REST|D_D4,N_E|D_8,N_DS
+.byte N_CS|D_8,N_E|D_D8,REST,N_A|D_8,REST,N_CH|D_8,REST,N_B|D_8,REST,N_A|D_8
+.byte REST,N_CH|D_8,N_B|D_D8,REST,N_FS|D_8,REST,N_DS|D_8,REST,N_A|D_8,N_GS|D_D4
+.byte REST,N_FS|D_D4,PATEND
+PPDAT_pino_a53_rhde_battle_backingAend:
+.byte N_G|D_8,REST,N_E|D_8,N_C,N_D|D_8,REST,N_C|D_8,REST,N_E|D_8,N_G,N_CH|D_8
+.byte REST|D_4,PATEND
+PPDAT_pino_a53_rhde_battle_melB:
+.byte N_F|D_8,N_DS,N_D|D_8,N_F|D_4,N_GS|D_8,REST,N_DH|D_8,REST,N_B|D_8,REST
+.byte N_AS|D_8,REST,N_GS|D_8,N_AS|D_8,REST,N_FS|D_D8,REST,N_F|D_8,REST,N_GS|D_8
+.byte REST,N_AS|D_8,N_GS,N_FS|D_8,N_F,N_FS|D_8,N_F,N_DS|D_8,N_CS,N_C|D_8,REST
+.byte N_DS|D_8,REST,N_GS|D_8,REST,N_CH|D_8,N_DSH|D_8,REST,N_FSH,N_GSH|D_8,N_DSH
+.byte N_CH|D_8,N_CSH,N_DSH|D_8,N_CH,N_CSH|D_8,N_DSH,N_FH|D_8,N_CSH,N_B|D_8
+.byte N_CSH,N_DSH|D_8,N_B,N_AS|D_D4,N_GS|D_D4,PATEND
+PPDAT_pino_a53_rhde_battle_backingB:
+.byte N_GS|D_8,N_FS,N_E|D_8,N_GS|D_4,N_B|D_8,REST,N_EH|D_8,REST,N_DH|D_8,REST
+.byte N_CH|D_8,REST,N_B|D_8,N_CH|D_8,REST,N_A|D_D8,REST,N_GS|D_8,REST,N_B|D_8
+.byte REST,N_CH|D_8,N_B,N_A|D_8,N_GS,N_A|D_8,N_G,N_E|D_8,N_C,N_D|D_8,REST
+.byte N_E|D_8,REST,N_FS|D_8,REST,N_A|D_8,N_DH|D_8,REST,N_EH,N_FSH|D_8,N_DH
+.byte N_CH|D_8,N_DH,N_EH|D_8,N_CH,N_B|D_8,N_CH,N_DH|D_8,N_B,N_A|D_8,N_B
+.byte N_CH|D_8,N_A,N_G|D_D4,REST|D_D4,PATEND
+PPDAT_pino_a53_rhde_kalinka_intro:
+.byte N_DS|D_2,N_CS|D_2,N_C|D_D2,REST|D_4,PATEND
+PPDAT_pino_a53_rhde_kalinka_introdrum:
+.byte N_TIE|D_1,N_TIE|D_D2,DR_pino_a53_snare|D_4,PATEND
+PPDAT_pino_a53_rhde_kalinka_bassA:
+.byte N_C|D_8,N_CH|D_8,N_C|D_8,N_AS|D_8,N_C|D_8,N_CH|D_8,N_C|D_8,N_CH|D_8
+.byte N_E|D_8,N_EH|D_8,N_E|D_8,N_EH|D_8,N_F|D_8,N_FH|D_8,N_GS|D_8,N_GSH|D_8
+.byte PATEND
+PPDAT_pino_a53_rhde_kalinka_partA:
+.byte N_DS|D_8,N_FS|D_8,N_DS|D_8,N_FS|D_8,ARPEGGIO,$47,N_GSH|D_8,ARPEGGIO,$0
+.byte N_DS|D_8,N_FS|D_8,N_DS|D_8,N_C|D_8,N_C|D_8,N_DS|D_8,N_FS|D_8,N_CS|D_8
+.byte N_CS|D_8,N_E|D_8,N_GS|D_8,PATEND
+PPDAT_pino_a53_rhde_kalinka_drum:
+.byte DR_pino_a53_kick|D_8,DR_pino_a53_clhat|D_8,DR_pino_a53_snare|D_8
+.byte DR_pino_a53_clhat|D_8,DR_pino_a53_kick|D_8,DR_pino_a53_clhat
+.byte DR_pino_a53_clhat,DR_pino_a53_snare|D_8,DR_pino_a53_clhat|D_8
+.byte DR_pino_a53_kick|D_8,DR_pino_a53_clhat|D_8,DR_pino_a53_snare|D_8
+.byte DR_pino_a53_clhat|D_8,DR_pino_a53_kick|D_8,DR_pino_a53_clhat|D_8
+.byte DR_pino_a53_snare,DR_pino_a53_clhat,DR_pino_a53_snareohat|D_8,PATEND
+PPDAT_pino_a53_rhde_kalinka_drumfill:
+.byte DR_pino_a53_snareohat,DR_pino_a53_snare,DR_pino_a53_snare
+.byte DR_pino_a53_snare,PATEND
+PPDAT_pino_a53_rhde_kalinka_bassB:
+.byte N_F|D_8,N_FH|D_8,N_F|D_8,N_FH|D_8,N_F|D_8,N_FH|D_8,N_F|D_8,N_DSH|D_8
+.byte N_C|D_8,N_CH|D_8,N_C|D_8,N_CH|D_8,N_CS|D_8,N_CSH|D_8,N_CS|D_8,N_CSH|D_8
+.byte PATEND
+PPDAT_pino_a53_rhde_kalinka_chordsB:
+.byte ARPEGGIO,$05,N_D|D_D2,N_TIE|D_8,N_C|D_8,N_A|D_2,N_AS|D_2,PATEND
+PPDAT_pino_a53_rhde_kalinka_ending_p1:
+.byte ARPEGGIO,$00,N_C|D_1,N_TIE|D_8,N_D|D_1,N_E|D_1,PATEND
+PPDAT_pino_a53_rhde_kalinka_ending_p2:
+.byte N_C|D_1,N_TIE|D_8,N_F|D_2,N_G|D_2,N_GS|D_1,PATEND
+PPDAT_pino_a53_rhde_kalinka_ending_tri:
+.byte N_F|D_1,N_TIE|D_8,N_G|D_1,N_C|D_1,PATEND
+PPDAT_pino_a53_K_231_LMIA:
+.byte N_CH|D_2,N_DH|D_2,N_B|D_2,N_CH|D_2,REST|D_4,N_CH|D_2,N_B|D_4,REST|D_4
+.byte N_FH|D_2,N_EH|D_4,N_EH|D_4,N_GH|D_4,N_FH|D_4,N_DH|D_4,N_GH|D_4,N_G|D_4
+.byte REST|D_4,N_CH|D_8,N_B|D_8,N_A|D_8,N_G|D_8,N_F|D_8,N_E|D_8,N_D|D_8,N_D|D_8
+.byte N_G|D_8,N_A|D_8,N_G|D_8,N_F|D_8,N_E|D_8,N_D|D_8,N_C|D_8,N_GH,N_GH,N_GH
+.byte N_GH,N_GH,N_GH,N_GH|D_8,N_CH|D_8,N_CH|D_4,REST|D_8,N_FH,N_FH,N_FH,N_FH
+.byte N_FH,N_FH,N_FH|D_8,N_B|D_8,N_B|D_4,REST|D_8,N_CH,N_DH,N_EH,N_FH,N_GH|D_8
+.byte N_A|D_8,N_AH,N_AH,N_AH,N_AH,N_AH,N_AH,N_AH|D_8,N_DH|D_8,N_DH|D_4,REST|D_8
+.byte N_GH,N_GH,N_GH,N_GH,N_GH,N_GH,N_GH|D_8,N_CH|D_8,N_CH|D_4,PATEND
+pently_songs:  ; 24 entries, 1651 bytes
+songdef PS_musicseq_argument, PSDAT_musicseq_argument
+songdef PS_musicseq_Isometry, PSDAT_musicseq_Isometry
+songdef PS_musicseq_Sticks, PSDAT_musicseq_Sticks
+songdef PS_musicseq_twinkle, PSDAT_musicseq_twinkle
+songdef PS_musicseq_canon, PSDAT_musicseq_canon
+songdef PS_musicseq_bf98, PSDAT_musicseq_bf98
+songdef PS_musicseq_arp_waltz, PSDAT_musicseq_arp_waltz
+songdef PS_musicseq_allfeatures, PSDAT_musicseq_allfeatures
+songdef PS_musicseq_Stairs, PSDAT_musicseq_Stairs
+songdef PS_musicseq_attacktest, PSDAT_musicseq_attacktest
+songdef PS_pino_a53_croom_intro, PSDAT_pino_a53_croom_intro
+songdef PS_pino_a53_croom_cleared, PSDAT_pino_a53_croom_cleared
+songdef PS_pino_a53_thwaite_0200, PSDAT_pino_a53_thwaite_0200
+songdef PS_pino_a53_thwaite_0300, PSDAT_pino_a53_thwaite_0300
+songdef PS_pino_a53_thwaite_0400, PSDAT_pino_a53_thwaite_0400
+songdef PS_pino_a53_thwaite_0500, PSDAT_pino_a53_thwaite_0500
+songdef PS_pino_a53_thwaite_1600, PSDAT_pino_a53_thwaite_1600
+songdef PS_pino_a53_thwaite_town_tune, PSDAT_pino_a53_thwaite_town_tune
+songdef PS_pino_a53_tennis_win_point, PSDAT_pino_a53_tennis_win_point
+songdef PS_pino_a53_tennis_win_game, PSDAT_pino_a53_tennis_win_game
+songdef PS_pino_a53_axe_beat, PSDAT_pino_a53_axe_beat
+songdef PS_pino_a53_rhde_battle, PSDAT_pino_a53_rhde_battle
+songdef PS_pino_a53_rhde_kalinka, PSDAT_pino_a53_rhde_kalinka
+songdef PS_pino_a53_K_231, PSDAT_pino_a53_K_231
+PSDAT_musicseq_argument:
+; title: Argument?
+playPatNoise PP_musicseq_argument_drum34
+setTempo 360
+setBeatDuration D_8
+waitRows 48  ; end at 0:08.00
+playPatSq2 PP_musicseq_argument_commemorate3, 23, PI_musicseq_bf98_flute2
+waitRows 48  ; end at 0:16.00
+playPatSq2 PP_musicseq_argument_tubbassloop, 0, PI_musicseq_tubbass_slow
+waitRows 24  ; end at 0:20.00
+stopPatSq2
+waitRows 24  ; end at 0:24.00
+playPatSq2 PP_musicseq_argument_intro_dut, 18, PI_musicseq_dut
+waitRows 48  ; end at 0:32.00
+stopPatSq2
+playPatTri PP_musicseq_argument_bass, 10, PI_musicseq_bass
+waitRows 96  ; end at 0:48.00
+playPatSq2 PP_musicseq_argument_melody, 27, PI_musicseq_bf98_flute2
+waitRows 96  ; end at 1:04.00
+attackOnSq2
+playPatSq2 PP_musicseq_argument_bass, 10, PI_musicseq_bf98_flute2
+playPatAttack PP_musicseq_argument_melodyend, 30, PI_musicseq_bf98_flute2
+playPatNoise PP_musicseq_argument_drum34_8
+waitRows 6  ; end at 1:05.00
+stopPatAttack
+waitRows 42  ; end at 1:12.00
+playPatSq1 PP_musicseq_argument_bass, 22, PI_musicseq_bf98_flute2
+waitRows 48  ; end at 1:20.00
+playPatSq1 PP_musicseq_argument_tubbassloop, 12, PI_musicseq_tubbass_slow
+playPatSq2 PP_musicseq_argument_melody, 39, PI_musicseq_bf98_flute2
+waitRows 96  ; end at 1:36.00
+playPatSq2 PP_musicseq_argument_descendingchords, 19, PI_musicseq_bf98_flute2
+waitRows 96  ; end at 1:52.00
+stopPatSq1
+playPatSq2 PP_musicseq_argument_twinkle, 50, PI_musicseq_argtwinkle
+waitRows 192  ; end at 2:24.00
+playPatSq1 PP_musicseq_argument_tubbassloop, 12, PI_musicseq_tubbass_slow
+playPatSq2 PP_musicseq_argument_melody, 39, PI_musicseq_bf98_flute2
+attackOnSq1
+playPatAttack PP_musicseq_argument_twinkle, 50, PI_musicseq_argtwinkle
+waitRows 96  ; end at 2:40.00
+attackOnSq2
+playPatSq2 PP_musicseq_argument_bass, 10, PI_musicseq_bf98_flute2
+playPatAttack PP_musicseq_argument_melodyend, 42, PI_musicseq_bf98_flute2
+stopPatSq1
+waitRows 6  ; end at 2:41.00
+stopPatAttack
+waitRows 42  ; end at 2:48.00
+playPatSq1 PP_musicseq_argument_bass, 22, PI_musicseq_bf98_flute2
+waitRows 48  ; end at 2:56.00
+playPatSq2 PP_musicseq_argument_cadenza, 34, PI_musicseq_bf98_flute2
+attackOnSq2
+playPatAttack PP_musicseq_argument_cadenza, 22, PI_musicseq_bf98_fluteshort
+playPatSq1 PP_musicseq_argument_cadenzabass, 10, PI_musicseq_tubbass_slow
+waitRows 144  ; end at 3:20.00
+playPatSq2 PP_musicseq_argument_cadenzaend, 15, PI_musicseq_bf98_flute2
+playPatAttack PP_musicseq_argument_cadenzaend, 3, PI_musicseq_bf98_fluteshort
+waitRows 24  ; end at 3:24.00
+playPatAttack PP_musicseq_argument_cadenzaend2, 31, PI_musicseq_bf98_fluteshort
+waitRows 18  ; end at 3:27.00
+playPatSq1 PP_musicseq_argument_cadenzaend3, 0, PI_musicseq_bf98_flute
+waitRows 6  ; end at 3:28.00
+stopPatSq1
+stopPatSq2
+stopPatTri
+stopPatAttack
+playPatNoise PP_musicseq_argument_drum68
+attackOnSq1
+playPatAttack PP_musicseq_argument_drum68top, 12, PI_musicseq_tubbass
+playPatTri PP_musicseq_argument_bass68, 10, PI_musicseq_arg2bass
+setBeatDuration D_D8
+waitRows 192  ; end at 4:00.00
+playPatSq2 PP_musicseq_argument_harmony68_1, 31, PI_musicseq_bf98_flute2
+waitRows 6  ; end at 4:01.00
+playPatSq1 PP_musicseq_argument_harmony68_2, 10, PI_musicseq_bf98_flute2
+waitRows 90  ; end at 4:16.00
+playPatAttack PP_musicseq_argument_harmony68_3, 27, PI_musicseq_bf98_flute2
+waitRows 96  ; end at 4:32.00
+playPatAttack PP_musicseq_argument_drum68top, 12, PI_musicseq_tubbass
+playPatSq2 PP_musicseq_argument_melody68, 22, PI_musicseq_bf98_flute2
+playPatNoise PP_musicseq_argument_drum68allkick
+waitRows 96  ; end at 4:48.00
+playPatNoise PP_musicseq_argument_drum68
+playPatSq2 PP_musicseq_argument_harmony68_1, 31, PI_musicseq_bf98_flute2
+playPatTri PP_musicseq_argument_harmony68_2, 10, PI_musicseq_bf98_flute2
+waitRows 96  ; end at 5:04.00
+playPatNoise PP_musicseq_argument_drum68allkick
+playPatAttack PP_musicseq_argument_drum68top, 12, PI_musicseq_tubbass
+playPatSq2 PP_musicseq_argument_melody68, 22, PI_musicseq_bf98_flute2
+playPatTri PP_musicseq_argument_bass68, 10, PI_musicseq_arg2bass
+waitRows 96  ; end at 5:20.00
+playPatTri PP_musicseq_argument_harmony68_2, 10, PI_musicseq_bf98_flute2
+playPatNoise PP_musicseq_argument_drum68nokick
+waitRows 96  ; end at 5:36.00
+stopPatSq1
+stopPatSq2
+playPatNoise PP_musicseq_argument_drum68allkick
+playPatTri PP_musicseq_argument_bass68, 10, PI_musicseq_arg2bass
+waitRows 96  ; end at 5:52.00
+playPatNoise PP_musicseq_argument_drum68
+playPatTri PP_musicseq_argument_bass68end, 10, PI_musicseq_arg2bass
+playPatAttack PP_musicseq_argument_drum68topend, 12, PI_musicseq_tubbass
+waitRows 96  ; end at 6:08.00
+stopPatTri
+dalSegno
+PSDAT_musicseq_Isometry:
+; title: Isometry
+attackOnSq1
+playPatAttack PP_musicseq_Isometry_tinkle1, 44, PI_musicseq_isotinkle
+playPatSq2 PP_musicseq_Isometry_melmaj2, 30, PI_musicseq_isopiano
+playPatSq1 PP_musicseq_Isometry_melmaj1, 26, PI_musicseq_isopiano
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatNoise PP_musicseq_Isometry_drum
+setTempo 360
+setBeatDuration D_4
+waitRows 32  ; end at 0:05.33
+playPatAttack PP_musicseq_Isometry_tinkle2, 45, PI_musicseq_isotinkle
+playPatTri PP_musicseq_Isometry_triosti, 26, PI_musicseq_isobeep
+waitRows 32  ; end at 0:10.67
+playPatAttack PP_musicseq_Isometry_tinkle3, 43, PI_musicseq_isotinkle
+playPatSq2 PP_musicseq_Isometry_melmin2, 30, PI_musicseq_isopiano
+playPatSq1 PP_musicseq_Isometry_melmin1, 26, PI_musicseq_isopiano
+playPatTri PP_musicseq_Isometry_triosti, 24, PI_musicseq_isobeep
+waitRows 32  ; end at 0:16.00
+playPatAttack PP_musicseq_Isometry_tinkle1, 44, PI_musicseq_isotinkle
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+waitRows 24  ; end at 0:20.00
+stopPatSq1
+stopPatAttack
+playPatNoise PP_musicseq_Isometry_drumfill
+playPatSq2 PP_musicseq_Isometry_trifill, 4, PI_musicseq_banjo
+playPatTri PP_musicseq_Isometry_trifill, 28, PI_musicseq_bass
+waitRows 8  ; end at 0:21.33
+playPatAttack PP_musicseq_Isometry_tinkle1, 44, PI_musicseq_isotinkle
+playPatSq2 PP_musicseq_Isometry_melmaj2, 30, PI_musicseq_isopiano
+playPatSq1 PP_musicseq_Isometry_melmaj1, 26, PI_musicseq_isopiano
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatNoise PP_musicseq_Isometry_drum
+waitRows 32  ; end at 0:26.67
+playPatAttack PP_musicseq_Isometry_tinkle2, 45, PI_musicseq_isotinkle
+playPatTri PP_musicseq_Isometry_triosti, 26, PI_musicseq_isobeep
+waitRows 32  ; end at 0:32.00
+playPatAttack PP_musicseq_Isometry_tinkle3, 43, PI_musicseq_isotinkle
+playPatSq2 PP_musicseq_Isometry_melmin2, 30, PI_musicseq_isopiano
+playPatSq1 PP_musicseq_Isometry_melmin1, 26, PI_musicseq_isopiano
+playPatTri PP_musicseq_Isometry_triosti, 24, PI_musicseq_isobeep
+waitRows 32  ; end at 0:37.33
+playPatAttack PP_musicseq_Isometry_tinkle1, 44, PI_musicseq_isotinkle
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+waitRows 24  ; end at 0:41.33
+stopPatSq1
+stopPatAttack
+playPatNoise PP_musicseq_Isometry_drumfill
+playPatSq2 PP_musicseq_Isometry_trifill, 4, PI_musicseq_banjo
+playPatTri PP_musicseq_Isometry_trifill, 28, PI_musicseq_bass
+waitRows 8  ; end at 0:42.67
+stopPatSq2
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 4, PI_musicseq_isobeepsq
+playPatNoise PP_musicseq_Isometry_drum
+waitRows 32  ; end at 0:48.00
+playPatTri PP_musicseq_Isometry_triosti, 26, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 2, PI_musicseq_isobeepsq
+waitRows 32  ; end at 0:53.33
+playPatTri PP_musicseq_Isometry_triosti, 24, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 0, PI_musicseq_isobeepsq
+waitRows 32  ; end at 0:58.67
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 4, PI_musicseq_isobeepsq
+waitRows 32  ; end at 1:04.00
+playPatSq1 PP_musicseq_Isometry_restperiod1, 20, PI_musicseq_isopiano
+waitRows 32  ; end at 1:09.33
+playPatTri PP_musicseq_Isometry_triosti, 26, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 2, PI_musicseq_isobeepsq
+waitRows 32  ; end at 1:14.67
+playPatSq1 PP_musicseq_Isometry_restperiod2, 16, PI_musicseq_isopiano
+playPatTri PP_musicseq_Isometry_triosti, 24, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 0, PI_musicseq_isobeepsq
+waitRows 32  ; end at 1:20.00
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 4, PI_musicseq_isobeepsq
+waitRows 32  ; end at 1:25.33
+playPatTri PP_musicseq_Isometry_triosti, 24, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 0, PI_musicseq_isobeepsq
+waitRows 32  ; end at 1:30.67
+playPatTri PP_musicseq_Isometry_triosti, 28, PI_musicseq_isobeep
+playPatSq2 PP_musicseq_Isometry_triosti, 4, PI_musicseq_isobeepsq
+waitRows 16  ; end at 1:33.33
+stopPatSq1
+stopPatAttack
+playPatSq2 PP_musicseq_Isometry_trifill, 4, PI_musicseq_banjo
+playPatNoise PP_musicseq_Isometry_drumfill
+playPatTri PP_musicseq_Isometry_trifill, 28, PI_musicseq_bass
+waitRows 16  ; end at 1:36.00
+dalSegno
+PSDAT_musicseq_Sticks:
+; title: Sticks
+playPatSq1 PP_musicseq_Sticks_introbanjo1, 24, PI_musicseq_banjo
+playPatSq2 PP_musicseq_Sticks_introch2, 5, PI_musicseq_toot0
+setTempo 600
+setBeatDuration D_D4
+waitRows 60  ; end at 0:06.00
+playPatSq1 PP_musicseq_Sticks_introbanjo2, 26, PI_musicseq_banjo
+waitRows 12  ; end at 0:07.20
+playPatTri PP_musicseq_Sticks_introbass, 0, PI_musicseq_bass
+playPatNoise PP_musicseq_Sticks_introdrum
+waitRows 48  ; end at 0:12.00
+playPatSq2 PP_musicseq_Sticks_chords2, 39, PI_musicseq_toot0
+playPatSq1 PP_musicseq_Sticks_chords1start, 36, PI_musicseq_toot0
+stopPatTri
+waitRows 24  ; end at 0:14.40
+stopPatNoise
+waitRows 24  ; end at 0:16.80
+playPatTri PP_musicseq_Sticks_bassstart, 44, PI_musicseq_isobeep
+waitRows 48  ; end at 0:21.60
+segno
+playPatSq1 PP_musicseq_Sticks_chords1, 3, PI_musicseq_toot0
+playPatSq2 PP_musicseq_Sticks_chords2, 39, PI_musicseq_toot0
+playPatTri PP_musicseq_Sticks_bass, 15, PI_musicseq_toot0
+playPatNoise PP_musicseq_Sticks_drum
+waitRows 256
+waitRows 128  ; end at 1:00.00
+playPatTri PP_musicseq_Sticks_v_iv_bass, 22, PI_musicseq_toot0
+playPatSq1 PP_musicseq_Sticks_v_iv_chords1, 24, PI_musicseq_toot0
+playPatSq2 PP_musicseq_Sticks_v_iv_chords2, 10, PI_musicseq_tubbass
+waitRows 72  ; end at 1:07.20
+stopPatNoise
+waitRows 24  ; end at 1:09.60
+dalSegno
+PSDAT_musicseq_twinkle:
+; title: The Naive Confidence
+; author: traditional; arr. D. Yerrick
+playPatSq2 PP_musicseq_twinkle_melody, 27, PI_musicseq_bf98_osti
+playPatNoise PP_musicseq_twinkle_beat
+playPatTri PP_musicseq_twinkle_bassline, 22, PI_musicseq_bass
+setTempo 270
+setBeatDuration D_D8
+waitRows 132  ; end at 0:29.33
+setTempo 225
+waitRows 6  ; end at 0:30.93
+playPatTri PP_musicseq_twinkle_bassfinal, 27, PI_musicseq_bass
+setTempo 180
+waitRows 3  ; end at 0:31.93
+stopPatNoise
+waitRows 3  ; end at 0:32.93
+fine
+PSDAT_musicseq_canon:
+; title: Canon in D
+; author: J. Pachelbel; arr. D. Yerrick
+playPatTri PP_musicseq_canon_bass, 17, PI_musicseq_bass
+setTempo 450
+setBeatDuration D_2
+waitRows 64  ; end at 0:08.53
+playPatSq2 PP_musicseq_canon_melody, 26, PI_musicseq_bf98_osti
+waitRows 64  ; end at 0:17.07
+playPatSq1 PP_musicseq_canon_melody, 26, PI_musicseq_fiddle2
+waitRows 192  ; end at 0:42.67
+waitRows 256  ; end at 1:16.80
+waitRows 256  ; end at 1:50.93
+waitRows 256
+waitRows 128  ; end at 2:42.13
+waitRows 256  ; end at 3:16.27
+waitRows 256
+waitRows 40  ; end at 3:55.73
+setTempo 400
+waitRows 8  ; end at 3:56.93
+setTempo 350
+waitRows 8  ; end at 3:58.30
+setTempo 300
+waitRows 8  ; end at 3:59.90
+playPatSq1 PP_musicseq_canon_melody, 26, PI_musicseq_fiddle2
+setTempo 250
+waitRows 8  ; end at 4:01.82
+fine
+PSDAT_musicseq_bf98:
+; title: Happy Flappy Crappy
+playPatSq2 PP_musicseq_bf98_orchhits, 31, PI_musicseq_orchhit
+setTempo 400
+setBeatDuration D_D8
+waitRows 36  ; end at 0:05.40
+playPatTri PP_musicseq_bf98_bassA, 17, PI_musicseq_bass
+playPatNoise PP_musicseq_bf98_drums
+noteOnNoise 5, PI_musicseq_crashcymbal
+waitRows 36  ; end at 0:10.80
+segno
+playPatSq2 PP_musicseq_bf98_melodyA, 33, PI_musicseq_bf98_flute
+playPatNoise PP_musicseq_bf98_drums
+waitRows 36  ; end at 0:16.20
+playPatSq1 PP_musicseq_bf98_thirdsA, 29, PI_musicseq_bf98_flute2
+waitRows 36  ; end at 0:21.60
+stopPatSq2
+playPatSq1 PP_musicseq_bf98_osti1, 41, PI_musicseq_bf98_osti
+playPatSq2 PP_musicseq_bf98_osti2, 31, PI_musicseq_orchhit
+waitRows 72  ; end at 0:32.40
+playPatSq2 PP_musicseq_bf98_melodyA, 33, PI_musicseq_bf98_flute
+playPatSq1 PP_musicseq_bf98_thirdsA, 29, PI_musicseq_bf98_flute2
+waitRows 72  ; end at 0:43.20
+playPatSq2 PP_musicseq_bf98_melodyB1, 35, PI_musicseq_bf98_flute
+playPatSq1 PP_musicseq_bf98_counterB1, 28, PI_musicseq_bf98_flute2
+playPatTri PP_musicseq_bf98_bassB1, 18, PI_musicseq_bass
+waitRows 63  ; end at 0:52.65
+playPatNoise PP_musicseq_bf98_drums_tripletfill
+waitRows 9  ; end at 0:54.00
+playPatNoise PP_musicseq_bf98_drums
+waitRows 18  ; end at 0:56.70
+playPatSq2 PP_musicseq_bf98_melodyB2, 34, PI_musicseq_bf98_flute
+playPatSq1 PP_musicseq_bf98_counterB2, 28, PI_musicseq_bf98_flute2
+playPatTri PP_musicseq_bf98_bassB2, 17, PI_musicseq_bass
+waitRows 45  ; end at 1:03.45
+playPatNoise PP_musicseq_bf98_drums_quietfill
+stopPatSq1
+stopPatSq2
+waitRows 9  ; end at 1:04.80
+playPatNoise PP_musicseq_bf98_drums
+playPatTri PP_musicseq_bf98_bassA, 17, PI_musicseq_bass
+waitRows 36  ; end at 1:10.20
+playPatNoise PP_musicseq_bf98_drums_break
+waitRows 27  ; end at 1:14.25
+playPatNoise PP_musicseq_bf98_drums_resumefill
+waitRows 9  ; end at 1:15.60
+dalSegno
+PSDAT_musicseq_arp_waltz:
+; title: Arpeggio Waltz
+playPatSq1 PP_musicseq_arp_waltz_bassintro, 3, PI_musicseq_toot0
+setTempo 180
+setBeatDuration 0
+waitRows 12  ; end at 0:04.00
+segno
+playPatSq2 PP_musicseq_arp_waltz_melody, 24, PI_musicseq_stringlead
+playPatSq1 PP_musicseq_arp_waltz_bass1, 1, PI_musicseq_toot0
+waitRows 39  ; end at 0:17.00
+playPatSq1 PP_musicseq_arp_waltz_bass2, 3, PI_musicseq_toot0
+waitRows 9  ; end at 0:20.00
+playPatSq1 PP_musicseq_arp_waltz_bass1, 1, PI_musicseq_toot0
+waitRows 39  ; end at 0:33.00
+playPatSq1 PP_musicseq_arp_waltz_bass2, 3, PI_musicseq_toot0
+waitRows 9  ; end at 0:36.00
+dalSegno
+PSDAT_musicseq_allfeatures:
+; title: Individual features
+playPatSq1 PP_musicseq_allfeatures_between, 6, PI_musicseq_feat_power
+playPatSq2 PP_musicseq_allfeatures_between, 13, PI_musicseq_feat_power
+playPatTri PP_musicseq_allfeatures_between, 30, PI_musicseq_bass
+setTempo 720
+setBeatDuration D_D4
+waitRows 12  ; end at 0:01.00
+stopPatSq1
+playPatNoise PP_musicseq_allfeatures_drum
+waitRows 36  ; end at 0:04.00
+playPatNoise PP_musicseq_allfeatures_drumfill
+waitRows 12  ; end at 0:05.00
+playPatTri PP_musicseq_allfeatures_bass, 25, PI_musicseq_bass
+playPatNoise PP_musicseq_allfeatures_drum
+playPatSq2 PP_musicseq_allfeatures_chords, 28, PI_musicseq_feat_wah
+waitRows 84  ; end at 0:12.00
+playPatNoise PP_musicseq_allfeatures_drumfill
+waitRows 12  ; end at 0:13.00
+stopPatNoise
+dalSegno
+PSDAT_musicseq_Stairs:
+; title: Stairs
+playPatSq2 PP_musicseq_Stairs_lead1, 19, PI_musicseq_banjo
+setTempo 300
+setBeatDuration D_D8
+waitRows 51  ; end at 0:10.20
+playPatSq1 PP_musicseq_Stairs_introg, 34, PI_musicseq_latebanjo
+waitRows 36  ; end at 0:17.40
+playPatSq2 PP_musicseq_Stairs_lead1end, 22, PI_musicseq_banjo
+waitRows 3  ; end at 0:18.00
+stopPatSq1
+waitRows 6  ; end at 0:19.20
+segno
+playPatSq2 PP_musicseq_Stairs_lead1, 19, PI_musicseq_banjo
+playPatSq1 PP_musicseq_Stairs_bass, 10, PI_musicseq_tubbass
+waitRows 87  ; end at 0:36.60
+playPatSq2 PP_musicseq_Stairs_lead1end, 22, PI_musicseq_banjo
+waitRows 3  ; end at 0:37.20
+playPatSq1 PP_musicseq_Stairs_introg, 10, PI_musicseq_tubbass
+waitRows 6  ; end at 0:38.40
+playPatSq2 PP_musicseq_Stairs_lead2, 17, PI_musicseq_banjo
+playPatSq1 PP_musicseq_Stairs_bass, 10, PI_musicseq_tubbass
+waitRows 84  ; end at 0:55.20
+playPatSq2 PP_musicseq_Stairs_lead2end, 22, PI_musicseq_banjo
+waitRows 6  ; end at 0:56.40
+playPatSq1 PP_musicseq_Stairs_introg, 10, PI_musicseq_tubbass
+waitRows 6  ; end at 0:57.60
+dalSegno
+PSDAT_musicseq_attacktest:
+; title: Attack injection (no pulse!)
+playPatNoise PP_musicseq_attacktest_drums
+playPatTri PP_musicseq_attacktest_bass, 15, PI_musicseq_bass
+attackOnTri
+playPatAttack PP_musicseq_attacktest_atk, 56, PI_musicseq_framepop
+setTempo 515
+setBeatDuration D_D4
+waitRows 72  ; end at 0:08.39
+playPatAttack PP_musicseq_attacktest_atk, 54, PI_musicseq_framepop
+waitRows 18  ; end at 0:10.49
+playPatNoise PP_musicseq_attacktest_drumfill
+waitRows 6  ; end at 0:11.18
+dalSegno
+PSDAT_pino_a53_croom_intro:
+; title: CRoom intro
+playPatSq1 PP_pino_a53_croom_intro_chords1, 21, PI_pino_a53_piano
+playPatSq2 PP_pino_a53_croom_intro_chords2, 30, PI_pino_a53_piano
+playPatTri PP_pino_a53_croom_intro_bass, 21, PI_pino_a53_v02
+setTempo 220
+setBeatDuration D_8
+waitRows 48  ; end at 0:13.09
+dalSegno
+PSDAT_pino_a53_croom_cleared:
+; title: CRoom stage clear
+playPatSq2 PP_pino_a53_croom_cleared_melody, 24, PI_pino_a53_piano
+playPatSq1 PP_pino_a53_croom_cleared_bass, 0, PI_pino_a53_piano
+playPatTri PP_pino_a53_croom_cleared_bass, 24, PI_pino_a53_v02
+setTempo 360
+setBeatDuration D_D8
+waitRows 12  ; end at 0:02.00
+fine
+PSDAT_pino_a53_thwaite_0200:
+; title: Thwaite 02:00
+; author: L. van Beethoven, arr. D. Yerrick
+playPatSq1 PP_pino_a53_thwaite_0200_backing, 28, PI_pino_a53_piano
+playPatSq2 PP_pino_a53_thwaite_0200_melody, 35, PI_pino_a53_piano
+playPatTri PP_pino_a53_thwaite_0200_bass, 31, PI_pino_a53_v02
+setTempo 300
+setBeatDuration D_D8
+waitRows 36  ; end at 0:07.20
+playPatNoise PP_pino_a53_thwaite_0200_drums
+waitRows 144  ; end at 0:36.00
+dalSegno
+PSDAT_pino_a53_thwaite_0300:
+; title: Thwaite 03:00
+playPatNoise PP_pino_a53_thwaite_0300_drums
+playPatTri PP_pino_a53_thwaite_0300_bass1, 19, PI_pino_a53_v02
+stopPatSq1
+stopPatSq2
+setTempo 300
+setBeatDuration D_D8
+waitRows 48  ; end at 0:09.60
+playPatSq1 PP_pino_a53_thwaite_0300_backingA, 34, PI_pino_a53_xylo_long
+playPatSq2 PP_pino_a53_thwaite_0300_melA, 39, PI_pino_a53_xylo_long
+waitRows 96  ; end at 0:28.80
+playPatTri PP_pino_a53_thwaite_0300_bass2, 24, PI_pino_a53_v02
+playPatSq2 PP_pino_a53_thwaite_0300_melB, 34, PI_pino_a53_xylo_long
+playPatSq1 PP_pino_a53_thwaite_0300_melB, 29, PI_pino_a53_xylo_long
+waitRows 96  ; end at 0:48.00
+dalSegno
+PSDAT_pino_a53_thwaite_0400:
+; title: Thwaite 04:00
+playPatSq1 PP_pino_a53_thwaite_0400_chords1, 22, PI_pino_a53_xylo_short
+playPatSq2 PP_pino_a53_thwaite_0400_chords2, 26, PI_pino_a53_xylo_short
+setTempo 300
+setBeatDuration D_D8
+waitRows 6  ; end at 0:01.20
+playPatNoise PP_pino_a53_thwaite_0400_drum1
+waitRows 84  ; end at 0:18.00
+segno
+playPatNoise PP_pino_a53_thwaite_0400_drum2
+waitRows 96  ; end at 0:37.20
+dalSegno
+PSDAT_pino_a53_thwaite_0500:
+; title: Thwaite 05:00
+; author: L. van Beethoven, arr. D. Yerrick
+playPatSq1 PP_pino_a53_thwaite_0500_backing, 26, PI_pino_a53_piano
+playPatSq2 PP_pino_a53_thwaite_0500_backing, 31, PI_pino_a53_piano
+stopPatTri
+playPatNoise PP_pino_a53_thwaite_0300_drums
+setTempo 300
+setBeatDuration D_D8
+waitRows 96  ; end at 0:19.20
+playPatSq2 PP_pino_a53_thwaite_0500_melody, 31, PI_pino_a53_xylo_medium
+playPatTri PP_pino_a53_thwaite_0500_bass, 19, PI_pino_a53_v02
+waitRows 192  ; end at 0:57.60
+dalSegno
+PSDAT_pino_a53_thwaite_1600:
+; title: Thwaite 16:00
+playPatSq1 PP_pino_a53_thwaite_1600_chords1, 25, PI_pino_a53_xylo_short
+playPatSq2 PP_pino_a53_thwaite_1600_chords2, 36, PI_pino_a53_xylo_short
+playPatTri PP_pino_a53_thwaite_1600_bass, 24, PI_pino_a53_v02
+playPatNoise PP_pino_a53_thwaite_1600_drum
+setTempo 300
+setBeatDuration D_D8
+waitRows 48  ; end at 0:09.60
+dalSegno
+PSDAT_pino_a53_thwaite_town_tune:
+; title: Thwaite town tune (clear)
+; author: Joseph Jowett
+playPatSq2 PP_pino_a53_thwaite_town_tune_town_tune, 24, PI_pino_a53_town_tune_bell
+playPatSq1 PP_pino_a53_thwaite_town_tune_town_tune, 15, PI_pino_a53_town_tune_bell
+setTempo 60
+setBeatDuration 0
+waitRows 5  ; end at 0:05.00
+fine
+PSDAT_pino_a53_tennis_win_point:
+; title: Tennis win point
+playPatSq2 PP_pino_a53_tennis_win_point_orchhits, 38, PI_pino_a53_orchhit
+playPatTri PP_pino_a53_tennis_win_point_bass, 26, PI_pino_a53_v02detached
+playPatSq1 PP_pino_a53_tennis_win_point_bass, 21, PI_pino_a53_distantguitdet
+playPatNoise PP_pino_a53_tennis_win_point_drum
+setTempo 600
+setBeatDuration D_4
+waitRows 26  ; end at 0:02.60
+fine
+PSDAT_pino_a53_tennis_win_game:
+; title: Tennis win game
+playPatSq2 PP_pino_a53_tennis_win_game_fanfare, 37, PI_pino_a53_fanfarehorn
+playPatNoise PP_pino_a53_tennis_win_game_drum
+setTempo 896
+setBeatDuration D_4
+waitRows 4  ; end at 0:00.27
+playPatTri PP_pino_a53_tennis_win_game_fanfarejoinin, 25, PI_pino_a53_v02detached
+playPatSq1 PP_pino_a53_tennis_win_game_fanfarejoinin, 29, PI_pino_a53_fanfarehorn
+waitRows 16  ; end at 0:01.34
+fine
+PSDAT_pino_a53_axe_beat:
+; title: Axe beat
+playPatNoise PP_pino_a53_axe_beat_drum
+playPatSq1 PP_pino_a53_axe_beat_sq1, 4, PI_pino_a53_xylo_short
+playPatSq2 PP_pino_a53_axe_beat_tiestream, 0, PI_pino_a53_xylo_short
+setTempo 515
+setBeatDuration D_4
+waitRows 32  ; end at 0:03.73
+playPatSq1 PP_pino_a53_axe_beat_sq1, 7, PI_pino_a53_xylo_short
+waitRows 32  ; end at 0:07.46
+playPatSq1 PP_pino_a53_axe_beat_sq1, 2, PI_pino_a53_xylo_short
+waitRows 32  ; end at 0:11.18
+playPatSq1 PP_pino_a53_axe_beat_sq1, 4, PI_pino_a53_xylo_short
+waitRows 32  ; end at 0:14.91
+dalSegno
+PSDAT_pino_a53_rhde_battle:
+; title: RHDE battle
+; author: The Eighth Bit
+playPatNoise PP_pino_a53_rhde_battle_drums
+playPatTri PP_pino_a53_rhde_battle_bassA, 22, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_battle_melA, 19, PI_pino_a53_stringsdet
+playPatSq1 PP_pino_a53_rhde_battle_backingA, 23, PI_pino_a53_stringsdet
+setTempo 468
+setBeatDuration D_D8
+waitRows 165  ; end at 0:21.15
+playPatTri PP_pino_a53_rhde_battle_bassAend, 22, PI_pino_a53_v02detached
+waitRows 6  ; end at 0:21.92
+playPatSq1 PP_pino_a53_rhde_battle_backingAend, 27, PI_pino_a53_stringsdet
+waitRows 21  ; end at 0:24.62
+playPatTri PP_pino_a53_rhde_battle_bassB, 19, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_battle_melB, 33, PI_pino_a53_stringsdet
+playPatSq1 PP_pino_a53_rhde_battle_backingB, 27, PI_pino_a53_stringsdet
+waitRows 192  ; end at 0:49.23
+dalSegno
+PSDAT_pino_a53_rhde_kalinka:
+; title: RHDE Kalinka
+; author: I. Larionov, arr. D. Yerrick
+playPatTri PP_pino_a53_rhde_kalinka_intro, 39, PI_pino_a53_v02detached
+playPatSq1 PP_pino_a53_rhde_kalinka_intro, 22, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_kalinka_intro, 31, PI_pino_a53_v02detached
+playPatNoise PP_pino_a53_rhde_kalinka_introdrum
+setTempo 560
+setBeatDuration D_4
+waitRows 32  ; end at 0:03.43
+playPatTri PP_pino_a53_rhde_kalinka_bassA, 3, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_kalinka_bassA, 3, PI_pino_a53_bassassist
+playPatSq1 PP_pino_a53_rhde_kalinka_partA, 19, PI_pino_a53_rhdeban
+playPatNoise PP_pino_a53_rhde_kalinka_drum
+waitRows 124  ; end at 0:16.71
+playPatNoise PP_pino_a53_rhde_kalinka_drumfill
+stopPatSq1
+stopPatSq2
+stopPatTri
+waitRows 4  ; end at 0:17.14
+playPatTri PP_pino_a53_rhde_kalinka_bassB, 3, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_kalinka_bassB, 3, PI_pino_a53_bassassist
+playPatSq1 PP_pino_a53_rhde_kalinka_chordsB, 13, PI_pino_a53_distantguitdet
+playPatNoise PP_pino_a53_rhde_kalinka_drum
+waitRows 62  ; end at 0:23.79
+playPatSq1 PP_pino_a53_rhde_kalinka_ending_p1, 23, PI_pino_a53_v02detached
+playPatSq2 PP_pino_a53_rhde_kalinka_ending_p2, 27, PI_pino_a53_v02detached
+playPatTri PP_pino_a53_rhde_kalinka_ending_tri, 23, PI_pino_a53_v02detached
+waitRows 2  ; end at 0:24.00
+stopPatNoise
+waitRows 48  ; end at 0:29.14
+fine
+PSDAT_pino_a53_K_231:
+; title: Leck mich im Arsch (K.231)
+; author: Mozart, arr. D. Yerrick
+playPatSq2 PP_pino_a53_K_231_LMIA, 25, PI_pino_a53_fanfarehorn
+setTempo 300
+setBeatDuration D_4
+waitRows 32  ; end at 0:06.40
+playPatSq1 PP_pino_a53_K_231_LMIA, 25, PI_pino_a53_piano
+waitRows 32  ; end at 0:12.80
+playPatTri PP_pino_a53_K_231_LMIA, 25, PI_pino_a53_v02detached
+segno
+waitRows 192  ; end at 0:51.20
+dalSegno
+pentlyseq_end:
+
+; references to subsequences
+PEDAT_musicseq_quiethat = PEDAT_musicseq_snarehat + 16
+PEDAT_musicseq_shorthat = PEDAT_musicseq_openhat + 4
+PEDAT_pino_a53_croom_rotate = PEDAT_pino_a53_thwaite_mirv_split + 0
+PEDAT_pino_a53_tkick = PEDAT_musicseq_trikick + 0
+PIDAT_musicseq_banjo = PIDAT_musicseq_latebanjo + 1
+PIDAT_musicseq_bf98_flute = PIDAT_musicseq_bf98_flute2 + 0
+PIDAT_musicseq_bf98_fluteshort = PIDAT_musicseq_bf98_flute2 + 0
+PIDAT_musicseq_isopiano = PIDAT_musicseq_feat_wah + 0
+
+; duplicates of identical objects
+PI_pino_a53_orchhit = PI_musicseq_orchhit
+PI_pino_a53_axe_echo_3 = PI_pino_a53_axe_echo_2
+pently_resume_mute = $00
+
+; Total music data size: 7095 bytes
+; pently_sfx_table: 1024 bytes
+;   PE_musicseq_kick: 24 bytes
+;   PE_musicseq_snare: 24 bytes
+;   PE_musicseq_hihat: 12 bytes
+;   PE_musicseq_openhat: 34 bytes
+;   PE_musicseq_snarehat: 34 bytes
+;   PE_musicseq_trikick: 14 bytes
+;   PE_musicseq_trisnare: 12 bytes
+;   PE_musicseq_quiethat: 6 bytes
+;   PE_musicseq_shorthat: 6 bytes
+;   PE_musicseq_tubfloorA: 28 bytes
+;   PE_musicseq_arghatbuzz: 16 bytes
+;   PE_musicseq_stickskick: 28 bytes
+;   PE_musicseq_stickshatlo: 16 bytes
+;   PE_musicseq_longkick: 38 bytes
+;   PE_musicseq_longsnare: 38 bytes
+;   PE_pino_a53_thwaite_mirv_split: 40 bytes
+;   PE_pino_a53_thwaite_threat_1: 46 bytes
+;   PE_pino_a53_thwaite_threat_2: 24 bytes
+;   PE_pino_a53_thwaite_shoot: 18 bytes
+;   PE_pino_a53_thwaite_boomp: 34 bytes
+;   PE_pino_a53_thwaite_boomn: 36 bytes
+;   PE_pino_a53_croom_rotate: 16 bytes
+;   PE_pino_a53_croom_shift: 8 bytes
+;   PE_pino_a53_croom_land: 20 bytes
+;   PE_pino_a53_croom_line_clear: 34 bytes
+;   PE_pino_a53_croom_homer_clear: 54 bytes
+;   PE_pino_a53_croom_garbage: 16 bytes
+;   PE_pino_a53_croom_die1: 38 bytes
+;   PE_pino_a53_croom_die2: 38 bytes
+;   PE_pino_a53_rhde_scanbeep: 12 bytes
+;   PE_pino_a53_rhde_countdown: 28 bytes
+;   PE_pino_a53_rhde_hold_piece: 14 bytes
+;   PE_pino_a53_rhde_explode: 20 bytes
+;   PE_pino_a53_rhde_start: 36 bytes
+;   PE_pino_a53_tennis_paddle: 12 bytes
+;   PE_pino_a53_kick: 12 bytes
+;   PE_pino_a53_snare: 18 bytes
+;   PE_pino_a53_tkick: 12 bytes
+;   PE_pino_a53_tsnare: 8 bytes
+;   PE_pino_a53_clhat: 10 bytes
+;   PE_pino_a53_ohat: 30 bytes
+;   PE_pino_a53_kickohat: 30 bytes
+;   PE_pino_a53_snareohat: 30 bytes
+; pently_instruments: 423 bytes
+;   PI_musicseq_bass: 5 bytes
+;   PI_musicseq_framepop: 6 bytes
+;   PI_musicseq_banjo: 13 bytes
+;   PI_musicseq_latebanjo: 14 bytes
+;   PI_musicseq_tubbass: 15 bytes
+;   PI_musicseq_tubbass_slow: 17 bytes
+;   PI_musicseq_dut: 21 bytes
+;   PI_musicseq_feat_wah: 17 bytes
+;   PI_musicseq_feat_power: 5 bytes
+;   PI_musicseq_bf98_flute: 12 bytes
+;   PI_musicseq_bf98_flute2: 12 bytes
+;   PI_musicseq_bf98_osti: 9 bytes
+;   PI_musicseq_orchhit: 45 bytes
+;   PI_musicseq_crashcymbal: 5 bytes
+;   PI_musicseq_fiddle2: 10 bytes
+;   PI_musicseq_bf98_fluteshort: 9 bytes
+;   PI_musicseq_vowele: 12 bytes
+;   PI_musicseq_vowela: 12 bytes
+;   PI_musicseq_argtwinkle: 15 bytes
+;   PI_musicseq_arg2bass: 5 bytes
+;   PI_musicseq_toot0: 12 bytes
+;   PI_musicseq_stringlead: 14 bytes
+;   PI_musicseq_isopiano: 6 bytes
+;   PI_musicseq_isotinkle: 7 bytes
+;   PI_musicseq_isobeep: 5 bytes
+;   PI_musicseq_isobeepsq: 5 bytes
+;   PI_pino_a53_v02: 5 bytes
+;   PI_pino_a53_v02detached: 5 bytes
+;   PI_pino_a53_piano: 7 bytes
+;   PI_pino_a53_town_tune_bell: 5 bytes
+;   PI_pino_a53_xylo_short: 5 bytes
+;   PI_pino_a53_xylo_medium: 7 bytes
+;   PI_pino_a53_xylo_long: 5 bytes
+;   PI_pino_a53_distanthorn: 9 bytes
+;   PI_pino_a53_distantguitdet: 7 bytes
+;   PI_pino_a53_stringsdet: 8 bytes
+;   PI_pino_a53_rhdeban: 5 bytes
+;   PI_pino_a53_bassassist: 5 bytes
+;   PI_pino_a53_fanfarehorn: 12 bytes
+;   PI_pino_a53_axe_fg_1: 5 bytes
+;   PI_pino_a53_axe_fg_2: 5 bytes
+;   PI_pino_a53_axe_fg_3: 5 bytes
+;   PI_pino_a53_axe_echo_1: 5 bytes
+;   PI_pino_a53_axe_echo_2: 5 bytes
+;   PI_pino_a53_axe_echo_tri: 5 bytes
+; pently_drums: 42 bytes
+;   DR_musicseq_kick: 2 bytes
+;   DR_musicseq_snare: 2 bytes
+;   DR_musicseq_clhat: 2 bytes
+;   DR_musicseq_ohat: 2 bytes
+;   DR_musicseq_tkick: 2 bytes
+;   DR_musicseq_tsnare: 2 bytes
+;   DR_musicseq_tsohat: 2 bytes
+;   DR_musicseq_tubkick: 2 bytes
+;   DR_musicseq_arghatbuzz: 2 bytes
+;   DR_musicseq_quiethat: 2 bytes
+;   DR_musicseq_shorthat: 2 bytes
+;   DR_musicseq_stickskick: 2 bytes
+;   DR_musicseq_stickshatlo: 2 bytes
+;   DR_musicseq_lkick: 2 bytes
+;   DR_musicseq_lsnare: 2 bytes
+;   DR_pino_a53_kick: 2 bytes
+;   DR_pino_a53_snare: 2 bytes
+;   DR_pino_a53_clhat: 2 bytes
+;   DR_pino_a53_ohat: 2 bytes
+;   DR_pino_a53_kickohat: 2 bytes
+;   DR_pino_a53_snareohat: 2 bytes
+; pently_patterns: 3955 bytes
+;   PP_musicseq_argument_drum34: 6 bytes
+;   PP_musicseq_argument_drum34_8: 9 bytes
+;   PP_musicseq_argument_commemorate3: 99 bytes
+;   PP_musicseq_argument_tubbassloop: 12 bytes
+;   PP_musicseq_argument_intro_dut: 18 bytes
+;   PP_musicseq_argument_bass: 31 bytes
+;   PP_musicseq_argument_melody: 13 bytes
+;   PP_musicseq_argument_melodyend: 6 bytes
+;   PP_musicseq_argument_descendingchords: 67 bytes
+;   PP_musicseq_argument_twinkle: 19 bytes
+;   PP_musicseq_argument_cadenzabass: 7 bytes
+;   PP_musicseq_argument_cadenza: 55 bytes
+;   PP_musicseq_argument_cadenzaend: 40 bytes
+;   PP_musicseq_argument_cadenzaend2: 21 bytes
+;   PP_musicseq_argument_cadenzaend3: 7 bytes
+;   PP_musicseq_argument_drum68: 5 bytes
+;   PP_musicseq_argument_drum68nokick: 6 bytes
+;   PP_musicseq_argument_drum68allkick: 6 bytes
+;   PP_musicseq_argument_drum68top: 4 bytes
+;   PP_musicseq_argument_bass68: 51 bytes
+;   PP_musicseq_argument_harmony68_1: 21 bytes
+;   PP_musicseq_argument_harmony68_2: 13 bytes
+;   PP_musicseq_argument_harmony68_3: 19 bytes
+;   PP_musicseq_argument_melody68: 46 bytes
+;   PP_musicseq_argument_bass68end: 27 bytes
+;   PP_musicseq_argument_drum68topend: 4 bytes
+;   PP_musicseq_Isometry_triosti: 4 bytes
+;   PP_musicseq_Isometry_trifill: 5 bytes
+;   PP_musicseq_Isometry_tinkle1: 7 bytes
+;   PP_musicseq_Isometry_tinkle2: 7 bytes
+;   PP_musicseq_Isometry_tinkle3: 7 bytes
+;   PP_musicseq_Isometry_melmin1: 11 bytes
+;   PP_musicseq_Isometry_melmaj1: 12 bytes
+;   PP_musicseq_Isometry_melmin2: 11 bytes
+;   PP_musicseq_Isometry_melmaj2: 12 bytes
+;   PP_musicseq_Isometry_drum: 11 bytes
+;   PP_musicseq_Isometry_drumfill: 4 bytes
+;   PP_musicseq_Isometry_restperiod1: 7 bytes
+;   PP_musicseq_Isometry_restperiod2: 11 bytes
+;   PP_musicseq_Sticks_introbanjo1: 9 bytes
+;   PP_musicseq_Sticks_introch2: 69 bytes
+;   PP_musicseq_Sticks_introbanjo2: 19 bytes
+;   PP_musicseq_Sticks_introbass: 10 bytes
+;   PP_musicseq_Sticks_introdrum: 14 bytes
+;   PP_musicseq_Sticks_bassstart: 10 bytes
+;   PP_musicseq_Sticks_bass: 18 bytes
+;   PP_musicseq_Sticks_chords1start: 12 bytes
+;   PP_musicseq_Sticks_chords1: 45 bytes
+;   PP_musicseq_Sticks_chords2: 10 bytes
+;   PP_musicseq_Sticks_drum: 7 bytes
+;   PP_musicseq_Sticks_v_iv_bass: 29 bytes
+;   PP_musicseq_Sticks_v_iv_chords1: 20 bytes
+;   PP_musicseq_Sticks_v_iv_chords2: 36 bytes
+;   PP_musicseq_twinkle_melody: 31 bytes
+;   PP_musicseq_twinkle_bassline: 35 bytes
+;   PP_musicseq_twinkle_bassfinal: 4 bytes
+;   PP_musicseq_twinkle_beat: 8 bytes
+;   PP_musicseq_canon_bass: 11 bytes
+;   PP_musicseq_canon_melody: 633 bytes
+;   PP_musicseq_bf98_orchhits: 9 bytes
+;   PP_musicseq_bf98_drums: 14 bytes
+;   PP_musicseq_bf98_drums_resumefill: 9 bytes
+;   PP_musicseq_bf98_drums_tripletfill: 8 bytes
+;   PP_musicseq_bf98_drums_quietfill: 6 bytes
+;   PP_musicseq_bf98_drums_break: 6 bytes
+;   PP_musicseq_bf98_bassA: 26 bytes
+;   PP_musicseq_bf98_melodyA: 27 bytes
+;   PP_musicseq_bf98_thirdsA: 22 bytes
+;   PP_musicseq_bf98_osti1: 31 bytes
+;   PP_musicseq_bf98_osti2: 47 bytes
+;   PP_musicseq_bf98_melodyB1: 43 bytes
+;   PP_musicseq_bf98_counterB1: 41 bytes
+;   PP_musicseq_bf98_bassB1: 26 bytes
+;   PP_musicseq_bf98_melodyB2: 31 bytes
+;   PP_musicseq_bf98_counterB2: 28 bytes
+;   PP_musicseq_bf98_bassB2: 35 bytes
+;   PP_musicseq_arp_waltz_bass1: 27 bytes
+;   PP_musicseq_arp_waltz_bass2: 11 bytes
+;   PP_musicseq_arp_waltz_bassintro: 9 bytes
+;   PP_musicseq_arp_waltz_melody: 146 bytes
+;   PP_musicseq_allfeatures_between: 10 bytes
+;   PP_musicseq_allfeatures_drumfill: 8 bytes
+;   PP_musicseq_allfeatures_drum: 15 bytes
+;   PP_musicseq_allfeatures_chords: 12 bytes
+;   PP_musicseq_allfeatures_bass: 17 bytes
+;   PP_musicseq_Stairs_lead1: 22 bytes
+;   PP_musicseq_Stairs_lead1end: 3 bytes
+;   PP_musicseq_Stairs_introg: 5 bytes
+;   PP_musicseq_Stairs_bass: 69 bytes
+;   PP_musicseq_Stairs_lead2: 35 bytes
+;   PP_musicseq_Stairs_lead2end: 9 bytes
+;   PP_musicseq_attacktest_drumfill: 7 bytes
+;   PP_musicseq_attacktest_drums: 21 bytes
+;   PP_musicseq_attacktest_bass: 44 bytes
+;   PP_musicseq_attacktest_atk: 19 bytes
+;   PP_pino_a53_croom_intro_chords1: 13 bytes
+;   PP_pino_a53_croom_intro_chords2: 10 bytes
+;   PP_pino_a53_croom_intro_bass: 10 bytes
+;   PP_pino_a53_croom_cleared_melody: 13 bytes
+;   PP_pino_a53_croom_cleared_bass: 11 bytes
+;   PP_pino_a53_thwaite_0200_bass: 43 bytes
+;   PP_pino_a53_thwaite_0200_backing: 44 bytes
+;   PP_pino_a53_thwaite_0200_melody: 47 bytes
+;   PP_pino_a53_thwaite_0200_drums: 9 bytes
+;   PP_pino_a53_thwaite_0300_drums: 16 bytes
+;   PP_pino_a53_thwaite_0300_bass1: 19 bytes
+;   PP_pino_a53_thwaite_0300_bass2: 19 bytes
+;   PP_pino_a53_thwaite_0300_melA: 7 bytes
+;   PP_pino_a53_thwaite_0300_backingA: 7 bytes
+;   PP_pino_a53_thwaite_0300_melB: 19 bytes
+;   PP_pino_a53_thwaite_0400_drum2: 7 bytes
+;   PP_pino_a53_thwaite_0400_drum1: 7 bytes
+;   PP_pino_a53_thwaite_0400_chords1: 47 bytes
+;   PP_pino_a53_thwaite_0400_chords2: 47 bytes
+;   PP_pino_a53_thwaite_0500_backing: 51 bytes
+;   PP_pino_a53_thwaite_0500_melody: 48 bytes
+;   PP_pino_a53_thwaite_0500_bass: 19 bytes
+;   PP_pino_a53_thwaite_1600_drum: 8 bytes
+;   PP_pino_a53_thwaite_1600_chords1: 23 bytes
+;   PP_pino_a53_thwaite_1600_chords2: 15 bytes
+;   PP_pino_a53_thwaite_1600_bass: 23 bytes
+;   PP_pino_a53_thwaite_town_tune_town_tune: 7 bytes
+;   PP_pino_a53_tennis_win_point_orchhits: 10 bytes
+;   PP_pino_a53_tennis_win_point_bass: 17 bytes
+;   PP_pino_a53_tennis_win_point_drum: 11 bytes
+;   PP_pino_a53_tennis_win_game_fanfare: 4 bytes
+;   PP_pino_a53_tennis_win_game_fanfarejoinin: 7 bytes
+;   PP_pino_a53_tennis_win_game_drum: 9 bytes
+;   PP_pino_a53_axe_beat_sq1: 5 bytes
+;   PP_pino_a53_axe_beat_drum: 11 bytes
+;   PP_pino_a53_axe_beat_tiestream: 4 bytes
+;   PP_pino_a53_rhde_battle_drums: 14 bytes
+;   PP_pino_a53_rhde_battle_bassA: 56 bytes
+;   PP_pino_a53_rhde_battle_bassAend: 19 bytes
+;   PP_pino_a53_rhde_battle_bassB: 56 bytes
+;   PP_pino_a53_rhde_battle_melA: 104 bytes
+;   PP_pino_a53_rhde_battle_backingA: 43 bytes
+;   PP_pino_a53_rhde_battle_backingAend: 15 bytes
+;   PP_pino_a53_rhde_battle_melB: 58 bytes
+;   PP_pino_a53_rhde_battle_backingB: 58 bytes
+;   PP_pino_a53_rhde_kalinka_intro: 7 bytes
+;   PP_pino_a53_rhde_kalinka_introdrum: 6 bytes
+;   PP_pino_a53_rhde_kalinka_bassA: 19 bytes
+;   PP_pino_a53_rhde_kalinka_partA: 23 bytes
+;   PP_pino_a53_rhde_kalinka_drum: 21 bytes
+;   PP_pino_a53_rhde_kalinka_drumfill: 7 bytes
+;   PP_pino_a53_rhde_kalinka_bassB: 19 bytes
+;   PP_pino_a53_rhde_kalinka_chordsB: 10 bytes
+;   PP_pino_a53_rhde_kalinka_ending_p1: 9 bytes
+;   PP_pino_a53_rhde_kalinka_ending_p2: 8 bytes
+;   PP_pino_a53_rhde_kalinka_ending_tri: 7 bytes
+;   PP_pino_a53_K_231_LMIA: 80 bytes
+; pently_songs: 1651 bytes
+;   PS_musicseq_argument: 326 bytes
+;   PS_musicseq_Isometry: 301 bytes
+;   PS_musicseq_Sticks: 99 bytes
+;   PS_musicseq_twinkle: 38 bytes
+;   PS_musicseq_canon: 58 bytes
+;   PS_musicseq_bf98: 142 bytes
+;   PS_musicseq_arp_waltz: 41 bytes
+;   PS_musicseq_allfeatures: 60 bytes
+;   PS_musicseq_Stairs: 75 bytes
+;   PS_musicseq_attacktest: 33 bytes
+;   PS_pino_a53_croom_intro: 20 bytes
+;   PS_pino_a53_croom_cleared: 20 bytes
+;   PS_pino_a53_thwaite_0200: 26 bytes
+;   PS_pino_a53_thwaite_0300: 48 bytes
+;   PS_pino_a53_thwaite_0400: 29 bytes
+;   PS_pino_a53_thwaite_0500: 34 bytes
+;   PS_pino_a53_thwaite_1600: 24 bytes
+;   PS_pino_a53_thwaite_town_tune: 16 bytes
+;   PS_pino_a53_tennis_win_point: 24 bytes
+;   PS_pino_a53_tennis_win_game: 26 bytes
+;   PS_pino_a53_axe_beat: 38 bytes
+;   PS_pino_a53_rhde_battle: 50 bytes
+;   PS_pino_a53_rhde_kalinka: 98 bytes
+;   PS_pino_a53_K_231: 25 bytes
+;
+; Breakdown by song
+;   Shared: 1489 bytes
+;   Song musicseq::Isometry: 410 bytes
+;   Song musicseq::Stairs: 218 bytes
+;   Song musicseq::Sticks: 407 bytes
+;   Song musicseq::allfeatures: 122 bytes
+;   Song musicseq::argument: 938 bytes
+;   Song musicseq::arp_waltz: 234 bytes
+;   Song musicseq::attacktest: 124 bytes
+;   Song musicseq::bf98: 551 bytes
+;   Song musicseq::canon: 702 bytes
+;   Song musicseq::twinkle: 116 bytes
+;   Song pino_a53::K_231: 105 bytes
+;   Song pino_a53::axe_beat: 58 bytes
+;   Song pino_a53::croom_cleared: 44 bytes
+;   Song pino_a53::croom_intro: 53 bytes
+;   Song pino_a53::rhde_battle: 473 bytes
+;   Song pino_a53::rhde_kalinka: 234 bytes
+;   Song pino_a53::tennis_win_game: 46 bytes
+;   Song pino_a53::tennis_win_point: 62 bytes
+;   Song pino_a53::thwaite_0200: 169 bytes
+;   Song pino_a53::thwaite_0300: 135 bytes
+;   Song pino_a53::thwaite_0400: 137 bytes
+;   Song pino_a53::thwaite_0500: 152 bytes
+;   Song pino_a53::thwaite_1600: 93 bytes
+;   Song pino_a53::thwaite_town_tune: 23 bytes
+
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute
+.exportzp PE_musicseq_kick,PE_musicseq_snare,PE_musicseq_hihat
+.exportzp PE_musicseq_openhat,PE_musicseq_snarehat,PE_musicseq_trikick
+.exportzp PE_musicseq_trisnare,PE_musicseq_quiethat,PE_musicseq_shorthat
+.exportzp PE_musicseq_tubfloorA,PE_musicseq_arghatbuzz,PE_musicseq_stickskick
+.exportzp PE_musicseq_stickshatlo,PE_musicseq_longkick,PE_musicseq_longsnare
+.exportzp PE_pino_a53_thwaite_mirv_split,PE_pino_a53_thwaite_threat_1
+.exportzp PE_pino_a53_thwaite_threat_2,PE_pino_a53_thwaite_shoot
+.exportzp PE_pino_a53_thwaite_boomp,PE_pino_a53_thwaite_boomn
+.exportzp PE_pino_a53_croom_rotate,PE_pino_a53_croom_shift
+.exportzp PE_pino_a53_croom_land,PE_pino_a53_croom_line_clear
+.exportzp PE_pino_a53_croom_homer_clear,PE_pino_a53_croom_garbage
+.exportzp PE_pino_a53_croom_die1,PE_pino_a53_croom_die2
+.exportzp PE_pino_a53_rhde_scanbeep,PE_pino_a53_rhde_countdown
+.exportzp PE_pino_a53_rhde_hold_piece,PE_pino_a53_rhde_explode
+.exportzp PE_pino_a53_rhde_start,PE_pino_a53_tennis_paddle,PE_pino_a53_kick
+.exportzp PE_pino_a53_snare,PE_pino_a53_tkick,PE_pino_a53_tsnare
+.exportzp PE_pino_a53_clhat,PE_pino_a53_ohat,PE_pino_a53_kickohat
+.exportzp PE_pino_a53_snareohat,PI_musicseq_bass,PI_musicseq_framepop
+.exportzp PI_musicseq_banjo,PI_musicseq_latebanjo,PI_musicseq_tubbass
+.exportzp PI_musicseq_tubbass_slow,PI_musicseq_dut,PI_musicseq_feat_wah
+.exportzp PI_musicseq_feat_power,PI_musicseq_bf98_flute,PI_musicseq_bf98_flute2
+.exportzp PI_musicseq_bf98_osti,PI_musicseq_orchhit,PI_musicseq_crashcymbal
+.exportzp PI_musicseq_fiddle2,PI_musicseq_bf98_fluteshort,PI_musicseq_vowele
+.exportzp PI_musicseq_vowela,PI_musicseq_argtwinkle,PI_musicseq_arg2bass
+.exportzp PI_musicseq_toot0,PI_musicseq_stringlead,PI_musicseq_isopiano
+.exportzp PI_musicseq_isotinkle,PI_musicseq_isobeep,PI_musicseq_isobeepsq
+.exportzp PI_pino_a53_v02,PI_pino_a53_v02detached,PI_pino_a53_piano
+.exportzp PI_pino_a53_town_tune_bell,PI_pino_a53_xylo_short
+.exportzp PI_pino_a53_xylo_medium,PI_pino_a53_xylo_long,PI_pino_a53_distanthorn
+.exportzp PI_pino_a53_distantguitdet,PI_pino_a53_stringsdet,PI_pino_a53_rhdeban
+.exportzp PI_pino_a53_bassassist,PI_pino_a53_fanfarehorn,PI_pino_a53_axe_fg_1
+.exportzp PI_pino_a53_axe_fg_2,PI_pino_a53_axe_fg_3,PI_pino_a53_axe_echo_1
+.exportzp PI_pino_a53_axe_echo_2,PI_pino_a53_axe_echo_tri,PI_pino_a53_orchhit
+.exportzp PI_pino_a53_axe_echo_3,PS_musicseq_argument,PS_musicseq_Isometry
+.exportzp PS_musicseq_Sticks,PS_musicseq_twinkle,PS_musicseq_canon
+.exportzp PS_musicseq_bf98,PS_musicseq_arp_waltz,PS_musicseq_allfeatures
+.exportzp PS_musicseq_Stairs,PS_musicseq_attacktest,PS_pino_a53_croom_intro
+.exportzp PS_pino_a53_croom_cleared,PS_pino_a53_thwaite_0200
+.exportzp PS_pino_a53_thwaite_0300,PS_pino_a53_thwaite_0400
+.exportzp PS_pino_a53_thwaite_0500,PS_pino_a53_thwaite_1600
+.exportzp PS_pino_a53_thwaite_town_tune,PS_pino_a53_tennis_win_point
+.exportzp PS_pino_a53_tennis_win_game,PS_pino_a53_axe_beat
+.exportzp PS_pino_a53_rhde_battle,PS_pino_a53_rhde_kalinka,PS_pino_a53_K_231
@@ -0,0 +1,1129 @@
+; Generated using Pently music assembler
+; in ASM6 mode
+; Music from audio/pino-a53.pently
+; title: Pin Eight NES OST
+; author: DJ Tepples
+; copyright: 2009-2015 Damian Yerrick
+;
+PENTLY_NUM_SONGS=14
+PENTLY_NUM_SOUNDS=28
+pently_sfx_table:  ; 28 entries, 694 bytes
+PE_thwaite_mirv_split = 0
+PE_thwaite_threat_1 = 0
+PE_thwaite_threat_2 = 0
+PE_thwaite_shoot = 0
+PE_thwaite_boomp = 0
+PE_thwaite_boomn = 0
+PE_croom_rotate = 0
+PE_croom_shift = 0
+PE_croom_land = 0
+PE_croom_line_clear = 0
+PE_croom_homer_clear = 0
+PE_croom_garbage = 0
+PE_croom_die1 = 0
+PE_croom_die2 = 0
+PE_rhde_scanbeep = 0
+PE_rhde_countdown = 0
+PE_rhde_hold_piece = 0
+PE_rhde_explode = 0
+PE_rhde_start = 0
+PE_tennis_paddle = 0
+PE_kick = 0
+PE_snare = 0
+PE_tkick = 0
+PE_tsnare = 0
+PE_clhat = 0
+PE_ohat = 0
+PE_kickohat = 0
+PE_snareohat = 0
+PENTLY_sfxdef PE_thwaite_mirv_split, PEDAT_thwaite_mirv_split, 18, 1, 0
+PENTLY_sfxdef PE_thwaite_threat_1, PEDAT_thwaite_threat_1, 21, 1, 0
+PENTLY_sfxdef PE_thwaite_threat_2, PEDAT_thwaite_threat_2, 10, 2, 0
+PENTLY_sfxdef PE_thwaite_shoot, PEDAT_thwaite_shoot, 7, 5, 3
+PENTLY_sfxdef PE_thwaite_boomp, PEDAT_thwaite_boomp, 15, 2, 0
+PENTLY_sfxdef PE_thwaite_boomn, PEDAT_thwaite_boomn, 16, 4, 3
+PENTLY_sfxdef PE_croom_rotate, PEDAT_croom_rotate, 6, 1, 0
+PENTLY_sfxdef PE_croom_shift, PEDAT_croom_shift, 2, 1, 0
+PENTLY_sfxdef PE_croom_land, PEDAT_croom_land, 8, 1, 0
+PENTLY_sfxdef PE_croom_line_clear, PEDAT_croom_line_clear, 15, 1, 0
+PENTLY_sfxdef PE_croom_homer_clear, PEDAT_croom_homer_clear, 25, 1, 0
+PENTLY_sfxdef PE_croom_garbage, PEDAT_croom_garbage, 6, 1, 0
+PENTLY_sfxdef PE_croom_die1, PEDAT_croom_die1, 17, 4, 0
+PENTLY_sfxdef PE_croom_die2, PEDAT_croom_die2, 17, 4, 3
+PENTLY_sfxdef PE_rhde_scanbeep, PEDAT_rhde_scanbeep, 4, 3, 0
+PENTLY_sfxdef PE_rhde_countdown, PEDAT_rhde_countdown, 12, 1, 0
+PENTLY_sfxdef PE_rhde_hold_piece, PEDAT_rhde_hold_piece, 5, 2, 3
+PENTLY_sfxdef PE_rhde_explode, PEDAT_rhde_explode, 8, 4, 3
+PENTLY_sfxdef PE_rhde_start, PEDAT_rhde_start, 16, 1, 0
+PENTLY_sfxdef PE_tennis_paddle, PEDAT_tennis_paddle, 4, 1, 3
+PENTLY_sfxdef PE_kick, PEDAT_kick, 4, 1, 3
+PENTLY_sfxdef PE_snare, PEDAT_snare, 7, 1, 3
+PENTLY_sfxdef PE_tkick, PEDAT_tkick, 4, 1, 2
+PENTLY_sfxdef PE_tsnare, PEDAT_tsnare, 2, 1, 2
+PENTLY_sfxdef PE_clhat, PEDAT_clhat, 3, 1, 3
+PENTLY_sfxdef PE_ohat, PEDAT_ohat, 13, 1, 3
+PENTLY_sfxdef PE_kickohat, PEDAT_kickohat, 13, 1, 3
+PENTLY_sfxdef PE_snareohat, PEDAT_snareohat, 13, 1, 3
+PEDAT_thwaite_mirv_split:
+.byte 79,36,68,36,79,41,68,41,79,46,68,46,68,36,66,36,68,41,66,41,68,46,66,46
+.byte 66,36,65,36,66,41,65,41,66,46,65,46
+PEDAT_thwaite_threat_1:
+.byte 70,31,76,31,76,31,76,37,76,37,76,43,76,43,76,49,76,49,76,49,76,49,76,49
+.byte 76,49,76,49,76,49,76,49,75,49,74,49,73,49,71,49,69,49
+PEDAT_thwaite_threat_2:
+.byte 76,28,76,34,76,40,76,46,76,46,76,46,76,46,75,46,73,46,70,46
+PEDAT_thwaite_shoot:
+.byte 10,3,8,4,7,4,6,5,4,6,3,6,2,6
+PEDAT_thwaite_boomp:
+.byte 143,18,143,15,142,12,142,15,141,12,140,10,139,11,138,9,137,6,136,8,135,7
+.byte 134,5,132,6,130,4,129,3
+PEDAT_thwaite_boomn:
+.byte 15,14,14,13,13,14,12,14,11,14,10,15,9,14,8,14,7,15,6,14,5,15,4,14,3,15,2
+.byte 14,1,15,1,15
+PEDAT_croom_shift:
+.byte 79,48,68,48
+PEDAT_croom_land:
+.byte 143,19,141,15,139,12,137,9,135,7,133,5,131,3,129,2
+PEDAT_croom_line_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,133,41
+.byte 132,44,131,39,130,42,129,44
+PEDAT_croom_homer_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,79,42,78
+.byte 45,77,47,76,42,75,44,74,47,137,42,136,45,135,47,134,42,133,44,132,47,131
+.byte 42,130,45,129,47
+PEDAT_croom_garbage:
+.byte 79,16,77,19,75,22,73,25,71,28,69,31
+PEDAT_croom_die1:
+.byte 143,7,143,7,142,7,141,7,140,7,139,7,138,7,137,7,136,7,135,7,134,7,133,7
+.byte 132,7,131,7,130,7,129,7,129,7
+PEDAT_croom_die2:
+.byte 15,12,15,13,14,14,13,14,12,14,11,14,10,14,9,14,8,14,7,14,6,14,5,14,4,14,3
+.byte 14,2,14,1,14,1,14
+PEDAT_rhde_scanbeep:
+.byte 140,42,140,42,131,42,129,42
+PEDAT_rhde_countdown:
+.byte 71,26,73,29,75,31,77,32,79,33,79,33,79,34,79,34,75,34,75,34,73,33,71,31
+PEDAT_rhde_hold_piece:
+.byte 7,11,9,10,9,11,8,12,6,14
+PEDAT_rhde_explode:
+.byte 15,13,13,13,11,13,9,14,7,14,5,14,3,14,2,14
+PEDAT_rhde_start:
+.byte 140,50,137,50,134,50,132,50,130,50,140,62,137,62,134,62,132,62,130,62,140
+.byte 57,137,57,134,57,132,57,130,57,129,57
+PEDAT_tennis_paddle:
+.byte 6,7,4,134,2,5,1,134
+PEDAT_kick:
+.byte 9,5,9,15,4,15,2,15
+PEDAT_snare:
+.byte 10,11,8,5,6,5,4,5,3,5,2,5,1,5
+PEDAT_tkick:
+.byte 143,31,143,27,143,24,130,21
+PEDAT_tsnare:
+.byte 143,38,143,36
+PEDAT_clhat:
+.byte 6,3,3,131,1,3
+PEDAT_ohat:
+.byte 7,3,6,131,5,3,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_kickohat:
+.byte 10,5,8,15,6,15,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_snareohat:
+.byte 10,11,8,5,6,5,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+pently_instruments:  ; 21 entries, 165 bytes
+PI_v02 = 0
+PI_v02detached = 0
+PI_piano = 0
+PI_town_tune_bell = 0
+PI_xylo_short = 0
+PI_xylo_medium = 0
+PI_xylo_long = 0
+PI_distanthorn = 0
+PI_distantguitdet = 0
+PI_stringsdet = 0
+PI_rhdeban = 0
+PI_bassassist = 0
+PI_orchhit = 0
+PI_fanfarehorn = 0
+PI_axe_fg_1 = 0
+PI_axe_fg_2 = 0
+PI_axe_fg_3 = 0
+PI_axe_echo_1 = 0
+PI_axe_echo_2 = 0
+PI_axe_echo_3 = 0
+PI_axe_echo_tri = 0
+PENTLY_instdef PI_v02, 2, 6, 0, 0, 0, 0
+PENTLY_instdef PI_v02detached, 2, 6, 0, 1, 0, 0
+PENTLY_instdef PI_piano, 1, 7, 2, 0, PIDAT_piano, 2
+PENTLY_instdef PI_town_tune_bell, 2, 6, 1, 0, 0, 0
+PENTLY_instdef PI_xylo_short, 2, 7, 6, 0, 0, 0
+PENTLY_instdef PI_xylo_medium, 2, 8, 4, 0, PIDAT_xylo_medium, 1
+PENTLY_instdef PI_xylo_long, 2, 7, 2, 0, 0, 0
+PENTLY_instdef PI_distanthorn, 0, 5, 0, 0, PIDAT_distanthorn, 4
+PENTLY_instdef PI_distantguitdet, 1, 4, 0, 1, PIDAT_distantguitdet, 1
+PENTLY_instdef PI_stringsdet, 0, 7, 3, 1, PIDAT_stringsdet, 3
+PENTLY_instdef PI_rhdeban, 0, 9, 8, 0, 0, 0
+PENTLY_instdef PI_bassassist, 1, 7, 6, 0, 0, 0
+PENTLY_instdef PI_orchhit, 1, 0, 0, 0, PIDAT_orchhit, 24
+PENTLY_instdef PI_fanfarehorn, 0, 7, 0, 1, PIDAT_fanfarehorn, 6
+PENTLY_instdef PI_axe_fg_1, 2, 6, 10, 0, 0, 0
+PENTLY_instdef PI_axe_fg_2, 1, 7, 10, 0, 0, 0
+PENTLY_instdef PI_axe_fg_3, 0, 9, 10, 0, 0, 0
+PENTLY_instdef PI_axe_echo_1, 2, 2, 3, 0, 0, 0
+PENTLY_instdef PI_axe_echo_2, 1, 2, 3, 0, 0, 0
+PENTLY_instdef PI_axe_echo_3, 1, 2, 3, 0, 0, 0
+PENTLY_instdef PI_axe_echo_tri, 2, 2, 5, 0, 0, 0
+PIDAT_piano:
+.byte 153,88
+PIDAT_xylo_medium:
+.byte 136,17
+PIDAT_distanthorn:
+.byte 83,21,22,22
+PIDAT_distantguitdet:
+.byte 131,254
+PIDAT_stringsdet:
+.byte 23,27,28
+PIDAT_orchhit:
+.byte 72,12,88,72,244,71,12,87,71,244,70,12,86,70,244,69,12,85,69,244,68,12,84
+.byte 68,244,67,12,83,67,244,66,12,82,66,244,65,12,81,65,244
+PIDAT_fanfarehorn:
+.byte 68,255,23,25,25,24,24
+pently_drums:  ; 6 entries, 12 bytes
+DR_kick = 0
+DR_snare = 0
+DR_clhat = 0
+DR_ohat = 0
+DR_kickohat = 0
+DR_snareohat = 0
+PENTLY_drumdef DR_kick,PE_kick,PE_tkick
+PENTLY_drumdef DR_snare,PE_snare,PE_tsnare
+PENTLY_drumdef DR_clhat,PE_clhat,$80
+PENTLY_drumdef DR_ohat,PE_ohat,$80
+PENTLY_drumdef DR_kickohat,PE_kickohat,PE_tkick
+PENTLY_drumdef DR_snareohat,PE_snareohat,PE_tsnare
+pently_patterns:  ; 57 entries, 1306 bytes
+PP_croom_intro_chords1 = 0
+PP_croom_intro_chords2 = 0
+PP_croom_intro_bass = 0
+PP_croom_cleared_melody = 0
+PP_croom_cleared_bass = 0
+PP_thwaite_0200_bass = 0
+PP_thwaite_0200_backing = 0
+PP_thwaite_0200_melody = 0
+PP_thwaite_0200_drums = 0
+PP_thwaite_0300_drums = 0
+PP_thwaite_0300_bass1 = 0
+PP_thwaite_0300_bass2 = 0
+PP_thwaite_0300_melA = 0
+PP_thwaite_0300_backingA = 0
+PP_thwaite_0300_melB = 0
+PP_thwaite_0400_drum2 = 0
+PP_thwaite_0400_drum1 = 0
+PP_thwaite_0400_chords1 = 0
+PP_thwaite_0400_chords2 = 0
+PP_thwaite_0500_backing = 0
+PP_thwaite_0500_melody = 0
+PP_thwaite_0500_bass = 0
+PP_thwaite_1600_drum = 0
+PP_thwaite_1600_chords1 = 0
+PP_thwaite_1600_chords2 = 0
+PP_thwaite_1600_bass = 0
+PP_thwaite_town_tune_town_tune = 0
+PP_tennis_win_point_orchhits = 0
+PP_tennis_win_point_bass = 0
+PP_tennis_win_point_drum = 0
+PP_tennis_win_game_fanfare = 0
+PP_tennis_win_game_fanfarejoinin = 0
+PP_tennis_win_game_drum = 0
+PP_axe_beat_sq1 = 0
+PP_axe_beat_drum = 0
+PP_axe_beat_tiestream = 0
+PP_rhde_battle_drums = 0
+PP_rhde_battle_bassA = 0
+PP_rhde_battle_bassAend = 0
+PP_rhde_battle_bassB = 0
+PP_rhde_battle_melA = 0
+PP_rhde_battle_backingA = 0
+PP_rhde_battle_backingAend = 0
+PP_rhde_battle_melB = 0
+PP_rhde_battle_backingB = 0
+PP_rhde_kalinka_intro = 0
+PP_rhde_kalinka_introdrum = 0
+PP_rhde_kalinka_bassA = 0
+PP_rhde_kalinka_partA = 0
+PP_rhde_kalinka_drum = 0
+PP_rhde_kalinka_drumfill = 0
+PP_rhde_kalinka_bassB = 0
+PP_rhde_kalinka_chordsB = 0
+PP_rhde_kalinka_ending_p1 = 0
+PP_rhde_kalinka_ending_p2 = 0
+PP_rhde_kalinka_ending_tri = 0
+PP_K_231_LMIA = 0
+PENTLY_patdef PP_croom_intro_chords1, PPDAT_croom_intro_chords1
+PENTLY_patdef PP_croom_intro_chords2, PPDAT_croom_intro_chords2
+PENTLY_patdef PP_croom_intro_bass, PPDAT_croom_intro_bass
+PENTLY_patdef PP_croom_cleared_melody, PPDAT_croom_cleared_melody
+PENTLY_patdef PP_croom_cleared_bass, PPDAT_croom_cleared_bass
+PENTLY_patdef PP_thwaite_0200_bass, PPDAT_thwaite_0200_bass
+PENTLY_patdef PP_thwaite_0200_backing, PPDAT_thwaite_0200_backing
+PENTLY_patdef PP_thwaite_0200_melody, PPDAT_thwaite_0200_melody
+PENTLY_patdef PP_thwaite_0200_drums, PPDAT_thwaite_0200_drums
+PENTLY_patdef PP_thwaite_0300_drums, PPDAT_thwaite_0300_drums
+PENTLY_patdef PP_thwaite_0300_bass1, PPDAT_thwaite_0300_bass1
+PENTLY_patdef PP_thwaite_0300_bass2, PPDAT_thwaite_0300_bass2
+PENTLY_patdef PP_thwaite_0300_melA, PPDAT_thwaite_0300_melA
+PENTLY_patdef PP_thwaite_0300_backingA, PPDAT_thwaite_0300_backingA
+PENTLY_patdef PP_thwaite_0300_melB, PPDAT_thwaite_0300_melB
+PENTLY_patdef PP_thwaite_0400_drum2, PPDAT_thwaite_0400_drum2
+PENTLY_patdef PP_thwaite_0400_drum1, PPDAT_thwaite_0400_drum1
+PENTLY_patdef PP_thwaite_0400_chords1, PPDAT_thwaite_0400_chords1
+PENTLY_patdef PP_thwaite_0400_chords2, PPDAT_thwaite_0400_chords2
+PENTLY_patdef PP_thwaite_0500_backing, PPDAT_thwaite_0500_backing
+PENTLY_patdef PP_thwaite_0500_melody, PPDAT_thwaite_0500_melody
+PENTLY_patdef PP_thwaite_0500_bass, PPDAT_thwaite_0500_bass
+PENTLY_patdef PP_thwaite_1600_drum, PPDAT_thwaite_1600_drum
+PENTLY_patdef PP_thwaite_1600_chords1, PPDAT_thwaite_1600_chords1
+PENTLY_patdef PP_thwaite_1600_chords2, PPDAT_thwaite_1600_chords2
+PENTLY_patdef PP_thwaite_1600_bass, PPDAT_thwaite_1600_bass
+PENTLY_patdef PP_thwaite_town_tune_town_tune, PPDAT_thwaite_town_tune_town_tune
+PENTLY_patdef PP_tennis_win_point_orchhits, PPDAT_tennis_win_point_orchhits
+PENTLY_patdef PP_tennis_win_point_bass, PPDAT_tennis_win_point_bass
+PENTLY_patdef PP_tennis_win_point_drum, PPDAT_tennis_win_point_drum
+PENTLY_patdef PP_tennis_win_game_fanfare, PPDAT_tennis_win_game_fanfare
+PENTLY_patdef PP_tennis_win_game_fanfarejoinin, PPDAT_tennis_win_game_fanfarejoinin
+PENTLY_patdef PP_tennis_win_game_drum, PPDAT_tennis_win_game_drum
+PENTLY_patdef PP_axe_beat_sq1, PPDAT_axe_beat_sq1
+PENTLY_patdef PP_axe_beat_drum, PPDAT_axe_beat_drum
+PENTLY_patdef PP_axe_beat_tiestream, PPDAT_axe_beat_tiestream
+PENTLY_patdef PP_rhde_battle_drums, PPDAT_rhde_battle_drums
+PENTLY_patdef PP_rhde_battle_bassA, PPDAT_rhde_battle_bassA
+PENTLY_patdef PP_rhde_battle_bassAend, PPDAT_rhde_battle_bassAend
+PENTLY_patdef PP_rhde_battle_bassB, PPDAT_rhde_battle_bassB
+PENTLY_patdef PP_rhde_battle_melA, PPDAT_rhde_battle_melA
+PENTLY_patdef PP_rhde_battle_backingA, PPDAT_rhde_battle_backingA
+PENTLY_patdef PP_rhde_battle_backingAend, PPDAT_rhde_battle_backingAend
+PENTLY_patdef PP_rhde_battle_melB, PPDAT_rhde_battle_melB
+PENTLY_patdef PP_rhde_battle_backingB, PPDAT_rhde_battle_backingB
+PENTLY_patdef PP_rhde_kalinka_intro, PPDAT_rhde_kalinka_intro
+PENTLY_patdef PP_rhde_kalinka_introdrum, PPDAT_rhde_kalinka_introdrum
+PENTLY_patdef PP_rhde_kalinka_bassA, PPDAT_rhde_kalinka_bassA
+PENTLY_patdef PP_rhde_kalinka_partA, PPDAT_rhde_kalinka_partA
+PENTLY_patdef PP_rhde_kalinka_drum, PPDAT_rhde_kalinka_drum
+PENTLY_patdef PP_rhde_kalinka_drumfill, PPDAT_rhde_kalinka_drumfill
+PENTLY_patdef PP_rhde_kalinka_bassB, PPDAT_rhde_kalinka_bassB
+PENTLY_patdef PP_rhde_kalinka_chordsB, PPDAT_rhde_kalinka_chordsB
+PENTLY_patdef PP_rhde_kalinka_ending_p1, PPDAT_rhde_kalinka_ending_p1
+PENTLY_patdef PP_rhde_kalinka_ending_p2, PPDAT_rhde_kalinka_ending_p2
+PENTLY_patdef PP_rhde_kalinka_ending_tri, PPDAT_rhde_kalinka_ending_tri
+PENTLY_patdef PP_K_231_LMIA, PPDAT_K_231_LMIA
+PPDAT_croom_intro_chords1:
+.byte PENTLY_REST,PENTLY_N_E,PENTLY_N_A|PENTLY_D_4,PENTLY_REST,PENTLY_N_D
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_REST,PENTLY_N_C,PENTLY_N_E|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_PATEND
+PPDAT_croom_intro_chords2:
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_4,PENTLY_REST|PENTLY_D_8,PENTLY_N_C|PENTLY_D_2
+.byte PENTLY_N_TIE|PENTLY_D_8,PENTLY_PATEND
+PPDAT_croom_intro_bass:
+.byte PENTLY_N_A|PENTLY_D_D4,PENTLY_N_G|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_D2
+.byte PENTLY_N_A|PENTLY_D_D4,PENTLY_N_G|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_N_D|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_croom_cleared_melody:
+.byte PENTLY_N_G,PENTLY_N_A,PENTLY_N_G,PENTLY_N_F,PENTLY_N_E,PENTLY_N_D
+.byte PENTLY_N_C,PENTLY_N_E,PENTLY_N_G,PENTLY_N_CH|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_croom_cleared_bass:
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_thwaite_0200_bass:
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_2,PENTLY_REST,PENTLY_N_G|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_2,PENTLY_REST,PENTLY_N_C|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_REST,PENTLY_N_AS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_2,PENTLY_REST,PENTLY_N_D|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_2,PENTLY_REST,PENTLY_N_C|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_REST,PENTLY_N_F|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_thwaite_0200_backing:
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_GS|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_AS|PENTLY_D_D8,PENTLY_N_DH|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_GS|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_CS|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CS|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_thwaite_0200_melody:
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_DS|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_2
+.byte PENTLY_REST,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST,PENTLY_N_GS|PENTLY_D_2
+.byte PENTLY_N_TIE,PENTLY_REST|PENTLY_D_D4,PENTLY_N_FS|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_GS|PENTLY_D_4
+.byte PENTLY_N_CSH|PENTLY_D_D8,PENTLY_N_DSH|PENTLY_D_D4,PENTLY_N_GS|PENTLY_D_2
+.byte PENTLY_N_TIE,PENTLY_REST|PENTLY_D_D4,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_AS|PENTLY_D_2,PENTLY_REST,PENTLY_N_DS|PENTLY_D_D4
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_FS,PENTLY_N_GS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_D|PENTLY_D_2,PENTLY_REST,PENTLY_N_FS|PENTLY_D_2,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_D8,PENTLY_N_CS|PENTLY_D_D8
+.byte PENTLY_N_C,PENTLY_N_DS|PENTLY_D_2,PENTLY_REST,PENTLY_N_CS|PENTLY_D_2
+.byte PENTLY_REST,PENTLY_PATEND
+PPDAT_thwaite_0200_drums:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_clhat,DR_clhat|PENTLY_D_D8
+.byte DR_snare|PENTLY_D_D8,DR_clhat|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_thwaite_0300_drums:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_kick,DR_snare|PENTLY_D_8
+.byte DR_clhat,DR_clhat|PENTLY_D_8,DR_clhat,DR_kick|PENTLY_D_8,DR_clhat
+.byte DR_clhat|PENTLY_D_8,DR_kick,DR_snare|PENTLY_D_D8,DR_clhat|PENTLY_D_D8
+.byte PENTLY_PATEND
+PPDAT_thwaite_0300_bass1:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D2,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_FH|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D2
+.byte PENTLY_PATEND
+PPDAT_thwaite_0300_bass2:
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D2,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D2
+.byte PENTLY_PATEND
+PPDAT_thwaite_0300_melA:
+.byte PENTLY_N_E|PENTLY_D_D2,PENTLY_N_D|PENTLY_D_D2,PENTLY_N_CS|PENTLY_D_D2
+.byte PENTLY_N_C|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_thwaite_0300_backingA:
+.byte PENTLY_N_FS|PENTLY_D_D2,PENTLY_N_E|PENTLY_D_D2,PENTLY_N_D|PENTLY_D_D2
+.byte PENTLY_N_C|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_thwaite_0300_melB:
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_FS|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_N_D|PENTLY_D_D4,PENTLY_N_TIE,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_F|PENTLY_D_4
+.byte PENTLY_N_E|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_TIE
+.byte PENTLY_PATEND
+PPDAT_thwaite_0400_drum2:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_D8,DR_snare|PENTLY_D_D8
+.byte DR_clhat|PENTLY_D_8,DR_kick
+PPDAT_thwaite_0400_drum1:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_D4,DR_clhat|PENTLY_D_8,DR_kick
+.byte PENTLY_PATEND
+PPDAT_thwaite_0400_chords1:
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_A|PENTLY_D_4,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_G,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_F,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_DS|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_DS,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_4,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_G,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_thwaite_0400_chords2:
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_AS|PENTLY_D_D8
+.byte PENTLY_N_GS|PENTLY_D_D8,PENTLY_N_FS|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_FS,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_GS|PENTLY_D_D8
+.byte PENTLY_N_FS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_F,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_FS|PENTLY_D_D8
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_DS,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_INSTRUMENT,PI_xylo_short,PENTLY_N_DS|PENTLY_D_D8
+.byte PENTLY_N_CS|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_GS,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_thwaite_0500_backing:
+.byte PENTLY_INSTRUMENT,PI_piano,PENTLY_REST|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_G,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_C,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G,PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_AS|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D2
+.byte PENTLY_INSTRUMENT,PI_piano,PENTLY_REST|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_G,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_INSTRUMENT,PI_distanthorn,PENTLY_N_C,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_G,PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_thwaite_0500_melody:
+.byte PENTLY_REST,PENTLY_N_A,PENTLY_N_AS,PENTLY_N_A,PENTLY_N_G,PENTLY_N_A
+.byte PENTLY_N_AS,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_D8,PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D2,PENTLY_REST|PENTLY_D_D2,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_A,PENTLY_N_AS|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_D8,PENTLY_N_AS
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_D8,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D2,PENTLY_REST|PENTLY_D_D2
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_F,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_G,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_D8,PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D2,PENTLY_REST|PENTLY_D_D2,PENTLY_N_C|PENTLY_D_D8
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_D8,PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D2,PENTLY_REST|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_thwaite_0500_bass:
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D4,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_REST,PENTLY_N_CS|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_REST|PENTLY_D_D4
+.byte PENTLY_REST|PENTLY_D_D2,PENTLY_PATEND
+PPDAT_thwaite_1600_drum:
+.byte DR_kick|PENTLY_D_D8,DR_snare|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_kick
+.byte DR_snare|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_thwaite_1600_chords1:
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_D|PENTLY_D_D8,PENTLY_N_G|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_G,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_F,PENTLY_N_G|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8
+.byte PENTLY_N_G|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_G
+.byte PENTLY_N_A|PENTLY_D_D8,PENTLY_N_E|PENTLY_D_D8,PENTLY_N_A|PENTLY_D_D8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_A,PENTLY_PATEND
+PPDAT_thwaite_1600_chords2:
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_D4,PENTLY_N_C|PENTLY_D_4
+.byte PENTLY_N_TIE,PENTLY_N_C,PENTLY_N_CS|PENTLY_D_D4,PENTLY_N_CS|PENTLY_D_4
+.byte PENTLY_N_TIE,PENTLY_N_CS,PENTLY_PATEND
+PPDAT_thwaite_1600_bass:
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST|PENTLY_D_8,PENTLY_PATEND
+PPDAT_thwaite_town_tune_town_tune:
+.byte PENTLY_N_F,PENTLY_N_A,PENTLY_N_G,PENTLY_N_C|PENTLY_D_8,PENTLY_PATEND
+PPDAT_tennis_win_point_orchhits:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_D4,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_FS|PENTLY_D_D8
+.byte PENTLY_N_GS|PENTLY_D_4,PENTLY_PATEND
+PPDAT_tennis_win_point_bass:
+.byte PENTLY_N_C|PENTLY_D_D8,PENTLY_N_DS|PENTLY_D_D8,PENTLY_N_F|PENTLY_D_D8
+.byte PENTLY_REST,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F,PENTLY_N_F
+.byte PENTLY_N_F,PENTLY_N_F|PENTLY_D_D8,PENTLY_N_FS|PENTLY_D_D8
+.byte PENTLY_N_GS|PENTLY_D_D8,PENTLY_REST,PENTLY_PATEND
+PPDAT_tennis_win_point_drum:
+.byte DR_snare|PENTLY_D_D8,DR_snare|PENTLY_D_D8,DR_snare|PENTLY_D_4,DR_kick
+.byte DR_kick,DR_snare|PENTLY_D_8,DR_kick,DR_kick,PENTLY_PATEND
+PPDAT_tennis_win_game_fanfare:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+PPDAT_tennis_win_game_fanfarejoinin:
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_REST|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_2,PENTLY_PATEND
+PPDAT_tennis_win_game_drum:
+.byte DR_clhat|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_snare|PENTLY_D_D4,DR_clhat
+.byte DR_clhat,DR_snare|PENTLY_D_2,PENTLY_PATEND
+PPDAT_axe_beat_sq1:
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_PATEND
+PPDAT_axe_beat_drum:
+.byte DR_kick|PENTLY_D_8,DR_ohat|PENTLY_D_8,DR_snare,PENTLY_GRACE,1
+.byte PENTLY_N_TIE,DR_clhat,DR_ohat|PENTLY_D_8,PENTLY_PATEND
+PPDAT_axe_beat_tiestream:
+.byte PENTLY_N_TIE|PENTLY_D_1,PENTLY_PATEND
+PPDAT_rhde_battle_drums:
+.byte DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_8,DR_clhat,DR_kick|PENTLY_D_D8
+.byte DR_clhat|PENTLY_D_8,DR_clhat,DR_kick|PENTLY_D_D8,DR_clhat|PENTLY_D_8
+.byte DR_clhat,DR_kick|PENTLY_D_D8,DR_kick|PENTLY_D_D8,PENTLY_PATEND
+PPDAT_rhde_battle_bassA:
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_C
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_C
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_A
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_E
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_E
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_AS
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CSH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_G
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_AS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_rhde_battle_bassAend:
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_F,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_D8,PENTLY_N_G,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_PATEND
+PPDAT_rhde_battle_bassB:
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_G
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CH
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_G
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_AS
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_F
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_AS
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_AS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_DS
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_REST|PENTLY_D_D8,PENTLY_N_CS
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_PATEND
+PPDAT_rhde_battle_melA:
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_N_GSH|PENTLY_D_D8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_G|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_EH|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_AS|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_N_CSH|PENTLY_D_8
+.byte PENTLY_N_AS,PENTLY_N_GS|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_REST,PENTLY_N_GSH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_EH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_CSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_AS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_D4,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DSH|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_GSH|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_F|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_N_EH|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_N_AS|PENTLY_D_D8,PENTLY_REST,PENTLY_N_AS|PENTLY_D_D8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_N_D
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_AS
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_REST,PENTLY_N_GSH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_EH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_N_GSH|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_CH
+.byte PENTLY_N_CSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_GSH,PENTLY_N_CHH|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_PATEND
+PPDAT_rhde_battle_backingA:
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_4,PENTLY_N_TIE
+.byte PENTLY_N_B|PENTLY_D_D8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_REST|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D8
+.byte PENTLY_N_FS|PENTLY_D_4,PENTLY_N_TIE,PENTLY_N_GS|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_C|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_DS,PENTLY_N_CS|PENTLY_D_8,PENTLY_N_E|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_REST,PENTLY_N_A|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_B|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_D4,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_rhde_battle_backingAend:
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_C|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_E|PENTLY_D_8,PENTLY_N_G,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_PATEND
+PPDAT_rhde_battle_melB:
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DS,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_4,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_REST,PENTLY_N_B|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_REST,PENTLY_N_FS|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_REST,PENTLY_N_GS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_GS,PENTLY_N_FS|PENTLY_D_8,PENTLY_N_F
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_N_F,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_CS
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_REST,PENTLY_N_DS|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_REST,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_DSH|PENTLY_D_8,PENTLY_REST,PENTLY_N_FSH,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_N_DSH,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CSH,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_CH,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_DSH,PENTLY_N_FH|PENTLY_D_8
+.byte PENTLY_N_CSH,PENTLY_N_B|PENTLY_D_8,PENTLY_N_CSH,PENTLY_N_DSH|PENTLY_D_8
+.byte PENTLY_N_B,PENTLY_N_AS|PENTLY_D_D4,PENTLY_N_GS|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_rhde_battle_backingB:
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_N_FS,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_GS|PENTLY_D_4,PENTLY_N_B|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_REST,PENTLY_N_DH|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_B|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_REST,PENTLY_N_A|PENTLY_D_D8,PENTLY_REST
+.byte PENTLY_N_GS|PENTLY_D_8,PENTLY_REST,PENTLY_N_B|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_B,PENTLY_N_A|PENTLY_D_8,PENTLY_N_GS
+.byte PENTLY_N_A|PENTLY_D_8,PENTLY_N_G,PENTLY_N_E|PENTLY_D_8,PENTLY_N_C
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_REST,PENTLY_N_E|PENTLY_D_8,PENTLY_REST
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_REST,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_REST,PENTLY_N_EH,PENTLY_N_FSH|PENTLY_D_8
+.byte PENTLY_N_DH,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_DH,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_CH,PENTLY_N_B|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_DH|PENTLY_D_8
+.byte PENTLY_N_B,PENTLY_N_A|PENTLY_D_8,PENTLY_N_B,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_A,PENTLY_N_G|PENTLY_D_D4,PENTLY_REST|PENTLY_D_D4,PENTLY_PATEND
+PPDAT_rhde_kalinka_intro:
+.byte PENTLY_N_DS|PENTLY_D_2,PENTLY_N_CS|PENTLY_D_2,PENTLY_N_C|PENTLY_D_D2
+.byte PENTLY_REST|PENTLY_D_4,PENTLY_PATEND
+PPDAT_rhde_kalinka_introdrum:
+.byte PENTLY_N_TIE|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_D2,DR_snare|PENTLY_D_4
+.byte PENTLY_PATEND
+PPDAT_rhde_kalinka_bassA:
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_AS|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_EH|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_EH|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8
+.byte PENTLY_N_GSH|PENTLY_D_8,PENTLY_PATEND
+PPDAT_rhde_kalinka_partA:
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8,PENTLY_N_DS|PENTLY_D_8
+.byte PENTLY_N_FS|PENTLY_D_8,PENTLY_ARPEGGIO,$47,PENTLY_N_GSH|PENTLY_D_8
+.byte PENTLY_ARPEGGIO,$0,PENTLY_N_DS|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_DS|PENTLY_D_8,PENTLY_N_FS|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_GS|PENTLY_D_8
+.byte PENTLY_PATEND
+PPDAT_rhde_kalinka_drum:
+.byte DR_kick|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_snare|PENTLY_D_8
+.byte DR_clhat|PENTLY_D_8,DR_kick|PENTLY_D_8,DR_clhat,DR_clhat
+.byte DR_snare|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_kick|PENTLY_D_8
+.byte DR_clhat|PENTLY_D_8,DR_snare|PENTLY_D_8,DR_clhat|PENTLY_D_8
+.byte DR_kick|PENTLY_D_8,DR_clhat|PENTLY_D_8,DR_snare,DR_clhat
+.byte DR_snareohat|PENTLY_D_8,PENTLY_PATEND
+PPDAT_rhde_kalinka_drumfill:
+.byte DR_snareohat,DR_snare,DR_snare,DR_snare,PENTLY_PATEND
+PPDAT_rhde_kalinka_bassB:
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8
+.byte PENTLY_N_FH|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_FH|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_DSH|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_CS|PENTLY_D_8,PENTLY_N_CSH|PENTLY_D_8,PENTLY_N_CS|PENTLY_D_8
+.byte PENTLY_N_CSH|PENTLY_D_8,PENTLY_PATEND
+PPDAT_rhde_kalinka_chordsB:
+.byte PENTLY_ARPEGGIO,$05,PENTLY_N_D|PENTLY_D_D2,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_C|PENTLY_D_8,PENTLY_N_A|PENTLY_D_2,PENTLY_N_AS|PENTLY_D_2
+.byte PENTLY_PATEND
+PPDAT_rhde_kalinka_ending_p1:
+.byte PENTLY_ARPEGGIO,$00,PENTLY_N_C|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_1,PENTLY_N_E|PENTLY_D_1,PENTLY_PATEND
+PPDAT_rhde_kalinka_ending_p2:
+.byte PENTLY_N_C|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_F|PENTLY_D_2
+.byte PENTLY_N_G|PENTLY_D_2,PENTLY_N_GS|PENTLY_D_1,PENTLY_PATEND
+PPDAT_rhde_kalinka_ending_tri:
+.byte PENTLY_N_F|PENTLY_D_1,PENTLY_N_TIE|PENTLY_D_8,PENTLY_N_G|PENTLY_D_1
+.byte PENTLY_N_C|PENTLY_D_1,PENTLY_PATEND
+PPDAT_K_231_LMIA:
+.byte PENTLY_N_CH|PENTLY_D_2,PENTLY_N_DH|PENTLY_D_2,PENTLY_N_B|PENTLY_D_2
+.byte PENTLY_N_CH|PENTLY_D_2,PENTLY_REST|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_2
+.byte PENTLY_N_B|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_FH|PENTLY_D_2
+.byte PENTLY_N_EH|PENTLY_D_4,PENTLY_N_EH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4
+.byte PENTLY_N_FH|PENTLY_D_4,PENTLY_N_DH|PENTLY_D_4,PENTLY_N_GH|PENTLY_D_4
+.byte PENTLY_N_G|PENTLY_D_4,PENTLY_REST|PENTLY_D_4,PENTLY_N_CH|PENTLY_D_8
+.byte PENTLY_N_B|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8
+.byte PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8,PENTLY_N_D|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_G|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8
+.byte PENTLY_N_G|PENTLY_D_8,PENTLY_N_F|PENTLY_D_8,PENTLY_N_E|PENTLY_D_8
+.byte PENTLY_N_D|PENTLY_D_8,PENTLY_N_C|PENTLY_D_8,PENTLY_N_GH,PENTLY_N_GH
+.byte PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH|PENTLY_D_8
+.byte PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_FH,PENTLY_N_FH,PENTLY_N_FH,PENTLY_N_FH,PENTLY_N_FH,PENTLY_N_FH
+.byte PENTLY_N_FH|PENTLY_D_8,PENTLY_N_B|PENTLY_D_8,PENTLY_N_B|PENTLY_D_4
+.byte PENTLY_REST|PENTLY_D_8,PENTLY_N_CH,PENTLY_N_DH,PENTLY_N_EH,PENTLY_N_FH
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_A|PENTLY_D_8,PENTLY_N_AH,PENTLY_N_AH
+.byte PENTLY_N_AH,PENTLY_N_AH,PENTLY_N_AH,PENTLY_N_AH,PENTLY_N_AH|PENTLY_D_8
+.byte PENTLY_N_DH|PENTLY_D_8,PENTLY_N_DH|PENTLY_D_4,PENTLY_REST|PENTLY_D_8
+.byte PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH,PENTLY_N_GH
+.byte PENTLY_N_GH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_8,PENTLY_N_CH|PENTLY_D_4
+.byte PENTLY_PATEND
+pently_songs:  ; 14 entries, 478 bytes
+PS_croom_intro = 0
+PS_croom_cleared = 0
+PS_thwaite_0200 = 0
+PS_thwaite_0300 = 0
+PS_thwaite_0400 = 0
+PS_thwaite_0500 = 0
+PS_thwaite_1600 = 0
+PS_thwaite_town_tune = 0
+PS_tennis_win_point = 0
+PS_tennis_win_game = 0
+PS_axe_beat = 0
+PS_rhde_battle = 0
+PS_rhde_kalinka = 0
+PS_K_231 = 0
+PENTLY_songdef PS_croom_intro, PSDAT_croom_intro
+PENTLY_songdef PS_croom_cleared, PSDAT_croom_cleared
+PENTLY_songdef PS_thwaite_0200, PSDAT_thwaite_0200
+PENTLY_songdef PS_thwaite_0300, PSDAT_thwaite_0300
+PENTLY_songdef PS_thwaite_0400, PSDAT_thwaite_0400
+PENTLY_songdef PS_thwaite_0500, PSDAT_thwaite_0500
+PENTLY_songdef PS_thwaite_1600, PSDAT_thwaite_1600
+PENTLY_songdef PS_thwaite_town_tune, PSDAT_thwaite_town_tune
+PENTLY_songdef PS_tennis_win_point, PSDAT_tennis_win_point
+PENTLY_songdef PS_tennis_win_game, PSDAT_tennis_win_game
+PENTLY_songdef PS_axe_beat, PSDAT_axe_beat
+PENTLY_songdef PS_rhde_battle, PSDAT_rhde_battle
+PENTLY_songdef PS_rhde_kalinka, PSDAT_rhde_kalinka
+PENTLY_songdef PS_K_231, PSDAT_K_231
+PSDAT_croom_intro:
+; title: CRoom intro
+PENTLY_playPatSq1 PP_croom_intro_chords1, 21, PI_piano
+PENTLY_playPatSq2 PP_croom_intro_chords2, 30, PI_piano
+PENTLY_playPatTri PP_croom_intro_bass, 21, PI_v02
+PENTLY_setTempo 220
+PENTLY_setBeatDuration PENTLY_D_8
+PENTLY_waitRows 48  ; end at 0:13.09
+PENTLY_dalSegno
+PSDAT_croom_cleared:
+; title: CRoom stage clear
+PENTLY_playPatSq2 PP_croom_cleared_melody, 24, PI_piano
+PENTLY_playPatSq1 PP_croom_cleared_bass, 0, PI_piano
+PENTLY_playPatTri PP_croom_cleared_bass, 24, PI_v02
+PENTLY_setTempo 360
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 12  ; end at 0:02.00
+PENTLY_fine
+PSDAT_thwaite_0200:
+; title: Thwaite 02:00
+; author: L. van Beethoven, arr. D. Yerrick
+PENTLY_playPatSq1 PP_thwaite_0200_backing, 28, PI_piano
+PENTLY_playPatSq2 PP_thwaite_0200_melody, 35, PI_piano
+PENTLY_playPatTri PP_thwaite_0200_bass, 31, PI_v02
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 36  ; end at 0:07.20
+PENTLY_playPatNoise PP_thwaite_0200_drums
+PENTLY_waitRows 144  ; end at 0:36.00
+PENTLY_dalSegno
+PSDAT_thwaite_0300:
+; title: Thwaite 03:00
+PENTLY_playPatNoise PP_thwaite_0300_drums
+PENTLY_playPatTri PP_thwaite_0300_bass1, 19, PI_v02
+PENTLY_stopPatSq1
+PENTLY_stopPatSq2
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 48  ; end at 0:09.60
+PENTLY_playPatSq1 PP_thwaite_0300_backingA, 34, PI_xylo_long
+PENTLY_playPatSq2 PP_thwaite_0300_melA, 39, PI_xylo_long
+PENTLY_waitRows 96  ; end at 0:28.80
+PENTLY_playPatTri PP_thwaite_0300_bass2, 24, PI_v02
+PENTLY_playPatSq2 PP_thwaite_0300_melB, 34, PI_xylo_long
+PENTLY_playPatSq1 PP_thwaite_0300_melB, 29, PI_xylo_long
+PENTLY_waitRows 96  ; end at 0:48.00
+PENTLY_dalSegno
+PSDAT_thwaite_0400:
+; title: Thwaite 04:00
+PENTLY_playPatSq1 PP_thwaite_0400_chords1, 22, PI_xylo_short
+PENTLY_playPatSq2 PP_thwaite_0400_chords2, 26, PI_xylo_short
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 6  ; end at 0:01.20
+PENTLY_playPatNoise PP_thwaite_0400_drum1
+PENTLY_waitRows 84  ; end at 0:18.00
+PENTLY_segno
+PENTLY_playPatNoise PP_thwaite_0400_drum2
+PENTLY_waitRows 96  ; end at 0:37.20
+PENTLY_dalSegno
+PSDAT_thwaite_0500:
+; title: Thwaite 05:00
+; author: L. van Beethoven, arr. D. Yerrick
+PENTLY_playPatSq1 PP_thwaite_0500_backing, 26, PI_piano
+PENTLY_playPatSq2 PP_thwaite_0500_backing, 31, PI_piano
+PENTLY_stopPatTri
+PENTLY_playPatNoise PP_thwaite_0300_drums
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 96  ; end at 0:19.20
+PENTLY_playPatSq2 PP_thwaite_0500_melody, 31, PI_xylo_medium
+PENTLY_playPatTri PP_thwaite_0500_bass, 19, PI_v02
+PENTLY_waitRows 192  ; end at 0:57.60
+PENTLY_dalSegno
+PSDAT_thwaite_1600:
+; title: Thwaite 16:00
+PENTLY_playPatSq1 PP_thwaite_1600_chords1, 25, PI_xylo_short
+PENTLY_playPatSq2 PP_thwaite_1600_chords2, 36, PI_xylo_short
+PENTLY_playPatTri PP_thwaite_1600_bass, 24, PI_v02
+PENTLY_playPatNoise PP_thwaite_1600_drum
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 48  ; end at 0:09.60
+PENTLY_dalSegno
+PSDAT_thwaite_town_tune:
+; title: Thwaite town tune (clear)
+; author: Joseph Jowett
+PENTLY_playPatSq2 PP_thwaite_town_tune_town_tune, 24, PI_town_tune_bell
+PENTLY_playPatSq1 PP_thwaite_town_tune_town_tune, 15, PI_town_tune_bell
+PENTLY_setTempo 60
+PENTLY_setBeatDuration 0
+PENTLY_waitRows 5  ; end at 0:05.00
+PENTLY_fine
+PSDAT_tennis_win_point:
+; title: Tennis win point
+PENTLY_playPatSq2 PP_tennis_win_point_orchhits, 38, PI_orchhit
+PENTLY_playPatTri PP_tennis_win_point_bass, 26, PI_v02detached
+PENTLY_playPatSq1 PP_tennis_win_point_bass, 21, PI_distantguitdet
+PENTLY_playPatNoise PP_tennis_win_point_drum
+PENTLY_setTempo 600
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 26  ; end at 0:02.60
+PENTLY_fine
+PSDAT_tennis_win_game:
+; title: Tennis win game
+PENTLY_playPatSq2 PP_tennis_win_game_fanfare, 37, PI_fanfarehorn
+PENTLY_playPatNoise PP_tennis_win_game_drum
+PENTLY_setTempo 896
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 4  ; end at 0:00.27
+PENTLY_playPatTri PP_tennis_win_game_fanfarejoinin, 25, PI_v02detached
+PENTLY_playPatSq1 PP_tennis_win_game_fanfarejoinin, 29, PI_fanfarehorn
+PENTLY_waitRows 16  ; end at 0:01.34
+PENTLY_fine
+PSDAT_axe_beat:
+; title: Axe beat
+PENTLY_playPatNoise PP_axe_beat_drum
+PENTLY_playPatSq1 PP_axe_beat_sq1, 4, PI_xylo_short
+PENTLY_playPatSq2 PP_axe_beat_tiestream, 0, PI_xylo_short
+PENTLY_setTempo 515
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 32  ; end at 0:03.73
+PENTLY_playPatSq1 PP_axe_beat_sq1, 7, PI_xylo_short
+PENTLY_waitRows 32  ; end at 0:07.46
+PENTLY_playPatSq1 PP_axe_beat_sq1, 2, PI_xylo_short
+PENTLY_waitRows 32  ; end at 0:11.18
+PENTLY_playPatSq1 PP_axe_beat_sq1, 4, PI_xylo_short
+PENTLY_waitRows 32  ; end at 0:14.91
+PENTLY_dalSegno
+PSDAT_rhde_battle:
+; title: RHDE battle
+; author: The Eighth Bit
+PENTLY_playPatNoise PP_rhde_battle_drums
+PENTLY_playPatTri PP_rhde_battle_bassA, 22, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_battle_melA, 19, PI_stringsdet
+PENTLY_playPatSq1 PP_rhde_battle_backingA, 23, PI_stringsdet
+PENTLY_setTempo 468
+PENTLY_setBeatDuration PENTLY_D_D8
+PENTLY_waitRows 165  ; end at 0:21.15
+PENTLY_playPatTri PP_rhde_battle_bassAend, 22, PI_v02detached
+PENTLY_waitRows 6  ; end at 0:21.92
+PENTLY_playPatSq1 PP_rhde_battle_backingAend, 27, PI_stringsdet
+PENTLY_waitRows 21  ; end at 0:24.62
+PENTLY_playPatTri PP_rhde_battle_bassB, 19, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_battle_melB, 33, PI_stringsdet
+PENTLY_playPatSq1 PP_rhde_battle_backingB, 27, PI_stringsdet
+PENTLY_waitRows 192  ; end at 0:49.23
+PENTLY_dalSegno
+PSDAT_rhde_kalinka:
+; title: RHDE Kalinka
+; author: I. Larionov, arr. D. Yerrick
+PENTLY_playPatTri PP_rhde_kalinka_intro, 39, PI_v02detached
+PENTLY_playPatSq1 PP_rhde_kalinka_intro, 22, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_kalinka_intro, 31, PI_v02detached
+PENTLY_playPatNoise PP_rhde_kalinka_introdrum
+PENTLY_setTempo 560
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 32  ; end at 0:03.43
+PENTLY_playPatTri PP_rhde_kalinka_bassA, 3, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_kalinka_bassA, 3, PI_bassassist
+PENTLY_playPatSq1 PP_rhde_kalinka_partA, 19, PI_rhdeban
+PENTLY_playPatNoise PP_rhde_kalinka_drum
+PENTLY_waitRows 124  ; end at 0:16.71
+PENTLY_playPatNoise PP_rhde_kalinka_drumfill
+PENTLY_stopPatSq1
+PENTLY_stopPatSq2
+PENTLY_stopPatTri
+PENTLY_waitRows 4  ; end at 0:17.14
+PENTLY_playPatTri PP_rhde_kalinka_bassB, 3, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_kalinka_bassB, 3, PI_bassassist
+PENTLY_playPatSq1 PP_rhde_kalinka_chordsB, 13, PI_distantguitdet
+PENTLY_playPatNoise PP_rhde_kalinka_drum
+PENTLY_waitRows 62  ; end at 0:23.79
+PENTLY_playPatSq1 PP_rhde_kalinka_ending_p1, 23, PI_v02detached
+PENTLY_playPatSq2 PP_rhde_kalinka_ending_p2, 27, PI_v02detached
+PENTLY_playPatTri PP_rhde_kalinka_ending_tri, 23, PI_v02detached
+PENTLY_waitRows 2  ; end at 0:24.00
+PENTLY_stopPatNoise
+PENTLY_waitRows 48  ; end at 0:29.14
+PENTLY_fine
+PSDAT_K_231:
+; title: Leck mich im Arsch (K.231)
+; author: Mozart, arr. D. Yerrick
+PENTLY_playPatSq2 PP_K_231_LMIA, 25, PI_fanfarehorn
+PENTLY_setTempo 300
+PENTLY_setBeatDuration PENTLY_D_4
+PENTLY_waitRows 32  ; end at 0:06.40
+PENTLY_playPatSq1 PP_K_231_LMIA, 25, PI_piano
+PENTLY_waitRows 32  ; end at 0:12.80
+PENTLY_playPatTri PP_K_231_LMIA, 25, PI_v02detached
+PENTLY_segno
+PENTLY_waitRows 192  ; end at 0:51.20
+PENTLY_dalSegno
+pentlyseq_end:
+
+; references to subsequences
+PEDAT_croom_rotate = PEDAT_thwaite_mirv_split + 0
+pently_resume_mute = $00
+
+; Total music data size: 2655 bytes
+; pently_sfx_table: 694 bytes
+;   PE_thwaite_mirv_split: 40 bytes
+;   PE_thwaite_threat_1: 46 bytes
+;   PE_thwaite_threat_2: 24 bytes
+;   PE_thwaite_shoot: 18 bytes
+;   PE_thwaite_boomp: 34 bytes
+;   PE_thwaite_boomn: 36 bytes
+;   PE_croom_rotate: 16 bytes
+;   PE_croom_shift: 8 bytes
+;   PE_croom_land: 20 bytes
+;   PE_croom_line_clear: 34 bytes
+;   PE_croom_homer_clear: 54 bytes
+;   PE_croom_garbage: 16 bytes
+;   PE_croom_die1: 38 bytes
+;   PE_croom_die2: 38 bytes
+;   PE_rhde_scanbeep: 12 bytes
+;   PE_rhde_countdown: 28 bytes
+;   PE_rhde_hold_piece: 14 bytes
+;   PE_rhde_explode: 20 bytes
+;   PE_rhde_start: 36 bytes
+;   PE_tennis_paddle: 12 bytes
+;   PE_kick: 12 bytes
+;   PE_snare: 18 bytes
+;   PE_tkick: 12 bytes
+;   PE_tsnare: 8 bytes
+;   PE_clhat: 10 bytes
+;   PE_ohat: 30 bytes
+;   PE_kickohat: 30 bytes
+;   PE_snareohat: 30 bytes
+; pently_instruments: 165 bytes
+;   PI_v02: 5 bytes
+;   PI_v02detached: 5 bytes
+;   PI_piano: 7 bytes
+;   PI_town_tune_bell: 5 bytes
+;   PI_xylo_short: 5 bytes
+;   PI_xylo_medium: 7 bytes
+;   PI_xylo_long: 5 bytes
+;   PI_distanthorn: 9 bytes
+;   PI_distantguitdet: 7 bytes
+;   PI_stringsdet: 8 bytes
+;   PI_rhdeban: 5 bytes
+;   PI_bassassist: 5 bytes
+;   PI_orchhit: 45 bytes
+;   PI_fanfarehorn: 12 bytes
+;   PI_axe_fg_1: 5 bytes
+;   PI_axe_fg_2: 5 bytes
+;   PI_axe_fg_3: 5 bytes
+;   PI_axe_echo_1: 5 bytes
+;   PI_axe_echo_2: 5 bytes
+;   PI_axe_echo_3: 5 bytes
+;   PI_axe_echo_tri: 5 bytes
+; pently_drums: 12 bytes
+;   DR_kick: 2 bytes
+;   DR_snare: 2 bytes
+;   DR_clhat: 2 bytes
+;   DR_ohat: 2 bytes
+;   DR_kickohat: 2 bytes
+;   DR_snareohat: 2 bytes
+; pently_patterns: 1306 bytes
+;   PP_croom_intro_chords1: 13 bytes
+;   PP_croom_intro_chords2: 10 bytes
+;   PP_croom_intro_bass: 10 bytes
+;   PP_croom_cleared_melody: 13 bytes
+;   PP_croom_cleared_bass: 11 bytes
+;   PP_thwaite_0200_bass: 43 bytes
+;   PP_thwaite_0200_backing: 44 bytes
+;   PP_thwaite_0200_melody: 47 bytes
+;   PP_thwaite_0200_drums: 9 bytes
+;   PP_thwaite_0300_drums: 16 bytes
+;   PP_thwaite_0300_bass1: 19 bytes
+;   PP_thwaite_0300_bass2: 19 bytes
+;   PP_thwaite_0300_melA: 7 bytes
+;   PP_thwaite_0300_backingA: 7 bytes
+;   PP_thwaite_0300_melB: 19 bytes
+;   PP_thwaite_0400_drum2: 7 bytes
+;   PP_thwaite_0400_drum1: 7 bytes
+;   PP_thwaite_0400_chords1: 47 bytes
+;   PP_thwaite_0400_chords2: 47 bytes
+;   PP_thwaite_0500_backing: 51 bytes
+;   PP_thwaite_0500_melody: 48 bytes
+;   PP_thwaite_0500_bass: 19 bytes
+;   PP_thwaite_1600_drum: 8 bytes
+;   PP_thwaite_1600_chords1: 23 bytes
+;   PP_thwaite_1600_chords2: 15 bytes
+;   PP_thwaite_1600_bass: 23 bytes
+;   PP_thwaite_town_tune_town_tune: 7 bytes
+;   PP_tennis_win_point_orchhits: 10 bytes
+;   PP_tennis_win_point_bass: 17 bytes
+;   PP_tennis_win_point_drum: 11 bytes
+;   PP_tennis_win_game_fanfare: 4 bytes
+;   PP_tennis_win_game_fanfarejoinin: 7 bytes
+;   PP_tennis_win_game_drum: 9 bytes
+;   PP_axe_beat_sq1: 5 bytes
+;   PP_axe_beat_drum: 11 bytes
+;   PP_axe_beat_tiestream: 4 bytes
+;   PP_rhde_battle_drums: 14 bytes
+;   PP_rhde_battle_bassA: 56 bytes
+;   PP_rhde_battle_bassAend: 19 bytes
+;   PP_rhde_battle_bassB: 56 bytes
+;   PP_rhde_battle_melA: 104 bytes
+;   PP_rhde_battle_backingA: 43 bytes
+;   PP_rhde_battle_backingAend: 15 bytes
+;   PP_rhde_battle_melB: 58 bytes
+;   PP_rhde_battle_backingB: 58 bytes
+;   PP_rhde_kalinka_intro: 7 bytes
+;   PP_rhde_kalinka_introdrum: 6 bytes
+;   PP_rhde_kalinka_bassA: 19 bytes
+;   PP_rhde_kalinka_partA: 23 bytes
+;   PP_rhde_kalinka_drum: 21 bytes
+;   PP_rhde_kalinka_drumfill: 7 bytes
+;   PP_rhde_kalinka_bassB: 19 bytes
+;   PP_rhde_kalinka_chordsB: 10 bytes
+;   PP_rhde_kalinka_ending_p1: 9 bytes
+;   PP_rhde_kalinka_ending_p2: 8 bytes
+;   PP_rhde_kalinka_ending_tri: 7 bytes
+;   PP_K_231_LMIA: 80 bytes
+; pently_songs: 478 bytes
+;   PS_croom_intro: 20 bytes
+;   PS_croom_cleared: 20 bytes
+;   PS_thwaite_0200: 26 bytes
+;   PS_thwaite_0300: 48 bytes
+;   PS_thwaite_0400: 29 bytes
+;   PS_thwaite_0500: 34 bytes
+;   PS_thwaite_1600: 24 bytes
+;   PS_thwaite_town_tune: 16 bytes
+;   PS_tennis_win_point: 24 bytes
+;   PS_tennis_win_game: 26 bytes
+;   PS_axe_beat: 38 bytes
+;   PS_rhde_battle: 50 bytes
+;   PS_rhde_kalinka: 98 bytes
+;   PS_K_231: 25 bytes
+;
+; Breakdown by song
+;   Shared: 871 bytes
+;   Song K_231: 105 bytes
+;   Song axe_beat: 58 bytes
+;   Song croom_cleared: 44 bytes
+;   Song croom_intro: 53 bytes
+;   Song rhde_battle: 473 bytes
+;   Song rhde_kalinka: 234 bytes
+;   Song tennis_win_game: 46 bytes
+;   Song tennis_win_point: 62 bytes
+;   Song thwaite_0200: 169 bytes
+;   Song thwaite_0300: 135 bytes
+;   Song thwaite_0400: 137 bytes
+;   Song thwaite_0500: 152 bytes
+;   Song thwaite_1600: 93 bytes
+;   Song thwaite_town_tune: 23 bytes
+
+; Period table of length 76 for ntsc: 152 bytes
+periodTableLo:
+.byte $f1,$7f,$13,$ad,$4d,$f3,$9d,$4c,$00,$b8,$74,$34,$f8,$bf,$89,$56,$26,$f9
+.byte $ce,$a6,$80,$5c,$3a,$1a,$fb,$df,$c4,$ab,$93,$7c,$67,$52,$3f,$2d,$1c,$0c
+.byte $fd,$ef,$e1,$d5,$c9,$bd,$b3,$a9,$9f,$96,$8e,$86,$7e,$77,$70,$6a,$64,$5e
+.byte $59,$54,$4f,$4b,$46,$42,$3f,$3b,$38,$34,$31,$2f,$2c,$29,$27,$25,$23,$21
+.byte $1f,$1d,$1b,$1a
+periodTableHi:
+.byte 7,7,7,6,6,5,5,5,5,4,4,4,3,3,3,3,3,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,0
+.byte 0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0
+.byte 0,0
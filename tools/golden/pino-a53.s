@@ -0,0 +1,812 @@
+; Generated using Pently music assembler
+; Music from audio/pino-a53.pently
+; title: Pin Eight NES OST
+; author: DJ Tepples
+; copyright: 2009-2015 Damian Yerrick
+;
+PENTLY_NUM_SONGS=14
+PENTLY_NUM_SOUNDS=28
+.include "../../src/pentlyseq.inc"
+.segment "RODATA"
+pentlyseq_start:
+pently_sfx_table:  ; 28 entries, 694 bytes
+sfxdef PE_thwaite_mirv_split, PEDAT_thwaite_mirv_split, 18, 1, 0
+sfxdef PE_thwaite_threat_1, PEDAT_thwaite_threat_1, 21, 1, 0
+sfxdef PE_thwaite_threat_2, PEDAT_thwaite_threat_2, 10, 2, 0
+sfxdef PE_thwaite_shoot, PEDAT_thwaite_shoot, 7, 5, 3
+sfxdef PE_thwaite_boomp, PEDAT_thwaite_boomp, 15, 2, 0
+sfxdef PE_thwaite_boomn, PEDAT_thwaite_boomn, 16, 4, 3
+sfxdef PE_croom_rotate, PEDAT_croom_rotate, 6, 1, 0
+sfxdef PE_croom_shift, PEDAT_croom_shift, 2, 1, 0
+sfxdef PE_croom_land, PEDAT_croom_land, 8, 1, 0
+sfxdef PE_croom_line_clear, PEDAT_croom_line_clear, 15, 1, 0
+sfxdef PE_croom_homer_clear, PEDAT_croom_homer_clear, 25, 1, 0
+sfxdef PE_croom_garbage, PEDAT_croom_garbage, 6, 1, 0
+sfxdef PE_croom_die1, PEDAT_croom_die1, 17, 4, 0
+sfxdef PE_croom_die2, PEDAT_croom_die2, 17, 4, 3
+sfxdef PE_rhde_scanbeep, PEDAT_rhde_scanbeep, 4, 3, 0
+sfxdef PE_rhde_countdown, PEDAT_rhde_countdown, 12, 1, 0
+sfxdef PE_rhde_hold_piece, PEDAT_rhde_hold_piece, 5, 2, 3
+sfxdef PE_rhde_explode, PEDAT_rhde_explode, 8, 4, 3
+sfxdef PE_rhde_start, PEDAT_rhde_start, 16, 1, 0
+sfxdef PE_tennis_paddle, PEDAT_tennis_paddle, 4, 1, 3
+sfxdef PE_kick, PEDAT_kick, 4, 1, 3
+sfxdef PE_snare, PEDAT_snare, 7, 1, 3
+sfxdef PE_tkick, PEDAT_tkick, 4, 1, 2
+sfxdef PE_tsnare, PEDAT_tsnare, 2, 1, 2
+sfxdef PE_clhat, PEDAT_clhat, 3, 1, 3
+sfxdef PE_ohat, PEDAT_ohat, 13, 1, 3
+sfxdef PE_kickohat, PEDAT_kickohat, 13, 1, 3
+sfxdef PE_snareohat, PEDAT_snareohat, 13, 1, 3
+PEDAT_thwaite_mirv_split:
+.byte 79,36,68,36,79,41,68,41,79,46,68,46,68,36,66,36,68,41,66,41,68,46,66,46
+.byte 66,36,65,36,66,41,65,41,66,46,65,46
+PEDAT_thwaite_threat_1:
+.byte 70,31,76,31,76,31,76,37,76,37,76,43,76,43,76,49,76,49,76,49,76,49,76,49
+.byte 76,49,76,49,76,49,76,49,75,49,74,49,73,49,71,49,69,49
+PEDAT_thwaite_threat_2:
+.byte 76,28,76,34,76,40,76,46,76,46,76,46,76,46,75,46,73,46,70,46
+PEDAT_thwaite_shoot:
+.byte 10,3,8,4,7,4,6,5,4,6,3,6,2,6
+PEDAT_thwaite_boomp:
+.byte 143,18,143,15,142,12,142,15,141,12,140,10,139,11,138,9,137,6,136,8,135,7
+.byte 134,5,132,6,130,4,129,3
+PEDAT_thwaite_boomn:
+.byte 15,14,14,13,13,14,12,14,11,14,10,15,9,14,8,14,7,15,6,14,5,15,4,14,3,15,2
+.byte 14,1,15,1,15
+PEDAT_croom_shift:
+.byte 79,48,68,48
+PEDAT_croom_land:
+.byte 143,19,141,15,139,12,137,9,135,7,133,5,131,3,129,2
+PEDAT_croom_line_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,133,41
+.byte 132,44,131,39,130,42,129,44
+PEDAT_croom_homer_clear:
+.byte 79,39,78,42,77,44,76,39,75,41,74,44,137,39,136,42,135,44,134,39,79,42,78
+.byte 45,77,47,76,42,75,44,74,47,137,42,136,45,135,47,134,42,133,44,132,47,131
+.byte 42,130,45,129,47
+PEDAT_croom_garbage:
+.byte 79,16,77,19,75,22,73,25,71,28,69,31
+PEDAT_croom_die1:
+.byte 143,7,143,7,142,7,141,7,140,7,139,7,138,7,137,7,136,7,135,7,134,7,133,7
+.byte 132,7,131,7,130,7,129,7,129,7
+PEDAT_croom_die2:
+.byte 15,12,15,13,14,14,13,14,12,14,11,14,10,14,9,14,8,14,7,14,6,14,5,14,4,14,3
+.byte 14,2,14,1,14,1,14
+PEDAT_rhde_scanbeep:
+.byte 140,42,140,42,131,42,129,42
+PEDAT_rhde_countdown:
+.byte 71,26,73,29,75,31,77,32,79,33,79,33,79,34,79,34,75,34,75,34,73,33,71,31
+PEDAT_rhde_hold_piece:
+.byte 7,11,9,10,9,11,8,12,6,14
+PEDAT_rhde_explode:
+.byte 15,13,13,13,11,13,9,14,7,14,5,14,3,14,2,14
+PEDAT_rhde_start:
+.byte 140,50,137,50,134,50,132,50,130,50,140,62,137,62,134,62,132,62,130,62,140
+.byte 57,137,57,134,57,132,57,130,57,129,57
+PEDAT_tennis_paddle:
+.byte 6,7,4,134,2,5,1,134
+PEDAT_kick:
+.byte 9,5,9,15,4,15,2,15
+PEDAT_snare:
+.byte 10,11,8,5,6,5,4,5,3,5,2,5,1,5
+PEDAT_tkick:
+.byte 143,31,143,27,143,24,130,21
+PEDAT_tsnare:
+.byte 143,38,143,36
+PEDAT_clhat:
+.byte 6,3,3,131,1,3
+PEDAT_ohat:
+.byte 7,3,6,131,5,3,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_kickohat:
+.byte 10,5,8,15,6,15,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+PEDAT_snareohat:
+.byte 10,11,8,5,6,5,5,131,4,3,4,131,3,3,3,131,2,3,2,131,2,3,1,131,1,3
+pently_instruments:  ; 21 entries, 165 bytes
+instdef PI_v02, 2, 6, 0, 0, 0, 0
+instdef PI_v02detached, 2, 6, 0, 1, 0, 0
+instdef PI_piano, 1, 7, 2, 0, PIDAT_piano, 2
+instdef PI_town_tune_bell, 2, 6, 1, 0, 0, 0
+instdef PI_xylo_short, 2, 7, 6, 0, 0, 0
+instdef PI_xylo_medium, 2, 8, 4, 0, PIDAT_xylo_medium, 1
+instdef PI_xylo_long, 2, 7, 2, 0, 0, 0
+instdef PI_distanthorn, 0, 5, 0, 0, PIDAT_distanthorn, 4
+instdef PI_distantguitdet, 1, 4, 0, 1, PIDAT_distantguitdet, 1
+instdef PI_stringsdet, 0, 7, 3, 1, PIDAT_stringsdet, 3
+instdef PI_rhdeban, 0, 9, 8, 0, 0, 0
+instdef PI_bassassist, 1, 7, 6, 0, 0, 0
+instdef PI_orchhit, 1, 0, 0, 0, PIDAT_orchhit, 24
+instdef PI_fanfarehorn, 0, 7, 0, 1, PIDAT_fanfarehorn, 6
+instdef PI_axe_fg_1, 2, 6, 10, 0, 0, 0
+instdef PI_axe_fg_2, 1, 7, 10, 0, 0, 0
+instdef PI_axe_fg_3, 0, 9, 10, 0, 0, 0
+instdef PI_axe_echo_1, 2, 2, 3, 0, 0, 0
+instdef PI_axe_echo_2, 1, 2, 3, 0, 0, 0
+instdef PI_axe_echo_3, 1, 2, 3, 0, 0, 0
+instdef PI_axe_echo_tri, 2, 2, 5, 0, 0, 0
+PIDAT_piano:
+.byte 153,88
+PIDAT_xylo_medium:
+.byte 136,17
+PIDAT_distanthorn:
+.byte 83,21,22,22
+PIDAT_distantguitdet:
+.byte 131,254
+PIDAT_stringsdet:
+.byte 23,27,28
+PIDAT_orchhit:
+.byte 72,12,88,72,244,71,12,87,71,244,70,12,86,70,244,69,12,85,69,244,68,12,84
+.byte 68,244,67,12,83,67,244,66,12,82,66,244,65,12,81,65,244
+PIDAT_fanfarehorn:
+.byte 68,255,23,25,25,24,24
+pently_drums:  ; 6 entries, 12 bytes
+drumdef DR_kick,PE_kick,PE_tkick
+drumdef DR_snare,PE_snare,PE_tsnare
+drumdef DR_clhat,PE_clhat,$80
+drumdef DR_ohat,PE_ohat,$80
+drumdef DR_kickohat,PE_kickohat,PE_tkick
+drumdef DR_snareohat,PE_snareohat,PE_tsnare
+pently_patterns:  ; 57 entries, 1306 bytes
+patdef PP_croom_intro_chords1, PPDAT_croom_intro_chords1
+patdef PP_croom_intro_chords2, PPDAT_croom_intro_chords2
+patdef PP_croom_intro_bass, PPDAT_croom_intro_bass
+patdef PP_croom_cleared_melody, PPDAT_croom_cleared_melody
+patdef PP_croom_cleared_bass, PPDAT_croom_cleared_bass
+patdef PP_thwaite_0200_bass, PPDAT_thwaite_0200_bass
+patdef PP_thwaite_0200_backing, PPDAT_thwaite_0200_backing
+patdef PP_thwaite_0200_melody, PPDAT_thwaite_0200_melody
+patdef PP_thwaite_0200_drums, PPDAT_thwaite_0200_drums
+patdef PP_thwaite_0300_drums, PPDAT_thwaite_0300_drums
+patdef PP_thwaite_0300_bass1, PPDAT_thwaite_0300_bass1
+patdef PP_thwaite_0300_bass2, PPDAT_thwaite_0300_bass2
+patdef PP_thwaite_0300_melA, PPDAT_thwaite_0300_melA
+patdef PP_thwaite_0300_backingA, PPDAT_thwaite_0300_backingA
+patdef PP_thwaite_0300_melB, PPDAT_thwaite_0300_melB
+patdef PP_thwaite_0400_drum2, PPDAT_thwaite_0400_drum2
+patdef PP_thwaite_0400_drum1, PPDAT_thwaite_0400_drum1
+patdef PP_thwaite_0400_chords1, PPDAT_thwaite_0400_chords1
+patdef PP_thwaite_0400_chords2, PPDAT_thwaite_0400_chords2
+patdef PP_thwaite_0500_backing, PPDAT_thwaite_0500_backing
+patdef PP_thwaite_0500_melody, PPDAT_thwaite_0500_melody
+patdef PP_thwaite_0500_bass, PPDAT_thwaite_0500_bass
+patdef PP_thwaite_1600_drum, PPDAT_thwaite_1600_drum
+patdef PP_thwaite_1600_chords1, PPDAT_thwaite_1600_chords1
+patdef PP_thwaite_1600_chords2, PPDAT_thwaite_1600_chords2
+patdef PP_thwaite_1600_bass, PPDAT_thwaite_1600_bass
+patdef PP_thwaite_town_tune_town_tune, PPDAT_thwaite_town_tune_town_tune
+patdef PP_tennis_win_point_orchhits, PPDAT_tennis_win_point_orchhits
+patdef PP_tennis_win_point_bass, PPDAT_tennis_win_point_bass
+patdef PP_tennis_win_point_drum, PPDAT_tennis_win_point_drum
+patdef PP_tennis_win_game_fanfare, PPDAT_tennis_win_game_fanfare
+patdef PP_tennis_win_game_fanfarejoinin, PPDAT_tennis_win_game_fanfarejoinin
+patdef PP_tennis_win_game_drum, PPDAT_tennis_win_game_drum
+patdef PP_axe_beat_sq1, PPDAT_axe_beat_sq1
+patdef PP_axe_beat_drum, PPDAT_axe_beat_drum
+patdef PP_axe_beat_tiestream, PPDAT_axe_beat_tiestream
+patdef PP_rhde_battle_drums, PPDAT_rhde_battle_drums
+patdef PP_rhde_battle_bassA, PPDAT_rhde_battle_bassA
+patdef PP_rhde_battle_bassAend, PPDAT_rhde_battle_bassAend
+patdef PP_rhde_battle_bassB, PPDAT_rhde_battle_bassB
+patdef PP_rhde_battle_melA, PPDAT_rhde_battle_melA
+patdef PP_rhde_battle_backingA, PPDAT_rhde_battle_backingA
+patdef PP_rhde_battle_backingAend, PPDAT_rhde_battle_backingAend
+patdef PP_rhde_battle_melB, PPDAT_rhde_battle_melB
+patdef PP_rhde_battle_backingB, PPDAT_rhde_battle_backingB
+patdef PP_rhde_kalinka_intro, PPDAT_rhde_kalinka_intro
+patdef PP_rhde_kalinka_introdrum, PPDAT_rhde_kalinka_introdrum
+patdef PP_rhde_kalinka_bassA, PPDAT_rhde_kalinka_bassA
+patdef PP_rhde_kalinka_partA, PPDAT_rhde_kalinka_partA
+patdef PP_rhde_kalinka_drum, PPDAT_rhde_kalinka_drum
+patdef PP_rhde_kalinka_drumfill, PPDAT_rhde_kalinka_drumfill
+patdef PP_rhde_kalinka_bassB, PPDAT_rhde_kalinka_bassB
+patdef PP_rhde_kalinka_chordsB, PPDAT_rhde_kalinka_chordsB
+patdef PP_rhde_kalinka_ending_p1, PPDAT_rhde_kalinka_ending_p1
+patdef PP_rhde_kalinka_ending_p2, PPDAT_rhde_kalinka_ending_p2
+patdef PP_rhde_kalinka_ending_tri, PPDAT_rhde_kalinka_ending_tri
+patdef PP_K_231_LMIA, PPDAT_K_231_LMIA
+PPDAT_croom_intro_chords1:
+.byte REST,N_E,N_A|D_4,REST,N_D,N_G|D_4,REST,N_C,N_E|D_2,N_TIE|D_8,PATEND
+PPDAT_croom_intro_chords2:
+.byte REST|D_8,N_DS|D_4,REST|D_8,N_D|D_4,REST|D_8,N_C|D_2,N_TIE|D_8,PATEND
+PPDAT_croom_intro_bass:
+.byte N_A|D_D4,N_G|D_D4,N_F|D_D2,N_A|D_D4,N_G|D_D4,N_C|D_D4,N_D|D_D4,PATEND
+PPDAT_croom_cleared_melody:
+.byte N_G,N_A,N_G,N_F,N_E,N_D,N_C,N_E,N_G,N_CH|D_D8,PATEND
+PPDAT_croom_cleared_bass:
+.byte N_CH|D_8,REST,N_G|D_8,REST,N_E|D_8,REST,N_C|D_8,REST,PATEND
+PPDAT_thwaite_0200_bass:
+.byte N_F|D_2,REST,N_DS|D_2,REST,N_F|D_2,REST,N_DS|D_2,REST,N_F|D_2,REST
+.byte N_DS|D_2,REST,N_F|D_2,REST,N_DS|D_2,REST,N_D|D_2,REST,N_G|D_2,REST
+.byte N_C|D_2,REST,N_C|D_2,REST,N_AS|D_2,REST,N_AS|D_2,REST,N_A|D_2,REST
+.byte N_D|D_2,REST,N_G|D_2,REST,N_C|D_2,REST,N_F|D_2,REST,N_F|D_2,REST,PATEND
+PPDAT_thwaite_0200_backing:
+.byte REST|D_D8,N_G|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8
+.byte N_F|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8,N_G|D_D4
+.byte REST|D_D8,N_F|D_D4,REST|D_D8,N_GS|D_D4,REST|D_D8,N_AS|D_D8,N_DH|D_D8
+.byte REST|D_D8,N_G|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8,N_G|D_D4,REST|D_D8
+.byte N_G|D_D4,REST|D_D8,N_GS|D_D4,REST|D_D8,N_DS|D_D4,REST|D_D8,N_F|D_D4
+.byte REST|D_D8,N_CS|D_D4,REST|D_D8,N_CS|D_D4,REST|D_D8,N_C|D_D4,PATEND
+PPDAT_thwaite_0200_melody:
+.byte REST|D_D8,N_F|D_D4,REST|D_D8,N_DS|D_D4,REST|D_D8,N_F|D_D4,REST|D_D8
+.byte N_DS|D_D4,N_F|D_2,REST,N_DS|D_2,REST,N_GS|D_2,N_TIE,REST|D_D4,N_FS|D_D8
+.byte N_F|D_4,N_TIE,N_GS|D_4,N_CSH|D_D8,N_DSH|D_D4,N_GS|D_2,N_TIE,REST|D_D4
+.byte N_A|D_D8,N_AS|D_2,REST,N_DS|D_D4,N_F|D_8,N_FS,N_GS|D_2,REST,N_D|D_2,REST
+.byte N_FS|D_2,REST,N_F|D_8,N_DS|D_D8,N_CS|D_D8,N_C,N_DS|D_2,REST,N_CS|D_2,REST
+.byte PATEND
+PPDAT_thwaite_0200_drums:
+.byte DR_kick|D_D8,DR_clhat|D_8,DR_clhat,DR_clhat|D_D8,DR_snare|D_D8
+.byte DR_clhat|D_D4,PATEND
+PPDAT_thwaite_0300_drums:
+.byte DR_kick|D_D8,DR_clhat|D_8,DR_kick,DR_snare|D_8,DR_clhat,DR_clhat|D_8
+.byte DR_clhat,DR_kick|D_8,DR_clhat,DR_clhat|D_8,DR_kick,DR_snare|D_D8
+.byte DR_clhat|D_D8,PATEND
+PPDAT_thwaite_0300_bass1:
+.byte N_C|D_8,REST,N_CH|D_8,N_C|D_8,REST,N_CH|D_8,REST|D_8,REST|D_D2,N_F|D_8
+.byte REST,N_FH|D_8,N_F|D_8,REST,N_FH|D_8,REST|D_8,REST|D_D2,PATEND
+PPDAT_thwaite_0300_bass2:
+.byte N_D|D_8,REST,N_DH|D_8,N_D|D_8,REST,N_DH|D_8,REST|D_8,REST|D_D2,N_C|D_8
+.byte REST,N_CH|D_8,N_C|D_8,REST,N_CH|D_8,REST|D_8,REST|D_D2,PATEND
+PPDAT_thwaite_0300_melA:
+.byte N_E|D_D2,N_D|D_D2,N_CS|D_D2,N_C|D_D2,PATEND
+PPDAT_thwaite_0300_backingA:
+.byte N_FS|D_D2,N_E|D_D2,N_D|D_D2,N_C|D_D2,PATEND
+PPDAT_thwaite_0300_melB:
+.byte REST|D_D8,N_E|D_4,N_TIE,N_G|D_4,N_FS|D_4,N_TIE,N_D|D_D4,N_TIE,REST|D_D8
+.byte N_D|D_4,N_TIE,N_F|D_4,N_E|D_4,N_TIE,N_C|D_D4,N_TIE,PATEND
+PPDAT_thwaite_0400_drum2:
+.byte DR_kick|D_D8,DR_clhat|D_D8,DR_snare|D_D8,DR_clhat|D_8,DR_kick
+PPDAT_thwaite_0400_drum1:
+.byte DR_kick|D_D8,DR_clhat|D_D4,DR_clhat|D_8,DR_kick,PATEND
+PPDAT_thwaite_0400_chords1:
+.byte INSTRUMENT,PI_xylo_short,N_AS|D_8,N_A|D_4,N_G|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_G,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_A|D_8,N_G|D_4,N_F|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_F,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_G|D_8,N_F|D_4,N_DS|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_DS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_DS|D_8,N_D|D_4,N_C|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_G,REST|D_8,REST|D_D4,REST|D_D4,PATEND
+PPDAT_thwaite_0400_chords2:
+.byte INSTRUMENT,PI_xylo_short,N_AS|D_D8,N_GS|D_D8,N_FS|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_FS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_GS|D_D8,N_FS|D_D8,N_F|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_F,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_FS|D_D8,N_F|D_D8,N_DS|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_DS,REST|D_8,REST|D_D4,REST|D_D4
+.byte INSTRUMENT,PI_xylo_short,N_DS|D_D8,N_CS|D_D8,N_C|D_D8
+.byte INSTRUMENT,PI_distanthorn,N_GS,REST|D_8,REST|D_D4,REST|D_D4,PATEND
+PPDAT_thwaite_0500_backing:
+.byte INSTRUMENT,PI_piano,REST|D_8,N_C,N_F|D_8,N_G,N_A|D_8,REST,N_AS|D_8
+.byte N_G|D_8,REST,INSTRUMENT,PI_distanthorn,N_C,N_F|D_8,N_G,N_A|D_8,REST
+.byte N_AS|D_8,N_G|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2
+.byte INSTRUMENT,PI_piano,REST|D_8,N_C,N_F|D_8,N_G,N_A|D_8,REST,N_G|D_8
+.byte N_DS|D_8,REST,INSTRUMENT,PI_distanthorn,N_C,N_F|D_8,N_G,N_A|D_8,REST
+.byte N_G|D_8,N_DS|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2,PATEND
+PPDAT_thwaite_0500_melody:
+.byte REST,N_A,N_AS,N_A,N_G,N_A,N_AS,N_CH|D_8,N_CH|D_8,N_CH|D_D8,REST|D_4
+.byte REST|D_D4,REST|D_D2,REST|D_D2,N_CH|D_8,N_A,N_AS|D_8,N_CH|D_D8,N_AS
+.byte N_A|D_8,N_DH|D_D8,REST|D_4,REST|D_D4,REST|D_D2,REST|D_D2,N_A|D_8,N_F
+.byte N_G|D_8,N_A|D_D8,N_G,N_F|D_8,N_AS|D_D8,REST|D_4,REST|D_D4,REST|D_D2
+.byte REST|D_D2,N_C|D_D8,N_C|D_D8,N_C|D_D8,N_C|D_8,N_F|D_D8,REST|D_4,REST|D_D4
+.byte REST|D_D2,REST|D_D2,PATEND
+PPDAT_thwaite_0500_bass:
+.byte N_F|D_8,REST,N_DS|D_8,N_D|D_8,REST,N_DS|D_8,REST|D_8,REST|D_D4,N_D|D_8
+.byte REST,N_CS|D_8,N_C|D_8,REST|D_8,REST|D_D8,REST|D_D4,REST|D_D2,PATEND
+PPDAT_thwaite_1600_drum:
+.byte DR_kick|D_D8,DR_snare|D_D8,DR_clhat|D_8,DR_kick,DR_snare|D_D8,PATEND
+PPDAT_thwaite_1600_chords1:
+.byte N_G|D_D8,N_D|D_D8,N_G|D_D8,N_D|D_8,N_G,N_F|D_D8,N_C|D_D8,N_F|D_D8,N_C|D_8
+.byte N_F,N_G|D_D8,N_E|D_D8,N_G|D_D8,N_E|D_8,N_G,N_A|D_D8,N_E|D_D8,N_A|D_D8
+.byte N_D|D_8,N_A,PATEND
+PPDAT_thwaite_1600_chords2:
+.byte N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_D4,N_C|D_4,N_TIE,N_C,N_CS|D_D4
+.byte N_CS|D_4,N_TIE,N_CS,PATEND
+PPDAT_thwaite_1600_bass:
+.byte N_GS|D_8,REST|D_4,REST|D_8,N_DS|D_8,REST|D_8,N_FS|D_8,REST|D_4,REST|D_8
+.byte N_CS|D_8,REST|D_8,N_F|D_8,REST|D_4,REST|D_8,N_C|D_8,REST|D_8,N_AS|D_8
+.byte REST|D_4,REST|D_8,N_DS|D_8,REST|D_8,PATEND
+PPDAT_thwaite_town_tune_town_tune:
+.byte N_F,N_A,N_G,N_C|D_8,PATEND
+PPDAT_tennis_win_point_orchhits:
+.byte N_C|D_D8,N_DS|D_D8,N_F|D_4,REST|D_D4,N_F|D_D8,N_FS|D_D8,N_GS|D_4,PATEND
+PPDAT_tennis_win_point_bass:
+.byte N_C|D_D8,N_DS|D_D8,N_F|D_D8,REST,N_F,N_F,N_F,N_F,N_F,N_F,N_F|D_D8
+.byte N_FS|D_D8,N_GS|D_D8,REST,PATEND
+PPDAT_tennis_win_point_drum:
+.byte DR_snare|D_D8,DR_snare|D_D8,DR_snare|D_4,DR_kick,DR_kick,DR_snare|D_8
+.byte DR_kick,DR_kick,PATEND
+PPDAT_tennis_win_game_fanfare:
+.byte N_C|D_8,N_C|D_8
+PPDAT_tennis_win_game_fanfarejoinin:
+.byte N_F|D_4,REST|D_8,N_C|D_8,N_F|D_2,PATEND
+PPDAT_tennis_win_game_drum:
+.byte DR_clhat|D_8,DR_clhat|D_8,DR_snare|D_D4,DR_clhat,DR_clhat,DR_snare|D_2
+.byte PATEND
+PPDAT_axe_beat_sq1:
+.byte REST|D_8,N_C|D_8,PATEND
+PPDAT_axe_beat_drum:
+.byte DR_kick|D_8,DR_ohat|D_8,DR_snare,GRACE,1,N_TIE,DR_clhat,DR_ohat|D_8
+.byte PATEND
+PPDAT_axe_beat_tiestream:
+.byte N_TIE|D_1,PATEND
+PPDAT_rhde_battle_drums:
+.byte DR_kick|D_D8,DR_clhat|D_8,DR_clhat,DR_kick|D_D8,DR_clhat|D_8,DR_clhat
+.byte DR_kick|D_D8,DR_clhat|D_8,DR_clhat,DR_kick|D_D8,DR_kick|D_D8,PATEND
+PPDAT_rhde_battle_bassA:
+.byte N_F|D_8,REST|D_D8,N_F,N_C|D_8,REST|D_D8,N_C,N_F|D_8,REST|D_D8,N_C,N_F|D_8
+.byte REST,N_G|D_8,REST,N_A|D_8,REST|D_D8,N_A,N_E|D_8,REST|D_D8,N_E,N_A|D_8
+.byte REST|D_D8,N_E,N_A|D_8,REST,N_CH|D_8,REST,N_AS|D_8,REST|D_D8,N_AS,N_F|D_8
+.byte REST|D_D8,N_F,N_AS|D_8,REST|D_D8,N_F,N_AS|D_8,REST,N_CSH|D_8,REST
+.byte N_CH|D_8,REST|D_D8,N_CH,N_G|D_8,REST|D_D8,N_G,N_CH|D_8,N_CH,N_AS|D_8,REST
+.byte N_A|D_8,REST,N_G|D_8,REST,PATEND
+PPDAT_rhde_battle_bassAend:
+.byte N_CH|D_8,REST,N_F|D_8,REST|D_D8,N_F,N_G|D_8,REST|D_D8,N_G,N_F|D_8,REST
+.byte N_C|D_8,REST,N_F|D_8,REST,N_G|D_8,REST,PATEND
+PPDAT_rhde_battle_bassB:
+.byte N_CH|D_8,REST|D_D8,N_CH,N_G|D_8,REST|D_D8,N_G,N_CH|D_8,REST|D_D8,N_CH
+.byte N_G|D_8,REST,N_CH|D_8,REST,N_F|D_8,REST|D_D8,N_F,N_G|D_8,REST|D_D8,N_G
+.byte N_F|D_8,REST|D_D8,N_F,N_CH|D_8,REST,N_F|D_8,REST,N_AS|D_8,REST|D_D8,N_AS
+.byte N_F|D_8,REST|D_D8,N_F,N_AS|D_8,REST|D_D8,N_AS,N_F|D_8,REST,N_AS|D_8,REST
+.byte N_DS|D_8,REST|D_D8,N_DS,N_CS|D_8,REST|D_D8,N_CS,N_C|D_8,N_CH,N_GS|D_8
+.byte REST,N_AS|D_8,REST,N_DS|D_8,REST,PATEND
+PPDAT_rhde_battle_melA:
+.byte N_CH|D_8,REST,N_DSH|D_4,N_TIE,N_GSH|D_D8,REST,N_CH|D_8,REST,N_DS|D_8,REST
+.byte N_GS|D_8,REST,N_F|D_8,REST,N_G|D_8,REST,N_EH|D_4,N_TIE,N_AS|D_D8,REST
+.byte N_AS|D_D4,REST|D_D4,N_CSH|D_8,N_AS,N_GS|D_8,N_CSH|D_D8,REST,N_EH|D_8,REST
+.byte N_GSH|D_8,REST,N_GSH|D_8,REST,N_EH|D_8,REST,N_GSH|D_8,N_GSH|D_D8,REST
+.byte N_CSH|D_8,REST,N_AS|D_8,REST,N_GS|D_8,N_G|D_D4,REST,N_G|D_D4,N_CH|D_8
+.byte REST,N_DSH|D_4,N_TIE,N_GSH|D_D8,REST,N_CH|D_8,REST,N_DS|D_8,REST,N_GS|D_8
+.byte N_DS,N_F|D_8,REST,N_G|D_8,REST,N_EH|D_4,N_TIE,N_AS|D_D8,REST,N_AS|D_D8
+.byte N_C|D_8,REST,N_E|D_8,N_D,N_C|D_8,REST,N_CSH|D_8,N_AS,N_GS|D_8,N_CSH|D_D8
+.byte REST,N_EH|D_8,REST,N_GSH|D_8,REST,N_GSH|D_8,REST,N_EH|D_8,REST,N_GSH|D_8
+.byte N_GSH|D_D8,REST,N_GSH|D_8,REST,N_DSH|D_8,N_CH,N_CSH|D_8,REST,N_CH|D_8
+.byte REST,N_DSH|D_8,N_GSH,N_CHH|D_8,REST|D_4,PATEND
+PPDAT_rhde_battle_backingA:
+.byte N_E|D_8,REST,N_GS|D_4,N_TIE,N_B|D_D8,REST,N_E|D_8,REST|D_4,REST|D_D4
+.byte REST|D_D8,N_FS|D_4,N_TIE,N_GS|D_D8,REST,N_C|D_D4,REST|D_D4,N_E|D_8,N_DS
+.byte N_CS|D_8,N_E|D_D8,REST,N_A|D_8,REST,N_CH|D_8,REST,N_B|D_8,REST,N_A|D_8
+.byte REST,N_CH|D_8,N_B|D_D8,REST,N_FS|D_8,REST,N_DS|D_8,REST,N_A|D_8,N_GS|D_D4
+.byte REST,N_FS|D_D4,PATEND
+PPDAT_rhde_battle_backingAend:
+.byte N_G|D_8,REST,N_E|D_8,N_C,N_D|D_8,REST,N_C|D_8,REST,N_E|D_8,N_G,N_CH|D_8
+.byte REST|D_4,PATEND
+PPDAT_rhde_battle_melB:
+.byte N_F|D_8,N_DS,N_D|D_8,N_F|D_4,N_GS|D_8,REST,N_DH|D_8,REST,N_B|D_8,REST
+.byte N_AS|D_8,REST,N_GS|D_8,N_AS|D_8,REST,N_FS|D_D8,REST,N_F|D_8,REST,N_GS|D_8
+.byte REST,N_AS|D_8,N_GS,N_FS|D_8,N_F,N_FS|D_8,N_F,N_DS|D_8,N_CS,N_C|D_8,REST
+.byte N_DS|D_8,REST,N_GS|D_8,REST,N_CH|D_8,N_DSH|D_8,REST,N_FSH,N_GSH|D_8,N_DSH
+.byte N_CH|D_8,N_CSH,N_DSH|D_8,N_CH,N_CSH|D_8,N_DSH,N_FH|D_8,N_CSH,N_B|D_8
+.byte N_CSH,N_DSH|D_8,N_B,N_AS|D_D4,N_GS|D_D4,PATEND
+PPDAT_rhde_battle_backingB:
+.byte N_GS|D_8,N_FS,N_E|D_8,N_GS|D_4,N_B|D_8,REST,N_EH|D_8,REST,N_DH|D_8,REST
+.byte N_CH|D_8,REST,N_B|D_8,N_CH|D_8,REST,N_A|D_D8,REST,N_GS|D_8,REST,N_B|D_8
+.byte REST,N_CH|D_8,N_B,N_A|D_8,N_GS,N_A|D_8,N_G,N_E|D_8,N_C,N_D|D_8,REST
+.byte N_E|D_8,REST,N_FS|D_8,REST,N_A|D_8,N_DH|D_8,REST,N_EH,N_FSH|D_8,N_DH
+.byte N_CH|D_8,N_DH,N_EH|D_8,N_CH,N_B|D_8,N_CH,N_DH|D_8,N_B,N_A|D_8,N_B
+.byte N_CH|D_8,N_A,N_G|D_D4,REST|D_D4,PATEND
+PPDAT_rhde_kalinka_intro:
+.byte N_DS|D_2,N_CS|D_2,N_C|D_D2,REST|D_4,PATEND
+PPDAT_rhde_kalinka_introdrum:
+.byte N_TIE|D_1,N_TIE|D_D2,DR_snare|D_4,PATEND
+PPDAT_rhde_kalinka_bassA:
+.byte N_C|D_8,N_CH|D_8,N_C|D_8,N_AS|D_8,N_C|D_8,N_CH|D_8,N_C|D_8,N_CH|D_8
+.byte N_E|D_8,N_EH|D_8,N_E|D_8,N_EH|D_8,N_F|D_8,N_FH|D_8,N_GS|D_8,N_GSH|D_8
+.byte PATEND
+PPDAT_rhde_kalinka_partA:
+.byte N_DS|D_8,N_FS|D_8,N_DS|D_8,N_FS|D_8,ARPEGGIO,$47,N_GSH|D_8,ARPEGGIO,$0
+.byte N_DS|D_8,N_FS|D_8,N_DS|D_8,N_C|D_8,N_C|D_8,N_DS|D_8,N_FS|D_8,N_CS|D_8
+.byte N_CS|D_8,N_E|D_8,N_GS|D_8,PATEND
+PPDAT_rhde_kalinka_drum:
+.byte DR_kick|D_8,DR_clhat|D_8,DR_snare|D_8,DR_clhat|D_8,DR_kick|D_8,DR_clhat
+.byte DR_clhat,DR_snare|D_8,DR_clhat|D_8,DR_kick|D_8,DR_clhat|D_8,DR_snare|D_8
+.byte DR_clhat|D_8,DR_kick|D_8,DR_clhat|D_8,DR_snare,DR_clhat,DR_snareohat|D_8
+.byte PATEND
+PPDAT_rhde_kalinka_drumfill:
+.byte DR_snareohat,DR_snare,DR_snare,DR_snare,PATEND
+PPDAT_rhde_kalinka_bassB:
+.byte N_F|D_8,N_FH|D_8,N_F|D_8,N_FH|D_8,N_F|D_8,N_FH|D_8,N_F|D_8,N_DSH|D_8
+.byte N_C|D_8,N_CH|D_8,N_C|D_8,N_CH|D_8,N_CS|D_8,N_CSH|D_8,N_CS|D_8,N_CSH|D_8
+.byte PATEND
+PPDAT_rhde_kalinka_chordsB:
+.byte ARPEGGIO,$05,N_D|D_D2,N_TIE|D_8,N_C|D_8,N_A|D_2,N_AS|D_2,PATEND
+PPDAT_rhde_kalinka_ending_p1:
+.byte ARPEGGIO,$00,N_C|D_1,N_TIE|D_8,N_D|D_1,N_E|D_1,PATEND
+PPDAT_rhde_kalinka_ending_p2:
+.byte N_C|D_1,N_TIE|D_8,N_F|D_2,N_G|D_2,N_GS|D_1,PATEND
+PPDAT_rhde_kalinka_ending_tri:
+.byte N_F|D_1,N_TIE|D_8,N_G|D_1,N_C|D_1,PATEND
+PPDAT_K_231_LMIA:
+.byte N_CH|D_2,N_DH|D_2,N_B|D_2,N_CH|D_2,REST|D_4,N_CH|D_2,N_B|D_4,REST|D_4
+.byte N_FH|D_2,N_EH|D_4,N_EH|D_4,N_GH|D_4,N_FH|D_4,N_DH|D_4,N_GH|D_4,N_G|D_4
+.byte REST|D_4,N_CH|D_8,N_B|D_8,N_A|D_8,N_G|D_8,N_F|D_8,N_E|D_8,N_D|D_8,N_D|D_8
+.byte N_G|D_8,N_A|D_8,N_G|D_8,N_F|D_8,N_E|D_8,N_D|D_8,N_C|D_8,N_GH,N_GH,N_GH
+.byte N_GH,N_GH,N_GH,N_GH|D_8,N_CH|D_8,N_CH|D_4,REST|D_8,N_FH,N_FH,N_FH,N_FH
+.byte N_FH,N_FH,N_FH|D_8,N_B|D_8,N_B|D_4,REST|D_8,N_CH,N_DH,N_EH,N_FH,N_GH|D_8
+.byte N_A|D_8,N_AH,N_AH,N_AH,N_AH,N_AH,N_AH,N_AH|D_8,N_DH|D_8,N_DH|D_4,REST|D_8
+.byte N_GH,N_GH,N_GH,N_GH,N_GH,N_GH,N_GH|D_8,N_CH|D_8,N_CH|D_4,PATEND
+pently_songs:  ; 14 entries, 478 bytes
+songdef PS_croom_intro, PSDAT_croom_intro
+songdef PS_croom_cleared, PSDAT_croom_cleared
+songdef PS_thwaite_0200, PSDAT_thwaite_0200
+songdef PS_thwaite_0300, PSDAT_thwaite_0300
+songdef PS_thwaite_0400, PSDAT_thwaite_0400
+songdef PS_thwaite_0500, PSDAT_thwaite_0500
+songdef PS_thwaite_1600, PSDAT_thwaite_1600
+songdef PS_thwaite_town_tune, PSDAT_thwaite_town_tune
+songdef PS_tennis_win_point, PSDAT_tennis_win_point
+songdef PS_tennis_win_game, PSDAT_tennis_win_game
+songdef PS_axe_beat, PSDAT_axe_beat
+songdef PS_rhde_battle, PSDAT_rhde_battle
+songdef PS_rhde_kalinka, PSDAT_rhde_kalinka
+songdef PS_K_231, PSDAT_K_231
+PSDAT_croom_intro:
+; title: CRoom intro
+playPatSq1 PP_croom_intro_chords1, 21, PI_piano
+playPatSq2 PP_croom_intro_chords2, 30, PI_piano
+playPatTri PP_croom_intro_bass, 21, PI_v02
+setTempo 220
+setBeatDuration D_8
+waitRows 48  ; end at 0:13.09
+dalSegno
+PSDAT_croom_cleared:
+; title: CRoom stage clear
+playPatSq2 PP_croom_cleared_melody, 24, PI_piano
+playPatSq1 PP_croom_cleared_bass, 0, PI_piano
+playPatTri PP_croom_cleared_bass, 24, PI_v02
+setTempo 360
+setBeatDuration D_D8
+waitRows 12  ; end at 0:02.00
+fine
+PSDAT_thwaite_0200:
+; title: Thwaite 02:00
+; author: L. van Beethoven, arr. D. Yerrick
+playPatSq1 PP_thwaite_0200_backing, 28, PI_piano
+playPatSq2 PP_thwaite_0200_melody, 35, PI_piano
+playPatTri PP_thwaite_0200_bass, 31, PI_v02
+setTempo 300
+setBeatDuration D_D8
+waitRows 36  ; end at 0:07.20
+playPatNoise PP_thwaite_0200_drums
+waitRows 144  ; end at 0:36.00
+dalSegno
+PSDAT_thwaite_0300:
+; title: Thwaite 03:00
+playPatNoise PP_thwaite_0300_drums
+playPatTri PP_thwaite_0300_bass1, 19, PI_v02
+stopPatSq1
+stopPatSq2
+setTempo 300
+setBeatDuration D_D8
+waitRows 48  ; end at 0:09.60
+playPatSq1 PP_thwaite_0300_backingA, 34, PI_xylo_long
+playPatSq2 PP_thwaite_0300_melA, 39, PI_xylo_long
+waitRows 96  ; end at 0:28.80
+playPatTri PP_thwaite_0300_bass2, 24, PI_v02
+playPatSq2 PP_thwaite_0300_melB, 34, PI_xylo_long
+playPatSq1 PP_thwaite_0300_melB, 29, PI_xylo_long
+waitRows 96  ; end at 0:48.00
+dalSegno
+PSDAT_thwaite_0400:
+; title: Thwaite 04:00
+playPatSq1 PP_thwaite_0400_chords1, 22, PI_xylo_short
+playPatSq2 PP_thwaite_0400_chords2, 26, PI_xylo_short
+setTempo 300
+setBeatDuration D_D8
+waitRows 6  ; end at 0:01.20
+playPatNoise PP_thwaite_0400_drum1
+waitRows 84  ; end at 0:18.00
+segno
+playPatNoise PP_thwaite_0400_drum2
+waitRows 96  ; end at 0:37.20
+dalSegno
+PSDAT_thwaite_0500:
+; title: Thwaite 05:00
+; author: L. van Beethoven, arr. D. Yerrick
+playPatSq1 PP_thwaite_0500_backing, 26, PI_piano
+playPatSq2 PP_thwaite_0500_backing, 31, PI_piano
+stopPatTri
+playPatNoise PP_thwaite_0300_drums
+setTempo 300
+setBeatDuration D_D8
+waitRows 96  ; end at 0:19.20
+playPatSq2 PP_thwaite_0500_melody, 31, PI_xylo_medium
+playPatTri PP_thwaite_0500_bass, 19, PI_v02
+waitRows 192  ; end at 0:57.60
+dalSegno
+PSDAT_thwaite_1600:
+; title: Thwaite 16:00
+playPatSq1 PP_thwaite_1600_chords1, 25, PI_xylo_short
+playPatSq2 PP_thwaite_1600_chords2, 36, PI_xylo_short
+playPatTri PP_thwaite_1600_bass, 24, PI_v02
+playPatNoise PP_thwaite_1600_drum
+setTempo 300
+setBeatDuration D_D8
+waitRows 48  ; end at 0:09.60
+dalSegno
+PSDAT_thwaite_town_tune:
+; title: Thwaite town tune (clear)
+; author: Joseph Jowett
+playPatSq2 PP_thwaite_town_tune_town_tune, 24, PI_town_tune_bell
+playPatSq1 PP_thwaite_town_tune_town_tune, 15, PI_town_tune_bell
+setTempo 60
+setBeatDuration 0
+waitRows 5  ; end at 0:05.00
+fine
+PSDAT_tennis_win_point:
+; title: Tennis win point
+playPatSq2 PP_tennis_win_point_orchhits, 38, PI_orchhit
+playPatTri PP_tennis_win_point_bass, 26, PI_v02detached
+playPatSq1 PP_tennis_win_point_bass, 21, PI_distantguitdet
+playPatNoise PP_tennis_win_point_drum
+setTempo 600
+setBeatDuration D_4
+waitRows 26  ; end at 0:02.60
+fine
+PSDAT_tennis_win_game:
+; title: Tennis win game
+playPatSq2 PP_tennis_win_game_fanfare, 37, PI_fanfarehorn
+playPatNoise PP_tennis_win_game_drum
+setTempo 896
+setBeatDuration D_4
+waitRows 4  ; end at 0:00.27
+playPatTri PP_tennis_win_game_fanfarejoinin, 25, PI_v02detached
+playPatSq1 PP_tennis_win_game_fanfarejoinin, 29, PI_fanfarehorn
+waitRows 16  ; end at 0:01.34
+fine
+PSDAT_axe_beat:
+; title: Axe beat
+playPatNoise PP_axe_beat_drum
+playPatSq1 PP_axe_beat_sq1, 4, PI_xylo_short
+playPatSq2 PP_axe_beat_tiestream, 0, PI_xylo_short
+setTempo 515
+setBeatDuration D_4
+waitRows 32  ; end at 0:03.73
+playPatSq1 PP_axe_beat_sq1, 7, PI_xylo_short
+waitRows 32  ; end at 0:07.46
+playPatSq1 PP_axe_beat_sq1, 2, PI_xylo_short
+waitRows 32  ; end at 0:11.18
+playPatSq1 PP_axe_beat_sq1, 4, PI_xylo_short
+waitRows 32  ; end at 0:14.91
+dalSegno
+PSDAT_rhde_battle:
+; title: RHDE battle
+; author: The Eighth Bit
+playPatNoise PP_rhde_battle_drums
+playPatTri PP_rhde_battle_bassA, 22, PI_v02detached
+playPatSq2 PP_rhde_battle_melA, 19, PI_stringsdet
+playPatSq1 PP_rhde_battle_backingA, 23, PI_stringsdet
+setTempo 468
+setBeatDuration D_D8
+waitRows 165  ; end at 0:21.15
+playPatTri PP_rhde_battle_bassAend, 22, PI_v02detached
+waitRows 6  ; end at 0:21.92
+playPatSq1 PP_rhde_battle_backingAend, 27, PI_stringsdet
+waitRows 21  ; end at 0:24.62
+playPatTri PP_rhde_battle_bassB, 19, PI_v02detached
+playPatSq2 PP_rhde_battle_melB, 33, PI_stringsdet
+playPatSq1 PP_rhde_battle_backingB, 27, PI_stringsdet
+waitRows 192  ; end at 0:49.23
+dalSegno
+PSDAT_rhde_kalinka:
+; title: RHDE Kalinka
+; author: I. Larionov, arr. D. Yerrick
+playPatTri PP_rhde_kalinka_intro, 39, PI_v02detached
+playPatSq1 PP_rhde_kalinka_intro, 22, PI_v02detached
+playPatSq2 PP_rhde_kalinka_intro, 31, PI_v02detached
+playPatNoise PP_rhde_kalinka_introdrum
+setTempo 560
+setBeatDuration D_4
+waitRows 32  ; end at 0:03.43
+playPatTri PP_rhde_kalinka_bassA, 3, PI_v02detached
+playPatSq2 PP_rhde_kalinka_bassA, 3, PI_bassassist
+playPatSq1 PP_rhde_kalinka_partA, 19, PI_rhdeban
+playPatNoise PP_rhde_kalinka_drum
+waitRows 124  ; end at 0:16.71
+playPatNoise PP_rhde_kalinka_drumfill
+stopPatSq1
+stopPatSq2
+stopPatTri
+waitRows 4  ; end at 0:17.14
+playPatTri PP_rhde_kalinka_bassB, 3, PI_v02detached
+playPatSq2 PP_rhde_kalinka_bassB, 3, PI_bassassist
+playPatSq1 PP_rhde_kalinka_chordsB, 13, PI_distantguitdet
+playPatNoise PP_rhde_kalinka_drum
+waitRows 62  ; end at 0:23.79
+playPatSq1 PP_rhde_kalinka_ending_p1, 23, PI_v02detached
+playPatSq2 PP_rhde_kalinka_ending_p2, 27, PI_v02detached
+playPatTri PP_rhde_kalinka_ending_tri, 23, PI_v02detached
+waitRows 2  ; end at 0:24.00
+stopPatNoise
+waitRows 48  ; end at 0:29.14
+fine
+PSDAT_K_231:
+; title: Leck mich im Arsch (K.231)
+; author: Mozart, arr. D. Yerrick
+playPatSq2 PP_K_231_LMIA, 25, PI_fanfarehorn
+setTempo 300
+setBeatDuration D_4
+waitRows 32  ; end at 0:06.40
+playPatSq1 PP_K_231_LMIA, 25, PI_piano
+waitRows 32  ; end at 0:12.80
+playPatTri PP_K_231_LMIA, 25, PI_v02detached
+segno
+waitRows 192  ; end at 0:51.20
+dalSegno
+pentlyseq_end:
+
+; references to subsequences
+PEDAT_croom_rotate = PEDAT_thwaite_mirv_split + 0
+pently_resume_mute = $00
+
+; Total music data size: 2655 bytes
+; pently_sfx_table: 694 bytes
+;   PE_thwaite_mirv_split: 40 bytes
+;   PE_thwaite_threat_1: 46 bytes
+;   PE_thwaite_threat_2: 24 bytes
+;   PE_thwaite_shoot: 18 bytes
+;   PE_thwaite_boomp: 34 bytes
+;   PE_thwaite_boomn: 36 bytes
+;   PE_croom_rotate: 16 bytes
+;   PE_croom_shift: 8 bytes
+;   PE_croom_land: 20 bytes
+;   PE_croom_line_clear: 34 bytes
+;   PE_croom_homer_clear: 54 bytes
+;   PE_croom_garbage: 16 bytes
+;   PE_croom_die1: 38 bytes
+;   PE_croom_die2: 38 bytes
+;   PE_rhde_scanbeep: 12 bytes
+;   PE_rhde_countdown: 28 bytes
+;   PE_rhde_hold_piece: 14 bytes
+;   PE_rhde_explode: 20 bytes
+;   PE_rhde_start: 36 bytes
+;   PE_tennis_paddle: 12 bytes
+;   PE_kick: 12 bytes
+;   PE_snare: 18 bytes
+;   PE_tkick: 12 bytes
+;   PE_tsnare: 8 bytes
+;   PE_clhat: 10 bytes
+;   PE_ohat: 30 bytes
+;   PE_kickohat: 30 bytes
+;   PE_snareohat: 30 bytes
+; pently_instruments: 165 bytes
+;   PI_v02: 5 bytes
+;   PI_v02detached: 5 bytes
+;   PI_piano: 7 bytes
+;   PI_town_tune_bell: 5 bytes
+;   PI_xylo_short: 5 bytes
+;   PI_xylo_medium: 7 bytes
+;   PI_xylo_long: 5 bytes
+;   PI_distanthorn: 9 bytes
+;   PI_distantguitdet: 7 bytes
+;   PI_stringsdet: 8 bytes
+;   PI_rhdeban: 5 bytes
+;   PI_bassassist: 5 bytes
+;   PI_orchhit: 45 bytes
+;   PI_fanfarehorn: 12 bytes
+;   PI_axe_fg_1: 5 bytes
+;   PI_axe_fg_2: 5 bytes
+;   PI_axe_fg_3: 5 bytes
+;   PI_axe_echo_1: 5 bytes
+;   PI_axe_echo_2: 5 bytes
+;   PI_axe_echo_3: 5 bytes
+;   PI_axe_echo_tri: 5 bytes
+; pently_drums: 12 bytes
+;   DR_kick: 2 bytes
+;   DR_snare: 2 bytes
+;   DR_clhat: 2 bytes
+;   DR_ohat: 2 bytes
+;   DR_kickohat: 2 bytes
+;   DR_snareohat: 2 bytes
+; pently_patterns: 1306 bytes
+;   PP_croom_intro_chords1: 13 bytes
+;   PP_croom_intro_chords2: 10 bytes
+;   PP_croom_intro_bass: 10 bytes
+;   PP_croom_cleared_melody: 13 bytes
+;   PP_croom_cleared_bass: 11 bytes
+;   PP_thwaite_0200_bass: 43 bytes
+;   PP_thwaite_0200_backing: 44 bytes
+;   PP_thwaite_0200_melody: 47 bytes
+;   PP_thwaite_0200_drums: 9 bytes
+;   PP_thwaite_0300_drums: 16 bytes
+;   PP_thwaite_0300_bass1: 19 bytes
+;   PP_thwaite_0300_bass2: 19 bytes
+;   PP_thwaite_0300_melA: 7 bytes
+;   PP_thwaite_0300_backingA: 7 bytes
+;   PP_thwaite_0300_melB: 19 bytes
+;   PP_thwaite_0400_drum2: 7 bytes
+;   PP_thwaite_0400_drum1: 7 bytes
+;   PP_thwaite_0400_chords1: 47 bytes
+;   PP_thwaite_0400_chords2: 47 bytes
+;   PP_thwaite_0500_backing: 51 bytes
+;   PP_thwaite_0500_melody: 48 bytes
+;   PP_thwaite_0500_bass: 19 bytes
+;   PP_thwaite_1600_drum: 8 bytes
+;   PP_thwaite_1600_chords1: 23 bytes
+;   PP_thwaite_1600_chords2: 15 bytes
+;   PP_thwaite_1600_bass: 23 bytes
+;   PP_thwaite_town_tune_town_tune: 7 bytes
+;   PP_tennis_win_point_orchhits: 10 bytes
+;   PP_tennis_win_point_bass: 17 bytes
+;   PP_tennis_win_point_drum: 11 bytes
+;   PP_tennis_win_game_fanfare: 4 bytes
+;   PP_tennis_win_game_fanfarejoinin: 7 bytes
+;   PP_tennis_win_game_drum: 9 bytes
+;   PP_axe_beat_sq1: 5 bytes
+;   PP_axe_beat_drum: 11 bytes
+;   PP_axe_beat_tiestream: 4 bytes
+;   PP_rhde_battle_drums: 14 bytes
+;   PP_rhde_battle_bassA: 56 bytes
+;   PP_rhde_battle_bassAend: 19 bytes
+;   PP_rhde_battle_bassB: 56 bytes
+;   PP_rhde_battle_melA: 104 bytes
+;   PP_rhde_battle_backingA: 43 bytes
+;   PP_rhde_battle_backingAend: 15 bytes
+;   PP_rhde_battle_melB: 58 bytes
+;   PP_rhde_battle_backingB: 58 bytes
+;   PP_rhde_kalinka_intro: 7 bytes
+;   PP_rhde_kalinka_introdrum: 6 bytes
+;   PP_rhde_kalinka_bassA: 19 bytes
+;   PP_rhde_kalinka_partA: 23 bytes
+;   PP_rhde_kalinka_drum: 21 bytes
+;   PP_rhde_kalinka_drumfill: 7 bytes
+;   PP_rhde_kalinka_bassB: 19 bytes
+;   PP_rhde_kalinka_chordsB: 10 bytes
+;   PP_rhde_kalinka_ending_p1: 9 bytes
+;   PP_rhde_kalinka_ending_p2: 8 bytes
+;   PP_rhde_kalinka_ending_tri: 7 bytes
+;   PP_K_231_LMIA: 80 bytes
+; pently_songs: 478 bytes
+;   PS_croom_intro: 20 bytes
+;   PS_croom_cleared: 20 bytes
+;   PS_thwaite_0200: 26 bytes
+;   PS_thwaite_0300: 48 bytes
+;   PS_thwaite_0400: 29 bytes
+;   PS_thwaite_0500: 34 bytes
+;   PS_thwaite_1600: 24 bytes
+;   PS_thwaite_town_tune: 16 bytes
+;   PS_tennis_win_point: 24 bytes
+;   PS_tennis_win_game: 26 bytes
+;   PS_axe_beat: 38 bytes
+;   PS_rhde_battle: 50 bytes
+;   PS_rhde_kalinka: 98 bytes
+;   PS_K_231: 25 bytes
+;
+; Breakdown by song
+;   Shared: 871 bytes
+;   Song K_231: 105 bytes
+;   Song axe_beat: 58 bytes
+;   Song croom_cleared: 44 bytes
+;   Song croom_intro: 53 bytes
+;   Song rhde_battle: 473 bytes
+;   Song rhde_kalinka: 234 bytes
+;   Song tennis_win_game: 46 bytes
+;   Song tennis_win_point: 62 bytes
+;   Song thwaite_0200: 169 bytes
+;   Song thwaite_0300: 135 bytes
+;   Song thwaite_0400: 137 bytes
+;   Song thwaite_0500: 152 bytes
+;   Song thwaite_1600: 93 bytes
+;   Song thwaite_town_tune: 23 bytes
+
+; Exports
+; Make music data available to Pently
+.export pentlyseq_start,pentlyseq_end,pently_sfx_table,pently_instruments
+.export pently_drums,pently_patterns,pently_songs
+
+; Sound effect, instrument, and song names for your program to .importzp
+.exportzp PENTLY_NUM_SONGS,PENTLY_NUM_SOUNDS,pently_resume_mute
+.exportzp PE_thwaite_mirv_split,PE_thwaite_threat_1,PE_thwaite_threat_2
+.exportzp PE_thwaite_shoot,PE_thwaite_boomp,PE_thwaite_boomn,PE_croom_rotate
+.exportzp PE_croom_shift,PE_croom_land,PE_croom_line_clear,PE_croom_homer_clear
+.exportzp PE_croom_garbage,PE_croom_die1,PE_croom_die2,PE_rhde_scanbeep
+.exportzp PE_rhde_countdown,PE_rhde_hold_piece,PE_rhde_explode,PE_rhde_start
+.exportzp PE_tennis_paddle,PE_kick,PE_snare,PE_tkick,PE_tsnare,PE_clhat,PE_ohat
+.exportzp PE_kickohat,PE_snareohat,PI_v02,PI_v02detached,PI_piano
+.exportzp PI_town_tune_bell,PI_xylo_short,PI_xylo_medium,PI_xylo_long
+.exportzp PI_distanthorn,PI_distantguitdet,PI_stringsdet,PI_rhdeban
+.exportzp PI_bassassist,PI_orchhit,PI_fanfarehorn,PI_axe_fg_1,PI_axe_fg_2
+.exportzp PI_axe_fg_3,PI_axe_echo_1,PI_axe_echo_2,PI_axe_echo_3,PI_axe_echo_tri
+.exportzp PS_croom_intro,PS_croom_cleared,PS_thwaite_0200,PS_thwaite_0300
+.exportzp PS_thwaite_0400,PS_thwaite_0500,PS_thwaite_1600,PS_thwaite_town_tune
+.exportzp PS_tennis_win_point,PS_tennis_win_game,PS_axe_beat,PS_rhde_battle
+.exportzp PS_rhde_kalinka,PS_K_231
@@ -32,9 +32,11 @@ import sys
 import json
 import re
 import argparse
-try:
-    from collections import ChainMap
-except ImportError:
+import filecmp
+from collections import namedtuple
+from itertools import chain
+from contextlib import contextmanager
+if sys.version_info < (3, 3):
     print("pentlyas.py: Python 3.3 or later is required", file=sys.stderr)
 
 scaledegrees = {
@@ -77,6 +79,15 @@ pattern_pitchoffsets = [
     'N_FSH', 'N_GH', 'N_GSH', 'N_AH', 'N_ASH', 'N_BH',
     'N_CHH'
 ]
+# Pattern effects are stored as integer opcodes with an already
+# formatted argument, and rendered as the name of the opcode followed
+# by the argument if any
+(PATFX_INSTRUMENT, PATFX_ARPEGGIO, PATFX_CHVOLUME, PATFX_BEND,
+ PATFX_VIBRATO, PATFX_FASTARP, PATFX_SLOWARP) = range(7)
+pattern_effect_names = [
+    'INSTRUMENT', 'ARPEGGIO', 'CHVOLUME', 'BEND',
+    'VIBRATO', 'FASTARP', 'SLOWARP'
+]
 default_arp_names = {
     'OF':   '00',     # off
     'M':    '47',     # major
@@ -114,7 +125,9 @@ arp_top -- if true, transpose notes down by the top of the chord
 arp_mod -- if not None, the current note has a single-note arpeggio
     modifier, and subsequent 'w' commands should get the same
 last_chord -- last (pitch, arpeggio) used; note 'q' repeats this
-arp_names
+arp_names -- chord names defined in this context
+arp_parent -- context whose chord names this context inherits, or
+    None to inherit only the default names
 
 """
 
@@ -124,7 +137,7 @@ arp_names
             self.reset_octave(octave_mode=None)
             self.reset_arp()
             self.simul_notes = False
-            self.arp_names = ChainMap({}, default_arp_names)
+            self.arp_parent = None
             self.mml_octaves = True
         else:
             self.set_language(other.language)
@@ -135,8 +148,36 @@ arp_names
             self.arp_top = other.arp_top
             self.last_chord = other.last_chord
             self.simul_notes = other.simul_notes
-            self.arp_names = other.arp_names.new_child()
+            self.arp_parent = other
             self.mml_octaves = other.mml_octaves
+        self.arp_names = {}
+        self.arp_table = self.arp_translations = None
+        self.arp_table_generation = -1
+
+    # Incremented whenever any context defines a chord name, so that
+    # flattened tables built before then get rebuilt
+    arp_generation = 0
+
+    # Results of calc_arp_inversion()
+    arp_inversions = {}
+
+    def get_arp_table(self):
+        """Get a flattened dict of all chord names usable in this context.
+
+The dict is shared with the parent context if this context defines
+no names of its own, and it must not be modified.
+"""
+        generation = PentlyPitchContext.arp_generation
+        if self.arp_table_generation != generation:
+            table = (self.arp_parent.get_arp_table()
+                     if self.arp_parent
+                     else default_arp_names)
+            if self.arp_names:
+                table = dict(table)
+                table.update(self.arp_names)
+            self.arp_table, self.arp_translations = table, {}
+            self.arp_table_generation = generation
+        return self.arp_table
 
     def set_language(self, language):
         language = language.lower()
@@ -180,8 +221,12 @@ octave -- the number of commas (negative) or primes (positive) in
         """Set the octave mode to absolute if None."""
         if self.octave_mode is None: self.octave_mode = 'absolute'
 
-    @staticmethod
-    def calc_arp_inversion(arp):
+    @classmethod
+    def calc_arp_inversion(self, arp):
+        try:
+            return self.arp_inversions[arp]
+        except KeyError:
+            pass
         if len(arp) != 2:
             raise ValueError("internal error: %s not length 2" % repr(arp))
 
@@ -193,18 +238,20 @@ octave -- the number of commas (negative) or primes (positive) in
 
         # 070 -> 050, preserving ratio of 50:50 arps
         if nibbles[1] == 0:
-            return "%x0" % (12 - nibbles[0])
-
-        # Replace 0 with C and subtract the lowest nonzero
-        nibbles = [12] + [c or 12 for c in nibbles]
-        lowest = min(nibbles)
-        nibbles = [c - lowest for c in nibbles]
-
-        # Rotate to the left until 0 leads
-        while nibbles[0]:
-            nibbles.append(nibbles[0])
-            del nibbles[0]
-        return "%X%X" % (nibbles[1], nibbles[2])
+            result = "%x0" % (12 - nibbles[0])
+        else:
+            # Replace 0 with C and subtract the lowest nonzero
+            nibbles = [12] + [c or 12 for c in nibbles]
+            lowest = min(nibbles)
+            nibbles = [c - lowest for c in nibbles]
+
+            # Rotate to the left until 0 leads
+            while nibbles[0]:
+                nibbles.append(nibbles[0])
+                del nibbles[0]
+            result = "%X%X" % (nibbles[1], nibbles[2])
+        self.arp_inversions[arp] = result
+        return result
 
     def translate_arp_name(self, arp):
         """Normalize an arpeggio name to 2 hex digits or raise KeyError.
@@ -213,6 +260,12 @@ Return None (if arp is falsey), 2 hex digits, or '-' followed by
 2 hex digits.
 """
         if not arp: return None
+        arp_table = self.get_arp_table()
+        try:
+            return self.arp_translations[arp]
+        except KeyError:
+            pass
+        original_arp = arp
 
         # Chop off modifiers (downward, chord inversion)
         arp_prefix = ''
@@ -232,13 +285,15 @@ Return None (if arp is falsey), 2 hex digits, or '-' followed by
             else:
                 arpvalue = ("00" + arp)[-2:]
         if arpvalue is None:
-            arp = self.arp_names[arp]
+            arp = arp_table[arp]
 
         # Process inversion
         for _ in range(inversion):
             arp = self.calc_arp_inversion(arp)
 
-        return arp_prefix + arp
+        arp = arp_prefix + arp
+        self.arp_translations[original_arp] = arp
+        return arp
 
     def add_arp_name(self, name, definition):
         if definition.startswith('-'):
@@ -259,6 +314,7 @@ Return None (if arp is falsey), 2 hex digits, or '-' followed by
             raise ValueError("chord name %s already defined as %s"
                              % (name, definition))
         self.arp_names[name] = definition
+        PentlyPitchContext.arp_generation += 1
 
     def set_arp(self, arp):
         """Set the arpeggio for subsequent notes to arp."""
@@ -548,25 +604,35 @@ class PentlyRenderable(object):
         self.asmdataname = self.asmdata = None
         self.asmdataprefix = ''
         self.bytesize = 0
+        # Source position and size in bytes of each element of
+        # asmdata, for objects whose data comes from several lines
+        self.asmdata_src = self.asmdata_sizes = None
 
     @classmethod
     def get_asmname(self, name):
         return '_'.join(c for c in self.nonalnumRE.split(name) if c)
 
-    def resolve_scope(self, scoped_name, parent_scope, existing):
-        if scoped_name.startswith('::'):
-            return scoped_name.lstrip(':')
-        while parent_scope:
-            test = '::'.join((parent_scope, scoped_name))
-            if test in existing: return test
-            parent_scope = parent_scope.rsplit('::', 1)
-            if len(parent_scope) < 2: break
-            parent_scope = parent_scope[0]
-        return scoped_name
-
     def render(self, scopes=None, prefix=''):
         raise NotImplementedError
 
+    def get_source_map(self):
+        """List where each part of the rendered data came from.
+
+Return a list of (byte offset, (file, line, column)) tuples, one for
+each change of source position.
+"""
+        if not self.asmdataname or not self.fileline:
+            return []
+        if self.asmdata_src is None:
+            return [(0, tuple(self.fileline) + (1,))]
+        out, offset, last_src = [], 0, None
+        for src, size in zip(self.asmdata_src, self.asmdata_sizes):
+            if src is not None and src != last_src and size:
+                out.append((offset, src))
+                last_src = src
+            offset += size
+        return out
+
 class PentlyEnvelopeContainer(PentlyRenderable):
 
     def __init__(self, name=None, orderkey=0, fileline=None, warn=None):
@@ -860,7 +926,7 @@ class PentlySong(PentlyRenderable):
         self.rhyctx = PentlyRhythmContext(rhyctx)
         self.rhyctx.tempo = 100.0
         self.last_rowtempo = self.segno_fileline = self.last_beatlen = None
-        self.conductor = []
+        self.conductor, self.conductor_src = [], []
         self.bytesize = 2
         self.rehearsal_marks = {}
         self.total_rows = self.last_mark_rows = 0
@@ -1012,6 +1078,23 @@ class PentlySong(PentlyRenderable):
         self.rehearsal_marks[markname] = (self.total_rows, fileline)
         self.last_mark_rows = self.total_rows
 
+    def set_source(self, src):
+        """Attribute conductor commands added since the last call to src."""
+        self.conductor_src.extend(
+            [src] * (len(self.conductor) - len(self.conductor_src))
+        )
+
+    conductor_sizes = {
+        'playPat': 4, 'stopPat': 4, 'noteOn': 3,
+        'setTempo': 2, 'waitRows': 2,
+    }
+
+    @classmethod
+    def get_conductor_size(self, row):
+        """Count the bytes in one element of the conductor list."""
+        cmd = row[0] if isinstance(row, tuple) else row.split(None, 1)[0]
+        return self.conductor_sizes.get(cmd, 1)
+
     def get_unclosed_msg(self):
         file, line = self.fileline
         return ("song %s began at %s line %d and was not ended with fine or dal segno"
@@ -1021,8 +1104,14 @@ class PentlySong(PentlyRenderable):
         out = ['; title: '+self.title]
         if self.author:
             out.append('; author: '+self.author)
-        for row in self.conductor:
+        out_src = [None] * len(out)
+        self.set_source(None)
+        for row, src in zip(self.conductor, self.conductor_src):
+            out_src.append(src)
             if isinstance(row, str):  # already-rendered items
+                if scopes.tempo_table and row.startswith('setTempo '):
+                    rowtempo = int(row.split()[1])
+                    row = 'setTempoEntry %d' % scopes.tempo_offsets[rowtempo]
                 out.append(prefix + row)
                 continue
             if row[0] == 'setBeatDuration':
@@ -1031,8 +1120,11 @@ class PentlySong(PentlyRenderable):
                 continue
             if row[0] == 'playPat':
                 track, patname, transpose, instrument = row[1:5]
-                patname = self.resolve_scope(patname, self.name, scopes.patterns)
-                pat = scopes.patterns[patname]
+                pat = scopes.lookup('pattern', patname, self.name, src)
+                if pat is None:
+                    out.append('; unknown pattern ' + patname)
+                    continue
+                patname = pat.name
                 if track is None: track = pat.track
                 try:
                     lowestnote = pat.transpose
@@ -1068,8 +1160,9 @@ class PentlySong(PentlyRenderable):
                 if instrument is None:
                     raise ValueError("%s: no instrument for pattern %s"
                                      % (self.name, patname))
-                instrument = self.resolve_scope(instrument, self.name, scopes.instruments)
-                instrument = scopes.instruments[instrument].asmname
+                instrument = scopes.lookup('instrument', instrument,
+                                           self.name, src)
+                instrument = instrument.asmname if instrument else '0'
                 suffix = track_suffixes[track]
                 out.append("%splayPat%s %s, %d, %s"
                            % (prefix, suffix, pat.asmname,
@@ -1080,19 +1173,178 @@ class PentlySong(PentlyRenderable):
                 continue
             if row[0] == 'noteOn':
                 ch, pitch, instrument = row[1:4]
-                instrument = self.resolve_scope(instrument, self.name, scopes.instruments)
-                instrument = scopes.instruments[instrument].asmname
+                instrument = scopes.lookup('instrument', instrument,
+                                           self.name, src)
+                instrument = instrument.asmname if instrument else '0'
                 out.append('%snoteOn%s %d, %s'
                            % (prefix, track_suffixes[ch], pitch, instrument))
                 continue
             raise ValueError(row)
 
         asmname = PentlyRenderable.get_asmname(self.name)
+        sizes = [0] * (len(out) - len(self.conductor))
+        sizes.extend(self.get_conductor_size(row) for row in self.conductor)
+        if scopes.conductor_call:
+            out, out_src, sizes = self.factor_segments(
+                out, out_src, sizes, 'PSSEG_%s_' % asmname, prefix
+            )
         self.asmname = 'PS_'+asmname
         self.asmdef = '%ssongdef PS_%s, PSDAT_%s' % (prefix, asmname, asmname)
         self.asmdataname = 'PSDAT_'+asmname
         self.asmdataprefix = ''
         self.asmdata = out
+        self.asmdata_src = out_src
+        self.asmdata_sizes = sizes
+        self.bytesize = sum(sizes) + 2
+
+    segment_barriers = {'segno', 'dalSegno', 'fine'}
+
+    @classmethod
+    def find_segment(self, keys, sizes):
+        """Find the repeated run of conductor commands that saves the most.
+
+keys -- a hashable for each command, equal for commands that can
+    share a segment and distinct for those that cannot
+sizes -- size in bytes of each command
+
+Return a tuple (bytes saved, run length, list of start indices) or
+None if no run saves bytes.
+"""
+        offsets = [0]
+        for size in sizes:
+            offsets.append(offsets[-1] + size)
+        starts_by_key = {}
+        for i, key in enumerate(keys):
+            starts_by_key.setdefault(key, []).append(i)
+        groups = [v for v in starts_by_key.values() if len(v) > 1]
+        best, runlen = None, 1
+        while groups:
+            next_groups = []
+            for starts in groups:
+                # Each start is a run of runlen identical commands.
+                # Calls can't overlap, so take them left to right.
+                used, last_end = [], 0
+                for start in starts:
+                    if start >= last_end:
+                        used.append(start)
+                        last_end = start + runlen
+                runbytes = offsets[starts[0] + runlen] - offsets[starts[0]]
+                # The segment costs its body plus a return, and each
+                # call is 3 bytes
+                saved = len(used) * (runbytes - 3) - runbytes - 1
+                if saved > 0 and (best is None or saved > best[0]):
+                    best = saved, runlen, used
+
+                longer = {}
+                for start in starts:
+                    if start + runlen < len(keys):
+                        longer.setdefault(keys[start + runlen], []).append(start)
+                next_groups.extend(v for v in longer.values() if len(v) > 1)
+            groups, runlen = next_groups, runlen + 1
+        return best
+
+    @classmethod
+    def factor_segments(self, out, out_src, sizes, label_prefix, prefix=''):
+        """Move repeated runs of conductor commands into segments.
+
+out -- rendered conductor lines, each a macro call or a comment
+out_src -- source position of each line
+sizes -- size in bytes of each line
+label_prefix -- start of segment labels, followed by a number
+
+Each run becomes a segment after the end of the song, ending with
+returnSegment, and each use of the run becomes callSegment.  The
+engine remembers one return address, so segments do not nest.
+Segments never contain segno, dalSegno, or fine.
+
+Return a tuple (out, out_src, sizes).
+"""
+        # Comments such as the end time of a waitRows don't count
+        # when comparing commands
+        keys = []
+        for i, (line, size) in enumerate(zip(out, sizes)):
+            cmd = line.split(';', 1)[0].strip()
+            barrier = cmd[len(prefix):] in self.segment_barriers
+            keys.append(cmd if size and not barrier else (i,))
+        out, out_src, sizes = list(out), list(out_src), list(sizes)
+
+        segments = []
+        while True:
+            found = self.find_segment(keys, sizes)
+            if not found: break
+            _, runlen, starts = found
+            label = '%s%d' % (label_prefix, len(segments))
+            first = starts[0]
+            body = [row[first:first + runlen]
+                    for row in (keys, out_src, sizes)]
+            segments.append((label, body))
+
+            # Replace each use, right to left so that indices stay valid
+            for start in reversed(starts):
+                end = start + runlen
+                line = "%scallSegment %s" % (prefix, label)
+                comments = [s.split(';', 1)[1] for s in out[start:end]
+                            if ';' in s]
+                if comments:
+                    line = "%s  ;%s" % (line, comments[-1])
+                keys[start:end] = [(label, start)]
+                out[start:end] = [line]
+                out_src[start:end] = [out_src[start]]
+                sizes[start:end] = [3]
+
+        for label, (body_keys, body_src, body_sizes) in segments:
+            out.append(label + ':')
+            out.extend(body_keys)
+            out.append(prefix + 'returnSegment')
+            out_src.append(None)
+            out_src.extend(body_src)
+            out_src.append(None)
+            sizes.append(0)
+            sizes.extend(body_sizes)
+            sizes.append(1)
+        return out, out_src, sizes
+
+class PentlyNote(object):
+    """A note, rest, wait, or drum in a pattern.
+
+pitch -- semitone number, 'r' for rest, 'w' for wait, or drum name
+arp -- arpeggio for this note or None
+rows -- duration in rows, or negative for a grace note of -rows frames
+slur -- a tie or slur marking ('~', '(', ')', or ''), which
+    collapse_ties() replaces with True if slurred into the next note
+"""
+    __slots__ = ('pitch', 'arp', 'rows', 'slur')
+
+    def __init__(self, pitch, rows, slur, arp=None):
+        self.pitch, self.arp, self.rows, self.slur = pitch, arp, rows, slur
+
+    def __repr__(self):
+        return "PentlyNote(%r, %r, %r, arp=%r)" % (
+            self.pitch, self.rows, self.slur, self.arp
+        )
+
+class PentlyPatternEffect(object):
+    """An effect in a pattern, such as an instrument or arpeggio change.
+
+opcode -- one of the PATFX_* constants
+arg -- formatted argument, such as '$47', or None; for
+    PATFX_INSTRUMENT, the name of the instrument
+"""
+    __slots__ = ('opcode', 'arg')
+
+    def __init__(self, opcode, arg=None):
+        self.opcode, self.arg = opcode, arg
+
+    def __repr__(self):
+        return "PentlyPatternEffect(%s, %r)" % (
+            pattern_effect_names[self.opcode], self.arg
+        )
+
+    def render(self, prefix=''):
+        name = pattern_effect_names[self.opcode]
+        if self.arg is None:
+            return prefix + name
+        return "%s%s,%s" % (prefix, name, self.arg)
 
 class PentlyPattern(PentlyRenderable):
 
@@ -1104,6 +1356,7 @@ class PentlyPattern(PentlyRenderable):
         self.rhyctx = PentlyRhythmContext(rhyctx)
         self.rhyctx.last_duration = None
         self.instrument, self.track, self.notes = instrument, track, []
+        self.notes_src = []
         self.transpose_runs = self.transpose = None
 
         # TODO: The fallthrough feature is currently sort of broken
@@ -1123,6 +1376,10 @@ class PentlyPattern(PentlyRenderable):
     def set_fallthrough(self, value):
         self.fallthrough = bool(value)
 
+    def set_source(self, src):
+        """Attribute notes and effects added since the last call to src."""
+        self.notes_src.extend([src] * (len(self.notes) - len(self.notes_src)))
+
     noteRE = re.compile(r"""
 (>*|<*)           # MML style octave
 ([a-hwprlq])      # note name
@@ -1188,8 +1445,11 @@ Return the fixed notematch as (pitch, rows, slur) or None if non-note.
 """
         f = self.rhyctx.fix_note_duration(notematch)
         if f:
-            self.notes.append(f)
-            rowduration = f[1]
+            pitch, rowduration, slur = f
+            arp = None
+            if isinstance(pitch, tuple):
+                pitch, arp = pitch
+            self.notes.append(PentlyNote(pitch, rowduration, slur, arp))
             if rowduration > 0:
                 self.rhyctx.add_rows(rowduration)
         return f
@@ -1220,7 +1480,8 @@ EN(-?(?:
 
         volmatch = volcodes.get(word)
         if volmatch is not None:
-            self.notes.append("CHVOLUME,%d" % volmatch)
+            self.notes.append(PentlyPatternEffect(PATFX_CHVOLUME,
+                                                  "%d" % volmatch))
             return
 
         if word == '|':  # Bar check
@@ -1239,9 +1500,9 @@ EN(-?(?:
         if arpmatch:
             arpvalue = arpmatch.group(1)
             if arpvalue == 'P1':
-                self.notes.append("FASTARP")
+                self.notes.append(PentlyPatternEffect(PATFX_FASTARP))
             elif arpvalue == 'P2':
-                self.notes.append("SLOWARP")
+                self.notes.append(PentlyPatternEffect(PATFX_SLOWARP))
             else:
                 self.pitchctx.set_arp(arpvalue)
             return
@@ -1256,7 +1517,7 @@ EN(-?(?:
             bendhex = slidematch.group(1)
             if bendhex == 'OF':
                 bendhex = '00'
-            self.notes.append("BEND,$"+bendhex)
+            self.notes.append(PentlyPatternEffect(PATFX_BEND, "$"+bendhex))
             return
         if word.startswith("EP") and not slidematch:
             self.warn("malformed portamento %s" % repr(word))
@@ -1273,13 +1534,13 @@ EN(-?(?:
             else:
                 vibargument = int(vibargument, 16)
                 vibargument = "%d" % min(vibargument, 4)
-            self.notes.append("VIBRATO,"+vibargument)
+            self.notes.append(PentlyPatternEffect(PATFX_VIBRATO, vibargument))
             return
 
         # @ marks are instrument changes.  Resolve them later
         # once asmname values have been assigned.
         if word.startswith('@'):
-            self.notes.append(word)
+            self.notes.append(PentlyPatternEffect(PATFX_INSTRUMENT, word[1:]))
             return
 
         if self.pitchctx.octave_mode is None:
@@ -1322,8 +1583,7 @@ EN(-?(?:
     def find_transpose_runs(data):
         """Break a list into runs of pitches up to 24 semitones apart.
 
-Elements that are strings are ignored, as are sequences whose first
-element is not an int.
+Effects are ignored, as are notes whose pitch is not an int.
 
 Return a list of tuples, one for each run
 [starting index of run, lowest semitone in run, highest semitone in run]
@@ -1331,9 +1591,9 @@ Return a list of tuples, one for each run
 """
         runs = [[0, None, None]]
         for i, note in enumerate(data):
-            if isinstance(note, str):
+            if not isinstance(note, PentlyNote):
                 continue
-            pitch = note[0]
+            pitch = note.pitch
             if not isinstance(pitch, int):
                 continue
             lo = hi = pitch
@@ -1346,55 +1606,53 @@ Return a list of tuples, one for each run
         return [tuple(i) for i in runs]
 
     @staticmethod
-    def collapse_ties(notes, tie_rests=False):
+    def collapse_ties(notes, tie_rests=False, srcs=None):
         """Interpret slur commands; combine w notes and slurred same-pitch notes.
 
-notes -- iterable of (pitch, numrows, slur) sequences
+notes -- iterable of PentlyNote and PentlyPatternEffect
 tie_rests -- True if track has no concept of a "note off"
+srcs -- source position of each element of notes, or None
 
+Notes are modified in place.  Return (notes, srcs), where a combined
+note takes the source position of its first part.
 """
+        notes = list(notes)
+        srcs = list(srcs) if srcs is not None else [None] * len(notes)
 
         # Convert tie/slur notations ~, (, and ) to true/false
         sluropen = False
-        slurnotes = []
         for note in notes:
-            if isinstance(note, str):
-                slurnotes.append(note)
+            if not isinstance(note, PentlyNote):
                 continue
-
-            pitch, numrows, slur = note
+            slur = note.slur
             if slur == '(':
                 sluropen = True
             elif slur == ')':
                 sluropen = False
-            slur = sluropen or slur == '~'
-            slurnotes.append((pitch, numrows, slur))
-        notes = slurnotes
+            note.slur = sluropen or slur == '~'
 
-        out = []
+        out, out_src = [], []
         lastwasnote = hasnote = False
         curarp = None
-        for note in notes:
-            if isinstance(note, str):
+        for note, src in zip(notes, srcs):
+            if not isinstance(note, PentlyNote):
                 lastwasnote = False
                 out.append(note)
+                out_src.append(src)
                 continue
 
-            pitch, numrows, slur = note
-            if isinstance(pitch, tuple):
-                pitch, arp = pitch
-            else:
-                arp = None
-
+            pitch, numrows, slur, arp = note.pitch, note.rows, note.slur, note.arp
             if arp is not None and arp != curarp:
                 arp = str(arp)
-                out.append("ARPEGGIO,$" + arp)
+                out.append(PentlyPatternEffect(PATFX_ARPEGGIO, "$" + arp))
+                out_src.append(src)
                 lastwasnote = False
                 curarp = arp
+            note.arp = None
 
             # slur
             if tie_rests and pitch == 'r':
-                pitch = 'w'
+                note.pitch = pitch = 'w'
             # Initial wait becomes a rest
             # 2024-01-16: Removing, as it might have caused the
             # problems I observed in Mega Mountain
@@ -1404,44 +1662,52 @@ tie_rests -- True if track has no concept of a "note off"
             if (lastwasnote
                 and numrows > 0
                 and (pitch == 'w'
-                     or (out[-1][0] == pitch and out[-1][2]))):
-                out[-1][1] += numrows
-                out[-1][2] = slur
+                     or (out[-1].pitch == pitch and out[-1].slur))):
+                out[-1].rows += numrows
+                out[-1].slur = slur
             else:
-                out.append([pitch, numrows, slur])
+                out.append(note)
+                out_src.append(src)
             lastwasnote = hasnote = True
-        return [tuple(i) if not isinstance(i, str) else i for i in out]
+        return out, out_src
 
     @staticmethod
-    def collapse_effects(notes):
+    def collapse_effects(notes, srcs):
 
         # Size optimization: If there are only rests and other effect
         # changes between an arp and the following arp, not notes or
         # waits, remove the first of the two.
-        rnotes = []
+        rnotes, rsrcs = [], []
         keep_prev_arp = True
-        for item in reversed(notes):
-            if isinstance(item, str):
-                if item.startswith("ARPEGGIO,$"):
+        for item, src in zip(reversed(notes), reversed(srcs)):
+            if not isinstance(item, PentlyNote):
+                if item.opcode == PATFX_ARPEGGIO:
                     if not keep_prev_arp:
                         continue
                     keep_prev_arp = False
-            elif item[0] != 'r':
+            elif item.pitch != 'r':
                 keep_prev_arp = True
             rnotes.append(item)
+            rsrcs.append(src)
         rnotes.reverse()
+        rsrcs.reverse()
 
         # Size optimization: Remove instruments identical to the
         # previous with no notes or waits in between
         # TODO
 
-        return rnotes
+        return rnotes, rsrcs
 
     def make_final(self):
         """Collapse ties, collapse arpeggio effects, and calculate transpose runs"""
         pitched = self.track != 'drum'
-        self.notes = self.collapse_ties(self.notes, not pitched)
-        self.notes = self.collapse_effects(self.notes)
+        self.set_source(None)
+        self.notes, self.notes_src = self.collapse_ties(
+            self.notes, not pitched, self.notes_src
+        )
+        self.notes, self.notes_src = self.collapse_effects(
+            self.notes, self.notes_src
+        )
         if self.track == 'drum':
             self.transpose = self.lowest_note = self.highest_note = None
             self.transpose_runs = []
@@ -1466,10 +1732,69 @@ tie_rests -- True if track has no concept of a "note off"
             yield ormask
             numrows -= dur
 
+    @staticmethod
+    def pack_repeats(bytedata, bytedata_src, prefix=''):
+        """Replace repeated runs of pattern commands with REPEAT.
+
+bytedata -- list of comma-separated pattern commands, each with its
+    arguments
+bytedata_src -- source position of each command
+
+A run played k + 1 times in a row becomes one copy followed by
+REPEAT,k,distance, where distance is the run's length plus 2.  The
+engine keeps one repeat count per track, so repeats do not nest.
+Choose the set of repeats that saves the most bytes.
+
+Return a tuple (bytedata, bytedata_src).
+"""
+        num_cmds = len(bytedata)
+        ids, cmd_ids = [], {}
+        offsets = [0]
+        for cmd in bytedata:
+            ids.append(cmd_ids.setdefault(cmd, len(cmd_ids)))
+            offsets.append(offsets[-1] + len(cmd.split(',')))
+
+        # best[i] is the most bytes saved from command i to the end,
+        # and choice[i] is the (run length, repeat count) that does it
+        best = [0] * (num_cmds + 1)
+        choice = [None] * (num_cmds + 1)
+        for i in range(num_cmds - 1, -1, -1):
+            best[i], choice[i] = best[i + 1], None
+            for runlen in range(1, (num_cmds - i) // 2 + 1):
+                runbytes = offsets[i + runlen] - offsets[i]
+                if runbytes > 253: break
+                if ids[i + runlen] != ids[i]: continue
+                run = ids[i:i + runlen]
+                end = i + runlen
+                for count in range(1, 256):
+                    if ids[end:end + runlen] != run: break
+                    end += runlen
+                    saved = count * runbytes - 3 + best[end]
+                    if saved > best[i]:
+                        best[i], choice[i] = saved, (runlen, count)
+        if not best[0]:
+            return bytedata, bytedata_src
+
+        out, out_src, i = [], [], 0
+        while i < num_cmds:
+            if not choice[i]:
+                out.append(bytedata[i])
+                out_src.append(bytedata_src[i])
+                i += 1
+                continue
+            runlen, count = choice[i]
+            runbytes = offsets[i + runlen] - offsets[i]
+            out.extend(bytedata[i:i + runlen])
+            out_src.extend(bytedata_src[i:i + runlen])
+            out.append("%sREPEAT,%d,%d" % (prefix, count, runbytes + 2))
+            out_src.append(bytedata_src[i + runlen])
+            i += runlen * (count + 1)
+        return out, out_src
+
     def render(self, scopes, prefix=''):
         is_drum = self.track == 'drum'
 
-        bytedata = []
+        bytedata, bytedata_src = [], []
         transpose_runs, cur_transpose = self.transpose_runs, self.transpose
         last_slur = False
 
@@ -1484,24 +1809,29 @@ tie_rests -- True if track has no concept of a "note off"
                  or cur_transpose + 24 < transpose_runs[0][2])):
             transpose_pos = 0
 
+        src = None
         for i, note in enumerate(self.notes):
+            bytedata_src.extend([src] * (len(bytedata) - len(bytedata_src)))
+            src = self.notes_src[i]
             if (transpose_runs
                 and transpose_pos < len(transpose_runs)
                 and i >= transpose_runs[transpose_pos][0]):
                 new_transpose = transpose_runs[transpose_pos][1]
                 bytedata.append("%sTRANSPOSE,<%d"
                                 % (prefix, new_transpose - cur_transpose))
+                bytedata_src.append(src)
                 cur_transpose = new_transpose
                 transpose_pos += 1
-            if isinstance(note, str):
-                if note.startswith('@'):
-                    instname = self.resolve_scope(note[1:], self.name, scopes.instruments)
-                    note = 'INSTRUMENT,' + scopes.instruments[instname].asmname
-                bytedata.append(prefix+note)
+            if not isinstance(note, PentlyNote):
+                if note.opcode == PATFX_INSTRUMENT:
+                    inst = scopes.lookup('instrument', note.arg,
+                                         self.name, src)
+                    note = PentlyPatternEffect(
+                        PATFX_INSTRUMENT, inst.asmname if inst else '0'
+                    )
+                bytedata.append(note.render(prefix))
                 continue
-            if len(note) != 3:
-                self.warn("internal: bad element count in "+repr(note))
-            pitch, numrows, slur = note
+            pitch, numrows, slur = note.pitch, note.rows, note.slur
             if isinstance(pitch, int):
                 offset = pitch - cur_transpose
                 assert 0 <= offset <= 24
@@ -1511,8 +1841,8 @@ tie_rests -- True if track has no concept of a "note off"
             elif pitch == 'w':  # usually a tie after an @-command
                 pitchcode = 'N_TIE'
             elif is_drum:
-                drumname = self.resolve_scope(pitch, self.name, scopes.drums)
-                pitchcode = 'DR_' + self.get_asmname(drumname)
+                drum = scopes.lookup('drum', pitch, self.name, src)
+                pitchcode = 'DR_' + self.get_asmname(drum.name if drum else pitch)
             else:
                 raise ValueError("unknown pitch %s" % pitch)
 
@@ -1536,11 +1866,18 @@ tie_rests -- True if track has no concept of a "note off"
                 bytedata.append("%sLEGATO_%s"
                                 % (prefix, "ON" if slur else "OFF"))
 
+        bytedata_src.extend([src] * (len(bytedata) - len(bytedata_src)))
+
         # Transpose back to start at end of pattern
         if transpose_runs and cur_transpose != self.transpose:
             bytedata.append("%sTRANSPOSE,<%d"
                             % (prefix, self.transpose - cur_transpose))
         if not self.fallthrough: bytedata.append(prefix + 'PATEND')
+        bytedata_src.extend([None] * (len(bytedata) - len(bytedata_src)))
+        if scopes.pattern_repeat:
+            bytedata, bytedata_src = self.pack_repeats(
+                bytedata, bytedata_src, prefix
+            )
 
         asmname = self.get_asmname(self.name)
         self.asmdef = '%spatdef PP_%s, PPDAT_%s' % (prefix, asmname, asmname)
@@ -1548,7 +1885,9 @@ tie_rests -- True if track has no concept of a "note off"
         self.asmdataname = 'PPDAT_'+asmname
         self.asmdataprefix = '.byte '
         self.asmdata = bytedata
-        self.bytesize = sum(len(s.split(',')) for s in bytedata) + 2
+        self.asmdata_src = bytedata_src
+        self.asmdata_sizes = [len(s.split(',')) for s in bytedata]
+        self.bytesize = sum(self.asmdata_sizes) + 2
 
 # Parse the score into objects ######################################
 
@@ -1557,9 +1896,72 @@ def relpathjoin(basepath, filename):
         return filename
     return os.path.join(os.path.dirname(basepath), filename)
 
+class PentlyScopeIndex(object):
+    """Look up names of objects relative to the song or pattern using them.
+
+A name starting with :: refers to that name at top level.  Otherwise,
+a name used in scope a::b refers to a::b::name if it exists, then
+a::name, then name at top level.
+"""
+
+    def __init__(self, existing):
+        """Index the names in a dict of objects keyed by scoped name."""
+        self.existing = existing
+        self.by_scope, self.parents, self.cache = {}, {}, {}
+        for key in existing:
+            parts = key.split('::')
+            for i in range(1, len(parts)):
+                self.by_scope.setdefault(('::'.join(parts[:i]),
+                                          '::'.join(parts[i:])), key)
+
+    def get_parents(self, scope):
+        """List a scope and its enclosing scopes, innermost first."""
+        try:
+            return self.parents[scope]
+        except KeyError:
+            pass
+        parts = scope.split('::') if scope else []
+        out = ['::'.join(parts[:i]) for i in range(len(parts), 0, -1)]
+        self.parents[scope] = out
+        return out
+
+    def resolve(self, scoped_name, parent_scope):
+        """Find the full name of scoped_name used in parent_scope.
+
+If no object is found, return the name at top level.
+"""
+        cachekey = scoped_name, parent_scope
+        try:
+            return self.cache[cachekey]
+        except KeyError:
+            pass
+        result = None
+        if scoped_name.startswith('::'):
+            result = scoped_name.lstrip(':')
+        else:
+            for scope in self.get_parents(parent_scope):
+                result = self.by_scope.get((scope, scoped_name))
+                if result is not None: break
+        if result is None:
+            result = scoped_name
+        self.cache[cachekey] = result
+        return result
+
 class PentlyInputParser(object):
 
-    def __init__(self, filename=None):
+    def __init__(self, filename=None, include_resolver=None, recover=False):
+        """Set up a parser for one score.
+
+filename -- name of the score, used in diagnostics and to find
+    included files
+include_resolver -- function taking the path of an included file,
+    relative to the current directory, and returning an iterable of
+    its lines, or None to open the file
+recover -- if true, add each error to errors and skip to the next
+    line starting with a keyword instead of raising an exception
+"""
+        self.include_resolver, self.recover = include_resolver, recover
+        self.errors, self.skipping = [], False
         self.sfxs = {}
         self.drums = {}
         self.instruments = {}
@@ -1572,18 +1974,72 @@ class PentlyInputParser(object):
         self.rhyctx = PentlyRhythmContext()
         self.pitchctx = PentlyPitchContext()
         self.unk_keywords = self.total_lines = 0
+        self.cur_line = ''
+        self.scope_index = None
+        self.unresolved = []
+        self.included_files = []
         self.warnings = []
         self.filename = filename or os.path.basename(sys.argv[0])
         self.title = self.author = self.copyright = "<?>"
+        self.pattern_repeat = self.conductor_call = False
+        self.tempo_table, self.tempo_scales = False, 1
+        self.tempo_offsets = {}
+        self.tempo_rounding = frozenset()
+        self.banks, self.bank_of, self.song_banks = [], {}, {}
+        self.namespaced, self.aliases = False, {}
 
     def append(self, s):
         """Parse one line of code."""
         self.filelinestack[-1][1] += 1
         self.total_lines += 1
+        self.cur_line = s
         s = s.strip()
         if not s or s.startswith(('#', '//')):
             return
-        self.dokeyword(s.split())
+
+        # After an error, skip notes until the next keyword, as they
+        # may belong to an object whose definition failed
+        words = s.split()
+        if self.skipping:
+            if not self.is_keyword_line(words): return
+            self.skipping = False
+
+        # Attribute song and pattern data added by this line to
+        # the line's first word
+        song, pat = self.cur_song, self.cur_obj
+        pat = pat[1] if pat and pat[0] == 'pattern' else None
+        src = self.get_source_positions(len(words))[0] if song or pat else None
+        if self.recover:
+            try:
+                self.dokeyword(words)
+            except Exception as e:
+                self.add_error(str(e))
+                self.skipping = True
+                return
+        else:
+            self.dokeyword(words)
+        if song: song.set_source(src)
+        if pat: pat.set_source(src)
+
+    def is_keyword_line(self, words):
+        """Return True if a line starts with a keyword or definition."""
+        return (words[0] in self.keywordhandlers
+                or (words[0].startswith('@') and '=' in ' '.join(words)))
+
+    wordRE = re.compile(r"\S+")
+
+    def get_source_positions(self, num_words):
+        """Find the file, line, and column of words in the current line.
+
+num_words -- how many words at the end of the line to find.
+    Counting from the end finds words passed to dokeyword() after
+    an "at" command's position.
+
+Return a list of (file, line, column) tuples.
+"""
+        file, line = self.filelinestack[-1]
+        columns = [m.start() + 1 for m in self.wordRE.finditer(self.cur_line)]
+        return [(file, line, c) for c in columns[-num_words:]]
 
     def extend(self, iterable):
         """Parse an iterable of lines."""
@@ -1597,6 +2053,53 @@ class PentlyInputParser(object):
         )
         self.warnings.append((tuple(self.filelinestack[-1]), msg))
 
+    def build_scope_index(self):
+        """Index object names once parsing is complete."""
+        self.scope_index = {
+            'drum': PentlyScopeIndex(self.drums),
+            'instrument': PentlyScopeIndex(self.instruments),
+            'pattern': PentlyScopeIndex(self.patterns),
+        }
+        self.unresolved = []
+
+    def lookup(self, kind, scoped_name, parent_scope, src=None):
+        """Find the object that a name used in a song or pattern refers to.
+
+kind -- 'drum', 'instrument', or 'pattern'
+src -- position of the reference as (file, line, column) or None
+
+Return the object, or None after noting the reference for
+check_unresolved() if there is no such object.
+"""
+        if self.scope_index is None:
+            self.build_scope_index()
+        index = self.scope_index[kind]
+        name = index.resolve(scoped_name, parent_scope)
+        try:
+            return index.existing[name]
+        except KeyError:
+            pass
+        if src is None:
+            src = (self.filename, 0)
+        self.unresolved.append("%s:%d: %s refers to unknown %s %s"
+                               % (src[0], src[1], parent_scope,
+                                  kind, scoped_name))
+        return None
+
+    def check_unresolved(self):
+        """Raise ValueError listing all unknown names used in rendering."""
+        if self.unresolved:
+            raise ValueError("%d unresolved references:\n%s"
+                             % (len(self.unresolved),
+                                "\n".join(self.unresolved)))
+
+    def add_error(self, msg):
+        self.errors.extend(
+            (tuple(row), "in included file")
+            for row in self.filelinestack[:-1]
+        )
+        self.errors.append((tuple(self.filelinestack[-1]), msg))
+
     def print_warnings(self, file=None):
         if len(self.warnings) == 0: return
         outfp = file or sys.stderr
@@ -2060,7 +2563,17 @@ Used to find the target of a time, scale, durations, or notenames command.
         if not path:
             raise ValueError('include requires a path')
         path = relpathjoin(self.filelinestack[-1][0], path)
+        if path not in self.included_files:
+            self.included_files.append(path)
 
+        if self.include_resolver:
+            lines = self.include_resolver(path)
+            if isinstance(lines, str):
+                lines = lines.splitlines()
+            self.filelinestack.append([path, 0])
+            self.extend(lines)
+            del self.filelinestack[-1]
+            return
         with open(path, "r") as infp:
             self.filelinestack.append([path, 0])
             self.extend(infp)
@@ -2129,8 +2642,10 @@ Used to find the target of a time, scale, durations, or notenames command.
             return kwh(self, words)
         if self.cur_obj and self.cur_obj[0] == 'pattern':
             pat = self.cur_obj[1]
-            for word in words:
+            srcs = self.get_source_positions(len(words))
+            for word, src in zip(words, srcs):
                 pat.add_pattern_note(word)
+                pat.set_source(src)
             return
         if self.unk_keywords < 10:
             if self.cur_obj:
@@ -2143,6 +2658,630 @@ Used to find the target of a time, scale, durations, or notenames command.
                       % (repr(words[0]), type_name))
         self.unk_keywords += 1
 
+# Importing FamiTracker text exports ################################
+
+ft_notesemis = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+ft_channel_tracks = ['pulse1', 'pulse2', 'triangle', 'drum']
+ft_channel_abbrs = ['sq1', 'sq2', 'tri', 'noise']
+ft_unsupported_effects = {
+    '1': 'pitch slide (1xx, 2xx)', '2': 'pitch slide (1xx, 2xx)',
+    '7': 'tremolo (7xy)', 'A': 'volume slide (Axy)',
+    'H': 'hardware sweep (Hxy, Ixy)', 'I': 'hardware sweep (Hxy, Ixy)',
+    'P': 'detune (Pxx)', 'Q': 'note slide (Qxy, Rxy)',
+    'R': 'note slide (Qxy, Rxy)', 'V': 'timbre override (Vxx)',
+}
+
+class FamiTrackerTrack(object):
+    """One song in a FamiTracker module."""
+
+    def __init__(self, rows, speed, tempo, name, fileline):
+        self.rows, self.speed, self.tempo = rows, speed, tempo
+        self.name, self.fileline = name, fileline
+        self.orders, self.order_lines = [], []
+        # patterns[channel, number][row] is (words, line, column)
+        self.patterns = {}
+
+class FamiTrackerImporter(object):
+    """Convert a FamiTracker text export into objects in a parser.
+
+FamiTracker's File > Export text writes a module as lines of the form
+KEYWORD arguments, described in the help file's "Text export" page.
+2A03 instruments become instruments, notes on the noise channel
+become drums, each track becomes a song, and each pattern that a
+frame plays on a channel becomes a pattern in that song.
+
+Use extend() to read the whole export, then build() to create the
+objects, as frames can be listed before the patterns they play.
+"""
+
+    header = "# FamiTracker text export"
+    quotedRE = re.compile(r'"((?:[^"\\]|\\.)*)"')
+    escapeRE = re.compile(r'\\(.)')
+    noteRE = re.compile(r"([A-G])([-#])([0-9])$")
+    noisenoteRE = re.compile(r"([0-9A-F])-#$")
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.filename = parser.filelinestack[-1][0]
+        self.macros, self.ft_instruments, self.tracks = {}, {}, []
+        self.instnames, self.drumnames = {}, {}
+        self.built_instruments = set()
+        self.unsupported = {}
+        self.split = 32
+        self.lineno = 0
+
+    @classmethod
+    def is_text_export(self, line):
+        """Return True if the first line of a file is a text export header."""
+        return line.startswith(self.header)
+
+    def set_line(self, line):
+        """Point the parser's diagnostics at a line of the export."""
+        self.parser.filelinestack[-1][1] = line
+
+    def note_unsupported(self, feature, line=None):
+        """Remember the first use of a feature that Pently lacks."""
+        self.unsupported.setdefault(feature, line or self.lineno)
+
+    def do(self, words, line):
+        """Run a score command as if it were on a line of the export."""
+        self.set_line(line)
+        self.parser.total_lines += 1
+        self.parser.dokeyword(words)
+
+    def unquote(self, line):
+        m = self.quotedRE.search(line)
+        return self.escapeRE.sub(r"\1", m.group(1)) if m else ''
+
+    # Reading
+
+    def extend(self, lines):
+        """Read an iterable of lines of a text export."""
+        for line in lines:
+            self.lineno += 1
+            words = line.split()
+            if not words or words[0].startswith('#'):
+                continue
+            try:
+                handler = self.keywordhandlers[words[0]]
+            except KeyError:
+                if words[0].startswith('INST'):
+                    self.note_unsupported("expansion audio instruments")
+                continue
+            self.set_line(self.lineno)
+            handler(self, line, words)
+
+    def add_info(self, line, words):
+        text = self.unquote(line)
+        if text:
+            setattr(self.parser, words[0].lower(), text)
+
+    def add_framerate(self, line, words):
+        if int(words[1]):
+            self.note_unsupported("engine speed other than the default")
+
+    def add_expansion(self, line, words):
+        if int(words[1]):
+            self.note_unsupported("Famicom expansion audio")
+
+    def add_split(self, line, words):
+        self.split = int(words[1])
+
+    def add_macro(self, line, words):
+        # MACRO type index loop release setting : steps
+        head, steps = line.split(':', 1)
+        kind, index, loop, release, setting = [int(x) for x in head.split()[1:6]]
+        steps = [int(x) for x in steps.split()]
+        if steps:
+            self.macros[kind, index] = (steps, loop, release, setting)
+
+    def add_inst2a03(self, line, words):
+        # INST2A03 index volume arpeggio pitch hipitch duty "name"
+        index = int(words[1])
+        sequences = [int(x) for x in words[2:7]]
+        self.ft_instruments[index] = (sequences, self.unquote(line),
+                                      self.lineno)
+
+    def add_track(self, line, words):
+        rows, speed, tempo = [int(x) for x in words[1:4]]
+        self.tracks.append(FamiTrackerTrack(
+            rows, speed, tempo, self.unquote(line),
+            (self.filename, self.lineno)
+        ))
+        self.cur_pattern = None
+
+    def add_order(self, line, words):
+        track = self.tracks[-1]
+        frame = int(words[1], 16)
+        if frame != len(track.orders):
+            raise ValueError("expected frame %02X, not %02X"
+                             % (len(track.orders), frame))
+        track.orders.append([int(x, 16) for x in line.split(':', 1)[1].split()])
+        track.order_lines.append(self.lineno)
+
+    def add_pattern(self, line, words):
+        self.cur_pattern = int(words[1], 16)
+
+    def add_row(self, line, words):
+        track = self.tracks[-1]
+        cells = line.split(':')
+        row = int(cells[0].split()[1], 16)
+        column = len(cells[0]) + 3
+        for channel, cell in enumerate(cells[1:6]):
+            cellwords = cell.split()
+            if all(c == '.' for word in cellwords for c in word):
+                column += len(cell) + 1
+                continue
+            if channel == 4 and cellwords[0] != '...':
+                self.note_unsupported("DPCM")
+            # Keep DPCM cells for their Bxx, Cxx, Dxx, and Fxx effects
+            pat = track.patterns.setdefault((channel, self.cur_pattern), {})
+            pat[row] = (cellwords, self.lineno, column)
+            column += len(cell) + 1
+
+    keywordhandlers = {
+        'TITLE': add_info,
+        'AUTHOR': add_info,
+        'COPYRIGHT': add_info,
+        'FRAMERATE': add_framerate,
+        'EXPANSION': add_expansion,
+        'SPLIT': add_split,
+        'MACRO': add_macro,
+        'INST2A03': add_inst2a03,
+        'TRACK': add_track,
+        'ORDER': add_order,
+        'PATTERN': add_pattern,
+        'ROW': add_row,
+    }
+
+    # Instruments and drums
+
+    def get_macro_steps(self, kind, index, line):
+        """Get the steps of a macro up to its release point.
+
+Return a list of steps with '|' before the loop point, or None if
+the instrument does not use this kind of macro.
+"""
+        try:
+            steps, loop, release, setting = self.macros[kind, index]
+        except KeyError:
+            return None
+        if kind == 1 and setting != 0:
+            self.note_unsupported("fixed and relative arpeggio envelopes",
+                                  line)
+            return None
+        if release >= 0:
+            steps = steps[:release + 1]
+            if loop > release: loop = -1
+        steps = [str(x) for x in steps]
+        if 0 <= loop < len(steps):
+            if kind == 0 and len(set(steps[loop:])) > 1:
+                self.note_unsupported("looping volume envelopes", line)
+            steps.insert(loop, '|')
+        return steps
+
+    @staticmethod
+    def get_safe_name(name):
+        return '_'.join(c for c in PentlyRenderable.nonalnumRE.split(name) if c)
+
+    def name_instruments(self):
+        for index in sorted(self.ft_instruments):
+            name = self.get_safe_name(self.ft_instruments[index][1])
+            if not name or name[0].isdigit() or name in self.instnames.values():
+                name = ("inst%02X_%s" % (index, name)).rstrip('_')
+            self.instnames[index] = name
+
+    def get_instname(self, index):
+        """Get the name of an instrument, making it on first use.
+
+Instruments used only for drums are not made.  Call this only
+while no song is open so that all songs share the instrument.
+"""
+        name = self.instnames[index]
+        if index not in self.built_instruments:
+            self.built_instruments.add(index)
+            self.build_instrument(index, name)
+        return name
+
+    def get_default_instname(self):
+        """Get an instrument for pitched patterns that never set one."""
+        if self.instnames:
+            return self.get_instname(min(self.instnames))
+        if 'ft_default' not in self.parser.instruments:
+            self.do(['instrument', 'ft_default'], self.lineno)
+        return 'ft_default'
+
+    def build_instrument(self, index, name):
+        (volume, arp, pitch, hipitch, duty), _, line = self.ft_instruments[index]
+        self.do(['instrument', name], line)
+        volume = self.get_macro_steps(0, volume, line) or ['15']
+        self.do(['volume'] + [x for x in volume if x != '|'], line)
+        timbre = self.get_macro_steps(4, duty, line) or ['0']
+        self.do(['timbre'] + [x if x == '|' else str(int(x) & 3)
+                              for x in timbre], line)
+        arp = self.get_macro_steps(1, arp, line)
+        if arp:
+            self.do(['pitch'] + arp, line)
+        self.check_pitch_macros(pitch, hipitch, line)
+
+    def check_pitch_macros(self, pitch, hipitch, line):
+        if (2, pitch) in self.macros or (3, hipitch) in self.macros:
+            self.note_unsupported("pitch and hi-pitch envelopes", line)
+
+    def get_drum(self, index, pitch, speed):
+        """Find or make a drum playing a noise pitch with an instrument.
+
+Drums are made at top level so that all songs share them.
+"""
+        key = index, pitch
+        try:
+            return self.drumnames[key]
+        except KeyError:
+            pass
+        instname = self.instnames.get(index, "inst%02X" % index)
+        sfxname = "noise_%X_%s" % (pitch, instname)
+        try:
+            (volume, arp, pitch_seq, hipitch, duty), _, line = self.ft_instruments[index]
+        except KeyError:
+            volume = arp = pitch_seq = hipitch = duty = -1
+            line = self.lineno
+        self.check_pitch_macros(pitch_seq, hipitch, line)
+        self.do(['sfx', sfxname, 'on', 'noise'], line)
+
+        # A noise note sounds until the next note.  Hold the last
+        # step for at least a row so that it isn't cut short.
+        volume = [x for x in self.get_macro_steps(0, volume, line) or ['15']
+                  if x != '|']
+        if volume[-1] != '0' and len(volume) < speed:
+            volume.extend([volume[-1]] * (speed - len(volume)))
+        self.do(['volume'] + volume, line)
+        arp = self.get_macro_steps(1, arp, line) or ['0']
+        self.do(['pitch'] + [x if x == '|' else str(min(max(pitch + int(x), 0), 15))
+                             for x in arp], line)
+        timbre = self.get_macro_steps(4, duty, line)
+        if timbre:
+            self.do(['timbre'] + [x if x == '|' else str(int(x) & 1)
+                                  for x in timbre], line)
+        drumname = sfxname + "_d"
+        self.do(['drum', drumname, sfxname], line)
+        self.drumnames[key] = drumname
+        return drumname
+
+    # Songs and patterns
+
+    @staticmethod
+    def get_frame_cells(track, frame, row):
+        """List the cells that the channels of a frame play on one row."""
+        out = []
+        for channel, patnum in enumerate(track.orders[frame][:5]):
+            try:
+                out.append(track.patterns[channel, patnum][row])
+            except KeyError:
+                pass
+        return out
+
+    def walk_frames(self, track):
+        """Follow jumps to find the order in which a track plays frames.
+
+Return (list of (frame, rows played), frame to loop to or None if
+the track halts).
+"""
+        order, visited, frame = [], set(), 0
+        while True:
+            if frame >= len(track.orders):
+                frame = 0
+            if frame in visited:
+                return order, frame
+            visited.add(frame)
+            length, next_frame, halt = track.rows, frame + 1, False
+            for row in range(track.rows):
+                for words, line, _ in self.get_frame_cells(track, frame, row):
+                    for effect in words[3:]:
+                        if effect[0] == 'B':
+                            length, next_frame = row + 1, int(effect[1:], 16)
+                        elif effect[0] == 'C':
+                            length, halt = row + 1, True
+                        elif effect[0] == 'D':
+                            length = row + 1
+                            if effect[1:] != '00':
+                                self.note_unsupported(
+                                    "jumping into the middle of a pattern (Dxx)",
+                                    line
+                                )
+                if length <= row + 1:
+                    break
+            order.append((frame, length))
+            if halt:
+                return order, None
+            frame = next_frame
+
+    def convert_pattern(self, track, channel, patnum, start_inst):
+        """Convert the rows of one pattern on one channel to notes.
+
+start_inst -- index of the instrument playing on the channel when
+    this pattern first plays, for drums on the noise channel
+
+Return (list of (PentlyNote or PentlyPatternEffect, src), instrument
+name to play the pattern with or None, list of (row, instrument
+index), list of (row, True if a note starts or False if it stops),
+True if the pattern plays no notes or drums).  Drums on noise do not
+hold past their row, so they count toward the last but not the others.
+"""
+        rows = track.patterns.get((channel, patnum), {})
+        is_noise = channel == 3
+        speed = track.speed
+        notes, inst_changes, note_changes = [], [], []
+        cur_inst = start_inst if is_noise else None
+        first_inst, started, has_drums = None, False, False
+        cur_vol = cur_arp = None
+        for row in range(track.rows):
+            try:
+                words, line, column = rows[row]
+            except KeyError:
+                notes.append((PentlyNote('w', 1, ''), None))
+                continue
+            src = (self.filename, line, column)
+            note, inst, vol = words[0], words[1], words[2]
+            delay = cut = 0
+            for effect in words[3:]:
+                fx = effect[0]
+                if fx == '.' or fx in 'BCDF':
+                    continue
+                arg = int(effect[1:], 16)
+                if fx == 'G':
+                    delay = arg
+                elif fx == 'S':
+                    cut = arg
+                elif is_noise:
+                    self.note_unsupported(
+                        "effects on noise other than Gxx and Sxx", line
+                    )
+                elif fx == '0':
+                    if arg != cur_arp:
+                        notes.append((PentlyPatternEffect(
+                            PATFX_ARPEGGIO, "$%02X" % arg
+                        ), src))
+                        cur_arp = arg
+                elif fx == '3':
+                    notes.append((PentlyPatternEffect(
+                        PATFX_BEND, self.get_bend_rate(arg)
+                    ), src))
+                elif fx == '4':
+                    # Pently's vibrato has speed 5 and depth 1, 3, 5, or 7
+                    depth = min((arg & 0x0F) + 1 >> 1, 4)
+                    notes.append((PentlyPatternEffect(
+                        PATFX_VIBRATO, "%d" % depth
+                    ), src))
+                else:
+                    self.note_unsupported(
+                        ft_unsupported_effects.get(fx, "effect %sxx" % fx),
+                        line
+                    )
+            if not 0 <= delay < speed or not 0 <= cut < speed:
+                self.note_unsupported("delays spanning more than a row (Gxx, Sxx)",
+                                      line)
+                delay = cut = 0
+
+            if vol != '.' and channel < 2:
+                # Round to 25%, 50%, 75%, or 100%
+                vol = min(int(vol, 16) + 2 >> 2, 4) or 1
+                if vol != cur_vol:
+                    notes.append((PentlyPatternEffect(PATFX_CHVOLUME, "%d" % vol), src))
+                    cur_vol = vol
+            elif vol != '.' and channel == 3:
+                self.note_unsupported("volume column on noise", line)
+
+            is_note = note not in ('...', '---', '===')
+            if is_note and inst != '..':
+                index = int(inst, 16)
+                if index not in self.instnames:
+                    self.note_unsupported("instruments other than 2A03", line)
+                elif index != cur_inst or not started:
+                    inst_changes.append((row, index))
+                    if is_noise:
+                        pass
+                    elif not started:
+                        first_inst = self.get_instname(index)
+                    else:
+                        notes.append((PentlyPatternEffect(
+                            PATFX_INSTRUMENT, self.get_instname(index)
+                        ), src))
+                    cur_inst = index
+            if is_note:
+                started = True
+
+            if note == '===':
+                self.note_unsupported("note release (===)", line)
+            if not is_note:
+                pitch = 'w' if note == '...' or is_noise else 'r'
+            elif is_noise:
+                m = self.noisenoteRE.match(note)
+                if not m:
+                    raise ValueError("%s is not a noise pitch" % note)
+                if cur_inst is None:
+                    raise ValueError("no instrument for noise note %s" % note)
+                pitch = self.get_drum(cur_inst, int(m.group(1), 16), speed)
+                has_drums = True
+            else:
+                m = self.noteRE.match(note)
+                if not m:
+                    raise ValueError("%s is not a note" % note)
+                # FamiTracker A-1 is 55 Hz, Pently's lowest pitch
+                pitch = (ft_notesemis[m.group(1)] + (m.group(2) == '#')
+                         + 12 * int(m.group(3)) - 21)
+                if pitch < 0:
+                    self.note_unsupported("notes below A-1", line)
+                    pitch %= 12
+            if pitch != 'w':
+                note_changes.append((row, pitch != 'r' and not is_noise))
+            if delay:
+                notes.append((PentlyNote('w', -delay, ''), src))
+            if cut and not is_noise:
+                notes.append((PentlyNote(pitch, -cut, ''), src))
+                pitch = 'r'
+                note_changes.append((row, False))
+            notes.append((PentlyNote(pitch, 1, ''), src))
+
+        is_silent = not (has_drums or any(
+            is_sounding for _, is_sounding in note_changes
+        ))
+        if is_noise or is_silent: first_inst = None
+        return notes, first_inst, inst_changes, note_changes, is_silent
+
+    bend_fractions = [4, 8, 12, 16, 24, 32, 48, 64, 96, 128, 192, 384]
+
+    @classmethod
+    def get_bend_rate(self, speed):
+        """Approximate a 3xx speed as a Pently portamento rate.
+
+3xx changes the period by xx units per frame, which near A-2 is
+about xx/16 semitone.
+"""
+        if speed == 0:
+            return '$00'
+        fraction = speed * 16
+        if fraction > self.bend_fractions[-1]:
+            return '$%02X' % min((fraction + 128) >> 8, 15)
+        nearest = min(range(len(self.bend_fractions)),
+                      key=lambda i: abs(self.bend_fractions[i] - fraction))
+        return '$%02X' % (0x10 + nearest)
+
+    @staticmethod
+    def get_bpm(tempo, speed):
+        """Convert FamiTracker tempo and speed to beats per minute.
+
+FamiTracker plays 24 * tempo / speed rows per minute, highlighting
+every fourth row as a beat.  Tempo 0 means speed alone sets the
+row length in frames.
+"""
+        return "%.6g" % ((tempo or 150) * 6.0 / speed)
+
+    def build_song(self, track, songnum):
+        order, loop_frame = self.walk_frames(track)
+        file, line = track.fileline
+
+        # Plan what each frame plays on each channel, converting
+        # patterns and making instruments and drums before the song
+        # opens.  A channel whose pattern plays no notes stops unless
+        # it holds a note from the previous frame past the first row.
+        converted, plan = {}, []
+        running_inst, sounding, playing = [None] * 4, [False] * 4, [None] * 4
+        for frame, length in order:
+            plays = []
+            for channel, patnum in enumerate(track.orders[frame][:4]):
+                key = channel, patnum
+                if key not in converted:
+                    converted[key] = self.convert_pattern(
+                        track, channel, patnum, running_inst[channel]
+                    )
+                _, first_inst, inst_changes, note_changes, is_silent = converted[key]
+                if is_silent and (not sounding[channel]
+                                  or note_changes[:1] == [(0, False)]):
+                    if playing[channel] is not None:
+                        plays.append((channel, None, None))
+                        playing[channel] = None
+                    sounding[channel] = False
+                    continue
+                inst = None
+                if channel < 3:
+                    inst = first_inst
+                    if inst is None and running_inst[channel] is not None:
+                        inst = self.get_instname(running_inst[channel])
+                    inst = inst or self.get_default_instname()
+                plays.append((channel, key, inst))
+                playing[channel] = key
+                for row, index in inst_changes:
+                    if row < length: running_inst[channel] = index
+                for row, is_sounding in note_changes:
+                    if row < length: sounding[channel] = is_sounding
+            plan.append((frame, length, plays))
+
+        songname = self.get_safe_name(track.name)
+        if not songname or songname[0].isdigit() or songname in self.parser.songs:
+            songname = ("song%d_%s" % (songnum + 1, songname)).rstrip('_')
+        self.do(['song', songname], line)
+        song = self.parser.cur_song
+        song.title = track.name or songname
+
+        played = sorted(set(key for _, _, plays in plan
+                            for _, key, _ in plays if key))
+        for key in played:
+            channel, patnum = key
+            rows = track.patterns.get(key)
+            patline = min(x[1] for x in rows.values()) if rows else line
+            self.do(['pattern', "%s_%02X" % (ft_channel_abbrs[channel], patnum)],
+                    patline)
+            pat = self.parser.cur_obj[1]
+            if channel == 3:
+                pat.track = pat.pitchctx.octave_mode = 'drum'
+            else:
+                pat.pitchctx.set_pitched_mode()
+            for item, src in converted[key][0]:
+                pat.notes.append(item)
+                pat.set_source(src)
+        self.parser.cur_obj = None
+
+        # Conductor track
+        speed, tempo = track.speed, track.tempo
+        self.do(['tempo', self.get_bpm(tempo, speed)], line)
+        for frame, length, plays in plan:
+            line = track.order_lines[frame]
+            src = (file, line, 1)
+            if frame != order[0][0]:
+                self.do(['mark', 'Frame', '%02X' % frame], line)
+                if frame == loop_frame:
+                    self.do(['segno'], line)
+            for channel, key, inst in plays:
+                trackname = ft_channel_tracks[channel]
+                if key is None:
+                    self.do(['stop', trackname], line)
+                    continue
+                words = ['play', "%s_%02X" % (ft_channel_abbrs[channel], key[1])]
+                if inst:
+                    words.extend(['on', trackname, 'with', inst])
+                self.do(words, line)
+            song.set_source(src)
+
+            # Wait for the frame, changing tempo at Fxx effects
+            last_row = 0
+            for row in range(length):
+                changes = [
+                    int(effect[1:], 16)
+                    for words, _, _ in self.get_frame_cells(track, frame, row)
+                    for effect in words[3:] if effect[0] == 'F'
+                ]
+                if not changes:
+                    continue
+                song.wait_rows(row - last_row)
+                last_row = row
+                for value in changes:
+                    if value >= self.split:
+                        tempo = value
+                    elif value > 0:
+                        speed = value
+                self.do(['tempo', self.get_bpm(tempo, speed)], line)
+            song.wait_rows(length - last_row)
+            song.set_source(src)
+
+        if loop_frame is None:
+            self.do(['fine'], line)
+        elif loop_frame == order[0][0]:
+            self.do(['da', 'capo'], line)
+        else:
+            self.do(['dal', 'segno'], line)
+        song.set_source(src)
+
+    def build(self):
+        """Make instruments, drums, songs, and patterns in the parser."""
+        self.name_instruments()
+        for songnum, track in enumerate(self.tracks):
+            self.build_song(track, songnum)
+        for feature, line in sorted(self.unsupported.items(),
+                                    key=lambda x: x[1]):
+            self.set_line(line)
+            self.parser.warn("FamiTracker feature not supported: " + feature)
+        self.set_line(self.lineno)
+
 # Finding pieces of data that can overlap each other ################
 
 # Perfect optimization of these is unlikely in the near future
@@ -2210,8 +3349,599 @@ def wrapdata(atoms, lineprefix, maxlength=79):
 
 MAX_REHEARSAL_MARKS = 15
 
-def render_rehearsal(parser):
-    """Render the rehearsal marks
+# Tempo table #######################################################
+
+# Frames per minute on NTSC and PAL, as in pently_fpmLo
+engine_frames_per_minute = [3606, 3000]
+TEMPO_TABLE_SCALES = 4
+
+def build_tempo_table(parser):
+    """Assign each tempo used by a song an entry in pently_tempo_table.
+
+Set parser.tempo_offsets to a dict from tempo in rows per minute to
+byte offset of its entry.  Entry 0 is the tempo that
+pently_start_music sets, followed by those that songs use in the
+order that they first use them.
+"""
+    entry_size = 2 * len(engine_frames_per_minute) * parser.tempo_scales
+    parser.tempo_offsets = {engine_initial_tempo: 0}
+    songs = sorted(parser.songs.values(), key=lambda x: x.orderkey)
+    for song in songs:
+        for row in song.conductor:
+            if isinstance(row, str) and row.startswith('setTempo '):
+                rowtempo = int(row.split()[1])
+                if rowtempo not in parser.tempo_offsets:
+                    offset = len(parser.tempo_offsets) * entry_size
+                    if offset >= 2048:
+                        raise ValueError("too many different tempos for tempo table")
+                    parser.tempo_offsets[rowtempo] = offset
+
+def iter_tempo_table(parser):
+    """Render pently_tempo_table, yielding lines.
+
+Each entry has one 16-bit word for each tempo scale and TV system:
+the fraction of a row, in units of 1/65536, that passes each frame.
+The words for NTSC and PAL at normal speed come first, followed by
+those at half, quarter, and eighth speed if parser.tempo_scales is 4.
+"""
+    yield "pently_tempo_table:"
+    for rowtempo in parser.tempo_offsets:
+        incs = [
+            max(1, int(round(rowtempo * 65536.0 / (fpm << scale))))
+            for scale in range(parser.tempo_scales)
+            for fpm in engine_frames_per_minute
+        ]
+        yield ".word %s  ; %d rows/min" % (",".join(str(x) for x in incs),
+                                          rowtempo)
+
+# Song duration #####################################################
+
+# Frame rates of NTSC and PAL in Hz, from the master clock divided by
+# the master clocks in a frame
+engine_frame_rates = [39375000 / 655171, 26601712.5 / 531960]
+tempo_rounding_modes = [
+    'segno', 'beat', 'pulse1', 'pulse2', 'triangle', 'drum', 'attack'
+]
+song_frames_cache = {}
+
+def get_tempo_increment(rowtempo, tv_system=0, tempo_table=False):
+    """Find how far the tempo counter advances each frame.
+
+Return a tuple (increment, row length), the amounts that the tempo
+counter adds each frame and subtracts each row: rows per minute and
+frames per minute, or with a tempo table, the tempo table entry and
+65536.
+"""
+    fpm = engine_frames_per_minute[tv_system]
+    if not tempo_table:
+        return rowtempo, fpm
+    return max(1, int(round(rowtempo * 65536.0 / fpm))), 65536
+
+def round_tempo_counter(counter, inc, rowlength, tempo_table=False):
+    """Round time within a row to 0 or 1 frame like pentlyi_round_to_beat."""
+    if tempo_table:
+        return 0 if inc >> 1 >= counter else inc
+    # Remaining musical time in the row half a frame ago, as 16 bits
+    remaining = ((inc >> 1) - counter - 1 + (inc & 1)) & 0xFFFF
+    if remaining >= rowlength:
+        return 0x10000 - rowlength
+    return (inc - rowlength) & 0xFFFF
+
+def count_song_frames(song, tv_system=0, loops=2, tempo_rounding=(),
+                      tempo_offsets=None, prefix=''):
+    """Play a song's conductor frame by frame like pentlyi_update_music.
+
+tv_system -- 0 for NTSC or 1 for PAL with PENTLY_USE_PAL_ADJUST
+loops -- for a looping song, stop at the loops'th dal segno
+tempo_rounding -- collection of names from tempo_rounding_modes
+    matching PENTLY_USE_TEMPO_ROUNDING_*
+tempo_offsets -- dict from rows per minute to offset in
+    pently_tempo_table if rendered with a tempo table, else None
+
+The tempo counter is a Bresenham accumulator: each frame it adds the
+tempo, and when it carries out of 16 bits, a row starts and it
+subtracts the row length.  Between conductor commands, the frames
+for a run of rows are found at once.
+
+Return the number of frames from the first row to the row that
+reaches fine or the last dal segno.
+"""
+    tempo_table = tempo_offsets is not None
+    if tempo_table:
+        offset_tempos = {v: k for k, v in tempo_offsets.items()}
+    con_lines, con_labels = index_conductor(song)
+    round_play_track = None
+    for i, name in enumerate(tempo_rounding_modes[2:]):
+        if name in tempo_rounding:
+            round_play_track = track_suffixes[i]
+    round_segno = 'segno' in tempo_rounding
+    round_beat = 'beat' in tempo_rounding
+
+    inc, rowlength = get_tempo_increment(engine_initial_tempo, tv_system,
+                                         tempo_table)
+    rows_per_beat, row_beat_part = engine_initial_row_length, 0xFF
+    con_pos = segno = 0
+    seg_return = None
+    loops_left = loops
+
+    # The first frame carries out of the counter and plays row 0
+    frame, counter = 0, 0xFFFF + inc - rowlength
+    rows_to_wait = 0
+    while True:
+        # Start of a row, after subtracting the row length
+        if round_beat:
+            row_beat_part = (row_beat_part + 1) & 0xFF
+            if row_beat_part >= rows_per_beat:
+                counter = round_tempo_counter(counter, inc, rowlength,
+                                              tempo_table)
+                row_beat_part = 0
+
+        if rows_to_wait:
+            rows_to_wait -= 1
+        else:
+            for _ in range(65536):
+                line = con_lines[con_pos][1]
+                if line is None:
+                    raise ValueError("%s: conductor ends without fine or dal segno"
+                                     % song.name)
+                con_pos += 1
+                name, args = split_conductor_command(line, prefix)
+                if name.startswith(('playPat', 'stopPat')):
+                    if name[7:] == round_play_track:
+                        counter = round_tempo_counter(counter, inc, rowlength,
+                                                      tempo_table)
+                elif name == 'waitRows':
+                    rows_to_wait = int(args[0]) - 1
+                    break
+                elif name == 'fine':
+                    return frame
+                elif name == 'segno':
+                    segno = con_pos
+                    if round_segno:
+                        counter = round_tempo_counter(counter, inc, rowlength,
+                                                      tempo_table)
+                elif name == 'dalSegno':
+                    loops_left -= 1
+                    if loops_left <= 0:
+                        return frame
+                    con_pos = segno
+                    if round_segno:
+                        counter = round_tempo_counter(counter, inc, rowlength,
+                                                      tempo_table)
+                elif name in ('setTempo', 'setTempoEntry'):
+                    rowtempo = int(args[0])
+                    if tempo_table:
+                        rowtempo = offset_tempos[rowtempo]
+                    inc, rowlength = get_tempo_increment(rowtempo, tv_system,
+                                                         tempo_table)
+                elif name == 'setBeatDuration':
+                    code = args[0]
+                    if prefix and code.startswith(prefix):
+                        code = code[len(prefix):]
+                    code = durcode_indices[code] if code != '0' else 0
+                    rows_per_beat = engine_durations[code]
+                    row_beat_part = 0
+                elif name == 'callSegment':
+                    seg_return = con_pos
+                    con_pos = con_labels[args[0]]
+                elif name == 'returnSegment':
+                    con_pos = seg_return
+            else:
+                raise ValueError("%s: conductor loops without waiting"
+                                 % song.name)
+
+        # Skip to the next row, or with beat rounding, through the wait
+        # to the next beat.  A row starts on the first frame that
+        # carries, and the counter can carry at most once per frame.
+        rows = 1
+        if inc <= rowlength:
+            rows += rows_to_wait
+            if round_beat:
+                rows = min(rows, max(1, rows_per_beat - row_beat_part))
+        frames = max(rows, -((counter - (rows - 1) * rowlength - 0x10000)
+                            // inc))
+        frame += frames
+        counter += frames * inc - rows * rowlength
+        rows_to_wait -= rows - 1
+        if round_beat:
+            row_beat_part += rows - 1
+
+def get_song_frames(parser, song, tv_system=0, loops=2, prefix=''):
+    """Count the frames that a rendered song plays, with caching.
+
+Results are cached by the conductor data and the options that
+affect timing, so that songs are simulated once per build even when
+several outputs need their durations.  See count_song_frames().
+"""
+    tempo_offsets = parser.tempo_offsets if parser.tempo_table else None
+    key = (
+        tuple(song.asmdata), tv_system, loops if song.looping else 0,
+        frozenset(parser.tempo_rounding), prefix,
+        tuple(sorted(tempo_offsets.items())) if tempo_offsets else None,
+    )
+    try:
+        return song_frames_cache[key]
+    except KeyError:
+        pass
+    frames = count_song_frames(song, tv_system, loops, parser.tempo_rounding,
+                               tempo_offsets, prefix)
+    song_frames_cache[key] = frames
+    return frames
+
+def get_song_duration_ms(parser, song, tv_system=0, loops=2, prefix=''):
+    """Find the duration of a rendered song in milliseconds."""
+    frames = get_song_frames(parser, song, tv_system, loops, prefix)
+    return int(round(frames * 1000 / engine_frame_rates[tv_system]))
+
+# Rehearsal mark snapshots ##########################################
+
+# Engine constants needed to follow the conductor and patterns
+engine_durations = [1, 2, 3, 4, 6, 8, 12, 16]
+engine_initial_tempo = 300
+engine_initial_row_length = 4
+engine_max_channel_volume = 4
+durcode_indices = {
+    name: engine_durations.index(rows)
+    for rows, name in durcodes.items()
+}
+NUM_SNAPSHOT_TRACKS = 5
+ATTACK_TRACK = 4
+
+def index_conductor(song):
+    """Split a rendered song's conductor into commands.
+
+Return a tuple (lines, labels), where lines is a list of (byte offset,
+command) tuples ending with (size, None), and labels is a dict from
+each segment label to the index into lines of its first command.
+"""
+    lines, labels = [], {}
+    offset = 0
+    for line, size in zip(song.asmdata, song.asmdata_sizes):
+        line = line.split(';', 1)[0].strip()
+        if line.endswith(':'):
+            labels[line[:-1]] = len(lines)
+        elif size:
+            lines.append((offset, line))
+        offset += size
+    lines.append((offset, None))
+    return lines, labels
+
+def split_conductor_command(line, prefix=''):
+    """Split a conductor command into its unprefixed name and arguments."""
+    words = line.split(None, 1)
+    name = words[0]
+    if prefix and name.startswith(prefix):
+        name = name[len(prefix):]
+    args = [s.strip() for s in words[1].split(',')] if len(words) > 1 else []
+    return name, args
+
+class PentlySeekState(object):
+    """Follows a song the way pently_skip_to_row does.
+
+The state after a given number of rows is what the engine would have
+after pently_start_music and pently_skip_to_row, except the sound of
+notes already playing.  Patterns and songs must already be rendered.
+A track or conductor that the engine could not follow either is
+warned about and then left alone.
+"""
+
+    def __init__(self, parser, song, prefix=''):
+        self.parser, self.prefix = parser, prefix
+        self.patterns = {}
+        self.next_patterns = {}
+        patterns = sorted(parser.patterns.values(), key=lambda x: x.orderkey)
+        for pat, next_pat in zip(patterns, patterns[1:] + [None]):
+            self.patterns[pat.asmname] = pat
+            self.next_patterns[pat.asmname] = next_pat
+        self.pattern_ops = {}
+
+        # Conductor lines with the byte offset of each
+        self.song = song
+        self.con_lines, self.con_labels = index_conductor(song)
+
+        self.con_pos, self.wait_rows, self.segno = 0, 0, 0
+        self.seg_return = None
+        self.tempo = 0 if parser.tempo_table else engine_initial_tempo
+        self.rows_per_beat, self.row_beat_part = engine_initial_row_length, 255
+        self.attack_ch, self.rows, self.playing = 0, 0, True
+        self.tracks = [self.new_track(i) for i in range(NUM_SNAPSHOT_TRACKS)]
+
+    @staticmethod
+    def new_track(track):
+        return {
+            'pattern': 255, 'data': None, 'pos': 0, 'rows_left': 0,
+            'grace': 0, 'instrument': '0', 'base_note': 0, 'legato': 0,
+            'arpeggio': 0, 'slowarp': 0, 'vibrato': 0, 'bend': 0,
+            'chvolume': engine_max_channel_volume if track < 4 else 0,
+            'repeat': 0,
+        }
+
+    def unprefix(self, name):
+        name = name.strip()
+        if self.prefix and name.startswith(self.prefix):
+            name = name[len(self.prefix):]
+        return name
+
+    @staticmethod
+    def parse_byte(arg):
+        arg = arg.strip().lstrip('<')
+        value = int(arg[1:], 16) if arg.startswith('$') else int(arg)
+        return value & 0xFF
+
+    def get_pattern_ops(self, asmname):
+        """Decode a rendered pattern.
+
+Return a tuple (ops, index), where ops is a list of (offset, name,
+args) tuples, args being the duration in rows for notes, and index
+maps each offset to its position in ops.
+"""
+        try:
+            return self.pattern_ops[asmname]
+        except KeyError:
+            pass
+        pat = self.patterns[asmname]
+        ops, offset = [], 0
+        for atom, size in zip(pat.asmdata, pat.asmdata_sizes):
+            words = atom.split(',')
+            parts = [self.unprefix(s) for s in words[0].split('|')]
+            if len(words) > 1 or parts[0] in ('LEGATO_ON', 'LEGATO_OFF',
+                                               'FASTARP', 'SLOWARP',
+                                               'PATEND'):
+                ops.append((offset, parts[0], words[1:]))
+            else:
+                dur = durcode_indices[parts[1]] if len(parts) > 1 else 0
+                ops.append((offset, parts[0], engine_durations[dur]))
+            offset += size
+        ops.append((offset, None, None))
+        result = ops, {op[0]: i for i, op in enumerate(ops)}
+        self.pattern_ops[asmname] = result
+        return result
+
+    def warn(self, thing, msg):
+        """Add a warning at the position of a pattern or song."""
+        fileline = tuple(thing.fileline or (self.parser.filename, 0))
+        self.parser.warnings.append((fileline, msg))
+
+    def stop_following(self, trk, msg):
+        """Warn about a track's pattern and treat it as silent from here."""
+        self.warn(self.patterns[trk['data']], msg)
+        trk['data'], trk['pos'], trk['rows_left'] = None, 0, 15
+
+    def start_pattern(self, trk):
+        trk['grace'] = trk['rows_left'] = trk['repeat'] = 0
+        trk['data'] = None if trk['pattern'] == 255 else trk['pattern']
+        trk['pos'] = 0
+
+    def read_pattern(self, track):
+        """Read one row of a track's pattern like pentlyi_read_pattern."""
+        trk = self.tracks[track]
+        if trk['rows_left']:
+            trk['rows_left'] -= 1
+            return
+        is_pitched = track < 3
+        for _ in range(65536):
+            if trk['data'] is None:  # silent pattern: whole rest
+                trk['rows_left'] = 15
+                return
+            ops, op_index = self.get_pattern_ops(trk['data'])
+            i = op_index[trk['pos']]
+            offset, name, args = ops[i]
+            if name is None:  # fall through into the next pattern
+                next_pat = self.next_patterns[trk['data']]
+                if next_pat is None:
+                    self.stop_following(
+                        trk, "pattern %s falls through past the end; "
+                        "rehearsal snapshots treat it as silent"
+                        % self.patterns[trk['data']].name
+                    )
+                    return
+                trk['data'], trk['pos'] = next_pat.asmname, 0
+                continue
+            trk['pos'] = ops[i + 1][0]
+            if isinstance(args, int):  # note, tie, or rest
+                trk['rows_left'] = args - 1
+                return
+            if name == 'PATEND':
+                self.start_pattern(trk)
+            elif name == 'REPEAT':
+                count, distance = (self.parse_byte(x) for x in args)
+                if trk['repeat']:
+                    trk['repeat'] -= 1
+                    if not trk['repeat']: continue
+                else:
+                    trk['repeat'] = count
+                trk['pos'] = offset + 2 - distance
+            elif name == 'INSTRUMENT':
+                trk['instrument'] = args[0].strip()
+            elif name == 'TRANSPOSE':
+                trk['base_note'] += self.parse_byte(args[0])
+                trk['base_note'] &= 0xFF
+            elif name == 'GRACE':
+                trk['grace'] = self.parse_byte(args[0]) + 1
+            elif name == 'CHVOLUME':
+                if track != ATTACK_TRACK:
+                    trk['chvolume'] = self.parse_byte(args[0])
+            elif not is_pitched:
+                continue
+            elif name.startswith('LEGATO_'):
+                trk['legato'] = 2 if name == 'LEGATO_ON' else 0
+            elif name in ('FASTARP', 'SLOWARP'):
+                trk['slowarp'] = 0x40 if name == 'SLOWARP' else 0
+            elif name == 'ARPEGGIO':
+                trk['arpeggio'] = self.parse_byte(args[0])
+            elif name == 'VIBRATO':
+                trk['vibrato'] = self.parse_byte(args[0]) & 0x07
+            elif name == 'BEND':
+                trk['bend'] = self.parse_byte(args[0])
+        self.stop_following(
+            trk, "pattern %s plays no notes; "
+            "rehearsal snapshots treat it as silent"
+            % self.patterns[trk['data']].name
+        )
+
+    def do_conductor(self):
+        """Process conductor commands until one waits."""
+        for _ in range(65536):
+            offset, line = self.con_lines[self.con_pos]
+            if line is None:
+                self.warn(self.song, "%s: conductor ends without fine or "
+                          "dal segno" % self.song.name)
+                self.playing = False
+                return
+            self.con_pos += 1
+            name, args = split_conductor_command(line, self.prefix)
+            if name.startswith('playPat') or name.startswith('stopPat'):
+                track = track_suffixes.index(name[7:])
+                trk = self.tracks[track]
+                if track < ATTACK_TRACK:
+                    trk['legato'] = 0
+                if name.startswith('stopPat'):
+                    trk['pattern'], trk['base_note'] = 255, 0
+                    trk['instrument'] = '0'
+                elif track == 3:
+                    trk['pattern'], trk['base_note'] = args[0], 0
+                    trk['instrument'] = '0'
+                else:
+                    trk['pattern'] = args[0]
+                    trk['base_note'] = int(args[1]) & 0xFF
+                    trk['instrument'] = args[2]
+                self.start_pattern(trk)
+            elif name == 'waitRows':
+                self.wait_rows = int(args[0]) - 1
+                return
+            elif name == 'fine':
+                self.playing, self.tempo = False, 0
+                return
+            elif name == 'segno':
+                self.segno = self.con_pos
+            elif name == 'dalSegno':
+                self.con_pos = self.segno
+            elif name.startswith('attackOn'):
+                self.attack_ch = track_suffixes.index(name[8:]) * 4
+            elif name in ('setTempo', 'setTempoEntry'):
+                self.tempo = int(args[0])
+            elif name == 'setBeatDuration':
+                code = self.unprefix(args[0])
+                code = durcode_indices[code] if code != '0' else 0
+                self.rows_per_beat, self.row_beat_part = engine_durations[code], 0
+            elif name == 'callSegment':
+                self.seg_return = self.con_pos
+                self.con_pos = self.con_labels[args[0]]
+            elif name == 'returnSegment':
+                self.con_pos = self.seg_return
+            elif not name.startswith('noteOn'):
+                self.warn(self.song, "%s: rehearsal snapshots skip unknown "
+                          "conductor command %s" % (self.song.name, line))
+        self.warn(self.song, "%s: conductor loops without waiting"
+                  % self.song.name)
+        self.playing = False
+
+    def next_row(self):
+        """Advance one row like pently_skip_to_row."""
+        # Fake out grace processing
+        for track in range(NUM_SNAPSHOT_TRACKS - 1, -1, -1):
+            while self.tracks[track]['grace']:
+                self.tracks[track]['grace'] = 0
+                self.read_pattern(track)
+
+        self.rows += 1
+        self.row_beat_part = (self.row_beat_part + 1) & 0xFF
+        if self.row_beat_part >= self.rows_per_beat:
+            self.row_beat_part = 0
+        if self.wait_rows:
+            self.wait_rows -= 1
+        elif self.playing:
+            self.do_conductor()
+        for track in (3, 2, 1, 0, ATTACK_TRACK):
+            self.read_pattern(track)
+
+    def skip_to_row(self, rows):
+        while self.rows < rows:
+            self.next_row()
+
+    def get_con_addr(self, pos):
+        offset = self.con_lines[pos][0]
+        return "%s+%d" % (self.song.asmdataname, offset)
+
+    def render(self):
+        """Format the state as a list of byte and word values.
+
+Return a list of (directive, values) tuples.
+"""
+        seg_return = (self.get_con_addr(self.seg_return)
+                      if self.seg_return is not None else '0')
+        out = [
+            ('.addr ', [self.get_con_addr(self.con_pos)]),
+            ('.byte ', [str(self.wait_rows)]),
+            ('.addr ', [self.get_con_addr(self.segno)]),
+            ('.word ', [str(self.tempo), str(self.rows)]),
+            ('.byte ', ["%d" % x for x in (self.rows_per_beat,
+                                           self.row_beat_part,
+                                           self.attack_ch)]),
+            ('.addr ', [seg_return]),
+        ]
+        for trk in self.tracks:
+            data = trk['data']
+            if data is None:
+                pos = '0'
+            else:
+                pos = "%s+%d" % (self.patterns[data].asmdataname, trk['pos'])
+            out.append(('.byte ', [
+                trk['pattern'] if trk['pattern'] != 255 else '255',
+                '<(%s)' % pos, '>(%s)' % pos,
+                str(trk['rows_left']), str(trk['grace']),
+                trk['instrument'], str(trk['base_note']),
+                '$%02X' % (trk['legato'] | trk['slowarp']),
+                '$%02X' % trk['arpeggio'], str(trk['vibrato']),
+                '$%02X' % trk['bend'], str(trk['chvolume']),
+                str(trk['repeat']),
+            ]))
+        return out
+
+def iter_rehearsal_snapshots(parser, songs, prefix=''):
+    """Render the state of each song at each rehearsal mark.
+
+songs -- list of (song name, PentlySong, list of (mark name, rows))
+    tuples in the order of pently_rehearsal_marks
+
+A pointer table called pently_rehearsal_snapshots points to the start
+of each song's snapshot table, which is a list of 16-bit pointers to
+snapshots in the same order as the marks in pently_rehearsal_marks.
+Each snapshot consists of the following:
+
+16-bit word: Conductor position
+byte: Rows to wait before the next conductor command
+16-bit words: Loop point, tempo in rows per minute (or with
+    --tempo-table, offset into pently_tempo_table), rows played
+3 bytes: Rows per beat, row within beat, attack channel
+16-bit word: Conductor position after the last callSegment
+5 tracks of 13 bytes: Pattern, 16-bit pattern position, rows left
+    in note, grace time, instrument, base note, legato (bit 1) and
+    slow arpeggio (bit 6), arpeggio, vibrato, bend, channel volume,
+    pattern repeat count
+"""
+    yield "pently_rehearsal_snapshots:"
+    yield from wrapdata(["PRS_%s" % row[0] for row in songs], ".addr ")
+    for songname, song, rm in songs:
+        state = PentlySeekState(parser, song, prefix)
+        yield ""
+        yield "PRS_%s:" % songname
+        if rm:
+            yield from wrapdata(["PRS_%s_%d" % (songname, i)
+                                 for i in range(len(rm))], ".addr ")
+        for i, (markname, rows) in enumerate(rm):
+            state.skip_to_row(rows)
+            yield "PRS_%s_%d:  ; %s" % (songname, i, markname)
+            for directive, values in state.render():
+                yield from wrapdata(values, directive)
+
+def render_rehearsal(parser, prefix=''):
+    """Render the rehearsal marks.  Return (lines, exports)."""
+    exports = []
+    return list(iter_rehearsal(parser, exports, prefix)), exports
+
+def iter_rehearsal(parser, exports, prefix=''):
+    """Render the rehearsal marks, yielding lines and adding to exports.
 
 A pointer table called pently_rehearsal_marks points to the start of
 each song's rehearsal mark table, which consists of the following:
@@ -2221,20 +3951,23 @@ byte: Reserved for future use
 16-bit words: Number of rows preceding each rehearsal mark
 n bytes: ASCII encoded rehearsal mark names, separated by $0A,
     terminated by $00
+
+These are followed by a snapshot of each song at each mark, as
+described in iter_rehearsal_snapshots().
 """
     songs = sorted(parser.songs.items(), key=lambda x: x[1].orderkey)
-    lines = [
-        "; Rehearsal mark data begin",
-        "pently_rehearsal_marks:"
-    ]
-    exports = [
+    yield "; Rehearsal mark data begin"
+    yield "pently_rehearsal_marks:"
+    exports.extend([
         ".exportzp pently_resume_song",
         ".export pently_rehearsal_marks, pently_resume_rows:absolute",
-    ]
+        ".export pently_rehearsal_snapshots",
+    ])
     rmidxnames = ["PRM_%s" % row[0] for row in songs]
-    lines.extend(wrapdata(rmidxnames, ".addr "))
+    yield from wrapdata(rmidxnames, ".addr ")
 
     resume_song = resume_rows = 0
+    song_marks = []
     for i, (songname, songdata) in enumerate(songs):
         if parser.resume_song == songname:
             resume_song, resume_rows = i, parser.resume_rows
@@ -2246,36 +3979,38 @@ n bytes: ASCII encoded rehearsal mark names, separated by $0A,
             parser.warn("%s has %d rehearsal marks; only %d will fit"
                         % (songname, len(rm), MAX_REHEARSAL_MARKS))
         rm.sort(key=lambda row: row[1])
-        lines.extend([
+        song_marks.append((songname, songdata, rm))
+        yield from [
             "",
             "PRM_%s:" % songname,
             ".byte %2d  ; number of rehearsal marks" % len(rm),
             ".byte  0  ; reserved"
-        ])
+        ]
 
         if rm:
             rmrowsdata = ("%d" % row[1] for row in rm)
-            lines.extend(wrapdata(rmrowsdata, ".word "))
+            yield from wrapdata(rmrowsdata, ".word ")
             rmnames = "\n".join(row[0] for row in rm)
             rmnamesdata = ["%d" % x for x in rmnames.encode("ascii")]
             rmnamesdata.append("0")
-            lines.extend(wrapdata(rmnamesdata, ".byte "))
+            yield from wrapdata(rmnamesdata, ".byte ")
 
-    lines.extend([
+    yield ""
+    yield from iter_rehearsal_snapshots(parser, song_marks, prefix)
+    yield from [
         "pently_resume_song = %d" % resume_song,
         "pently_resume_rows = %d" % resume_rows,
         "; Rehearsal mark end"
-    ])
-    return lines, exports
+    ]
 
-def render_file(parser, segment='RODATA', asm6=False, prefix=''):
-    if len(parser.songs) == 0:
-        raise IndexError("no songs defined")
+def get_parts_to_print(parser):
+    """List the kinds of object in a score in the order they are emitted.
 
-    # each entry in this row is a tuple of the form
-    # list, name of directory table, include asmnames in export,
-    # include in byte subsequence packing
-    parts_to_print = [
+Each entry is a tuple of the form (dict of objects, name of directory
+table, include asmnames in export, include in byte subsequence
+packing).
+"""
+    return [
         (parser.sfxs, 'pently_sfx_table', True,
          True),
         (parser.instruments, 'pently_instruments', True,
@@ -2288,6 +4023,8 @@ def render_file(parser, segment='RODATA', asm6=False, prefix=''):
          False),
     ]
 
+def finalize_patterns(parser):
+    """Collapse each pattern and choose transpositions for fallthrough groups."""
     # Determine fallthrough groups and reject clearly invalid combinations
     patterns = sorted(parser.patterns.values(), key=lambda x: x.orderkey)
     fallthrough_group = {}
@@ -2345,25 +4082,234 @@ def render_file(parser, segment='RODATA', asm6=False, prefix=''):
             last_lowest_note = min(lowest_note, last_lowest_note)
             pat.transpose, pat.lowest_note = last_transpose, last_lowest_note
 
-    # Pack byte arrays that are subsequences of another byte array
-    # into the longer one
-    subseq_pool_directory = []
-    subseq_pool_data = []
-    for ptpidx, row in enumerate(parts_to_print):
-        things, deflabel, _, is_bytes = row
-        for thingkey, thing in things.items():
+def render_objects(parser, prefix=''):
+    """Render every object in a score and pack overlapping byte arrays.
+
+Return a dict from asmdataname of each byte array that is a
+subsequence of another to a tuple (asmdataname of the longer array,
+start offset, end offset).
+"""
+    parts_to_print = get_parts_to_print(parser)
+    parser.build_scope_index()
+    if parser.tempo_table:
+        build_tempo_table(parser)
+
+    for things, _, _, _ in parts_to_print:
+        for thing in things.values():
             thing.render(scopes=parser, prefix=prefix)
-            if thing.asmdata and is_bytes:
-                subseq_pool_directory.append(thing.asmdataname)
-                subseq_pool_data.append(thing.asmdata)
-    subseq_packed = subseq_pack(subseq_pool_data)
-    subseq_packed = {
-        k: v
-        for k, v in zip(subseq_pool_directory, subseq_packed)
-        if v
+    parser.check_unresolved()
+    if parser.namespaced:
+        dedupe_objects(parser)
+    if parser.banks:
+        assign_banks(parser)
+
+    # Pack byte arrays that are subsequences of another byte array
+    # into the longer one, separately in each bank
+    subseq_pools = {}
+    for things, _, _, is_bytes in parts_to_print:
+        if not is_bytes: continue
+        for thing in things.values():
+            if thing.asmdata:
+                bank = parser.bank_of.get(thing.asmdataname)
+                directory, data = subseq_pools.setdefault(bank, ([], []))
+                directory.append(thing.asmdataname)
+                data.append(thing.asmdata)
+    out = {}
+    for directory, data in subseq_pools.values():
+        out.update(
+            (k, (directory[v[0]],) + tuple(v[1:]))
+            for k, v in zip(directory, subseq_pack(data))
+            if v
+        )
+    return out
+
+def get_dedupe_key(thing, aliases):
+    """Describe a rendered object's definition and data apart from its name.
+
+aliases -- dict from asmname of a removed duplicate to asmname of the
+    object kept, applied to names that the definition refers to
+"""
+    own = (thing.asmname, thing.asmdataname)
+    asmdef = re.sub(r"[A-Za-z_][A-Za-z0-9_]*",
+                    lambda m: ('' if m.group(0) in own
+                               else aliases.get(m.group(0), m.group(0))),
+                    thing.asmdef)
+    return asmdef, tuple(thing.asmdata or ())
+
+def dedupe_objects(parser):
+    """Keep one of each set of identically rendered objects.
+
+Sound effects, instruments, and drums that render the same apart from
+their names, such as a drum kit included by several linked scores,
+are kept once, in the position of the first.  The rest are removed,
+and parser.aliases maps each removed object's asmname to the asmname
+of the object kept.  Drums are compared after their sound effects.
+"""
+    for things in (parser.sfxs, parser.instruments, parser.drums):
+        kept = {}
+        for thing in sorted(things.values(), key=lambda x: x.orderkey):
+            first = kept.setdefault(get_dedupe_key(thing, parser.aliases),
+                                    thing)
+            if first is not thing:
+                parser.aliases[thing.asmname] = first.asmname
+                del things[thing.name]
+
+def prepare_file(parser, prefix=''):
+    """Finalize patterns and render all objects to data.
+
+Return the subsequence packing result from render_objects().
+"""
+    if len(parser.songs) == 0:
+        raise IndexError("no songs defined")
+    finalize_patterns(parser)
+    return render_objects(parser, prefix)
+
+def get_song_owner(name, is_song=False, namespaced=False):
+    """Find the song to which a rendered object is attributed.
+
+namespaced -- if true, name starts with the namespace of a linked
+    score, which stays on the song name
+
+Return the name of the song, or '' if the object is shared.
+"""
+    namespace = ''
+    if namespaced:
+        namespace, name = name.split("::", 1)
+        namespace += "::"
+    name = name.split("::", 1)
+    song_specific = len(name) > 1 or is_song
+    return namespace + name[0] if song_specific else ''
+
+def get_song_bytes(parser):
+    """Count the bytes of rendered data attributable to each song.
+
+Return a dict from song name to size, where '' means shared.
+"""
+    songbytes = {'': 0}
+    for things, _, _, _ in get_parts_to_print(parser):
+        for name, tng in things.items():
+            name = get_song_owner(name, isinstance(tng, PentlySong),
+                                  parser.namespaced)
+            songbytes[name] = songbytes.get(name, 0) + tng.bytesize
+    return songbytes
+
+def get_data_size(thing):
+    """Count the bytes in a rendered object's data array."""
+    sizes = getattr(thing, 'asmdata_sizes', None)
+    if sizes is not None:
+        return sum(sizes)
+    return len(thing.asmdata or ())
+
+def get_song_users(parser):
+    """Find which songs use each pattern and instrument.
+
+Patterns in a fallthrough group count as used by every song that
+uses any of them, as they must stay together.
+
+Return a dict from asmname to set of song names.
+"""
+    identRE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+    patterns = sorted(parser.patterns.values(), key=lambda x: x.orderkey)
+    users = {x.asmname: set() for x in patterns}
+    users.update((x.asmname, set()) for x in parser.instruments.values())
+    for songname, song in parser.songs.items():
+        for line in song.asmdata:
+            for ident in identRE.findall(line.split(';', 1)[0]):
+                ident = parser.aliases.get(ident, ident)
+                if ident in users:
+                    users[ident].add(songname)
+
+    # Merge users of fallthrough groups, which do not end in PATEND
+    group = []
+    for pat in patterns:
+        group.append(pat)
+        if pat.fallthrough: continue
+        merged = set().union(*(users[x.asmname] for x in group))
+        for x in group:
+            users[x.asmname] = merged
+        group = []
+
+    # Instruments changed within a pattern
+    for pat in patterns:
+        for atom in pat.asmdata:
+            for ident in identRE.findall(atom):
+                ident = parser.aliases.get(ident, ident)
+                if ident in users and ident != pat.asmname:
+                    users[ident].update(users[pat.asmname])
+    return users
+
+def assign_banks(parser):
+    """Place each song and the data only it uses in a switchable bank.
+
+parser.banks is a list of (segment name, byte budget).  Songs are
+placed first-fit in decreasing order of size of the song with the
+patterns and instrument envelopes that no other song uses.  Sound
+effects, drums, directory tables, and patterns and instruments
+shared among songs stay in the common segment.
+
+Set parser.bank_of to a dict from asmdataname to index into
+parser.banks and parser.song_banks to a dict from song name to index.
+"""
+    users = get_song_users(parser)
+    working_sets = {songname: [song] for songname, song in parser.songs.items()}
+    for things in (parser.patterns, parser.instruments):
+        for thing in things.values():
+            songnames = users[thing.asmname]
+            if len(songnames) == 1 and thing.asmdata:
+                working_sets[next(iter(songnames))].append(thing)
+    ws_sizes = {
+        songname: sum(get_data_size(x) for x in things)
+        for songname, things in working_sets.items()
     }
 
-    lines = [
+    remaining = [budget for segment, budget in parser.banks]
+    song_banks = {}
+    for songname in sorted(ws_sizes, key=lambda x: (-ws_sizes[x], x)):
+        size = ws_sizes[songname]
+        for i, budget in enumerate(remaining):
+            if size <= budget: break
+        else:
+            raise ValueError("song %s needs %d bytes, more than any bank has left"
+                             % (songname, size))
+        remaining[i] -= size
+        song_banks[songname] = i
+
+    bank_of = {}
+    for songname, things in working_sets.items():
+        for thing in things:
+            bank_of[thing.asmdataname] = song_banks[songname]
+    parser.bank_of, parser.song_banks = bank_of, song_banks
+
+def render_file(parser, segment='RODATA', asm6=False, prefix='', banks=None):
+    """Prepare and format a score as assembly language.
+
+banks -- list of (segment name, byte budget) to split songs and the
+    data only they use across, or None to put everything in segment
+
+Return (lines, exports).
+"""
+    if banks:
+        parser.banks = list(banks)
+    subseq_packed = prepare_file(parser, prefix)
+    return format_file(parser, subseq_packed, segment, asm6)
+
+def format_file(parser, subseq_packed, segment='RODATA', asm6=False):
+    """Format a prepared score as assembly language.
+
+subseq_packed -- the result of prepare_file()
+
+Return (lines, exports).
+"""
+    exports = []
+    lines = list(iter_file(parser, subseq_packed, segment, asm6, exports))
+    return lines, exports
+
+def iter_file(parser, subseq_packed, segment, asm6, exports):
+    """Format a prepared score, yielding lines and adding to exports."""
+    if asm6 and parser.banks:
+        raise ValueError("ASM6 output does not support banks")
+    parts_to_print = get_parts_to_print(parser)
+    yield from [
         '; title: ' + parser.title,
         '; author: ' + parser.author,
         '; copyright: ' + parser.copyright,
@@ -2373,11 +4319,11 @@ def render_file(parser, segment='RODATA', asm6=False, prefix=''):
     ]
     if not asm6:
         # ASM6 relies on the caller to include pentlyseq.inc first
-        lines.extend([
+        yield from [
             '.include "../../src/pentlyseq.inc"',
             '.segment "%s"' % segment,
             'pentlyseq_start:'
-        ])
+        ]
 
     all_export = [
         'pentlyseq_start', 'pentlyseq_end',
@@ -2386,35 +4332,32 @@ def render_file(parser, segment='RODATA', asm6=False, prefix=''):
         'PENTLY_NUM_SONGS', 'PENTLY_NUM_SOUNDS', 'pently_resume_mute',
     ]
     bytes_lines = []
-    songbytes = {'': 0}
+    songbytes = get_song_bytes(parser)
     total_partbytes = 0
     subseq_refs = []
+    banked_things = [[] for _ in parser.banks]
     for row in parts_to_print:
         things, deflabel, exportable, is_bytes = row
-
-        # Count the size attributable to each song
-        for name, tng in things.items():
-            name = name.split("::", 1)
-            song_specific = len(name) > 1 or isinstance(tng, PentlySong)
-            name = name[0] if song_specific else ''
-            songbytes[name] = songbytes.get(name, 0) + tng.bytesize
-
         fmtfunc = str if is_bytes else None
         defs1 = sorted(things.values(), key=lambda x: x.orderkey)
         if exportable:
-            all_exportzp.extend(thing.asmname for thing in defs1)
+            asmnames = [thing.asmname for thing in defs1]
+            all_exportzp.extend(asmnames)
+            all_exportzp.extend(alias
+                                for alias, asmname in parser.aliases.items()
+                                if asmname in asmnames)
         all_export.append(deflabel)
 
         entries_plural = "entry" if len(defs1) == 1 else "entries"
         partbytes = sum(thing.bytesize for thing in defs1)
         total_partbytes += partbytes
-        lines.append("%s:  ; %d %s, %d bytes"
-                     % (deflabel, len(defs1), entries_plural, partbytes))
+        yield ("%s:  ; %d %s, %d bytes"
+               % (deflabel, len(defs1), entries_plural, partbytes))
 
         # Workaround for *def macros not being able to create new variables
         if asm6:
-            lines.extend("%s = 0" % thing.asmname for thing in defs1)
-        lines.extend(thing.asmdef for thing in defs1)
+            yield from ("%s = 0" % thing.asmname for thing in defs1)
+        yield from (thing.asmdef for thing in defs1)
         for thing in defs1:
 
             # Skip renderables without any data array
@@ -2423,64 +4366,99 @@ def render_file(parser, segment='RODATA', asm6=False, prefix=''):
             # Use the packed array if it exists
             packresult = subseq_packed.get(thing.asmdataname)
             if packresult is not None:
-                diridx, startoffset, endoffset = packresult
+                longername, startoffset, endoffset = packresult
                 assert endoffset - startoffset == len(thing.asmdata)
                 line = ('%s = %s + %d'
-                        % (thing.asmdataname, subseq_pool_directory[diridx],
-                           startoffset))
+                        % (thing.asmdataname, longername, startoffset))
                 subseq_refs.append(line)
                 continue
 
-            # Otherwise, emit the array
-            lines.append("%s:" % thing.asmdataname)
-            data = ((fmtfunc(s) for s in thing.asmdata)
-                    if fmtfunc
-                    else thing.asmdata)
-            if thing.asmdataprefix:
-                data = wrapdata(data, thing.asmdataprefix)
-            lines.extend(data)
+            # Otherwise, emit the array, in its bank if it has one
+            bank = parser.bank_of.get(thing.asmdataname)
+            if bank is not None:
+                banked_things[bank].append((thing, fmtfunc))
+                continue
+            yield from iter_asmdata(thing, fmtfunc)
 
         bytes_lines.append('; %s: %d bytes' % (deflabel, partbytes))
         bytes_lines.extend(';   %s: %d bytes' % (thing.asmname, thing.bytesize)
                            for thing in defs1)
 
+    if parser.tempo_table:
+        all_export.append('pently_tempo_table')
+        tempobytes = (2 * len(engine_frames_per_minute)
+                      * parser.tempo_scales * len(parser.tempo_offsets))
+        total_partbytes += tempobytes
+        songbytes[''] += tempobytes
+        bytes_lines.append('; pently_tempo_table: %d bytes' % tempobytes)
+        yield from iter_tempo_table(parser)
+    if parser.banks:
+        all_export.append('pently_song_banks')
+        songs = sorted(parser.songs.values(), key=lambda x: x.orderkey)
+        songbanks = ["<.bank(%s)" % song.asmdataname for song in songs]
+        total_partbytes += len(songbanks)
+        songbytes[''] += len(songbanks)
+        bytes_lines.append('; pently_song_banks: %d bytes' % len(songbanks))
+        yield "pently_song_banks:"
+        yield from wrapdata(songbanks, ".byte ")
+
     # Put all references to subsequences below the definitions of
     # said sequences in order to reduce forward references in ASM6
-    lines.extend([
+    yield from [
         'pentlyseq_end:',
         '',
         '; references to subsequences'
-    ])
-    lines.extend(subseq_refs)
-
-    exports = [
-        '; Make music data available to Pently'
     ]
+    yield from subseq_refs
+    if parser.aliases:
+        yield ''
+        yield '; duplicates of identical objects'
+        yield from ('%s = %s' % row for row in parser.aliases.items())
+
+    # Data that only one bank's songs use
+    for (bankseg, budget), things in zip(parser.banks, banked_things):
+        used = sum(get_data_size(thing) for thing, _ in things)
+        yield ''
+        yield '.segment "%s"' % bankseg
+        yield '; %d of %d bytes' % (used, budget)
+        for thing, fmtfunc in things:
+            yield from iter_asmdata(thing, fmtfunc)
+    if parser.banks:
+        yield ''
+        yield '.segment "%s"' % segment
+
+    exports.append('; Make music data available to Pently')
     exports.extend(wrapdata(all_export, ".export "))
     exports.extend([
         '',
         '; Sound effect, instrument, and song names for your program to .importzp'
     ])
     exports.extend(wrapdata(all_exportzp, ".exportzp "))
-    lines.append("pently_resume_mute = $%02X" % parser.resume_mute)
-    lines.extend([
-        '',
-        '; Total music data size: %d bytes' % total_partbytes
-    ])
-    lines.extend(bytes_lines)
-    lines.extend([
+    yield "pently_resume_mute = $%02X" % parser.resume_mute
+    yield ''
+    yield '; Total music data size: %d bytes' % total_partbytes
+    yield from bytes_lines
+    yield from [
         ";",
         "; Breakdown by song",
         ";   Shared: %d bytes" % songbytes['']
-    ])
-    lines.extend(
+    ]
+    yield from (
         ";   Song %s: %d bytes" % (k, v)
         for (k, v) in sorted(songbytes.items())
         if k
     )
-
-    lines.append('')
-    return lines, exports
+    yield ''
+
+def iter_asmdata(thing, fmtfunc=None):
+    """Yield the label and data lines of a rendered object's data array."""
+    yield "%s:" % thing.asmdataname
+    data = ((fmtfunc(s) for s in thing.asmdata)
+            if fmtfunc
+            else thing.asmdata)
+    if thing.asmdataprefix:
+        data = wrapdata(data, thing.asmdataprefix)
+    yield from data
 
 def ca65_escape_bytes(blo):
     """Encode an iterable of ints in 0-255, mostly ASCII, for ca65 .byte statement"""
@@ -2503,12 +4481,22 @@ def bytes_strcpy(b, length):
     b = b[:32]
     return bytes(b) + bytes(32 - len(b))
 
-def render_include_file(parser):
+def render_include_file(parser, prefix=''):
+    """Format the metadata include file.  Return a list of lines."""
+    return list(iter_include_file(parser, prefix))
+
+def iter_include_file(parser, prefix=''):
+    """Format the metadata include file, yielding lines.
+
+Song durations come from count_song_frames(): to the end of a song
+that ends or the end of the second loop of a song that loops, on
+NTSC and on PAL.
+"""
     title_utf8 = parser.title.encode("utf-8")
     author_utf8 = parser.author.encode("utf-8")
     copyright_utf8 = parser.copyright.encode("utf-8")
 
-    lines = [
+    yield from [
         '; title: ' + parser.title,
         '; author: ' + parser.author,
         '; copyright: ' + parser.copyright,
@@ -2546,77 +4534,549 @@ def render_include_file(parser):
     sfxs = parts_to_print[0]
     songs = parts_to_print[2]
     for objs in parts_to_print:
-        lines.extend(
+        yield from (
             "%s = %i" % (obj.asmname, i) for i, obj in enumerate(objs)
         )
 
     # Macros to write song names
-    lines.append(".macro PENTLY_WRITE_SONG_TITLES terminator")
-    lines.extend(
+    yield ".macro PENTLY_WRITE_SONG_TITLES terminator"
+    yield from (
         "PSTITLE_%d: .byte %s, terminator"
         % (i, ca65_escape_bytes(song.title.encode("utf-8")))
         for i, song in enumerate(songs)
     )
-    lines.append(".endmacro")
-    lines.append(".macro PENTLY_WRITE_SONG_TITLE_PTRS")
-    lines.extend(
+    yield ".endmacro"
+    yield ".macro PENTLY_WRITE_SONG_TITLE_PTRS"
+    yield from (
         "  .addr PSTITLE_%d" % i for i in range(len(songs))
     )
-    lines.append(".endmacro")
+    yield ".endmacro"
 
-    lines.append(".macro PENTLY_WRITE_SFX_TITLES terminator")
-    lines.extend(
+    yield ".macro PENTLY_WRITE_SFX_TITLES terminator"
+    yield from (
         "PETITLE_%d: .byte %s, terminator"
         % (i, ca65_escape_bytes(sfx.name.encode("utf-8")))
         for i, sfx in enumerate(sfxs)
     )
-    lines.append(".endmacro")
-    lines.append(".macro PENTLY_WRITE_SFX_TITLE_PTRS")
-    lines.extend(
+    yield ".endmacro"
+    yield ".macro PENTLY_WRITE_SFX_TITLE_PTRS"
+    yield from (
         "  .addr PETITLE_%d" % i for i in range(len(sfxs))
     )
-    lines.append(".endmacro")
+    yield ".endmacro"
 
-    lines.append(".macro PENTLY_WRITE_SONG_AUTHORS terminator")
-    lines.extend(
+    yield ".macro PENTLY_WRITE_SONG_AUTHORS terminator"
+    yield from (
         "PSAUTHOR_%d: .byte %s, terminator"
         % (i, ca65_escape_bytes((song.author or parser.author).encode("utf-8")))
         for i, song in enumerate(songs)
     )
-    lines.append(".endmacro")
-    lines.append(".macro PENTLY_WRITE_SONG_AUTHOR_PTRS")
-    lines.extend(
+    yield ".endmacro"
+    yield ".macro PENTLY_WRITE_SONG_AUTHOR_PTRS"
+    yield from (
         "  .addr PSAUTHOR_%d" % i for i in range(len(songs))
     )
-    lines.append(".endmacro")
-
-    lines.append(".macro PENTLY_WRITE_NSFE_DURATIONS")
-    for song in songs:
-        duration = song.wall_time
-        if song.looping: duration += duration - song.segno_wall_time
-        lines.append("  .dword %d" % round(duration * 1000))
-    lines.append(".endmacro")
+    yield ".endmacro"
+
+    for tv_system, suffix in enumerate(('', '_PAL')):
+        yield ".macro PENTLY_WRITE_NSFE_DURATIONS" + suffix
+        yield from (
+            "  .dword %d" % get_song_duration_ms(parser, song, tv_system,
+                                                 2, prefix)
+            for song in songs
+        )
+        yield ".endmacro"
 
-    lines.append(".macro PENTLY_WRITE_NSFE_FADES")
-    lines.extend(
+    yield ".macro PENTLY_WRITE_NSFE_FADES"
+    yield from (
         "  .dword $FFFFFFFF" if song.looping else "  .dword 0"
         for song in songs
     )
-    lines.append(".endmacro")
+    yield ".endmacro"
 
-    lines.append(".macro PENTLY_WRITE_NSFE_SFX_DURATIONS")
-    lines.extend(
+    yield ".macro PENTLY_WRITE_NSFE_SFX_DURATIONS"
+    yield from (
         "  .dword %d" % ((sfx.rate or 1) * len(sfx.volume) * 20)
         for sfx in sfxs
     )
-    lines.append(".endmacro")
+    yield ".endmacro"
+
+    yield ".macro PENTLY_WRITE_NSFE_SFX_FADES"
+    yield from ("  .dword 0" for sfx in sfxs)
+    yield ".endmacro"
+
+    yield ''
+
+# Engine features that depend on what a score uses, in the order
+# of pentlyconfig.inc
+score_features = [
+    'VIBRATO', 'PORTAMENTO', '303_PORTAMENTO', 'ARPEGGIO',
+    'ATTACK_PHASE', 'ATTACK_TRACK', 'CHANNEL_VOLUME',
+    'PATTERN_REPEAT', 'CONDUCTOR_CALL', 'TEMPO_TABLE', 'SONG_BANKS',
+    'REHEARSAL',
+]
+
+def get_used_features(parser, prefix='', rehearse=False):
+    """Find the engine features that a prepared score uses.
+
+rehearse -- true if the output includes rehearsal mark data
+
+Return a dict from each name in score_features to 1 if used or 0 if
+not, for a PENTLY_USE_ flag.
+"""
+    used = set()
+    for pat in parser.patterns.values():
+        for atom in pat.asmdata:
+            cmd, _, arg = atom.partition(',')
+            if prefix and cmd.startswith(prefix):
+                cmd = cmd[len(prefix):]
+            if cmd == 'VIBRATO':
+                used.add('VIBRATO')
+            elif cmd == 'BEND':
+                used.add('PORTAMENTO')
+                if int(arg.lstrip('$'), 16) >= 0x20:
+                    used.add('303_PORTAMENTO')
+            elif cmd in ('ARPEGGIO', 'FASTARP', 'SLOWARP'):
+                used.add('ARPEGGIO')
+            elif cmd == 'CHVOLUME':
+                used.add('CHANNEL_VOLUME')
+            elif cmd == 'REPEAT':
+                used.add('PATTERN_REPEAT')
+    if any(inst.asmdata for inst in parser.instruments.values()):
+        used.add('ATTACK_PHASE')
+    for song in parser.songs.values():
+        for line in song.asmdata:
+            cmd = line.split(None, 1)[0] if line.strip() else ''
+            if prefix and cmd.startswith(prefix):
+                cmd = cmd[len(prefix):]
+            if cmd.startswith('attackOn') or cmd.endswith('Attack'):
+                used.add('ATTACK_TRACK')
+            elif cmd == 'callSegment':
+                used.add('CONDUCTOR_CALL')
+    if 'ATTACK_TRACK' in used:
+        # The attack track uses the attack phase's variables
+        used.add('ATTACK_PHASE')
+    if parser.tempo_table:
+        used.add('TEMPO_TABLE')
+    if parser.banks:
+        used.add('SONG_BANKS')
+    if rehearse:
+        used.add('REHEARSAL')
+    return {name: int(name in used) for name in score_features}
+
+def render_config_file(parser, prefix='', rehearse=False, template=None):
+    """Format a Pently configuration file.  Return a list of lines."""
+    return list(iter_config_file(parser, prefix, rehearse, template))
+
+def iter_config_file(parser, prefix='', rehearse=False, template=None):
+    """Format a Pently configuration file for a score, yielding lines.
+
+Each PENTLY_USE_ flag in score_features is 1 if the score uses that
+feature or 0 if not.  ATTACK_PHASE is also 1 if the template keeps
+PENTLY_USE_NOISE_POOLING on, as noise pooling requires it.
+
+template -- iterable of lines of a configuration file, such as
+    src/pentlyconfig.inc, whose flags in score_features are replaced
+    and other lines are kept; if None, only those flags are written,
+    for a configuration file to .include
+"""
+    features = get_used_features(parser, prefix, rehearse)
+    useRE = re.compile(r"\s*PENTLY_USE_([a-zA-Z0-9_]+)\s*=")
+    if template is None:
+        yield '; Pently features used by ' + parser.title
+        yield from ("PENTLY_USE_%s = %d" % row for row in features.items())
+        yield ''
+        return
+
+    # A template that keeps noise pooling needs the attack phase for
+    # pentlysound.s to assemble, even if the score has no attacks
+    template = [line.rstrip("\n") for line in template]
+    for line in template:
+        m = useRE.match(line)
+        if m and m.group(1) == 'NOISE_POOLING':
+            value = line[m.end():].split(';', 1)[0].strip()
+            if value != '0': features['ATTACK_PHASE'] = 1
+
+    lines, missing = [], dict(features)
+    for line in template:
+        m = useRE.match(line)
+        if m and m.group(1) in features:
+            line = "PENTLY_USE_%s = %d" % (m.group(1), missing.pop(m.group(1)))
+        lines.append(line)
+
+    # Features that the template lacks go before its closing .endif
+    end = len(lines)
+    for i in range(len(lines) - 1, -1, -1):
+        if lines[i].strip().lower().startswith('.endif'):
+            end = i
+            break
+    lines[end:end] = ["PENTLY_USE_%s = %d" % row for row in missing.items()]
+    yield '; Pently configuration for ' + parser.title
+    yield from lines
+    yield ''
+
+# Python interface ##################################################
+
+PentlyWarning = namedtuple('PentlyWarning', ['file', 'line', 'message'])
+PentlyError = namedtuple('PentlyError', ['file', 'line', 'message'])
+
+# kind -- 'sfx', 'instrument', 'drum', 'pattern', or 'song'
+# name -- name in the score, with scope prefix such as 'song::pat'
+# asmname -- symbol naming the object's index in its directory
+# index -- position in its directory table
+# data -- list of bytes (sfx and instrument) or assembly language
+#     expressions (drum, pattern, and song), or None if no data array
+# bytesize -- size in bytes, including directory entry
+# fileline -- (file, line) where the object was defined
+# packed_into -- (asmdataname, offset) of a longer byte array
+#     containing this one, or None
+PentlyRenderedObject = namedtuple('PentlyRenderedObject', [
+    'kind', 'name', 'asmname', 'asmdataname', 'index', 'data',
+    'bytesize', 'fileline', 'packed_into'
+])
+
+rendered_kinds = {
+    'pently_sfx_table': 'sfx',
+    'pently_instruments': 'instrument',
+    'pently_drums': 'drum',
+    'pently_patterns': 'pattern',
+    'pently_songs': 'song',
+}
+
+class PentlyCompileError(ValueError):
+    """A score could not be compiled.
+
+file, line -- where the (first) error was found
+warnings -- list of PentlyWarning issued before the error
+errors -- list of PentlyError; more than one if compiled with
+    recover=True
+"""
+
+    def __init__(self, message, file=None, line=0, warnings=(), errors=None):
+        super().__init__(message)
+        self.message, self.file, self.line = message, file, line
+        self.warnings = list(warnings)
+        self.errors = (list(errors) if errors is not None
+                       else [PentlyError(file, line, message)])
+
+    def __str__(self):
+        return "%s:%d: %s" % (self.file, self.line, self.message)
+
+class PentlyScore(object):
+    """A compiled score.
+
+Attributes:
+parser -- the PentlyInputParser that read the score
+prefix -- prefix of song data labels and macros
+objects -- list of PentlyRenderedObject in output order
+warnings -- list of PentlyWarning
+symbols -- dict from kind to dict from asmname to index, including
+    names of duplicates removed when linking scores
+bytesize -- total size of music data in bytes
+songbytes -- dict from song name to bytes attributable to that
+    song, where '' means shared by all songs
+"""
+
+    def __init__(self, parser, subseq_packed, prefix=''):
+        self.parser, self.subseq_packed = parser, subseq_packed
+        self.prefix = prefix
+        self.objects, self.symbols = [], {}
+        for things, deflabel, _, _ in get_parts_to_print(parser):
+            kind = rendered_kinds[deflabel]
+            defs1 = sorted(things.values(), key=lambda x: x.orderkey)
+            self.symbols[kind] = {}
+            for i, thing in enumerate(defs1):
+                packresult = subseq_packed.get(thing.asmdataname)
+                packed_into = packresult[:2] if packresult else None
+                self.symbols[kind][thing.asmname] = i
+                self.objects.append(PentlyRenderedObject(
+                    kind, thing.name, thing.asmname, thing.asmdataname, i,
+                    list(thing.asmdata) if thing.asmdata else None,
+                    thing.bytesize, thing.fileline, packed_into
+                ))
+            self.symbols[kind].update(
+                (alias, self.symbols[kind][asmname])
+                for alias, asmname in parser.aliases.items()
+                if asmname in self.symbols[kind]
+            )
+        self.bytesize = sum(x.bytesize for x in self.objects)
+        self.songbytes = get_song_bytes(parser)
+
+    @property
+    def warnings(self):
+        return parser_warnings(self.parser)
+
+    def render_text(self, segment='RODATA', asm6=False):
+        """Format the score as assembly language.
+
+Return (lines, exports).
+"""
+        return format_file(self.parser, self.subseq_packed, segment, asm6)
+
+    def render_rehearsal(self):
+        """Format rehearsal mark data.  Return (lines, exports)."""
+        return render_rehearsal(self.parser, self.prefix)
+
+    def render_include(self):
+        """Format the metadata include file.  Return a list of lines."""
+        return render_include_file(self.parser, self.prefix)
 
-    lines.append(".macro PENTLY_WRITE_NSFE_SFX_FADES")
-    lines.extend("  .dword 0" for sfx in sfxs)
-    lines.append(".endmacro")
+    def render_config(self, rehearse=False, template=None):
+        """Format a configuration file enabling only the features used.
 
-    lines.append('')
-    return lines
+See iter_config_file().  Return a list of lines.
+"""
+        return render_config_file(self.parser, self.prefix, rehearse,
+                                  template)
+
+    def report(self):
+        """Summarize sizes for machine consumption.
+
+Return a dict suitable for json.dump() with per-object sizes, bytes
+attributable to each song, and byte arrays packed into longer ones.
+"""
+        objects, kinds = [], {}
+        bytes_saved = 0
+        for obj in self.objects:
+            packed_into = None
+            if obj.packed_into:
+                packed_into = {
+                    'array': obj.packed_into[0],
+                    'offset': obj.packed_into[1],
+                    'bytes_saved': len(obj.data),
+                }
+                bytes_saved += len(obj.data)
+            file, line = obj.fileline or (None, 0)
+            objects.append({
+                'kind': obj.kind,
+                'name': obj.name,
+                'asmname': obj.asmname,
+                'bytesize': obj.bytesize,
+                'song': get_song_owner(obj.name, obj.kind == 'song',
+                                       self.parser.namespaced) or None,
+                'file': file,
+                'line': line,
+                'packed_into': packed_into,
+            })
+            kinds[obj.kind] = kinds.get(obj.kind, 0) + obj.bytesize
+        return {
+            'title': self.parser.title,
+            'total_bytes': self.bytesize,
+            'packed_bytes_saved': bytes_saved,
+            'output_bytes': self.bytesize - bytes_saved,
+            'kinds': kinds,
+            'shared_bytes': self.songbytes[''],
+            'songs': {k: v for k, v in self.songbytes.items() if k},
+            'objects': objects,
+            'warnings': len(self.warnings),
+        }
+
+    def source_map(self):
+        """Find the score position that produced each part of the data.
+
+Return a list of (data label, byte offset, file, line, column)
+tuples, one for each change of source position.
+"""
+        out = []
+        for things, _, _, _ in get_parts_to_print(self.parser):
+            defs1 = sorted(things.values(), key=lambda x: x.orderkey)
+            out.extend(
+                (thing.asmdataname, offset) + tuple(src)
+                for thing in defs1
+                for offset, src in thing.get_source_map()
+            )
+        return out
+
+def compile_score(source, filename=None, include_resolver=None, prefix='',
+                  recover=False, pattern_repeat=False, conductor_call=False,
+                  tempo_table=False, tempo_scales=1, banks=None,
+                  tempo_rounding=()):
+    """Compile a score without touching the file system.
+
+source -- a string or an iterable of lines of a score or of a
+    FamiTracker text export
+filename -- name used in warnings and to resolve included files
+include_resolver -- function taking a path and returning a string or
+    iterable of lines; if None, included files are opened
+prefix -- prefix for song data labels, such as 'PENTLY_'
+recover -- if true, keep parsing after an error to find more errors,
+    and report all of them in the PentlyCompileError
+pattern_repeat -- if true, shorten patterns with the REPEAT command,
+    which needs PENTLY_USE_PATTERN_REPEAT in the engine
+conductor_call -- if true, move repeated runs of conductor commands
+    into segments, which needs PENTLY_USE_CONDUCTOR_CALL in the engine
+tempo_table -- if true, set tempos as entries in pently_tempo_table,
+    which needs PENTLY_USE_TEMPO_TABLE in the engine
+tempo_scales -- number of tempo scales in each tempo table entry:
+    1, or 4 to follow pently_tempo_scale with PENTLY_USE_REHEARSAL
+banks -- list of (segment name, byte budget) to split songs and the
+    data only they use across, which needs PENTLY_USE_SONG_BANKS in
+    the engine, or None to put everything in one segment
+tempo_rounding -- names from tempo_rounding_modes of the
+    PENTLY_USE_TEMPO_ROUNDING_* modes that the engine uses, for
+    computing song durations
+
+Return a PentlyScore, or raise PentlyCompileError.
+"""
+    parser = parse_score(source, filename, include_resolver, recover)
+    set_render_options(parser, pattern_repeat, conductor_call,
+                       tempo_table, tempo_scales, banks, tempo_rounding)
+    with compile_errors(parser):
+        subseq_packed = prepare_file(parser, prefix)
+    return PentlyScore(parser, subseq_packed, prefix)
+
+def link_scores(sources, include_resolver=None, prefix='', recover=False,
+                pattern_repeat=False, conductor_call=False,
+                tempo_table=False, tempo_scales=1, banks=None,
+                tempo_rounding=()):
+    """Compile several scores into one set of music data.
+
+sources -- iterable of (filename, source) tuples, where source is as
+    in compile_score()
+
+Each score's objects go in a namespace named after its filename, so
+that song intro in title.pently becomes title::intro, with asmname
+PS_title_intro.  Names used in a score resolve within its namespace.
+Songs are numbered in the order of sources, then in the order of
+each score.  Sound effects, instruments, and drums that render
+identically are kept once (see dedupe_objects()).  Other arguments
+are as in compile_score().
+
+Return a PentlyScore, or raise PentlyCompileError.
+"""
+    parsers = []
+    for filename, source in sources:
+        parser = parse_score(source, filename, include_resolver, recover)
+        with compile_errors(parser):
+            finalize_patterns(parser)
+        parsers.append(parser)
+    parser = link_parsers(parsers)
+    set_render_options(parser, pattern_repeat, conductor_call,
+                       tempo_table, tempo_scales, banks, tempo_rounding)
+    with compile_errors(parser):
+        if len(parser.songs) == 0:
+            raise IndexError("no songs defined")
+        subseq_packed = render_objects(parser, prefix)
+    return PentlyScore(parser, subseq_packed, prefix)
+
+def parse_score(source, filename=None, include_resolver=None, recover=False):
+    """Parse a score or FamiTracker text export without rendering it.
+
+Arguments are as in compile_score().
+
+Return a PentlyInputParser, or raise PentlyCompileError.
+"""
+    if isinstance(source, str):
+        source = source.splitlines()
+    source = iter(source)
+    first_line = next(source, None)
+    if first_line is not None:
+        source = chain([first_line], source)
+    parser = PentlyInputParser(filename, include_resolver, recover)
+    with compile_errors(parser):
+        if first_line and FamiTrackerImporter.is_text_export(first_line):
+            importer = FamiTrackerImporter(parser)
+            importer.extend(source)
+            importer.build()
+        else:
+            parser.extend(source)
+        if parser.cur_song:
+            parser.warn(parser.cur_song.get_unclosed_msg())
+        if parser.errors:
+            (file, line), msg = parser.errors[0]
+            raise PentlyCompileError(msg, file, line, errors=[
+                PentlyError(efile, eline, emsg)
+                for (efile, eline), emsg in parser.errors
+            ])
+    return parser
+
+def set_render_options(parser, pattern_repeat=False, conductor_call=False,
+                       tempo_table=False, tempo_scales=1, banks=None,
+                       tempo_rounding=()):
+    """Set the options of compile_score() that affect rendering."""
+    parser.pattern_repeat = pattern_repeat
+    parser.conductor_call = conductor_call
+    parser.tempo_table, parser.tempo_scales = tempo_table, tempo_scales
+    parser.banks = list(banks or [])
+    parser.tempo_rounding = frozenset(tempo_rounding)
+
+@contextmanager
+def compile_errors(parser):
+    """Raise errors in parsing or rendering as PentlyCompileError.
+
+The error gets the warnings issued so far and, if not already a
+PentlyCompileError, the position of the parser.
+"""
+    try:
+        yield
+    except PentlyCompileError as e:
+        e.warnings = parser_warnings(parser)
+        raise
+    except Exception as e:
+        file, line = tuple(parser.filelinestack[-1])
+        raise PentlyCompileError(str(e), file, line,
+                                 parser_warnings(parser)) from e
+
+def get_namespace(filename):
+    """Name the namespace of a linked score after its filename."""
+    basename = os.path.splitext(os.path.basename(filename or ''))[0]
+    return PentlyRenderable.get_asmname(basename) or 'score'
+
+def link_parsers(parsers):
+    """Combine parsed scores into one, each in its own namespace.
+
+parsers -- list of PentlyInputParser whose patterns are finalized
+
+Return a PentlyInputParser holding every score's objects, with names
+prefixed by each score's namespace and order keys offset to keep
+scores in order.  Title, author, copyright, and resume point come
+from the first score that sets them.
+"""
+    linked = PentlyInputParser(parsers[0].filename)
+    linked.namespaced = True
+    namespaces, orderbase = {}, 0
+    for parser in parsers:
+        namespace = get_namespace(parser.filename)
+        if namespace in namespaces:
+            raise PentlyCompileError(
+                "namespace %s was already used by %s"
+                % (namespace, namespaces[namespace]), parser.filename
+            )
+        namespaces[namespace] = parser.filename
+        for attr in ('sfxs', 'drums', 'instruments', 'patterns', 'songs'):
+            out = getattr(linked, attr)
+            for name, thing in getattr(parser, attr).items():
+                thing.name = '::'.join((namespace, name))
+                thing.orderkey += orderbase
+                out[thing.name] = thing
+        for drum in parser.drums.values():
+            drum.sfxnames = ['::'.join((namespace, x)) for x in drum.sfxnames]
+        orderbase += parser.total_lines + 1
+
+        for attr in ('title', 'author', 'copyright'):
+            if getattr(linked, attr) == "<?>":
+                setattr(linked, attr, getattr(parser, attr))
+        if parser.resume_song is not None and linked.resume_song is None:
+            linked.resume_song = '::'.join((namespace, parser.resume_song))
+            linked.resume_rows = parser.resume_rows
+            linked.resume_fileline = parser.resume_fileline
+        if parser.resume_mute_fileline and not linked.resume_mute_fileline:
+            linked.resume_mute = parser.resume_mute
+            linked.resume_mute_fileline = parser.resume_mute_fileline
+        linked.warnings.extend(parser.warnings)
+        linked.included_files.extend(
+            x for x in parser.included_files
+            if x not in linked.included_files
+        )
+        linked.total_lines += parser.total_lines
+        linked.unk_keywords += parser.unk_keywords
+    return linked
+
+def parser_warnings(parser):
+    return [
+        PentlyWarning(file, line, msg)
+        for (file, line), msg in parser.warnings
+    ]
 
 # Period table generation ###########################################
 
@@ -2636,6 +5096,24 @@ def getPeriodValues(maxNote=64, region='ntsc', a=440.0):
                for freq in relFreqs]
     return periods
 
+def print_warnings(warnings, file=None):
+    if len(warnings) == 0: return
+    outfp = file or sys.stderr
+    outfp.write("".join(
+        "%s:%s: warning: %s\n" % w for w in warnings
+    ))
+
+def parse_bank_arg(s):
+    """Parse a --bank argument of the form SEGMENT:BYTES."""
+    segname, sep, budget = s.rpartition(':')
+    try:
+        budget = int(budget, 0)
+    except ValueError:
+        budget = None
+    if not (sep and segname and budget and budget > 0):
+        raise argparse.ArgumentTypeError("%s: expected SEGMENT:BYTES" % s)
+    return segname, budget
+
 def parse_argv(argv):
     warntypes = ['error']
     parser = argparse.ArgumentParser()
@@ -2643,8 +5121,18 @@ def parse_argv(argv):
                         help='Pently-MML file to process or - for standard input; omit for period table only')
     parser.add_argument("-o", "--output", metavar='OUTFILENAME',
                         help='write output to a file instead of standard output')
+    parser.add_argument("--link", action='append', metavar='SCORE',
+                        help='also compile SCORE, putting each score in a namespace named after its file and keeping identical sound effects, instruments, and drums once (may be repeated)')
     parser.add_argument("--write-inc", metavar='INCFILENAME',
                         help='write metadata as include file')
+    parser.add_argument("--write-config", metavar='CONFIGFILENAME',
+                        help='write PENTLY_USE_ flags enabling only the features the score uses')
+    parser.add_argument("--config-template", metavar='TEMPLATEFILENAME',
+                        help='with --write-config, copy other settings from this configuration file')
+    parser.add_argument("--report-json", metavar='JSONFILENAME',
+                        help='write sizes of objects and songs as JSON')
+    parser.add_argument("--source-map", metavar='MAPFILENAME',
+                        help='write the score position of each part of the data')
     parser.add_argument("--periods", type=int, default=0,
                         metavar='LENGTH',
                         help='include a period table in the output; LENGTH is usually 64 to 80')
@@ -2656,8 +5144,31 @@ def parse_argv(argv):
                         help='frequency in Hz of A above middle C (default: 440)')
     parser.add_argument("--segment", default='RODATA',
                         help='place output in this segment (default: RODATA)')
+    parser.add_argument("--pattern-repeat", action='store_true',
+                        help='shorten patterns with the REPEAT command (needs PENTLY_USE_PATTERN_REPEAT)')
+    parser.add_argument("--conductor-call", action='store_true',
+                        help='move repeated runs of conductor commands into segments (needs PENTLY_USE_CONDUCTOR_CALL)')
+    parser.add_argument("--tempo-table", action='store_true',
+                        help='precompute tempo for each TV system in a table (needs PENTLY_USE_TEMPO_TABLE)')
+    parser.add_argument("--bank", dest='banks', action='append',
+                        type=parse_bank_arg, metavar='SEGMENT:BYTES',
+                        help='put songs and the data only they use in up to BYTES bytes of SEGMENT (may be repeated; needs PENTLY_USE_SONG_BANKS)')
+    parser.add_argument("--tempo-rounding", action='append',
+                        choices=tempo_rounding_modes, metavar='MODE',
+                        help='compute song durations for an engine built with this PENTLY_USE_TEMPO_ROUNDING_* mode: segno, beat, or the track for PLAY_CH (pulse1, pulse2, triangle, drum, attack) (may be repeated)')
     parser.add_argument("--rehearse", action='store_true',
                         help='include rehearsal mark data in output')
+    parser.add_argument("-MD", dest='write_deps', action='store_true',
+                        help='write a make dependency file named after OUTFILENAME with extension .d')
+    parser.add_argument("-MF", dest='deps_file', metavar='DEPFILENAME',
+                        help='write a make dependency file listing the score and included files')
+    parser.add_argument("-MT", dest='deps_targets', action='append',
+                        metavar='TARGET',
+                        help='name TARGET in the dependency file instead of OUTFILENAME (may be repeated)')
+    parser.add_argument("-MP", dest='deps_phony', action='store_true',
+                        help='add an empty rule for each included file, so that make does not fail after it is deleted')
+    parser.add_argument("-k", "--keep-going", action='store_true',
+                        help='after an error, skip to the next keyword and keep looking for errors')
     parser.add_argument("-v", '--verbose', action="store_true",
                         help='show tracebacks and other verbose diagnostics')
     parser.add_argument("-W", '--warn', action="append", choices=warntypes,
@@ -2671,8 +5182,35 @@ def parse_argv(argv):
     args.warn = set(args.warn or [])
     if not args.infilename and not args.periods:
         parser.error('at least one of infilename and --periods is required')
+    if args.link and not args.infilename:
+        parser.error("cannot link scores without infilename")
     if args.write_inc and not args.infilename:
         parser.error("cannot write include file without infilename")
+    if args.write_config and not args.infilename:
+        parser.error("cannot write configuration file without infilename")
+    if args.config_template and not args.write_config:
+        parser.error("--config-template requires --write-config")
+    args.tempo_rounding = set(args.tempo_rounding or ())
+    if len(args.tempo_rounding.difference(('segno', 'beat'))) > 1:
+        parser.error("--tempo-rounding accepts only one track")
+    if args.banks and args.asm6:
+        parser.error("--bank is not supported with --asm6")
+    if args.report_json and not args.infilename:
+        parser.error("cannot write size report without infilename")
+    if args.source_map and not args.infilename:
+        parser.error("cannot write source map without infilename")
+    is_stdout = not args.output or args.output == '-'
+    if args.write_deps and not args.deps_file:
+        if is_stdout:
+            parser.error("-MD requires -o or -MF")
+        args.deps_file = os.path.splitext(args.output)[0] + '.d'
+    if args.deps_file:
+        if not args.infilename or args.infilename == '-':
+            parser.error("cannot write dependency file without infilename")
+        if not args.deps_targets:
+            if is_stdout:
+                parser.error("dependency file requires -o or -MT")
+            args.deps_targets = [args.output]
     if args.periods < 0:
         parser.error('NUMSEMITONES cannot be negative')
     if args.periods > 88:
@@ -2687,83 +5225,205 @@ def parse_argv(argv):
             print("%s: warning: %s" % (parser.prog, msg), file=sys.stderr)
     return args
 
+def get_compile_options(args):
+    """Translate command line arguments to compile_score() keywords."""
+    return {
+        'prefix': "PENTLY_" if args.prefixed else "",
+        'recover': args.keep_going,
+        'pattern_repeat': args.pattern_repeat,
+        'conductor_call': args.conductor_call,
+        'tempo_table': args.tempo_table,
+        'tempo_scales': TEMPO_TABLE_SCALES if args.rehearse else 1,
+        'banks': args.banks,
+        'tempo_rounding': args.tempo_rounding,
+    }
+
+def iter_period_table(length, region, tuning, exports):
+    """Format a period table, yielding lines and adding to exports."""
+    periods = getPeriodValues(length, region, a=tuning)
+    yield ('; Period table of length %d for %s: %d bytes'
+           % (length, region, length * 2))
+    yield 'periodTableLo:'
+    yield from wrapdata(("$%02x" % (x & 0xFF) for x in periods), '.byte ')
+    yield 'periodTableHi:'
+    yield from wrapdata((str(x >> 8) for x in periods), '.byte ')
+    exports.append('.export periodTableLo, periodTableHi')
+
+def iter_output(args, score, display_filename):
+    """Yield the lines of the output file for command line arguments."""
+    exports = [
+        '; Exports'
+    ]
+    yield '; Generated using Pently music assembler'
+    if args.asm6:
+        yield '; in ASM6 mode'
+    if score:
+        yield '; Music from ' + display_filename
+        yield from iter_file(score.parser, score.subseq_packed,
+                             args.segment, args.asm6, exports)
+        if args.rehearse:
+            yield from iter_rehearsal(score.parser, exports, score.prefix)
+    if args.periods > 0:
+        yield from iter_period_table(args.periods, args.period_region,
+                                     args.period_tuning, exports)
+    if not args.asm6:
+        yield from exports
+    yield ''
+
+@contextmanager
+def render_errors(score):
+    """Raise errors in rendering a score, if any, as PentlyCompileError."""
+    if score is None:
+        yield
+        return
+    with compile_errors(score.parser):
+        yield
+
+def exit_compile_error(e, verbose=False):
+    """Report a PentlyCompileError and its warnings, then exit."""
+    if verbose:
+        import traceback
+        traceback.print_exc()
+    sys.stderr.write("".join(
+        "%s:%d: %s\n" % row for row in e.errors
+    ))
+    print_warnings(e.warnings)
+    sys.exit(1)
+
+def write_lines(outfp, lines):
+    """Write lines separated by newlines without joining them first."""
+    lines = iter(lines)
+    for line in lines:
+        outfp.write(line)
+        break
+    for line in lines:
+        outfp.write('\n')
+        outfp.write(line)
+
+@contextmanager
+def open_if_changed(filename):
+    """Open a text file for writing, keeping the old file if unchanged.
+
+The new contents go to a temporary file, which replaces the old file
+only if they differ.  This way an unchanged file keeps its timestamp,
+and make does not rebuild what depends on it.
+"""
+    tmpname = filename + '.tmp'
+    try:
+        with open(tmpname, 'w') as outfp:
+            yield outfp
+        if (os.path.exists(filename)
+            and filecmp.cmp(tmpname, filename, shallow=False)):
+            os.remove(tmpname)
+        else:
+            os.replace(tmpname, filename)
+    except BaseException:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+        raise
+
+def make_escape(filename):
+    """Escape a filename for use in a makefile rule."""
+    return filename.replace('$', '$$').replace(' ', '\\ ').replace('#', '\\#')
+
+def iter_deps_file(targets, prerequisites, phony=False):
+    """Yield the lines of a make dependency file.
+
+phony -- if true, also add an empty rule for each prerequisite after
+    the first, as gcc -MP does
+"""
+    yield "%s: %s" % (" ".join(make_escape(x) for x in targets),
+                      " ".join(make_escape(x) for x in prerequisites))
+    if phony:
+        for filename in prerequisites[1:]:
+            yield ""
+            yield "%s:" % make_escape(filename)
+    yield ""
+
 def main(argv=None):
     argv = argv or sys.argv
     prog = os.path.basename(argv[0])
     args = parse_argv(argv)
 
-    lines = [
-        '; Generated using Pently music assembler'
-    ]
-    if args.asm6:
-        lines.append('; in ASM6 mode')
-    exports = [
-        '; Exports'
-    ]
+    score = display_filename = None
     if args.infilename:
         is_stdin = args.infilename == '-'
         display_filename = "<stdin>" if is_stdin else args.infilename
-        parser = PentlyInputParser(filename=display_filename)
         infp = sys.stdin if is_stdin else open(args.infilename, 'r')
+        options = get_compile_options(args)
         try:
-            parser.extend(infp)
-            if parser.cur_song:
-                parser.warn(parser.cur_song.get_unclosed_msg())
-            lines.append('; Music from ' + display_filename)
-            l, e = render_file(parser, args.segment, args.asm6,
-                               "PENTLY_" if args.prefixed else "")
-            lines.extend(l)
-            exports.extend(e)
-            if args.rehearse:
-                l, e = render_rehearsal(parser)
-                lines.extend(l)
-                exports.extend(e)
-        except Exception as e:
-            if args.verbose:
-                import traceback
-                traceback.print_exc()
-            file, line = tuple(parser.filelinestack[-1])
-            print("%s:%d: %s" % (file, line, e), file=sys.stderr)
-            sys.exit(1)
+            if args.link:
+                sources = [(display_filename, infp)]
+                for filename in args.link:
+                    with open(filename, 'r') as linkfp:
+                        sources.append((filename, linkfp.readlines()))
+                score = link_scores(sources, **options)
+                display_filename = ", ".join(
+                    [display_filename] + args.link
+                )
+            else:
+                score = compile_score(infp, display_filename, **options)
+        except PentlyCompileError as e:
+            exit_compile_error(e, args.verbose)
         finally:
             if not is_stdin:
                 infp.close()
-            parser.print_warnings()
 
     if 'error' in args.warn:
+        if score: print_warnings(score.warnings)
         print("%s: exiting due to warnings (-Werror)" % (prog,),
               file=sys.stderr)
         sys.exit(1)
 
-    if args.periods > 0:
-        periods = getPeriodValues(args.periods, args.period_region,
-                                  a=args.period_tuning)
-        lines.extend([
-            '; Period table of length %d for %s: %d bytes'
-            % (args.periods, args.period_region, args.periods * 2),
-            'periodTableLo:'
-        ])
-        lines.extend(wrapdata(("$%02x" % (x & 0xFF) for x in periods), '.byte '))
-        lines.append('periodTableHi:')
-        lines.extend(wrapdata((str(x >> 8) for x in periods), '.byte '))
-        exports.append('.export periodTableLo, periodTableHi')
-
-    if not args.asm6:
-        lines.extend(exports)
-        exports[:] = []
+    template = None
+    if args.config_template:
+        with open(args.config_template, 'r') as infp:
+            template = infp.readlines()
 
+    # Output goes to a temporary file as it renders, which an error
+    # discards.  Standard output can't be taken back, so buffer it.
     is_stdout = not args.output or args.output == '-'
-    outfp = sys.stdout if is_stdout else open(args.output, 'w')
-    lines.append('')
+    lines = iter_output(args, score, display_filename)
     try:
-        outfp.write('\n'.join(lines))
-    finally:
-        if not is_stdout:
-            outfp.close()
-    if args.write_inc:
-        lines = render_include_file(parser)
-        with open(args.write_inc, "w") as outfp:
-            outfp.write("\n".join(lines))
+        if is_stdout:
+            with render_errors(score):
+                lines = list(lines)
+            write_lines(sys.stdout, lines)
+        else:
+            with open_if_changed(args.output) as outfp, render_errors(score):
+                write_lines(outfp, lines)
+        if args.write_inc:
+            with open_if_changed(args.write_inc) as outfp, render_errors(score):
+                write_lines(outfp, iter_include_file(score.parser,
+                                                     score.prefix))
+        if args.write_config:
+            with open_if_changed(args.write_config) as outfp, \
+                 render_errors(score):
+                write_lines(outfp, iter_config_file(
+                    score.parser, score.prefix, args.rehearse, template
+                ))
+    except PentlyCompileError as e:
+        exit_compile_error(e, args.verbose)
+
+    # Rendering rehearsal marks can add warnings
+    if score: print_warnings(score.warnings)
+
+    if args.report_json:
+        with open_if_changed(args.report_json) as outfp:
+            json.dump(score.report(), outfp, indent=2, sort_keys=True)
+            outfp.write("\n")
+    if args.source_map:
+        with open_if_changed(args.source_map) as outfp:
+            outfp.writelines(
+                "%s+%d %s:%d:%d\n" % row for row in score.source_map()
+            )
+    if args.deps_file:
+        prerequisites = [args.infilename]
+        prerequisites.extend(args.link or ())
+        prerequisites.extend(score.parser.included_files)
+        with open_if_changed(args.deps_file) as outfp:
+            write_lines(outfp, iter_deps_file(args.deps_targets, prerequisites,
+                                              args.deps_phony))
 
 if __name__=='__main__':
 ##    main(["pentlyas.py", "../audio/musicseq.pently"])
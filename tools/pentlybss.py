@@ -7,7 +7,9 @@ Copyright 2017 Damian Yerrick
 [Insert zlib License here]
 """
 import sys
+import os
 import re
+import time
 import argparse
 
 default_heighttypes = {
@@ -48,9 +50,14 @@ pentlyi_graceTime    PER_TRACK
 pentlyi_instrument   PER_TRACK
 pentlyi_musicPattern PER_TRACK
 pentlyi_chBaseNote   PER_TRACK
+pentlyi_repeatCount  PER_TRACK           PATTERN_REPEAT
 pentlyi_tempoLo      SINGLETON
 pentlyi_tempoHi      SINGLETON
+pentlyi_tempoIncLo   SINGLETON           TEMPO_TABLE
+pentlyi_tempoIncHi   SINGLETON           TEMPO_TABLE
 pentlyi_songWaitRows SINGLETON
+pentlyi_segRetLo     SINGLETON           CONDUCTOR_CALL
+pentlyi_segRetHi     SINGLETON           CONDUCTOR_CALL
 pently_rows_per_beat SINGLETON           BPMMATH
 pently_row_beat_part SINGLETON           BPMMATH
 pently_mute_track    PER_TRACK           VARMIX
@@ -83,13 +90,62 @@ pentlyi_conductorSegnoLo = pentlyBSS + 16
 pentlyi_conductorSegnoHi = pentlyBSS + 17
 """
 
-def load_uses(config_path):
-    """Read the set of features that Pently is configured to use."""
+# Approximate number of times each subroutine runs per frame, used to
+# weight references when estimating the benefit of zero page.
+# Subroutines not listed run only when the program calls them, such
+# as to start a song, and don't count toward the estimate.
+rows_per_frame = 1 / 6  # 150 BPM at 4 rows per beat
+proc_frequencies = {
+    'pently_update': 1,
+    'pentlyi_update_music': 1,
+    'pentlyi_update_music_ch': 5,
+    'pentlyi_mix_sfx': 4,
+    'pentlyi_write_psg_chn': 4,
+    'pentlyi_calc_sustain': 4,
+    'pentlyi_set_ch_silent': 1,
+    'pentlyi_scale_volume': 4,
+    'pentlyi_calc_pitch_effects': 3,
+    'pentlyi_calc_vibrato': 3,
+    'pentlyi_calc_frac_pitch': 3,
+    'pentlyi_calc_portamento': 3,
+    'pentlyi_next_row': rows_per_frame,
+    'pentlyi_read_patterns': rows_per_frame,
+    'pentlyi_read_pattern': 5 * rows_per_frame,
+    'pentlyi_start_pattern': rows_per_frame,
+    'pently_play_note': 3 * rows_per_frame,
+    'pentlyi_round_to_beat': rows_per_frame,
+}
+
+# Instructions that take a cycle longer in absolute,X than zero page,X
+# mode.  Reads take equally long unless absolute,X crosses a page.
+indexed_zp_faster = {
+    'sta', 'sty', 'inc', 'dec', 'asl', 'lsr', 'rol', 'ror'
+}
+
+default_engine_sources = ['pentlymusic.s', 'pentlysound.s']
+
+mnemonics_6502 = set("""
+adc and asl bcc bcs beq bit bmi bne bpl brk bvc bvs clc cld cli clv
+cmp cpx cpy dec dex dey eor inc inx iny jmp jsr lda ldx ldy lsr nop
+ora pha php pla plp rol ror rti rts sbc sec sed sei sta stx sty tax
+tay tsx txa txs tya
+""".split())
+branch_mnemonics = {'bcc', 'bcs', 'beq', 'bmi', 'bne', 'bpl', 'bvc', 'bvs'}
+
+def load_uses(config_path, defines=()):
+    """Read the set of features that Pently is configured to use.
+
+defines -- NAME=VALUE strings as passed to ca65 -D, which take
+    precedence over the configuration file
+"""
     useRE = re.compile(r"PENTLY_USE_([a-zA-Z0-9_]+)\s*=\s*([0-9])+\s*(?:;.*)?")
     with open(config_path, "r") as infp:
         uses = [useRE.match(line.strip()) for line in infp]
-    uses = [m.groups() for m in uses if m]
-    return {name for name, value in uses if int(value)}
+    uses = dict(m.groups() for m in uses if m)
+    for define in defines:
+        m = useRE.match(define.replace(' ', ''))
+        if m: uses[m.group(1)] = m.group(2)
+    return {name for name, value in uses.items() if int(value)}
 
 def get_heighttypes(uses):
     hts = dict(default_heighttypes)
@@ -111,6 +167,290 @@ def get_needed_vars(uses):
             unneeded_vars.append((varname, row[1], height, conditions))
     return needed_vars, unneeded_vars
 
+def zp_cycles_saved(mnemonic, operand):
+    """Count cycles saved by moving an instruction's operand to zero page."""
+    index = operand.rsplit(',', 1)
+    index = index[1].strip().lower() if len(index) > 1 else None
+    if index == 'y':
+        # Only LDX and STX have a zero page,Y mode
+        return 1 if mnemonic in ('ldx', 'stx') else 0
+    if index == 'x':
+        return 1 if mnemonic in indexed_zp_faster else 0
+    return 1
+
+def count_references(paths, varnames):
+    """Count references to variables in engine source code.
+
+paths -- ca65 source files to scan
+varnames -- iterable of variable names to look for
+
+Return a dict from name to [static references, cycles per frame
+saved if on zero page].  The latter is weighted by proc_frequencies
+of the .proc containing each reference.
+"""
+    instRE = re.compile(r"(?:[A-Za-z_@][A-Za-z0-9_@]*:)?\s*([a-zA-Z]{3})\s+(.*)$")
+    wordRE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+    refs = {name: [0, 0.0] for name in varnames}
+    for path in paths:
+        proc_frequency = 0
+        with open(path, "r") as infp:
+            lines = [line.split(";", 1)[0].strip() for line in infp]
+        for line in lines:
+            if line.startswith(".proc"):
+                proc_frequency = proc_frequencies.get(line.split()[1], 0)
+                continue
+            if line.startswith(".endproc"):
+                proc_frequency = 0
+                continue
+            m = instRE.match(line)
+            if not m or m.group(2).startswith('#'):
+                continue
+            mnemonic, operand = m.group(1).lower(), m.group(2)
+            for word in wordRE.findall(operand):
+                ref = refs.get(word)
+                if ref is None: continue
+                ref[0] += 1
+                ref[1] += proc_frequency * zp_cycles_saved(mnemonic, operand)
+    return refs
+
+def feature_names():
+    """List the features that decide whether some variable is needed."""
+    return sorted({cond for row in specs if len(row) > 2
+                   for cond in row[2].split("|")})
+
+def estimate_rom_costs(paths):
+    """Estimate the ROM bytes that each feature adds to the engine.
+
+Bytes inside ".if PENTLY_USE_FOO" count toward FOO, and bytes in the
+matching .else or .elseif count against it.  Only the innermost such
+.if counts, and conditions combining several features count toward
+none.  Instruction sizes are guessed from the operand syntax: an
+operand is assumed absolute unless defined relative to
+pently_zp_state or pently_zptemp.
+
+Return a dict from feature name to bytes.  Each is the change in the
+size of engine code, which is negative for a feature such as
+TEMPO_TABLE that replaces code with data that scores supply (see
+data_rom_costs).
+"""
+    equRE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*=\s*:*([A-Za-z_][A-Za-z0-9_]*)")
+    featureRE = re.compile(r":*PENTLY_USE_([A-Z0-9_]+)$")
+    wordRE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+    all_lines = []
+    for path in paths:
+        with open(path, "r") as infp:
+            all_lines.extend(line.split(";", 1)[0].strip() for line in infp)
+
+    zp_names = {'pently_zp_state', 'pently_zptemp'}
+    equates = [m.groups() for m in map(equRE.match, all_lines) if m]
+    while True:
+        new_names = {name for name, base in equates
+                     if base in zp_names and name not in zp_names}
+        if not new_names: break
+        zp_names.update(new_names)
+
+    costs = {}
+    ifstack = []  # [feature or None, sign]
+    for line in all_lines:
+        words = line.split(None, 1)
+        if not words: continue
+        word0 = words[0].lower()
+        if word0.startswith(".if"):
+            m = featureRE.match(words[1].strip()) if word0 == '.if' else None
+            ifstack.append([m.group(1) if m else None, 1])
+            continue
+        if word0 in ('.else', '.elseif'):
+            ifstack[-1][1] = -1
+            continue
+        if word0 == '.endif':
+            del ifstack[-1]
+            continue
+        feature = next((row for row in reversed(ifstack) if row[0]), None)
+        if feature is None: continue
+
+        if word0.endswith(':') and len(words) > 1:
+            words = words[1].split(None, 1)
+            word0 = words[0].lower()
+        operand = words[1].strip() if len(words) > 1 else ''
+        if word0 in ('.byt', '.byte'):
+            size = len(operand.split(','))
+        elif word0 in ('.addr', '.word'):
+            size = 2 * len(operand.split(','))
+        elif word0 not in mnemonics_6502:
+            continue
+        elif operand in ('', 'a'):
+            size = 1
+        elif operand.startswith('#') or word0 in branch_mnemonics:
+            size = 2
+        elif operand.startswith('('):
+            size = 3 if word0 == 'jmp' else 2
+        else:
+            first_word = wordRE.search(operand)
+            is_zp = first_word and first_word.group(0) in zp_names
+            if operand.lower().endswith(',y') and word0 not in ('ldx', 'stx'):
+                is_zp = False
+            size = 2 if is_zp else 3
+        costs[feature[0]] = costs.get(feature[0], 0) + feature[1] * size
+    return costs
+
+# ROM that a feature adds to each score beyond the engine code
+data_rom_costs = {
+    'TEMPO_TABLE': "4 bytes per tempo (16 with REHEARSAL)",
+}
+
+def pareto_front(points):
+    """Find the points that no other point dominates.
+
+points -- iterable of (key, costs) tuples, where costs is a tuple
+    of values to minimize
+
+A point dominates another if it costs no more in every respect and
+less in at least one.  Return the keys of undominated points.
+"""
+    front = []
+    for key, costs in sorted(points, key=lambda x: x[1]):
+        # Sorting puts any point that dominates this one before it
+        if not any(other != costs
+                   and all(a <= b for a, b in zip(other, costs))
+                   for _, other in front):
+            front.append((key, costs))
+    return [key for key, costs in front]
+
+def needed_bytes(needed_vars, time_limit, cache):
+    """Find the size of the smallest layout found for some variables.
+
+cache -- dict from sorted heights to layout size, shared across
+    calls because the layout depends only on the heights
+"""
+    key = tuple(sorted((ht for name, ht in needed_vars), reverse=True))
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    if time_limit > 0:
+        cols, _ = exact_pack(needed_vars, num_cols, time_limit)
+    else:
+        cols = ffd(needed_vars, num_cols)
+    cache[key] = result = layout_size(cols)
+    return result
+
+def format_matrix(time_limit, rom_costs=None):
+    """Tabulate RAM use of every combination of RAM-affecting features.
+
+Only Pareto-optimal combinations are listed: those for which no other
+combination has at least as many features, uses no more RAM, and,
+with rom_costs, has no larger ROM estimate, while being better in
+at least one respect.
+"""
+    features = feature_names()
+    cache = {}
+    ram = []
+    for mask in range(1 << len(features)):
+        uses = {f for i, f in enumerate(features) if mask & (1 << i)}
+        needed_vars, _ = get_needed_vars(uses)
+        ram.append(needed_bytes(needed_vars, time_limit, cache))
+    full = (1 << len(features)) - 1
+
+    def rom_of(mask):
+        return sum(rom_costs.get(f, 0) for i, f in enumerate(features)
+                   if mask & (1 << i))
+
+    pareto = pareto_front(
+        (mask, (-bin(mask).count("1"), nbytes)
+               + ((rom_of(mask),) if rom_costs is not None else ()))
+        for mask, nbytes in enumerate(ram)
+    )
+    pareto.sort(key=lambda mask: (ram[mask], mask))
+
+    out = [
+        "; RAM use for %d combinations of %d features (%d distinct layouts)"
+        % (len(ram), len(features), len(cache)),
+        ";",
+        "; Cost of each feature relative to all enabled",
+    ]
+    for i, feature in enumerate(features):
+        line = ("; %s: %d bytes RAM"
+                % (feature, ram[full] - ram[full & ~(1 << i)]))
+        if rom_costs is not None:
+            line += ", about %d bytes ROM" % rom_costs.get(feature, 0)
+            if feature in data_rom_costs:
+                line += " plus " + data_rom_costs[feature]
+        out.append(line)
+    if rom_costs is not None:
+        out.append("; ROM is the change in engine code size, so it can be "
+                   "negative")
+    out.extend([
+        ";",
+        "; Pareto-optimal combinations",
+        ";  RAM %sfeatures" % ("   ROM " if rom_costs is not None else ""),
+    ])
+    for mask in pareto:
+        names = [f for i, f in enumerate(features) if mask & (1 << i)]
+        rom = "%5d " % rom_of(mask) if rom_costs is not None else ""
+        out.append("; %4d %s%s" % (ram[mask], rom, " ".join(names) or "(none)"))
+    return out
+
+def find_exports(paths):
+    """List the symbols that engine source exports as absolute.
+
+paths -- ca65 source files to scan, along with the files they
+    .include that exist, such as pently.inc
+
+Return a set of names that appear in .export or .global.  Other
+modules import these as absolute, so they must stay off zero page.
+"""
+    exportRE = re.compile(r"\.(?:export|global)\s+(.*)$", re.IGNORECASE)
+    includeRE = re.compile(r'\.include\s+"([^"]+)"', re.IGNORECASE)
+    exports, seen = set(), set()
+    paths = list(paths)
+    while paths:
+        path = os.path.normpath(paths.pop())
+        if path in seen: continue
+        seen.add(path)
+        with open(path, "r") as infp:
+            lines = [line.split(";", 1)[0].strip() for line in infp]
+        for line in lines:
+            m = includeRE.match(line)
+            if m:
+                incpath = os.path.join(os.path.dirname(path), m.group(1))
+                if os.path.isfile(incpath): paths.append(incpath)
+                continue
+            m = exportRE.match(line)
+            if m:
+                exports.update(name.split(':', 1)[0].split('=', 1)[0].strip()
+                               for name in m.group(1).split(','))
+    return exports
+
+def choose_zp_vars(needed_vars, refs, budget, time_limit=2.0, exclude=()):
+    """Choose variables to move to a zero page block of at most budget bytes.
+
+Variables are taken in decreasing order of cycles saved per byte,
+skipping any that no longer fit and any in exclude, such as the
+result of find_exports().
+time_limit -- seconds to search for each trial layout, or 0 to use
+    first-fit decreasing
+
+Return (zp_vars, bss_vars, cols) where cols is the layout of zp_vars.
+"""
+    by_benefit = sorted(
+        (row for row in needed_vars
+         if refs[row[0]][1] > 0 and row[0] not in exclude),
+        key=lambda row: refs[row[0]][1] / row[1], reverse=True
+    )
+    zp_vars, cols = [], None
+    for row in by_benefit:
+        if row[1] > budget: continue
+        if time_limit > 0:
+            trial, _ = exact_pack(zp_vars + [row], num_cols, time_limit)
+        else:
+            trial = ffd(zp_vars + [row], num_cols)
+        if layout_size(trial) <= budget:
+            zp_vars.append(row)
+            cols = trial
+    zp_names = {name for name, height in zp_vars}
+    bss_vars = [row for row in needed_vars if row[0] not in zp_names]
+    return zp_vars, bss_vars, cols
+
 def format_unneeded(unneeded_vars):
     return [
         "; %s (%s, %d %s): %s disabled"
@@ -132,6 +472,117 @@ def ffd(needed, num_cols):
     cols.sort(key=byel1, reverse=True)
     return cols
 
+def layout_size(cols):
+    """Count the bytes spanned by a layout whose columns are sorted tallest first.
+
+The last row need only extend as far as the last column that reaches it.
+"""
+    maxht = max(col[1] for col in cols)
+    belowmax = sum(1 for k, ht in cols if ht < maxht)
+    return maxht * len(cols) - belowmax
+
+def pack_into(items, capacities, deadline):
+    """Try to pack variables into columns of the given heights.
+
+items -- list of (name, height) tuples, tallest first
+capacities -- maximum height of each column
+deadline -- time.monotonic() value after which to give up
+
+Return cols in the same form as ffd() returns, None if the items
+cannot fit, or raise TimeoutError if the deadline passes.
+"""
+    cols = [[[], 0] for x in capacities]
+    suffix_sums = [0] * (len(items) + 1)
+    for i in range(len(items) - 1, -1, -1):
+        suffix_sums[i] = suffix_sums[i + 1] + items[i][1]
+
+    def search(i, first_col):
+        if i >= len(items):
+            return True
+        height = items[i][1]
+        if height == 1:
+            # Single bytes fill any gap, so only the total matters
+            free = sum(cap - col[1] for col, cap in zip(cols, capacities))
+            if free < suffix_sums[i]:
+                return False
+            c = 0
+            for name, _ in items[i:]:
+                while cols[c][1] >= capacities[c]:
+                    c += 1
+                cols[c][0].append((name, cols[c][1]))
+                cols[c][1] += 1
+            return True
+        if time.monotonic() > deadline:
+            raise TimeoutError
+
+        # Space in columns too full for this variable can never be used
+        usable = sum(cap - col[1] for col, cap in zip(cols, capacities)
+                     if cap - col[1] >= items[-1][1])
+        if usable < suffix_sums[i]:
+            return False
+
+        # Identical variables go in nondecreasing column order, and
+        # columns with the same space left are interchangeable
+        if i == 0 or items[i - 1][1] != height:
+            first_col = 0
+        tried = set()
+        for c in range(first_col, len(cols)):
+            col, cap = cols[c], capacities[c]
+            if col[1] + height > cap or (col[1], cap) in tried:
+                continue
+            tried.add((col[1], cap))
+            col[0].append((items[i][0], col[1]))
+            col[1] += height
+            if search(i + 1, c):
+                return True
+            col[1] -= height
+            del col[0][-1]
+        return False
+
+    if not search(0, 0):
+        return None
+    cols.sort(key=lambda x: x[1], reverse=True)
+    return cols
+
+def exact_pack(needed, num_cols, time_limit=2.0):
+    """Pack variables into columns with the fewest bytes.
+
+needed -- list of (name, height) tuples
+num_cols -- spacing between consecutive rows of a variable
+time_limit -- seconds to search before giving up
+
+Try each size from a lower bound up to the size that first-fit
+decreasing achieves, and return the first that fits as (cols, True),
+where cols is in the same form as ffd() returns.  If the time limit
+runs out first, return (ffd result, False).  Variables in a
+must_ascend group share a height type, so sort_cols() can reorder
+them within any layout this returns.
+"""
+    best = ffd(needed, num_cols)
+    best_size = layout_size(best)
+    items = sorted(needed, key=lambda x: x[1], reverse=True)
+    if not items:
+        return best, True
+
+    # No layout is smaller than the sum of heights, and the tallest
+    # variable needs a column reaching at least its height
+    lower_bound = max(sum(ht for _, ht in items),
+                      (items[0][1] - 1) * num_cols + 1)
+    deadline = time.monotonic() + time_limit
+    for size in range(lower_bound, best_size):
+        # A layout of this size has k columns of height maxht
+        # followed by columns of height maxht - 1
+        maxht, k = divmod(size - 1, num_cols)
+        maxht, k = maxht + 1, k + 1
+        capacities = [maxht] * k + [maxht - 1] * (num_cols - k)
+        try:
+            cols = pack_into(items, capacities, deadline)
+        except TimeoutError:
+            return best, False
+        if cols is not None:
+            return cols, True
+    return best, True
+
 def sort_cols(cols):
     offsets = {
         name: ht * len(cols) + i
@@ -160,12 +611,58 @@ def parse_argv(argv):
                         help="write output to file")
     parser.add_argument("--asm6", action="store_true",
                         help="write output in asm6 format")
-    return parser.parse_args(argv[1:])
+    parser.add_argument("-D", dest="defines", action="append", default=[],
+                        metavar="NAME=VALUE",
+                        help="set a PENTLY_USE_ flag as ca65 -D does, "
+                             "overriding configpath (may be repeated)")
+    parser.add_argument("--time-limit", type=float, default=2.0,
+                        metavar="SECONDS",
+                        help="time to search for a smaller layout than "
+                             "first-fit decreasing (default 2; 0 to skip)")
+    parser.add_argument("--zp-budget", type=int, default=0,
+                        metavar="BYTES",
+                        help="move the most frequently accessed variables "
+                             "to a zero page block of at most BYTES bytes")
+    parser.add_argument("--hotness", action="store_true",
+                        help="report references to each variable")
+    parser.add_argument("--matrix", action="store_true",
+                        help="instead of a RAM map, report RAM use of every "
+                             "combination of features")
+    parser.add_argument("--rom", action="store_true",
+                        help="with --matrix, estimate ROM use of each "
+                             "feature from engine source")
+    parser.add_argument("--engine-src", action="append", metavar="FILE",
+                        help="engine source to scan for references "
+                             "(default: pentlymusic.s and pentlysound.s "
+                             "next to configpath)")
+    args = parser.parse_args(argv[1:])
+    if args.zp_budget < 0:
+        parser.error("zero page budget cannot be negative")
+    if args.zp_budget and args.asm6:
+        parser.error("--zp-budget is not supported in asm6 format")
+    if not args.engine_src:
+        srcdir = os.path.dirname(args.configpath)
+        args.engine_src = [os.path.join(srcdir, filename)
+                           for filename in default_engine_sources]
+    if args.zp_budget or args.hotness or (args.matrix and args.rom):
+        for path in args.engine_src:
+            if not (os.path.isfile(path) and os.access(path, os.R_OK)):
+                parser.error("%s: engine source is not a readable file"
+                             % path)
+    return args
 
 def main(argv=None):
     args = parse_argv(argv or sys.argv)
 
-    uses = load_uses(args.configpath)
+    if args.matrix:
+        rom_costs = estimate_rom_costs(args.engine_src) if args.rom else None
+        out = format_matrix(args.time_limit, rom_costs)
+        outfp = open(args.output, "w") if args.output != '-' else sys.stdout
+        with outfp:
+            print("\n".join(out), file=outfp)
+        return
+
+    uses = load_uses(args.configpath, args.defines)
     needed_vars, unneeded_vars = get_needed_vars(uses)
     out = []
     if unneeded_vars:
@@ -177,17 +674,60 @@ def main(argv=None):
         out.append(asm6_prefix)
         out.append("%s: dsb %s_size" % (args.base_label, args.base_label))
 
-    cols = ffd(needed_vars, num_cols)
+    zp_label = args.base_label + "_zp"
+    zp_vars = []
+    if args.zp_budget or args.hotness:
+        refs = count_references(args.engine_src,
+                                (name for name, height in needed_vars))
+    if args.hotness:
+        out.append("; References: static count, cycles per frame saved on zero page")
+        out.extend(
+            "; %s: %d, %.2f" % (name, refs[name][0], refs[name][1])
+            for name, height in sorted(needed_vars,
+                                       key=lambda row: refs[row[0]][1],
+                                       reverse=True)
+        )
+    if args.zp_budget:
+        zp_vars, needed_vars, zp_cols = choose_zp_vars(
+            needed_vars, refs, args.zp_budget, args.time_limit,
+            find_exports(args.engine_src)
+        )
+    if zp_vars:
+        zp_size = layout_size(zp_cols)
+        out.append("; Zero page: %d of %d bytes for %d variables, "
+                   "saving about %.1f cycles per frame"
+                   % (zp_size, args.zp_budget, len(zp_vars),
+                      sum(refs[name][1] for name, height in zp_vars)))
+        out.append("%s_size = %d" % (zp_label, zp_size))
+        out.extend([
+            ".pushseg",
+            ".zeropage",
+            "%s: .res %s_size" % (zp_label, zp_label),
+            ".popseg",
+        ])
+        out.extend(format_cols(sort_cols(zp_cols), zp_label))
+    else:
+        out.append("%s_size = 0" % zp_label)
+
+    ffd_size = layout_size(ffd(needed_vars, num_cols))
+    if args.time_limit > 0:
+        cols, optimal = exact_pack(needed_vars, num_cols, args.time_limit)
+    else:
+        cols, optimal = ffd(needed_vars, num_cols), False
     minht = min(col[1] for col in cols)
     maxht = max(col[1] for col in cols)
     sumht = sum(col[1] for col in cols)
     belowmax = sum(1 for k, ht in cols if ht < maxht)
-    bytesneeded = maxht * num_cols - belowmax
+    bytesneeded = layout_size(cols)
 
     waste = bytesneeded - sumht
     out.append("; Columns are %d-%d rows tall, total %d"
                % (minht, maxht, sumht))
     out.append("; Below max: %d; layout waste %d" % (belowmax, waste))
+    if args.time_limit > 0:
+        out.append("; %s layout saves %d bytes over first-fit decreasing"
+                   % ("Optimal" if optimal else "Best found",
+                      ffd_size - bytesneeded))
     out.append("%s_size = %d" % (args.base_label, bytesneeded))
     cols = sort_cols(cols)
     out.extend(format_cols(cols, args.base_label))
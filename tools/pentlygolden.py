@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Pently golden output checker
+
+Compiles the scores in audio/ and a set of generated scores that
+exercise corner cases of the compiler, and compares each output
+byte for byte with the copy stored in tools/golden.  Run it before
+and after changing pentlyas.py to make sure the output is unchanged.
+
+Copyright 2019 Damian Yerrick
+
+[Insert zlib License here]
+"""
+import sys
+import os
+import argparse
+import difflib
+import fnmatch
+import io
+import time
+from multiprocessing import Pool
+import pentlyas
+
+tooldir = os.path.dirname(os.path.abspath(__file__))
+topdir = os.path.dirname(tooldir)
+default_golden_dir = os.path.join(tooldir, 'golden')
+
+# Command line options for each variant of each score
+audio_variants = [
+    ('', []),
+    ('-packed', [
+        '--pattern-repeat', '--conductor-call', '--tempo-table',
+        '--rehearse', '--tempo-rounding', 'beat'
+    ]),
+    ('-asm6', ['--asm6', '--prefixed', '--periods', '76']),
+]
+generated_variants = audio_variants[:2]
+
+# Generated scores ##################################################
+
+gen_header = """\
+durations stick
+sfx hat on noise
+  volume 6 4 3 2 1
+  pitch 12
+sfx kick on noise
+  volume 10 8 6 4 2
+  pitch 9 10 11
+sfx trikick on triangle
+  volume 15 15 15 2
+  pitch e' c' a f#
+drum hat hat
+drum kick kick trikick
+drum kickhat hat trikick
+instrument lead
+  volume 12 10 8 6
+  decay 1
+  timbre 2
+instrument bass
+  timbre 2
+"""
+
+def gen_fallthrough(chainlength):
+    """Make a score whose patterns fall through in a chain."""
+    lines = [
+        "song fallthrough%d" % chainlength,
+        "  time 4/4", "  scale 16", "  tempo 150", "  at 1",
+    ]
+    pitches = ["c'", "e'", "g'", "b'", "d''", "f''"]
+    for i in range(chainlength + 1):
+        lines.append("  pattern ft%d on pulse2 with lead" % i)
+        lines.append("    %s4 r8 %s8 w4 %s8 r8"
+                     % (pitches[i], pitches[i + 1], pitches[i]))
+        if i < chainlength:
+            lines.append("  fallthrough")
+    lines.append("  play ft0")
+    for i in range(1, chainlength + 1):
+        lines.extend([
+            "  at %d" % (i * 2 + 1),
+            "  play ft%d on pulse1 with lead" % i,
+        ])
+    lines.extend(["  at %d" % (chainlength * 2 + 3), "  fine"])
+    return lines
+
+def gen_wide_range(semitones):
+    """Make a score with a pattern spanning more than two octaves."""
+    notenames = ['c', 'c#', 'd', 'd#', 'e', 'f', 'f#', 'g', 'g#', 'a',
+                 'a#', 'b']
+    def absnote(pitch):
+        octave = pitch // 12
+        mark = "'" * (octave - 1) if octave >= 1 else "," * (1 - octave)
+        return notenames[pitch % 12] + mark
+    low = 12
+    notes = [absnote(low), absnote(low + semitones),
+             absnote(low + semitones // 2), absnote(low + 1),
+             absnote(low + semitones - 1), absnote(low)]
+    return [
+        "song wide%d" % semitones,
+        "  tempo 120", "  at 1",
+        "  pattern wide%d_up with lead" % semitones,
+        "    absolute",
+        "    " + " ".join(n + "8" for n in notes),
+        "    " + " ".join(n + "16" for n in reversed(notes)),
+        "  play wide%d_up on pulse1" % semitones,
+        "  play wide%d_up on pulse2 up %d" % (semitones, semitones),
+        "  play wide%d_up on triangle with bass up %d" % (semitones, 12),
+        "  at 3", "  fine",
+    ]
+
+def gen_grace(scale):
+    """Make a score using grace notes at one rows-per-note scale."""
+    return [
+        "song grace%d" % scale,
+        "  scale %d" % scale, "  tempo 100", "  at 1",
+        "  pattern grace%d on pulse2 with lead" % scale,
+        "    d'4g e'4 d'2 c'1g d'8 e'2g f'8 r3g g'4.",
+        "    g'6g w4 a'2g b'4 r2g c''2",
+        "  play grace%d" % scale,
+        "  at 2", "  fine",
+    ]
+
+def gen_detect():
+    """Make a score whose patterns are detected as pitched or drum."""
+    return [
+        "song detect",
+        "  tempo 140", "  at 1",
+        "  pattern detect_drum",
+        "    kick8 hat kickhat hat r4 kick",
+        "  pattern detect_rest_drum",
+        "    r8 w16 hat hat kick8 hat",
+        "  pattern detect_pitched with bass",
+        "    c4 e g e",
+        "  pattern detect_rest_pitched",
+        "    r8 w8 c'8 e' g' r4",
+        "  pattern detect_waits",
+        "    w1",
+        "  play detect_drum",
+        "  play detect_pitched on triangle",
+        "  play detect_rest_pitched on pulse2 with lead",
+        "  at 2",
+        "  play detect_rest_drum",
+        "  play detect_waits on pulse1 with lead",
+        "  at 3", "  fine",
+    ]
+
+def gen_ambiguous():
+    """Make a score with a drum named like a pitch, which is an error."""
+    return [
+        "sfx cess on noise", "  volume 8 4", "  pitch 3",
+        "drum ces cess",
+        "song ambiguous", "  at 1",
+        "  pattern ambiguous", "    ces4 ces ces ces",
+        "  play ambiguous",
+    ]
+
+def gen_famitracker():
+    """Make a FamiTracker text export with drums on the noise channel.
+
+The noise pattern stops for one frame and then plays again.
+"""
+    empty = "... .. . ..."
+    def row(num, *cells):
+        cells = list(cells) + [empty] * (5 - len(cells))
+        return "ROW %02X : %s" % (num, " : ".join(cells))
+    return [
+        "# FamiTracker text export 0.4.2",
+        'TITLE           "Drum test"',
+        'AUTHOR          "Nobody"',
+        'COPYRIGHT       "2019"',
+        "FRAMERATE       0",
+        "EXPANSION       0",
+        "SPLIT           32",
+        "MACRO       0   0  -1  -1   0 : 15 12 9 6 3 0",
+        "MACRO       4   0  -1  -1   0 : 2",
+        'INST2A03   0     0  -1  -1  -1   0 "lead"',
+        'TRACK  16   6 150 "Drums"',
+        "COLUMNS : 1 1 1 1 1",
+        "ORDER 00 : 00 00 00 00 00",
+        "ORDER 01 : 00 00 00 01 00",
+        "ORDER 02 : 01 00 00 00 00",
+        "PATTERN 00",
+        row(0x00, "C-4 00 . ...", empty, "C-3 00 . ...", "1-# 00 . ..."),
+        row(0x04, "E-4 00 . ...", empty, empty, "C-# 00 . ..."),
+        row(0x08, "G-4 00 . ...", empty, "G-2 00 . ...", "1-# 00 . ..."),
+        row(0x0C, "--- .. . ...", empty, empty, "C-# 00 . ..."),
+        "PATTERN 01",
+        row(0x00, "D-4 00 . ..."),
+    ]
+
+def iter_generated_scores():
+    """Yield (name, source) for each generated score."""
+    def score(lines):
+        return gen_header + "".join(line + "\n" for line in lines)
+    for chainlength in (1, 2, 4):
+        yield 'fallthrough%d' % chainlength, score(gen_fallthrough(chainlength))
+    for semitones in (24, 25, 30, 36, 47):
+        yield 'wide%d' % semitones, score(gen_wide_range(semitones))
+    for scale in (8, 16, 32):
+        yield 'grace%d' % scale, score(gen_grace(scale))
+    yield 'detect', score(gen_detect())
+    yield 'ambiguous', score(gen_ambiguous())
+    yield 'famitracker', "".join(line + "\n" for line in gen_famitracker())
+
+# Running cases #####################################################
+
+def get_cases():
+    """List the cases as (name, filename, source, options) tuples.
+
+filename is relative to the top of the repository.  source is None
+to read the file or a string of a generated score.
+"""
+    cases = []
+    audiodir = os.path.join(topdir, 'audio')
+    scores = sorted(x for x in os.listdir(audiodir)
+                    if x.endswith('.pently'))
+    for filename in scores:
+        basename = os.path.splitext(filename)[0]
+        for suffix, options in audio_variants:
+            cases.append((basename + suffix, 'audio/' + filename, None,
+                          options))
+    cases.append(('musicseq-linked', 'audio/musicseq.pently', None,
+                  ['--link', 'audio/pino-a53.pently']))
+    for name, source in iter_generated_scores():
+        for suffix, options in generated_variants:
+            cases.append(('gen-' + name + suffix,
+                          'generated/%s.pently' % name, source, options))
+    return cases
+
+def compile_case(case):
+    """Compile one case as pentlyas.py would with its options.
+
+Return (name, outputs, seconds), where outputs is a list of
+(extension, text).  The main output goes in .s or .asm and the
+include file in -titles.inc.  Warnings go in .log, as do errors
+in place of the other outputs.
+"""
+    name, filename, source, options = case
+    start = time.perf_counter()
+    args = pentlyas.parse_argv(['pentlyas.py', filename] + options)
+    log = io.StringIO()
+    try:
+        if source is None:
+            with open(filename, 'r') as infp:
+                source = infp.readlines()
+        if args.link:
+            sources = [(filename, source)]
+            for linkname in args.link:
+                with open(linkname, 'r') as infp:
+                    sources.append((linkname, infp.readlines()))
+            score = pentlyas.link_scores(
+                sources, **pentlyas.get_compile_options(args)
+            )
+            filename = ", ".join([filename] + args.link)
+        else:
+            score = pentlyas.compile_score(
+                source, filename, **pentlyas.get_compile_options(args)
+            )
+    except pentlyas.PentlyCompileError as e:
+        log.write("".join("%s:%d: %s\n" % row for row in e.errors))
+        pentlyas.print_warnings(e.warnings, log)
+        outputs = [('.log', log.getvalue())]
+    else:
+        output = "\n".join(pentlyas.iter_output(args, score, filename))
+        include = "\n".join(pentlyas.iter_include_file(score.parser,
+                                                       score.prefix))
+        pentlyas.print_warnings(score.warnings, log)
+        outputs = [
+            ('.asm' if args.asm6 else '.s', output),
+            ('-titles.inc', include),
+        ]
+        if log.getvalue():
+            outputs.append(('.log', log.getvalue()))
+    return name, outputs, time.perf_counter() - start
+
+def check_output(golden_dir, name, outputs, update=False):
+    """Compare a case's outputs to its golden files.
+
+Return a list of (filename, problem, difference lines), where problem
+is 'missing', 'differs', or 'extra' for a golden file no longer
+produced.  If update is true, rewrite golden files that differ.
+"""
+    problems = []
+    expected = set()
+    for ext, text in outputs:
+        goldname = name + ext
+        expected.add(goldname)
+        path = os.path.join(golden_dir, goldname)
+        data = text.encode('utf-8')
+        try:
+            with open(path, 'rb') as infp:
+                golden = infp.read()
+        except FileNotFoundError:
+            golden = None
+        if golden == data: continue
+        if golden is None:
+            problems.append((goldname, 'missing', []))
+        else:
+            diff = difflib.unified_diff(
+                golden.decode('utf-8').splitlines(), text.splitlines(),
+                'golden/' + goldname, goldname, lineterm='', n=1
+            )
+            problems.append((goldname, 'differs', list(diff)))
+        if update:
+            with open(path, 'wb') as outfp:
+                outfp.write(data)
+    for ext in ('.s', '.asm', '-titles.inc', '.log'):
+        goldname = name + ext
+        path = os.path.join(golden_dir, goldname)
+        if goldname not in expected and os.path.exists(path):
+            problems.append((goldname, 'extra', []))
+            if update:
+                os.remove(path)
+    return problems
+
+# Command line ######################################################
+
+def parse_argv(argv):
+    parser = argparse.ArgumentParser(
+        description="Compare pentlyas.py output to stored golden files."
+    )
+    parser.add_argument("cases", nargs='*', metavar='CASE',
+                        help="names of cases to run, with * and ? wildcards (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="compile in this many processes (default: number of CPUs)")
+    parser.add_argument("--golden-dir", default=default_golden_dir,
+                        help="directory of golden files (default: tools/golden)")
+    parser.add_argument("--update", action="store_true",
+                        help="rewrite golden files that differ instead of failing")
+    parser.add_argument("--list", action="store_true",
+                        help="list the cases and exit")
+    parser.add_argument("--max-diff", type=int, default=20,
+                        metavar='LINES',
+                        help="show up to this many lines of each difference (default: 20)")
+    args = parser.parse_args(argv[1:])
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be positive")
+    return args
+
+def main(argv=None):
+    args = parse_argv(argv or sys.argv)
+    golden_dir = os.path.abspath(args.golden_dir)
+    os.chdir(topdir)
+    cases = get_cases()
+    if args.cases:
+        cases = [
+            case for case in cases
+            if any(fnmatch.fnmatchcase(case[0], pat) for pat in args.cases)
+        ]
+        if not cases:
+            sys.exit("pentlygolden.py: no cases match")
+    if args.list:
+        print("\n".join(case[0] for case in cases))
+        return
+    if args.update:
+        os.makedirs(golden_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    if args.jobs == 1:
+        results = [compile_case(case) for case in cases]
+    else:
+        with Pool(args.jobs) as pool:
+            results = pool.map(compile_case, cases)
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    print("Case                         ms  result")
+    for name, outputs, seconds in results:
+        problems = check_output(golden_dir, name, outputs, args.update)
+        if problems:
+            failures += 1
+        status = ("updated" if args.update else "FAIL") if problems else "ok"
+        print("%-24s  %7.1f  %s" % (name, seconds * 1000, status))
+        for goldname, problem, diff in problems:
+            print("  %s %s" % (goldname, problem))
+            for line in diff[:args.max_diff]:
+                print("    " + line)
+            if len(diff) > args.max_diff:
+                print("    ... %d more lines" % (len(diff) - args.max_diff))
+    total = sum(x[2] for x in results)
+    print("%d cases, %.1f ms compiling, %.1f ms elapsed"
+          % (len(results), total * 1000, elapsed * 1000))
+    if failures and not args.update:
+        print("%d of %d cases differ from golden output"
+              % (failures, len(results)), file=sys.stderr)
+        sys.exit(1)
+
+if __name__=='__main__':
+    main()
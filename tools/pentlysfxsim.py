@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Pently sound effect collision analyzer
+
+Replays a log of the sound effects that a game started and reports
+which ones pently_start_sound dropped or cut short, and how busy each
+channel was.
+
+Copyright 2019 Damian Yerrick
+
+[Insert zlib License here]
+"""
+import sys
+import argparse
+from collections import namedtuple
+import pentlyas
+
+channel_names = {0: 'pulse 1', 4: 'pulse 2', 8: 'triangle', 12: 'noise'}
+NOISE_CH = 12
+NOISE_ATTACK = 16
+channel_names[NOISE_ATTACK] = 'noise attack'
+
+SfxInfo = namedtuple('SfxInfo', ['name', 'channel', 'length', 'rate'])
+SfxResult = namedtuple('SfxResult', [
+    'frame', 'name', 'channel', 'outcome', 'frames_played', 'frames_total',
+    'cause', 'moved'
+])
+
+def load_sfx(score):
+    """Read the sound effects of a compiled score.
+
+Return a dict from each sound effect's name, asmname, and index to
+an SfxInfo, whose length is in steps and rate in frames per step.
+"""
+    sfxs = sorted(score.parser.sfxs.values(), key=lambda x: x.orderkey)
+    out = {}
+    for i, sfx in enumerate(sfxs):
+        info = SfxInfo(sfx.name, sfx.channel_type * 4,
+                       len(sfx.asmdata) // 2, sfx.rate or 1)
+        out[sfx.name] = out[sfx.asmname] = out[str(i)] = info
+    return out
+
+def parse_log(lines, sfx_table, filename='<log>'):
+    """Parse an event log of lines of the form FRAME SFXNAME.
+
+FRAME counts calls to pently_update.  A sound effect started in a
+frame is started before that frame's pently_update.  Blank lines and
+lines starting with # are ignored.
+
+Return a list of (frame, SfxInfo) sorted by frame, keeping the
+order of sound effects started in the same frame.
+"""
+    events = []
+    for linenum, line in enumerate(lines, 1):
+        line = line.split('#', 1)[0].split()
+        if not line: continue
+        if len(line) != 2:
+            raise ValueError("%s:%d: expected FRAME SFXNAME"
+                             % (filename, linenum))
+        try:
+            frame = int(line[0])
+        except ValueError:
+            raise ValueError("%s:%d: frame %s is not a number"
+                             % (filename, linenum, line[0]))
+        try:
+            sfx = sfx_table[line[1]]
+        except KeyError:
+            raise ValueError("%s:%d: unknown sound effect %s"
+                             % (filename, linenum, line[1]))
+        events.append((frame, sfx))
+    events.sort(key=lambda x: x[0])
+    return events
+
+def simulate(events, square_pooling=True, noise_pooling=True):
+    """Follow pently_start_sound's choices for a sequence of sound effects.
+
+events -- list of (frame, SfxInfo) sorted by frame
+square_pooling, noise_pooling -- whether the engine was built with
+    PENTLY_USE_SQUARE_POOLING and PENTLY_USE_NOISE_POOLING
+
+A sound effect plays if it has at least as many steps as remain in
+the effect on its channel; otherwise it is dropped.  With square
+pooling, a pulse effect goes to pulse 2 if fewer steps remain there
+than on pulse 1.  With noise pooling, an effect at 1 frame per step
+still playing on noise moves to the noise attack envelope if that
+is idle.  Each channel's remaining length is computed from when its
+effect started, so the replay takes time proportional to the number
+of events, not frames.
+
+Return a list of SfxResult in the order of events.  outcome is one
+of 'played', 'truncated', or 'dropped'; cause is the index into the
+list of the effect that cut it off or kept it from playing, or None;
+moved is the frame when it moved to the noise attack envelope, or None.
+"""
+    results = []
+    playing = {}  # channel: (result index, start frame, SfxInfo)
+    attack = None  # (result index, frame when it ends)
+
+    def remaining(ch, frame):
+        """Count steps left on a channel before this frame's update."""
+        try:
+            i, start, sfx = playing[ch]
+        except KeyError:
+            return 0
+        return max(0, sfx.length - (frame - start) // sfx.rate)
+
+    for frame, sfx in events:
+        ch = sfx.channel
+        if square_pooling and ch == 0 and remaining(4, frame) < remaining(0, frame):
+            ch = 4
+        if noise_pooling and ch == NOISE_CH:
+            attack_left = attack and max(0, attack[1] - frame)
+            noise_left = remaining(NOISE_CH, frame)
+            if (noise_left and not attack_left
+                and playing[NOISE_CH][2].rate == 1):
+                i = playing.pop(NOISE_CH)[0]
+                attack = (i, frame + noise_left)
+                results[i] = results[i]._replace(moved=frame)
+
+        i = len(results)
+        total = sfx.length * sfx.rate
+        left = remaining(ch, frame)
+        if sfx.length < left:
+            results.append(SfxResult(frame, sfx.name, ch, 'dropped', 0,
+                                     total, playing[ch][0], None))
+            continue
+        if left:
+            j, start, old = playing[ch]
+            results[j] = results[j]._replace(
+                outcome='truncated', frames_played=frame - start, cause=i
+            )
+        playing[ch] = (i, frame, sfx)
+        results.append(SfxResult(frame, sfx.name, ch, 'played', total,
+                                 total, None, None))
+    return results
+
+def get_occupancy(results):
+    """Count the frames that each channel plays a sound effect.
+
+Return a tuple (busy, span), where busy is a dict from channel to
+frames and span is the number of frames from the first sound effect
+to the end of the last.
+"""
+    busy, first, last = {}, None, None
+    for r in results:
+        if r.outcome == 'dropped': continue
+        end = r.frame + r.frames_played
+        first = r.frame if first is None else min(first, r.frame)
+        last = end if last is None else max(last, end)
+        split = r.moved if r.moved is not None else end
+        busy[r.channel] = busy.get(r.channel, 0) + split - r.frame
+        if split < end:
+            busy[NOISE_ATTACK] = busy.get(NOISE_ATTACK, 0) + end - split
+    return busy, (last - first if first is not None else 0)
+
+def format_report(results, verbose=False):
+    """Format simulation results as lines of text."""
+    out = []
+    counts = {}
+    for i, r in enumerate(results):
+        sfxcounts = counts.setdefault(r.name, {})
+        sfxcounts[r.outcome] = sfxcounts.get(r.outcome, 0) + 1
+        if r.outcome == 'played' and not verbose: continue
+        line = ("frame %d: %s on %s %s"
+                % (r.frame, r.name, channel_names[r.channel], r.outcome))
+        if r.moved is not None:
+            line += " (moved to noise attack at frame %d)" % r.moved
+        if r.outcome == 'truncated':
+            line += (" after %d of %d frames by %s at frame %d"
+                     % (r.frames_played, r.frames_total,
+                        results[r.cause].name, results[r.cause].frame))
+        elif r.outcome == 'dropped':
+            line += " because %s is longer" % results[r.cause].name
+        out.append(line)
+    if out: out.append('')
+
+    out.append("Sound effect  played  truncated  dropped")
+    out.extend(
+        "%-12s  %6d  %9d  %7d"
+        % (name, c.get('played', 0), c.get('truncated', 0),
+           c.get('dropped', 0))
+        for name, c in sorted(counts.items())
+    )
+    out.append('')
+
+    busy, span = get_occupancy(results)
+    out.append("Channel       frames  occupancy")
+    out.extend(
+        "%-12s  %6d  %8.1f%%"
+        % (channel_names[ch], busy[ch], 100.0 * busy[ch] / span if span else 0)
+        for ch in sorted(busy)
+    )
+    return out
+
+def parse_argv(argv):
+    parser = argparse.ArgumentParser(
+        description="Report sound effects that Pently would drop or cut short."
+    )
+    parser.add_argument("score",
+                        help="score whose sound effects the game uses")
+    parser.add_argument("logfile",
+                        help="event log with lines of the form FRAME SFXNAME, or - for standard input")
+    parser.add_argument("-o", "--output", default='-',
+                        help="write report to file")
+    parser.add_argument("--no-square-pooling", dest="square_pooling",
+                        action="store_false",
+                        help="simulate an engine built without PENTLY_USE_SQUARE_POOLING")
+    parser.add_argument("--no-noise-pooling", dest="noise_pooling",
+                        action="store_false",
+                        help="simulate an engine built without PENTLY_USE_NOISE_POOLING")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="list every sound effect, not only those dropped or cut short")
+    return parser.parse_args(argv[1:])
+
+def main(argv=None):
+    args = parse_argv(argv or sys.argv)
+    with open(args.score, 'r') as infp:
+        score = pentlyas.compile_score(infp, args.score)
+    sfx_table = load_sfx(score)
+    try:
+        if args.logfile == '-':
+            events = parse_log(sys.stdin, sfx_table, '<stdin>')
+        else:
+            with open(args.logfile, 'r') as infp:
+                events = parse_log(infp, sfx_table, args.logfile)
+    except ValueError as e:
+        sys.exit(str(e))
+    results = simulate(events, args.square_pooling, args.noise_pooling)
+    out = format_report(results, args.verbose)
+    outfp = open(args.output, "w") if args.output != '-' else sys.stdout
+    with outfp:
+        print("\n".join(out), file=outfp)
+
+if __name__=='__main__':
+    main()